@@ -9,7 +9,8 @@ from typer.core import TyperGroup
 from typing_extensions import override
 
 from pipelex import log, pretty_print
-from pipelex.exceptions import PipelexCLIError, PipelexConfigError
+from pipelex.config import get_config
+from pipelex.exceptions import LibrarySnapshotError, PipelexCLIError, PipelexConfigError
 from pipelex.hub import get_pipe_provider, get_pipeline_tracker, get_required_pipe
 from pipelex.libraries.library_config import LibraryConfig
 from pipelex.pipe_works.pipe_dry import dry_run_all_pipes, dry_run_single_pipe
@@ -132,6 +133,34 @@ def validate(
     log.info("Setup sequence passed OK, config and pipelines are validated.")
 
 
+@app.command("compile-libraries")
+def compile_libraries(
+    relative_config_folder_path: Annotated[
+        str, typer.Option("--config-folder-path", "-c", help="Relative path to the config folder path")
+    ] = "./pipelex_libraries",
+) -> None:
+    """Validate the libraries and compile them into a snapshot, loaded at setup if enabled and as long as the sources are unchanged."""
+    # Check if pipelex libraries folder exists
+    if not is_pipelex_libraries_folder(relative_config_folder_path):
+        typer.echo(f"❌ No pipelex libraries folder found at '{relative_config_folder_path}'")
+        typer.echo("To create a pipelex libraries folder, run: pipelex init-libraries")
+        raise typer.Exit(1)
+
+    pipelex_instance = Pipelex.make(relative_config_folder_path=relative_config_folder_path, from_file=False)
+    library_manager = pipelex_instance.library_manager
+    if library_manager.is_loaded_from_snapshot:
+        typer.echo(f"✅ The library snapshot '{get_config().pipelex.library_config.library_snapshot_path}' is up to date")
+        return
+    pipelex_instance.validate_libraries()
+    try:
+        snapshot_path = library_manager.compile_snapshot()
+    except LibrarySnapshotError as exc:
+        raise PipelexCLIError(f"Failed to compile libraries: {exc}")
+    typer.echo(f"✅ Successfully compiled libraries into '{snapshot_path}'")
+    if not get_config().pipelex.library_config.is_library_snapshot_enabled:
+        typer.echo("To load the snapshot at setup, set is_library_snapshot_enabled = true in [pipelex.library_config]")
+
+
 @app.command()
 def dry_run_pipe(
     pipe_code: Annotated[str, typer.Argument(help="The pipe code to dry run")],
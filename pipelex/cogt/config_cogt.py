@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, cast
+from typing import Dict, List, Literal, Optional, Union, cast
 
 from pydantic import Field, field_validator
 
@@ -6,6 +6,8 @@ from pipelex.cogt.imgg.imgg_handle import ImggHandle
 from pipelex.cogt.imgg.imgg_job_components import ImggJobConfig, ImggJobParams, ImggJobParamsDefaults
 from pipelex.cogt.llm.llm_job_components import LLMJobConfig
 from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
+from pipelex.cogt.llm.llm_response_cache import LLMResponseCacheBackend
+from pipelex.cogt.ocr.ocr_job_components import OcrJobConfig
 from pipelex.tools.config.models import ConfigModel
 
 
@@ -13,6 +15,10 @@ class OcrConfig(ConfigModel):
     ocr_handles: List[str]
     page_output_text_file_name: str
     default_page_views_dpi: int
+    is_page_views_storage_enabled: bool = False
+    page_views_storage_dir: str = ".pipelex/page_views"
+    default_nb_pages_per_chunk: Optional[int] = Field(default=None, ge=1)
+    ocr_job_config: OcrJobConfig = Field(default_factory=OcrJobConfig)
 
 
 class ImggConfig(ConfigModel):
@@ -29,12 +35,29 @@ class InstructorConfig(ConfigModel):
     is_openai_structured_output_enabled: bool
 
 
+class LLMResponseCacheConfig(ConfigModel):
+    is_enabled: bool
+    backend: LLMResponseCacheBackend = Field(strict=False)
+    max_entries: int = Field(ge=1)
+    ttl_seconds: Union[int, Literal["unlimited"]]
+    sqlite_path: str
+
+    @property
+    def applied_ttl_seconds(self) -> Optional[int]:
+        if self.ttl_seconds == "unlimited":
+            return None
+        else:
+            return self.ttl_seconds
+
+
 class LLMConfig(ConfigModel):
     preferred_platforms: Dict[str, LLMPlatform]
     instructor_config: InstructorConfig
     llm_job_config: LLMJobConfig
+    response_cache_config: LLMResponseCacheConfig
 
     default_max_images: int
+    prompt_images_cache_max_bytes: int = Field(default=256 * 1024 * 1024, ge=0)
 
     @field_validator("preferred_platforms", mode="before")
     def validate_preferred_platforms_enums(cls, value: Dict[str, str]) -> Dict[str, LLMPlatform]:
@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional, Type, cast
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, Dict, List, Optional, Type, cast
 
 from typing_extensions import override
 
@@ -15,7 +16,7 @@ from pipelex.cogt.content_generation.assignment_models import (
 from pipelex.cogt.content_generation.content_generator_protocol import ContentGeneratorProtocol, update_job_metadata
 from pipelex.cogt.content_generation.imgg_generate import imgg_gen_image_list, imgg_gen_single_image
 from pipelex.cogt.content_generation.jinja2_generate import jinja2_gen_text
-from pipelex.cogt.content_generation.llm_generate import llm_gen_object, llm_gen_object_list, llm_gen_text
+from pipelex.cogt.content_generation.llm_generate import llm_gen_object, llm_gen_object_list, llm_gen_text, llm_gen_text_stream
 from pipelex.cogt.content_generation.ocr_generate import ocr_gen_extract_pages
 from pipelex.cogt.image.generated_image import GeneratedImage
 from pipelex.cogt.imgg.imgg_handle import ImggHandle
@@ -57,6 +58,27 @@ class ContentGenerator(ContentGeneratorProtocol):
         log.verbose(f"{self.__class__.__name__} generated text: {generated_text}")
         return generated_text
 
+    @override
+    async def make_llm_text_stream(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        job_metadata: JobMetadata,
+        llm_setting_main: LLMSetting,
+        llm_prompt_for_text: LLMPrompt,
+    ) -> AsyncGenerator[str, None]:
+        # update_job_metadata only wraps coroutines, so we do the same thing inline for this async generator
+        job_metadata.update(updated_metadata=JobMetadata(content_generation_job_id="make_llm_text_stream"))
+        log.verbose(f"{self.__class__.__name__} make_llm_text_stream: {llm_prompt_for_text}")
+        log.verbose(f"llm_setting_main: {llm_setting_main}")
+        llm_assignment = LLMAssignment(
+            job_metadata=job_metadata,
+            llm_setting=llm_setting_main,
+            llm_prompt=llm_prompt_for_text,
+        )
+        log.verbose(llm_assignment.desc, title="llm_assignment")
+        async with aclosing(llm_gen_text_stream(llm_assignment=llm_assignment)) as text_stream:
+            async for text_chunk in text_stream:
+                yield text_chunk
+
     @override
     @update_job_metadata
     async def make_object_direct(  # pyright: ignore[reportIncompatibleMethodOverride]
@@ -1,6 +1,5 @@
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, AsyncGenerator, Dict, List, Optional, Type
 
-from polyfactory.factories.pydantic_factory import ModelFactory
 from typing_extensions import override
 
 from pipelex import log
@@ -47,6 +46,18 @@ class ContentGeneratorDry(ContentGeneratorProtocol):
         generated_text = f"DRY RUN: {func_name} • llm_setting={llm_setting_main.desc()} • prompt={prompt_truncated}"
         return generated_text
 
+    @override
+    async def make_llm_text_stream(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        job_metadata: JobMetadata,
+        llm_setting_main: LLMSetting,
+        llm_prompt_for_text: LLMPrompt,
+    ) -> AsyncGenerator[str, None]:
+        func_name = "make_llm_text_stream"
+        log.dev(f"🤡 DRY RUN: {self.__class__.__name__}.{func_name}")
+        prompt_truncated = llm_prompt_for_text.desc(truncate_text_length=self._text_gen_truncate_length)
+        yield f"DRY RUN: {func_name} • llm_setting={llm_setting_main.desc()} • prompt={prompt_truncated}"
+
     @override
     @update_job_metadata
     async def make_object_direct(  # pyright: ignore[reportIncompatibleMethodOverride]
@@ -58,6 +69,8 @@ class ContentGeneratorDry(ContentGeneratorProtocol):
     ) -> BaseModelTypeVar:
         func_name = "make_object_direct"
         log.dev(f"🤡 DRY RUN: {self.__class__.__name__}.{func_name}")
+        # polyfactory is only needed for dry runs
+        from polyfactory.factories.pydantic_factory import ModelFactory
 
         class ObjectFactory(ModelFactory[object_class]):  # type: ignore
             __model__ = object_class
@@ -1,11 +1,56 @@
-from typing import List
+from contextlib import aclosing
+from typing import AsyncGenerator, List, Optional, Tuple, Type
 
 from pydantic import BaseModel
 
 from pipelex import log
 from pipelex.cogt.content_generation.assignment_models import LLMAssignment, ObjectAssignment
+from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.llm.llm_job_factory import LLMJobFactory
-from pipelex.hub import get_class_registry, get_llm_worker
+from pipelex.cogt.llm.llm_response_cache import LLMResponseCacheAbstract, make_llm_response_cache_key
+from pipelex.cogt.llm.llm_schema_cache import get_llm_schema_cache
+from pipelex.cogt.llm.llm_worker_abstract import LLMWorkerAbstract
+from pipelex.cogt.llm.llm_worker_internal_abstract import LLMWorkerInternalAbstract
+from pipelex.hub import get_class_registry, get_inference_manager, get_llm_worker
+from pipelex.pipeline.job_metadata import UnitJobId
+from pipelex.tools.typing.pydantic_utils import BaseModelTypeVar
+
+
+def _get_llm_response_cache(llm_worker: LLMWorkerAbstract) -> Optional[Tuple[LLMResponseCacheAbstract, LLMWorkerInternalAbstract]]:
+    # the cache key needs the llm_id, so workers from external plugins are not cached
+    if not isinstance(llm_worker, LLMWorkerInternalAbstract):
+        return None
+    if llm_response_cache := get_inference_manager().get_llm_response_cache():
+        return llm_response_cache, llm_worker
+    return None
+
+
+async def _gen_text_with_cache(llm_worker: LLMWorkerAbstract, llm_job: LLMJob) -> str:
+    if not (cache_and_worker := _get_llm_response_cache(llm_worker=llm_worker)):
+        return await llm_worker.gen_text(llm_job=llm_job)
+    llm_response_cache, internal_llm_worker = cache_and_worker
+    cache_key = make_llm_response_cache_key(llm_id=internal_llm_worker.llm_engine.llm_id, llm_job=llm_job)
+    if (cached_text := await llm_response_cache.get(cache_key=cache_key)) is not None:
+        log.debug(f"LLM response cache hit for {internal_llm_worker.desc}")
+        internal_llm_worker.report_cache_hit(llm_job=llm_job, unit_job_id=UnitJobId.LLM_GEN_TEXT)
+        return cached_text
+    generated_text = await llm_worker.gen_text(llm_job=llm_job)
+    await llm_response_cache.set(cache_key=cache_key, response=generated_text)
+    return generated_text
+
+
+async def _gen_object_with_cache(llm_worker: LLMWorkerAbstract, llm_job: LLMJob, schema: Type[BaseModelTypeVar]) -> BaseModelTypeVar:
+    if not (cache_and_worker := _get_llm_response_cache(llm_worker=llm_worker)):
+        return await llm_worker.gen_object(llm_job=llm_job, schema=schema)
+    llm_response_cache, internal_llm_worker = cache_and_worker
+    cache_key = make_llm_response_cache_key(llm_id=internal_llm_worker.llm_engine.llm_id, llm_job=llm_job, schema=schema)
+    if (cached_json := await llm_response_cache.get(cache_key=cache_key)) is not None:
+        log.debug(f"LLM response cache hit for {internal_llm_worker.desc}")
+        internal_llm_worker.report_cache_hit(llm_job=llm_job, unit_job_id=UnitJobId.LLM_GEN_OBJECT)
+        return schema.model_validate_json(cached_json)
+    generated_object = await llm_worker.gen_object(llm_job=llm_job, schema=schema)
+    await llm_response_cache.set(cache_key=cache_key, response=generated_object.model_dump_json())
+    return generated_object
 
 
 async def llm_gen_text(llm_assignment: LLMAssignment) -> str:
@@ -15,11 +60,41 @@ async def llm_gen_text(llm_assignment: LLMAssignment) -> str:
         llm_prompt=llm_assignment.llm_prompt,
         llm_job_params=llm_assignment.llm_job_params,
     )
-    generated_text = await llm_worker.gen_text(llm_job=llm_job)
+    generated_text = await _gen_text_with_cache(llm_worker=llm_worker, llm_job=llm_job)
     log.verbose(generated_text, title="llm_gen_text")
     return generated_text
 
 
+async def llm_gen_text_stream(llm_assignment: LLMAssignment) -> AsyncGenerator[str, None]:
+    llm_worker = get_llm_worker(llm_handle=llm_assignment.llm_handle)
+    llm_job = LLMJobFactory.make_llm_job(
+        job_metadata=llm_assignment.job_metadata,
+        llm_prompt=llm_assignment.llm_prompt,
+        llm_job_params=llm_assignment.llm_job_params,
+    )
+    cache_and_worker = _get_llm_response_cache(llm_worker=llm_worker)
+    cache_key: Optional[str] = None
+    if cache_and_worker:
+        llm_response_cache, internal_llm_worker = cache_and_worker
+        cache_key = make_llm_response_cache_key(llm_id=internal_llm_worker.llm_engine.llm_id, llm_job=llm_job)
+        if (cached_text := await llm_response_cache.get(cache_key=cache_key)) is not None:
+            log.debug(f"LLM response cache hit for {internal_llm_worker.desc}")
+            internal_llm_worker.report_cache_hit(llm_job=llm_job, unit_job_id=UnitJobId.LLM_GEN_TEXT)
+            yield cached_text
+            return
+
+    text_chunks: List[str] = []
+    async with aclosing(llm_worker.gen_text_stream(llm_job=llm_job)) as text_stream:
+        async for text_chunk in text_stream:
+            text_chunks.append(text_chunk)
+            yield text_chunk
+    generated_text = "".join(text_chunks)
+    log.verbose(generated_text, title="llm_gen_text_stream")
+    if cache_and_worker and cache_key:
+        llm_response_cache, _ = cache_and_worker
+        await llm_response_cache.set(cache_key=cache_key, response=generated_text)
+
+
 async def llm_gen_object(object_assignment: ObjectAssignment) -> BaseModel:
     llm_assignment = object_assignment.llm_assignment_for_object
     log.verbose(f"llm_gen_object to generate a: '{object_assignment.object_class_name}'")
@@ -31,7 +106,8 @@ async def llm_gen_object(object_assignment: ObjectAssignment) -> BaseModel:
     )
     content_class_name = object_assignment.object_class_name
     content_class = get_class_registry().get_required_base_model(name=content_class_name)
-    generated_object: BaseModel = await llm_worker.gen_object(
+    generated_object: BaseModel = await _gen_object_with_cache(
+        llm_worker=llm_worker,
         llm_job=llm_job,
         schema=content_class,
     )
@@ -49,13 +125,12 @@ async def llm_gen_object_list(object_assignment: ObjectAssignment) -> List[BaseM
     )
     item_class_name = object_assignment.object_class_name
     item_class = get_class_registry().get_required_class(name=item_class_name)
+    list_schema = get_llm_schema_cache().get_list_schema(item_class=item_class)
 
-    class ListSchema(BaseModel):
-        items: List[item_class]  # type: ignore
-
-    wrapped_list: ListSchema = await llm_worker.gen_object(
+    wrapped_list = await _gen_object_with_cache(
+        llm_worker=llm_worker,
         llm_job=llm_job,
-        schema=ListSchema,
+        schema=list_schema,
     )
-    generated_list: List[BaseModel] = wrapped_list.items  # pyright: ignore[reportUnknownMemberType]
+    generated_list: List[BaseModel] = getattr(wrapped_list, "items")
     return generated_list
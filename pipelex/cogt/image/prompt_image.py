@@ -13,6 +13,9 @@ class PromptImageTypedBytes(CustomBaseModel):
     base_64: bytes
     file_type: FileType
 
+    def make_data_url(self) -> str:
+        return f"data:{self.file_type.mime};base64,{self.base_64.decode('utf-8')}"
+
 
 PromptImageTypedBytesOrUrl = Union[PromptImageTypedBytes, str]
 
@@ -0,0 +1,105 @@
+import io
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from pydantic import Field
+
+from pipelex.tools.config.models import ConfigModel
+from pipelex.tools.misc.filetype_utils import FileType
+from pipelex.types import StrEnum
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# when max_bytes is still exceeded at the lowest quality, the image is shrunk by this factor until it fits
+PROMPT_IMAGE_SHRINK_FACTOR = 0.75
+PROMPT_IMAGE_MIN_QUALITY = 40
+PROMPT_IMAGE_MIN_EDGE_PIXELS = 64
+
+
+class PromptImageFormat(StrEnum):
+    JPEG = "jpeg"
+    PNG = "png"
+    WEBP = "webp"
+
+    @property
+    def file_type(self) -> FileType:
+        match self:
+            case PromptImageFormat.JPEG:
+                return FileType(extension="jpg", mime="image/jpeg")
+            case PromptImageFormat.PNG:
+                return FileType(extension="png", mime="image/png")
+            case PromptImageFormat.WEBP:
+                return FileType(extension="webp", mime="image/webp")
+
+    @property
+    def is_lossy(self) -> bool:
+        return self != PromptImageFormat.PNG
+
+
+class PromptImageBudget(ConfigModel):
+    """Limits applied to the images sent to an LLM: images above them are downscaled and recompressed.
+
+    The images stored in the working memory are left untouched, only the payloads sent to the LLM are reduced.
+    """
+
+    max_edge_pixels: Optional[int] = Field(default=None, gt=0)
+    max_bytes: Optional[int] = Field(default=None, gt=0)
+    target_format: Optional[PromptImageFormat] = Field(default=None, strict=False)
+    quality: int = Field(default=85, ge=1, le=100)
+
+    @property
+    def cache_key(self) -> Tuple[str, ...]:
+        return (str(self.max_edge_pixels), str(self.max_bytes), str(self.target_format), str(self.quality))
+
+    def apply(self, image_bytes: bytes, file_type: FileType) -> Tuple[bytes, FileType]:
+        """Downscale and recompress an image to fit the budget. This is CPU-bound, it's meant to run in a thread.
+
+        Returns the original bytes and file type if the image already fits the budget.
+        """
+        from PIL import Image
+
+        image = Image.open(io.BytesIO(image_bytes))
+        is_too_large = bool(self.max_edge_pixels and max(image.size) > self.max_edge_pixels)
+        is_too_heavy = bool(self.max_bytes and len(image_bytes) > self.max_bytes)
+        is_format_changed = self.target_format is not None and self.target_format.file_type.mime != file_type.mime
+        if not (is_too_large or is_too_heavy or is_format_changed):
+            return image_bytes, file_type
+
+        target_format = self.target_format or self._get_default_target_format(image=image)
+        if self.max_edge_pixels and max(image.size) > self.max_edge_pixels:
+            image.thumbnail((self.max_edge_pixels, self.max_edge_pixels), Image.Resampling.LANCZOS)
+        if target_format == PromptImageFormat.JPEG and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+
+        quality = self.quality
+        encoded_bytes = self._encode(image=image, target_format=target_format, quality=quality)
+        if self.max_bytes:
+            while len(encoded_bytes) > self.max_bytes:
+                if target_format.is_lossy and quality > PROMPT_IMAGE_MIN_QUALITY:
+                    quality = max(PROMPT_IMAGE_MIN_QUALITY, quality - 15)
+                elif min(image.size) * PROMPT_IMAGE_SHRINK_FACTOR >= PROMPT_IMAGE_MIN_EDGE_PIXELS:
+                    new_size = (int(image.size[0] * PROMPT_IMAGE_SHRINK_FACTOR), int(image.size[1] * PROMPT_IMAGE_SHRINK_FACTOR))
+                    image = image.resize(new_size, Image.Resampling.LANCZOS)
+                else:
+                    break
+                encoded_bytes = self._encode(image=image, target_format=target_format, quality=quality)
+        return encoded_bytes, target_format.file_type
+
+    @staticmethod
+    def _get_default_target_format(image: "Image.Image") -> PromptImageFormat:
+        # keep transparency and lossless images as PNG, photos and scans are better off as JPEG
+        if image.format == "PNG" and image.mode in ("RGBA", "LA", "P"):
+            return PromptImageFormat.PNG
+        return PromptImageFormat.JPEG
+
+    @staticmethod
+    def _encode(image: "Image.Image", target_format: PromptImageFormat, quality: int) -> bytes:
+        buffer = io.BytesIO()
+        match target_format:
+            case PromptImageFormat.JPEG:
+                image.save(buffer, format="JPEG", quality=quality, optimize=True)
+            case PromptImageFormat.PNG:
+                image.save(buffer, format="PNG", optimize=True)
+            case PromptImageFormat.WEBP:
+                image.save(buffer, format="WEBP", quality=quality)
+        return buffer.getvalue()
@@ -2,11 +2,7 @@ from typing import Optional
 
 from pipelex.cogt.exceptions import PromptImageFactoryError
 from pipelex.cogt.image.prompt_image import PromptImage, PromptImageBytes, PromptImagePath, PromptImageUrl
-from pipelex.tools.misc.base_64_utils import (
-    encode_to_base64_async,
-    load_binary_as_base64_async,
-)
-from pipelex.tools.misc.file_fetch_utils import fetch_file_from_url_httpx_async
+from pipelex.hub import get_inference_manager
 from pipelex.tools.misc.path_utils import clarify_path_or_url
 
 
@@ -43,18 +39,10 @@ class PromptImageFactory:
         cls,
         prompt_image_url: PromptImageUrl,
     ) -> PromptImageBytes:
-        raw_image_bytes = await fetch_file_from_url_httpx_async(prompt_image_url.url)
-        base_64 = await encode_to_base64_async(raw_image_bytes)
-        return PromptImageBytes(base_64=base_64)
+        typed_bytes = await get_inference_manager().get_prompt_image_preparer().prepare_typed_bytes(prompt_image=prompt_image_url)
+        return PromptImageBytes(base_64=typed_bytes.base_64)
 
     @classmethod
     async def promptimage_to_b64_async(cls, image_prompt: PromptImage) -> bytes:
-        if isinstance(image_prompt, PromptImagePath):
-            return await load_binary_as_base64_async(image_prompt.file_path)
-        elif isinstance(image_prompt, PromptImageBytes):
-            return image_prompt.base_64
-        elif isinstance(image_prompt, PromptImageUrl):
-            image_bytes = await cls.make_promptimagebytes_from_url_async(image_prompt)
-            return image_bytes.base_64
-        else:
-            raise PromptImageFactoryError(f"Unknown PromptImage type: {image_prompt}")
+        typed_bytes = await get_inference_manager().get_prompt_image_preparer().prepare_typed_bytes(prompt_image=image_prompt)
+        return typed_bytes.base_64
@@ -0,0 +1,162 @@
+import asyncio
+import base64
+import hashlib
+import os
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+import aiofiles
+
+from pipelex.cogt.exceptions import PromptImageFactoryError
+from pipelex.cogt.image.prompt_image import (
+    PromptImage,
+    PromptImageBytes,
+    PromptImagePath,
+    PromptImageTypedBytes,
+    PromptImageTypedBytesOrUrl,
+    PromptImageUrl,
+)
+from pipelex.cogt.image.prompt_image_budget import PromptImageBudget
+from pipelex.tools.misc.file_fetch_utils import fetch_file_from_url_httpx_async
+from pipelex.tools.misc.filetype_utils import FileType, detect_file_type_from_base64, detect_file_type_from_bytes
+
+# enough base64 characters to decode the 262 bytes that file type detection looks at
+FILE_TYPE_DETECTION_B64_PREFIX_LENGTH = 360
+
+PreparedImageKey = Tuple[str, ...]
+
+
+def detect_file_type_from_base64_prefix(b64: bytes) -> FileType:
+    """Detect the file type of a base64 payload, without decoding all of it."""
+    return detect_file_type_from_base64(b64[:FILE_TYPE_DETECTION_B64_PREFIX_LENGTH])
+
+
+class PromptImagePreparer:
+    """Prepares the base64 payloads of prompt images, with their file type, for the LLM workers.
+
+    Image files are read asynchronously and the payloads are kept in an LRU cache bounded by their total size,
+    keyed by path, modification time and size for files and by url for downloaded images. So an image which is sent
+    to several LLM steps is read, encoded and typed once. With an image budget, the image is downscaled and recompressed
+    in a worker thread, and the reduced payload is cached under the image key and the budget.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._payloads: OrderedDict[PreparedImageKey, PromptImageTypedBytes] = OrderedDict()
+        self._nb_bytes = 0
+
+    @property
+    def nb_bytes(self) -> int:
+        return self._nb_bytes
+
+    def clear(self):
+        self._payloads.clear()
+        self._nb_bytes = 0
+
+    def _get_cached(self, key: PreparedImageKey) -> Optional[PromptImageTypedBytes]:
+        if typed_bytes := self._payloads.get(key):
+            self._payloads.move_to_end(key)
+        return typed_bytes
+
+    def _set_cached(self, key: PreparedImageKey, typed_bytes: PromptImageTypedBytes):
+        payload_size = len(typed_bytes.base_64)
+        if payload_size > self.max_bytes:
+            return
+        if previous := self._payloads.pop(key, None):
+            self._nb_bytes -= len(previous.base_64)
+        self._payloads[key] = typed_bytes
+        self._nb_bytes += payload_size
+        while self._nb_bytes > self.max_bytes:
+            _, evicted = self._payloads.popitem(last=False)
+            self._nb_bytes -= len(evicted.base_64)
+
+    @staticmethod
+    async def _encode_raw_bytes(raw_bytes: bytes) -> PromptImageTypedBytes:
+        file_type = detect_file_type_from_bytes(buf=raw_bytes)
+        base_64 = await asyncio.to_thread(base64.b64encode, raw_bytes)
+        return PromptImageTypedBytes(base_64=base_64, file_type=file_type)
+
+    @staticmethod
+    def _apply_image_budget(raw_bytes: bytes, image_budget: PromptImageBudget) -> PromptImageTypedBytes:
+        file_type = detect_file_type_from_bytes(buf=raw_bytes)
+        budgeted_bytes, budgeted_file_type = image_budget.apply(image_bytes=raw_bytes, file_type=file_type)
+        return PromptImageTypedBytes(base_64=base64.b64encode(budgeted_bytes), file_type=budgeted_file_type)
+
+    @staticmethod
+    def _make_source_key(prompt_image: PromptImage) -> PreparedImageKey:
+        if isinstance(prompt_image, PromptImagePath):
+            file_stat = os.stat(prompt_image.file_path)
+            return ("path", os.path.abspath(prompt_image.file_path), str(file_stat.st_mtime_ns), str(file_stat.st_size))
+        elif isinstance(prompt_image, PromptImageUrl):
+            return ("url", prompt_image.url)
+        elif isinstance(prompt_image, PromptImageBytes):
+            return ("bytes", hashlib.sha256(prompt_image.base_64).hexdigest())
+        else:
+            raise PromptImageFactoryError(f"Unknown PromptImage type: {prompt_image}")
+
+    @staticmethod
+    async def _load_raw_bytes(prompt_image: PromptImage) -> bytes:
+        if isinstance(prompt_image, PromptImagePath):
+            async with aiofiles.open(prompt_image.file_path, "rb") as fp:  # type: ignore[reportUnknownMemberType]
+                return await fp.read()
+        elif isinstance(prompt_image, PromptImageUrl):
+            return await fetch_file_from_url_httpx_async(prompt_image.url)
+        elif isinstance(prompt_image, PromptImageBytes):
+            return await asyncio.to_thread(base64.b64decode, prompt_image.base_64)
+        else:
+            raise PromptImageFactoryError(f"Unknown PromptImage type: {prompt_image}")
+
+    async def prepare_typed_bytes(
+        self,
+        prompt_image: PromptImage,
+        image_budget: Optional[PromptImageBudget] = None,
+    ) -> PromptImageTypedBytes:
+        if image_budget is None and isinstance(prompt_image, PromptImageBytes):
+            # already in memory and encoded, only its file type is needed
+            return PromptImageTypedBytes(base_64=prompt_image.base_64, file_type=detect_file_type_from_base64_prefix(prompt_image.base_64))
+
+        key = self._make_source_key(prompt_image=prompt_image)
+        if image_budget is not None:
+            key += ("budget",) + image_budget.cache_key
+        if cached_typed_bytes := self._get_cached(key=key):
+            return cached_typed_bytes
+
+        raw_bytes = await self._load_raw_bytes(prompt_image=prompt_image)
+        typed_bytes: PromptImageTypedBytes
+        if image_budget is None:
+            typed_bytes = await self._encode_raw_bytes(raw_bytes=raw_bytes)
+        else:
+            typed_bytes = await asyncio.to_thread(self._apply_image_budget, raw_bytes, image_budget)
+        self._set_cached(key=key, typed_bytes=typed_bytes)
+        return typed_bytes
+
+    async def prepare_typed_bytes_or_url(
+        self,
+        prompt_image: PromptImage,
+        image_budget: Optional[PromptImageBudget] = None,
+    ) -> PromptImageTypedBytesOrUrl:
+        """Same as prepare_typed_bytes, except that urls are kept as such, for the providers which fetch them.
+
+        With an image budget, the image has to be downloaded to be reduced, so it's sent as bytes.
+        """
+        if image_budget is None and isinstance(prompt_image, PromptImageUrl):
+            return prompt_image.url
+        return await self.prepare_typed_bytes(prompt_image=prompt_image, image_budget=image_budget)
+
+    async def prepare_all_typed_bytes(
+        self,
+        prompt_images: Sequence[PromptImage],
+        image_budget: Optional[PromptImageBudget] = None,
+    ) -> List[PromptImageTypedBytes]:
+        return await asyncio.gather(
+            *(self.prepare_typed_bytes(prompt_image=prompt_image, image_budget=image_budget) for prompt_image in prompt_images)
+        )
+
+    async def prepare_all_typed_bytes_or_urls(
+        self,
+        prompt_images: Sequence[PromptImage],
+        image_budget: Optional[PromptImageBudget] = None,
+    ) -> List[PromptImageTypedBytesOrUrl]:
+        return await asyncio.gather(
+            *(self.prepare_typed_bytes_or_url(prompt_image=prompt_image, image_budget=image_budget) for prompt_image in prompt_images)
+        )
@@ -6,7 +6,6 @@ from pipelex.cogt.imgg.imgg_platform import ImggPlatform
 from pipelex.cogt.imgg.imgg_worker_abstract import ImggWorkerAbstract
 from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
 from pipelex.hub import get_plugin_manager, get_secret
-from pipelex.plugins.openai.openai_imgg_worker import OpenAIImggWorker
 from pipelex.plugins.plugin_sdk_registry import PluginSdkHandle
 from pipelex.reporting.reporting_protocol import ReportingProtocol
 from pipelex.tools.secrets.secrets_errors import SecretNotFoundError
@@ -55,6 +54,7 @@ class ImggWorkerFactory:
                 )
             case ImggPlatform.OPENAI:
                 from pipelex.plugins.openai.openai_factory import OpenAIFactory
+                from pipelex.plugins.openai.openai_imgg_worker import OpenAIImggWorker
 
                 imgg_sdk_instance = plugin_sdk_registry.get_llm_sdk_instance(
                     llm_sdk_handle=imgg_sdk_handle
@@ -1,6 +1,5 @@
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import pandas as pd
 from pydantic import Field, RootModel
 from rich import box
 from rich.console import Console
@@ -11,13 +10,19 @@ from pipelex.cogt.exceptions import CostRegistryError
 from pipelex.cogt.llm.llm_report import LLMTokenCostReport, LLMTokenCostReportField, LLMTokensUsage, model_cost_per_token
 from pipelex.cogt.llm.token_category import TokenCategory
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 CostRegistryRoot = List[LLMTokenCostReport]
 
 
 class CostRegistry(RootModel[CostRegistryRoot]):
     root: CostRegistryRoot = Field(default_factory=list)
 
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self) -> "pd.DataFrame":
+        # pandas is slow to import and only needed to generate the reports
+        import pandas as pd
+
         records: List[Dict[str, Any]] = []
         for token_cost_report in self.root:
             record_dict = token_cost_report.as_flat_dictionary()
@@ -32,14 +37,19 @@ class CostRegistry(RootModel[CostRegistryRoot]):
         llm_tokens_usages: List[LLMTokensUsage],
         unit_scale: float,
         cost_report_file_path: Optional[str] = None,
+        completed_cost_reports: Optional[List[LLMTokenCostReport]] = None,
     ):
-        if not llm_tokens_usages:
+        """
+        Generate the report of the llm_tokens_usages, plus the completed_cost_reports if any,
+        which are cost reports already completed from usages, e.g. reloaded from disk.
+        """
+        if not llm_tokens_usages and not completed_cost_reports:
             if pipeline_run_id != "untitled":
                 log.warning(f"No report to generate for pipeline '{pipeline_run_id}'")
             else:
                 log.verbose(f"No report to generate for pipeline '{pipeline_run_id}'")
             return
-        cost_registry = CostRegistry()
+        cost_registry = CostRegistry(root=list(completed_cost_reports or []))
         for llm_tokens_usage in llm_tokens_usages:
             cost_report = cls.complete_cost_report(llm_tokens_usage=llm_tokens_usage)
             cost_registry.root.append(cost_report)
@@ -49,15 +59,19 @@ class CostRegistry(RootModel[CostRegistryRoot]):
         # Calculate total costs overall
         total_nb_tokens_input_cached = cost_registry_df[LLMTokenCostReportField.NB_TOKENS_INPUT_CACHED].sum()  # pyright: ignore[reportUnknownMemberType]
         total_nb_tokens_input_non_cached = cost_registry_df[LLMTokenCostReportField.NB_TOKENS_INPUT_NON_CACHED].sum()  # pyright: ignore[reportUnknownMemberType]
+        total_nb_tokens_input_cache_write = cost_registry_df[LLMTokenCostReportField.NB_TOKENS_INPUT_CACHE_WRITE].sum()  # pyright: ignore[reportUnknownMemberType]
         total_nb_tokens_input_joined = cost_registry_df[LLMTokenCostReportField.NB_TOKENS_INPUT_JOINED].sum()  # pyright: ignore[reportUnknownMemberType]
         total_nb_tokens_output = cost_registry_df[LLMTokenCostReportField.NB_TOKENS_OUTPUT].sum()  # pyright: ignore[reportUnknownMemberType]
         total_cost_input_cached = cost_registry_df[LLMTokenCostReportField.COST_INPUT_CACHED].sum()  # pyright: ignore[reportUnknownMemberType]
         total_cost_input_non_cached = cost_registry_df[LLMTokenCostReportField.COST_INPUT_NON_CACHED].sum()  # pyright: ignore[reportUnknownMemberType]
+        total_cost_input_cache_write = cost_registry_df[LLMTokenCostReportField.COST_INPUT_CACHE_WRITE].sum()  # pyright: ignore[reportUnknownMemberType]
         total_cost_input_joined = cost_registry_df[LLMTokenCostReportField.COST_INPUT_JOINED].sum()  # pyright: ignore[reportUnknownMemberType]
         total_cost_output = cost_registry_df[LLMTokenCostReportField.COST_OUTPUT].sum()  # pyright: ignore[reportUnknownMemberType]
+        total_nb_cache_hits = cost_registry_df[LLMTokenCostReportField.IS_CACHE_HIT].sum()  # pyright: ignore[reportUnknownMemberType]
         total_cost = cls.compute_total_cost(
             input_non_cached_cost=total_cost_input_non_cached,
             input_cached_cost=total_cost_input_cached,
+            input_cache_write_cost=total_cost_input_cache_write,
             output_cost=total_cost_output,
         )
 
@@ -67,12 +81,15 @@ class CostRegistry(RootModel[CostRegistryRoot]):
             {
                 LLMTokenCostReportField.NB_TOKENS_INPUT_CACHED: "sum",
                 LLMTokenCostReportField.NB_TOKENS_INPUT_NON_CACHED: "sum",
+                LLMTokenCostReportField.NB_TOKENS_INPUT_CACHE_WRITE: "sum",
                 LLMTokenCostReportField.NB_TOKENS_INPUT_JOINED: "sum",
                 LLMTokenCostReportField.NB_TOKENS_OUTPUT: "sum",
                 LLMTokenCostReportField.COST_INPUT_CACHED: "sum",
                 LLMTokenCostReportField.COST_INPUT_NON_CACHED: "sum",
+                LLMTokenCostReportField.COST_INPUT_CACHE_WRITE: "sum",
                 LLMTokenCostReportField.COST_INPUT_JOINED: "sum",
                 LLMTokenCostReportField.COST_OUTPUT: "sum",
+                LLMTokenCostReportField.IS_CACHE_HIT: "sum",
             }
         ).reset_index()
         if agg_by_llm_name is None or agg_by_llm_name.empty:  # pyright: ignore[reportUnnecessaryComparison]
@@ -90,12 +107,15 @@ class CostRegistry(RootModel[CostRegistryRoot]):
             scale_str = str(unit_scale)
         # Add columns
         table.add_column("Model", style="cyan")
+        table.add_column("Cache Hits", justify="right", style="green")
         table.add_column("Input Cached", justify="right", style="green")
         table.add_column("Input Non Cached", justify="right", style="green")
+        table.add_column("Input Cache Write", justify="right", style="green")
         table.add_column("Input Joined", justify="right", style="green")
         table.add_column("Output", justify="right", style="green")
         table.add_column(f"Input Cached Cost ({scale_str}$)", justify="right", style="yellow")
         table.add_column(f"Input Non Cached Cost ({scale_str}$)", justify="right", style="yellow")
+        table.add_column(f"Input Cache Write Cost ({scale_str}$)", justify="right", style="yellow")
         table.add_column(f"Input Joined Cost ({scale_str}$)", justify="right", style="yellow")
         table.add_column(f"Output Cost ({scale_str}$)", justify="right", style="yellow")
         table.add_column(f"Total Cost ({scale_str}$)", justify="right", style="bold yellow")
@@ -105,16 +125,20 @@ class CostRegistry(RootModel[CostRegistryRoot]):
             row_total_cost = cls.compute_total_cost(
                 input_non_cached_cost=row[LLMTokenCostReportField.COST_INPUT_NON_CACHED],  # pyright: ignore[reportUnknownArgumentType]
                 input_cached_cost=row[LLMTokenCostReportField.COST_INPUT_CACHED],  # pyright: ignore[reportUnknownArgumentType]
+                input_cache_write_cost=row[LLMTokenCostReportField.COST_INPUT_CACHE_WRITE],  # pyright: ignore[reportUnknownArgumentType]
                 output_cost=row[LLMTokenCostReportField.COST_OUTPUT],  # pyright: ignore[reportUnknownArgumentType]
             )
             table.add_row(
                 llm_name,  # pyright: ignore[reportUnknownArgumentType]
+                f"{row[LLMTokenCostReportField.IS_CACHE_HIT]:,}",  # pyright: ignore[reportUnknownVariableType]
                 f"{row[LLMTokenCostReportField.NB_TOKENS_INPUT_CACHED]:,}",  # pyright: ignore[reportUnknownVariableType]
                 f"{row[LLMTokenCostReportField.NB_TOKENS_INPUT_NON_CACHED]:,}",  # pyright: ignore[reportUnknownVariableType]
+                f"{row[LLMTokenCostReportField.NB_TOKENS_INPUT_CACHE_WRITE]:,}",  # pyright: ignore[reportUnknownVariableType]
                 f"{row[LLMTokenCostReportField.NB_TOKENS_INPUT_JOINED]:,}",  # pyright: ignore[reportUnknownVariableType]
                 f"{row[LLMTokenCostReportField.NB_TOKENS_OUTPUT]:,}",  # pyright: ignore[reportUnknownVariableType]
                 f"{row[LLMTokenCostReportField.COST_INPUT_CACHED] / unit_scale:.4f}",  # pyright: ignore[reportUnknownVariableType]
                 f"{row[LLMTokenCostReportField.COST_INPUT_NON_CACHED] / unit_scale:.4f}",  # pyright: ignore[reportUnknownVariableType]
+                f"{row[LLMTokenCostReportField.COST_INPUT_CACHE_WRITE] / unit_scale:.4f}",  # pyright: ignore[reportUnknownVariableType]
                 f"{row[LLMTokenCostReportField.COST_INPUT_JOINED] / unit_scale:.4f}",  # pyright: ignore[reportUnknownVariableType]
                 f"{row[LLMTokenCostReportField.COST_OUTPUT] / unit_scale:.4f}",  # pyright: ignore[reportUnknownVariableType]
                 f"{row_total_cost / unit_scale:.4f}",  # pyright: ignore[reportUnknownVariableType]
@@ -124,12 +148,15 @@ class CostRegistry(RootModel[CostRegistryRoot]):
         footer_style = "bold"
         table.add_row(
             "Total",
+            f"{total_nb_cache_hits:,}",
             f"{total_nb_tokens_input_cached:,}",
             f"{total_nb_tokens_input_non_cached:,}",
+            f"{total_nb_tokens_input_cache_write:,}",
             f"{total_nb_tokens_input_joined:,}",
             f"{total_nb_tokens_output:,}",
             f"{total_cost_input_cached / unit_scale:.4f}",
             f"{total_cost_input_non_cached / unit_scale:.4f}",
+            f"{total_cost_input_cache_write / unit_scale:.4f}",
             f"{total_cost_input_joined / unit_scale:.4f}",
             f"{total_cost_output / unit_scale:.4f}",
             f"{total_cost / unit_scale:.4f}",
@@ -146,8 +173,14 @@ class CostRegistry(RootModel[CostRegistryRoot]):
             )
 
     @classmethod
-    def compute_total_cost(cls, input_non_cached_cost: float, input_cached_cost: float, output_cost: float) -> float:
-        return input_non_cached_cost + input_cached_cost + output_cost
+    def compute_total_cost(
+        cls,
+        input_non_cached_cost: float,
+        input_cached_cost: float,
+        input_cache_write_cost: float,
+        output_cost: float,
+    ) -> float:
+        return input_non_cached_cost + input_cached_cost + input_cache_write_cost + output_cost
 
     @classmethod
     def complete_cost_report(cls, llm_tokens_usage: LLMTokensUsage) -> LLMTokenCostReport:
@@ -160,17 +193,21 @@ class CostRegistry(RootModel[CostRegistryRoot]):
         cost_report.costs_by_token_category.pop(TokenCategory.INPUT, None)
 
         nb_tokens_input_cached = cost_report.nb_tokens_by_category.get(TokenCategory.INPUT_CACHED, 0)
-        nb_tokens_input_non_cached = nb_tokens_input_joined - nb_tokens_input_cached
+        nb_tokens_input_cache_write = cost_report.nb_tokens_by_category.get(TokenCategory.INPUT_CACHE_WRITE, 0)
+        nb_tokens_input_non_cached = nb_tokens_input_joined - nb_tokens_input_cached - nb_tokens_input_cache_write
         cost_report.nb_tokens_by_category[TokenCategory.INPUT_JOINED] = nb_tokens_input_joined
         cost_report.nb_tokens_by_category[TokenCategory.INPUT_NON_CACHED] = nb_tokens_input_non_cached
         cost_report.nb_tokens_by_category[TokenCategory.INPUT_CACHED] = nb_tokens_input_cached
+        cost_report.nb_tokens_by_category[TokenCategory.INPUT_CACHE_WRITE] = nb_tokens_input_cache_write
 
         cost_report.costs_by_token_category[TokenCategory.INPUT_NON_CACHED] = nb_tokens_input_non_cached * model_cost_per_token(
             llm_engine=llm_tokens_usage.llm_engine, token_type=TokenCategory.INPUT_NON_CACHED
         )
         costs_input_cached = cost_report.costs_by_token_category.get(TokenCategory.INPUT_CACHED, 0)
         cost_report.costs_by_token_category[TokenCategory.INPUT_CACHED] = costs_input_cached
+        costs_input_cache_write = cost_report.costs_by_token_category.get(TokenCategory.INPUT_CACHE_WRITE, 0)
+        cost_report.costs_by_token_category[TokenCategory.INPUT_CACHE_WRITE] = costs_input_cache_write
         cost_report.costs_by_token_category[TokenCategory.INPUT_JOINED] = (
-            costs_input_cached + cost_report.costs_by_token_category[TokenCategory.INPUT_NON_CACHED]
+            costs_input_cached + costs_input_cache_write + cost_report.costs_by_token_category[TokenCategory.INPUT_NON_CACHED]
         )
         return cost_report
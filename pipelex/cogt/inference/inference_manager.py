@@ -1,15 +1,22 @@
-from typing import Dict, Type
+from typing import Dict, Optional, Type
 
 from typing_extensions import override
 
 from pipelex import log
 from pipelex.cogt.exceptions import InferenceManagerWorkerSetupError
+from pipelex.cogt.image.prompt_image_preparer import PromptImagePreparer
 from pipelex.cogt.imgg.imgg_engine_factory import ImggEngineFactory
 from pipelex.cogt.imgg.imgg_worker_abstract import ImggWorkerAbstract
 from pipelex.cogt.imgg.imgg_worker_factory import ImggWorkerFactory
 from pipelex.cogt.inference.inference_manager_protocol import InferenceManagerProtocol
 from pipelex.cogt.llm.llm_models.llm_engine_blueprint import LLMEngineBlueprint
 from pipelex.cogt.llm.llm_models.llm_engine_factory import LLMEngineFactory
+from pipelex.cogt.llm.llm_response_cache import (
+    LLMResponseCacheAbstract,
+    LLMResponseCacheBackend,
+    LLMResponseCacheLRU,
+    LLMResponseCacheSqlite,
+)
 from pipelex.cogt.llm.llm_worker_abstract import LLMWorkerAbstract
 from pipelex.cogt.llm.llm_worker_factory import LLMWorkerFactory
 from pipelex.cogt.llm.llm_worker_internal_abstract import LLMWorkerInternalAbstract
@@ -27,6 +34,8 @@ class InferenceManager(InferenceManagerProtocol):
         self.llm_workers: Dict[str, LLMWorkerAbstract] = {}
         self.imgg_workers: Dict[str, ImggWorkerAbstract] = {}
         self.ocr_workers: Dict[str, OcrWorkerAbstract] = {}
+        self.llm_response_cache: Optional[LLMResponseCacheAbstract] = None
+        self.prompt_image_preparer: Optional[PromptImagePreparer] = None
 
     @override
     def teardown(self):
@@ -41,6 +50,12 @@ class InferenceManager(InferenceManagerProtocol):
         for ocr_worker in self.ocr_workers.values():
             ocr_worker.teardown()
         self.ocr_workers = {}
+        if self.llm_response_cache:
+            self.llm_response_cache.teardown()
+            self.llm_response_cache = None
+        if self.prompt_image_preparer:
+            self.prompt_image_preparer.clear()
+            self.prompt_image_preparer = None
         log.verbose("InferenceManager teardown done")
 
     def print_workers(self):
@@ -113,6 +128,32 @@ class InferenceManager(InferenceManagerProtocol):
                 log.warning(f"LLM worker for '{llm_handle}' already registered, skipping")
         self.llm_workers[llm_handle] = llm_worker_class(reporting_delegate=get_report_delegate())
 
+    @override
+    def get_llm_response_cache(self) -> Optional[LLMResponseCacheAbstract]:
+        response_cache_config = get_config().cogt.llm_config.response_cache_config
+        if not response_cache_config.is_enabled:
+            return None
+        if self.llm_response_cache is None:
+            match response_cache_config.backend:
+                case LLMResponseCacheBackend.LRU:
+                    self.llm_response_cache = LLMResponseCacheLRU(
+                        max_entries=response_cache_config.max_entries,
+                        ttl_seconds=response_cache_config.applied_ttl_seconds,
+                    )
+                case LLMResponseCacheBackend.SQLITE:
+                    self.llm_response_cache = LLMResponseCacheSqlite(
+                        sqlite_path=response_cache_config.sqlite_path,
+                        max_entries=response_cache_config.max_entries,
+                        ttl_seconds=response_cache_config.applied_ttl_seconds,
+                    )
+        return self.llm_response_cache
+
+    @override
+    def get_prompt_image_preparer(self) -> PromptImagePreparer:
+        if self.prompt_image_preparer is None:
+            self.prompt_image_preparer = PromptImagePreparer(max_bytes=get_config().cogt.llm_config.prompt_images_cache_max_bytes)
+        return self.prompt_image_preparer
+
     ####################################################################################################
     # Manage IMGG Workers
     ####################################################################################################
@@ -1,6 +1,8 @@
-from typing import Protocol, Type
+from typing import Optional, Protocol, Type
 
+from pipelex.cogt.image.prompt_image_preparer import PromptImagePreparer
 from pipelex.cogt.imgg.imgg_worker_abstract import ImggWorkerAbstract
+from pipelex.cogt.llm.llm_response_cache import LLMResponseCacheAbstract
 from pipelex.cogt.llm.llm_worker_abstract import LLMWorkerAbstract
 from pipelex.cogt.ocr.ocr_worker_abstract import OcrWorkerAbstract
 
@@ -28,6 +30,10 @@ class InferenceManagerProtocol(Protocol):
         should_warn_if_already_registered: bool = True,
     ): ...
 
+    def get_llm_response_cache(self) -> Optional[LLMResponseCacheAbstract]: ...
+
+    def get_prompt_image_preparer(self) -> PromptImagePreparer: ...
+
     ####################################################################################################
     # IMG Generation Workers
     ####################################################################################################
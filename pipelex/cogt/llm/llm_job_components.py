@@ -2,6 +2,7 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from pipelex.cogt.image.prompt_image_budget import PromptImageBudget
 from pipelex.cogt.llm.llm_report import LLMTokensUsage
 
 ########################################################################
@@ -13,6 +14,7 @@ class LLMJobParams(BaseModel):
     temperature: float = Field(..., ge=0, le=1)
     max_tokens: Optional[int] = Field(None, gt=0)
     seed: Optional[int] = Field(None, ge=0)
+    image_budget: Optional[PromptImageBudget] = None
 
 
 class LLMJobConfig(BaseModel):
@@ -1,6 +1,6 @@
-from typing import Dict, Optional, Union
+from typing import Any, Dict, Optional, Union, cast
 
-from pydantic import field_validator, model_validator
+from pydantic import PrivateAttr, field_validator, model_validator
 from typing_extensions import Self, override
 
 from pipelex.cogt.exceptions import LLMDeckValidatonError, LLMHandleNotFoundError, LLMPresetNotFoundError, LLMSettingsValidationError
@@ -8,6 +8,8 @@ from pipelex.cogt.llm.llm_models.llm_deck_abstract import LLMDeckAbstract
 from pipelex.cogt.llm.llm_models.llm_engine_blueprint import LLMEngineBlueprint
 from pipelex.cogt.llm.llm_models.llm_family import LLMFamily
 from pipelex.cogt.llm.llm_models.llm_model import LLMModel
+from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
+from pipelex.cogt.llm.llm_models.llm_rate_limit import LLM_RATE_LIMIT_DEFAULT_KEY, LLMPlatformRateLimits, LLMRateLimit
 from pipelex.cogt.llm.llm_models.llm_setting import LLMSetting, LLMSettingChoices, LLMSettingOrPresetId
 from pipelex.hub import get_llm_models_provider
 from pipelex.tools.config.models import ConfigModel
@@ -17,6 +19,10 @@ LLM_PRESET_DISABLED = "disabled"
 
 
 class LLMDeck(LLMDeckAbstract, ConfigModel):
+    # memoized resolution of llm handles into llm models: a reloaded deck is a new instance,
+    # and the memo is reset when handles are added
+    _llm_models_by_handle: Dict[str, Optional[LLMModel]] = PrivateAttr(default_factory=dict)
+
     ############################################################
     # LLMDeckAbstract overrides
     ############################################################
@@ -52,6 +58,8 @@ class LLMDeck(LLMDeckAbstract, ConfigModel):
 
     @override
     def find_llm_model(self, llm_handle: str) -> LLMModel:
+        if llm_model := self._llm_models_by_handle.get(llm_handle):
+            return llm_model
         llm_models_provider = get_llm_models_provider()
         llm_engine_blueprint = self.llm_handles[llm_handle]
         llm_model = llm_models_provider.get_llm_model(
@@ -59,10 +67,13 @@ class LLMDeck(LLMDeckAbstract, ConfigModel):
             llm_version=llm_engine_blueprint.llm_version,
             llm_platform_choice=llm_engine_blueprint.llm_platform_choice,
         )
+        self._llm_models_by_handle[llm_handle] = llm_model
         return llm_model
 
     @override
     def find_optional_llm_model(self, llm_handle: str) -> Optional[LLMModel]:
+        if llm_handle in self._llm_models_by_handle:
+            return self._llm_models_by_handle[llm_handle]
         llm_models_provider = get_llm_models_provider()
         llm_engine_blueprint = self.llm_handles.get(llm_handle)
         if not llm_engine_blueprint:
@@ -72,8 +83,16 @@ class LLMDeck(LLMDeckAbstract, ConfigModel):
             llm_version=llm_engine_blueprint.llm_version,
             llm_platform_choice=llm_engine_blueprint.llm_platform_choice,
         )
+        self._llm_models_by_handle[llm_handle] = llm_model
         return llm_model
 
+    @override
+    def get_llm_rate_limit(self, llm_platform: LLMPlatform, llm_id: str) -> Optional[LLMRateLimit]:
+        platform_rate_limits = self.llm_rate_limits.get(llm_platform)
+        if not platform_rate_limits:
+            return None
+        return platform_rate_limits.get(llm_id) or platform_rate_limits.get(LLM_RATE_LIMIT_DEFAULT_KEY)
+
     @override
     @classmethod
     def final_validate(cls, deck: Self):
@@ -120,6 +139,14 @@ class LLMDeck(LLMDeckAbstract, ConfigModel):
                 raise ConfigValidationError(f"Invalid LLM engine blueprint for '{llm_handle}' is a {type(llm_engine_spec)}: {llm_engine_spec}")
         return the_dict
 
+    @field_validator("llm_rate_limits", mode="before")
+    @classmethod
+    def validate_llm_rate_limits(cls, value: Dict[str, Any]) -> Dict[LLMPlatform, LLMPlatformRateLimits]:
+        return cast(
+            Dict[LLMPlatform, LLMPlatformRateLimits],
+            ConfigModel.transform_dict_str_to_enum(input_dict=value, key_enum_cls=LLMPlatform),
+        )
+
     @field_validator("llm_choice_defaults", mode="after")
     @classmethod
     def validate_llm_choice_defaults(cls, llm_choice_defaults: LLMSettingChoices) -> LLMSettingChoices:
@@ -143,6 +170,10 @@ class LLMDeck(LLMDeckAbstract, ConfigModel):
             raise ConfigValidationError(f"LLM engine blueprint for '{llm_name}' is already defined in llm deck's llm_handles")
         # TODO: sort the defaults by llm family
         self.llm_handles[llm_name] = LLMEngineBlueprint(llm_name=llm_name)
+        self.clear_memoized_llm_models()
+
+    def clear_memoized_llm_models(self):
+        self._llm_models_by_handle.clear()
 
     def validate_llm_presets(self) -> Self:
         for llm_preset_id, llm_setting in self.llm_presets.items():
@@ -6,6 +6,8 @@ from typing_extensions import Self
 
 from pipelex.cogt.llm.llm_models.llm_engine_blueprint import LLMEngineBlueprint
 from pipelex.cogt.llm.llm_models.llm_model import LLMModel
+from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
+from pipelex.cogt.llm.llm_models.llm_rate_limit import LLMPlatformRateLimits, LLMRateLimit
 from pipelex.cogt.llm.llm_models.llm_setting import LLMSetting, LLMSettingChoices, LLMSettingChoicesDefaults, LLMSettingOrPresetId
 
 
@@ -18,6 +20,7 @@ class LLMDeckAbstract(ABC):
         for_text=None,
         for_object=None,
     )
+    llm_rate_limits: Dict[LLMPlatform, LLMPlatformRateLimits] = Field(default_factory=dict)
 
     @abstractmethod
     def check_llm_setting(self, llm_setting_or_preset_id: LLMSettingOrPresetId, is_disabled_allowed: bool = False):
@@ -39,6 +42,10 @@ class LLMDeckAbstract(ABC):
     def find_optional_llm_model(self, llm_handle: str) -> Optional[LLMModel]:
         pass
 
+    @abstractmethod
+    def get_llm_rate_limit(self, llm_platform: LLMPlatform, llm_id: str) -> Optional[LLMRateLimit]:
+        pass
+
     @classmethod
     @abstractmethod
     def final_validate(cls, deck: Self):
@@ -4,6 +4,7 @@ from pydantic import BaseModel, Field, model_validator
 from typing_extensions import Self
 
 from pipelex.cogt.exceptions import LLMModelDefinitionError
+from pipelex.cogt.image.prompt_image_budget import PromptImageBudget
 from pipelex.cogt.llm.llm_models.llm_family import LLMFamily
 from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
 from pipelex.cogt.llm.token_category import TokenCostsByCategoryDict
@@ -25,6 +26,8 @@ class LLMModel(BaseModel):
     max_tokens: Optional[int] = None
 
     max_prompt_images: Optional[int] = Field(None, ge=0)
+    # applied to the prompt images unless the llm setting has its own
+    image_budget: Optional[PromptImageBudget] = None
 
     @model_validator(mode="after")
     def check_vision_and_nb_images(self) -> Self:
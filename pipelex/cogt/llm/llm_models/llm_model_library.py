@@ -1,7 +1,7 @@
 import os
-from typing import Any, ClassVar, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
-from pydantic import Field, RootModel
+from pydantic import Field, PrivateAttr, RootModel
 from typing_extensions import override
 
 from pipelex import log
@@ -33,6 +33,10 @@ LLMModelLibraryRoot = List[LLMModel]
 class LLMModelLibrary(LLMModelProviderAbstract, RootModel[LLMModelLibraryRoot]):
     root: LLMModelLibraryRoot = Field(default_factory=list)
     library_config: ClassVar[LibraryConfig]
+    # indexes built at setup, lists are kept to detect duplicates
+    _llm_models_by_name: Dict[str, List[LLMModel]] = PrivateAttr(default_factory=dict)
+    _llm_models_by_name_and_version: Dict[Tuple[str, str], List[LLMModel]] = PrivateAttr(default_factory=dict)
+    _latest_llm_models: Dict[Tuple[str, LLMPlatformChoice], LLMModel] = PrivateAttr(default_factory=dict)
 
     @classmethod
     def make_empty(cls, config_folder_path: str) -> "LLMModelLibrary":
@@ -56,11 +60,37 @@ class LLMModelLibrary(LLMModelProviderAbstract, RootModel[LLMModelLibraryRoot]):
                     llm_model = LLMModel.model_validate(complete_llm_model_dict)
                     self.root.append(llm_model)
 
+        self._build_indexes()
         log.debug(f"Loaded {len(self.root)} llm models")
 
     @override
     def teardown(self):
         self.root = []
+        self._clear_indexes()
+
+    def _clear_indexes(self):
+        self._llm_models_by_name = {}
+        self._llm_models_by_name_and_version = {}
+        self._latest_llm_models = {}
+
+    def _build_indexes(self):
+        self._clear_indexes()
+        for llm_model in self.root:
+            self._llm_models_by_name.setdefault(llm_model.llm_name, []).append(llm_model)
+            self._llm_models_by_name_and_version.setdefault((llm_model.llm_name, llm_model.version), []).append(llm_model)
+
+        # precompute the resolution of the latest version, for the default platform and for each platform having a version
+        for llm_name, llm_models in self._llm_models_by_name.items():
+            llm_platform_choices: List[LLMPlatformChoice] = [DEFAULT_PLATFORM_INDICATOR]
+            for llm_model in llm_models:
+                llm_platform_choices.extend(llm_model.platform_llm_id.keys())
+            for llm_platform_choice in llm_platform_choices:
+                if latest_llm_model := self._resolve_latest_version(
+                    llm_name=llm_name,
+                    llm_platform_choice=llm_platform_choice,
+                    found_llm_models=llm_models,
+                ):
+                    self._latest_llm_models[(llm_name, llm_platform_choice)] = latest_llm_model
 
     @property
     @override
@@ -106,7 +136,7 @@ class LLMModelLibrary(LLMModelProviderAbstract, RootModel[LLMModelLibraryRoot]):
         if llm_version == LATEST_VERSION_NAME:
             return self._get_optional_llm_model_latest_version(llm_name=llm_name, llm_platform_choice=llm_platform_choice)
 
-        found_llm_models = [llm_model for llm_model in self.root if llm_model.llm_name == llm_name and llm_model.version == llm_version]
+        found_llm_models = self._llm_models_by_name_and_version.get((llm_name, llm_version))
         if not found_llm_models:
             return None
         if len(found_llm_models) > 1:
@@ -124,10 +154,20 @@ class LLMModelLibrary(LLMModelProviderAbstract, RootModel[LLMModelLibraryRoot]):
         llm_name: str,
         llm_platform_choice: LLMPlatformChoice,
     ) -> Optional[LLMModel]:
-        found_llm_models = [llm_model for llm_model in self.root if llm_model.llm_name == llm_name]
+        if latest_llm_model := self._latest_llm_models.get((llm_name, llm_platform_choice)):
+            return latest_llm_model
+        found_llm_models = self._llm_models_by_name.get(llm_name)
         if not found_llm_models:
             return None
-        elif len(found_llm_models) == 1:
+        return self._resolve_latest_version(llm_name=llm_name, llm_platform_choice=llm_platform_choice, found_llm_models=found_llm_models)
+
+    @staticmethod
+    def _resolve_latest_version(
+        llm_name: str,
+        llm_platform_choice: LLMPlatformChoice,
+        found_llm_models: List[LLMModel],
+    ) -> Optional[LLMModel]:
+        if len(found_llm_models) == 1:
             # only one so it is the latest we've got
             llm_model = found_llm_models[0]
         elif chosen_model := next((model for model in found_llm_models if model.version == LATEST_VERSION_NAME), None):
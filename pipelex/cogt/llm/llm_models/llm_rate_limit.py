@@ -0,0 +1,25 @@
+from typing import Dict, Optional
+
+from pydantic import field_validator
+
+from pipelex.tools.config.models import ConfigModel
+from pipelex.tools.exceptions import ConfigValidationError
+
+# key of the rate limit applied to any llm_id of a platform which doesn't have its own entry
+LLM_RATE_LIMIT_DEFAULT_KEY = "default"
+
+
+class LLMRateLimit(ConfigModel):
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+
+    @field_validator("requests_per_minute", "tokens_per_minute")
+    @classmethod
+    def validate_positive(cls, value: Optional[int]) -> Optional[int]:
+        if value is not None and value < 1:
+            raise ConfigValidationError(f"LLM rate limits must be positive integers, got {value}")
+        return value
+
+
+# rate limits by llm_id (or LLM_RATE_LIMIT_DEFAULT_KEY) for a given platform
+LLMPlatformRateLimits = Dict[str, LLMRateLimit]
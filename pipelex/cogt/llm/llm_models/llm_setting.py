@@ -4,6 +4,7 @@ from pydantic import Field, field_validator, model_validator
 from typing_extensions import Self
 
 from pipelex.cogt.exceptions import LLMSettingsValidationError
+from pipelex.cogt.image.prompt_image_budget import PromptImageBudget
 from pipelex.cogt.llm.llm_job_components import LLMJobParams
 from pipelex.cogt.llm.llm_models.llm_prompting_target import LLMPromptingTarget
 from pipelex.tools.config.models import ConfigModel
@@ -15,6 +16,7 @@ class LLMSetting(ConfigModel):
     temperature: float = Field(..., ge=0, le=1)
     max_tokens: Optional[int] = None
     prompting_target: Optional[LLMPromptingTarget] = Field(default=None, strict=False)
+    image_budget: Optional[PromptImageBudget] = None
 
     @field_validator("max_tokens", mode="before")
     @classmethod
@@ -43,6 +45,7 @@ class LLMSetting(ConfigModel):
             temperature=self.temperature,
             max_tokens=self.max_tokens,
             seed=None,
+            image_budget=self.image_budget,
         )
 
     def desc(self) -> str:
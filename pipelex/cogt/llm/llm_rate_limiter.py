@@ -0,0 +1,81 @@
+import asyncio
+import time
+from typing import Optional
+
+from pipelex import log
+from pipelex.cogt.llm.llm_models.llm_rate_limit import LLMRateLimit
+from pipelex.cogt.llm.llm_prompt import LLMPrompt
+from pipelex.cogt.llm.token_category import NbTokensByCategoryDict, TokenCategory
+
+# Rough heuristics used to estimate the prompt size before the call, the actual usage is reconciled afterwards
+NB_CHARS_PER_TOKEN_ESTIMATE = 4
+NB_TOKENS_PER_IMAGE_ESTIMATE = 1000
+
+
+def estimate_nb_prompt_tokens(llm_prompt: LLMPrompt) -> int:
+    nb_chars = len(llm_prompt.system_text or "") + len(llm_prompt.user_text or "")
+    return nb_chars // NB_CHARS_PER_TOKEN_ESTIMATE + len(llm_prompt.user_images) * NB_TOKENS_PER_IMAGE_ESTIMATE
+
+
+def count_nb_tokens_used(nb_tokens_by_category: NbTokensByCategoryDict) -> int:
+    return nb_tokens_by_category.get(TokenCategory.INPUT, 0) + nb_tokens_by_category.get(TokenCategory.OUTPUT, 0)
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously up to its capacity over the refill period.
+
+    Callers reserve their amount up front, which can push the level below zero: each caller then sleeps
+    until the refill covers its own reservation, so waiting callers are admitted in arrival order.
+    There is no lock or await between reading and updating the level, so it's safe within a single event loop.
+    """
+
+    def __init__(self, capacity: int, refill_period_seconds: float = 60.0):
+        self.capacity = float(capacity)
+        self.refill_rate = self.capacity / refill_period_seconds
+        self.level = self.capacity
+        self.last_refill_time = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.last_refill_time) * self.refill_rate)
+        self.last_refill_time = now
+
+    def reserve(self, amount: float) -> float:
+        """Take amount from the bucket and return the number of seconds to wait before it is actually available."""
+        self._refill()
+        # a single request larger than the whole bucket would never be admitted, so we cap it
+        self.level -= min(amount, self.capacity)
+        if self.level >= 0:
+            return 0.0
+        return -self.level / self.refill_rate
+
+    def adjust(self, amount: float):
+        """Take (or give back, if negative) an amount without waiting, e.g. to correct an estimate."""
+        self._refill()
+        self.level = min(self.capacity, self.level - amount)
+
+
+class LLMRateLimiter:
+    def __init__(self, llm_rate_limit: LLMRateLimit, desc: str):
+        self.desc = desc
+        self.requests_bucket: Optional[TokenBucket] = None
+        self.tokens_bucket: Optional[TokenBucket] = None
+        if requests_per_minute := llm_rate_limit.requests_per_minute:
+            self.requests_bucket = TokenBucket(capacity=requests_per_minute)
+        if tokens_per_minute := llm_rate_limit.tokens_per_minute:
+            self.tokens_bucket = TokenBucket(capacity=tokens_per_minute)
+
+    async def acquire(self, nb_tokens_estimate: int):
+        wait_seconds = 0.0
+        if self.requests_bucket:
+            wait_seconds = max(wait_seconds, self.requests_bucket.reserve(amount=1))
+        if self.tokens_bucket:
+            wait_seconds = max(wait_seconds, self.tokens_bucket.reserve(amount=nb_tokens_estimate))
+        if wait_seconds:
+            log.debug(f"Rate limiter for {self.desc}: waiting {wait_seconds:.2f}s")
+            await asyncio.sleep(wait_seconds)
+
+    def reconcile(self, nb_tokens_estimate: int, nb_tokens_used: int):
+        if self.tokens_bucket:
+            self.tokens_bucket.adjust(amount=nb_tokens_used - nb_tokens_estimate)
@@ -17,14 +17,17 @@ class LLMTokenCostReportField(StrEnum):
     LLM_FAMILY = "llm_family"
     VERSION = "version"
     PLATFORM_LLM_ID = "platform_llm_id"
+    IS_CACHE_HIT = "is_cache_hit"
     NB_TOKENS_INPUT = "nb_tokens_input"
     NB_TOKENS_INPUT_CACHED = "nb_tokens_input_cached"
     NB_TOKENS_INPUT_NON_CACHED = "nb_tokens_input_non_cached"
-    NB_TOKENS_INPUT_JOINED = "nb_tokens_input_joined"  # joined = cached + non-cached
+    NB_TOKENS_INPUT_CACHE_WRITE = "nb_tokens_input_cache_write"
+    NB_TOKENS_INPUT_JOINED = "nb_tokens_input_joined"  # joined = cached + non-cached + cache write
     NB_TOKENS_OUTPUT = "nb_tokens_output"
     COST_INPUT_CACHED = "cost_input_cached"
     COST_INPUT_NON_CACHED = "cost_input_non_cached"
-    COST_INPUT_JOINED = "cost_input_joined"  # joined = cached + non-cached
+    COST_INPUT_CACHE_WRITE = "cost_input_cache_write"
+    COST_INPUT_JOINED = "cost_input_joined"  # joined = cached + non-cached + cache write
     COST_OUTPUT = "cost_output"
 
     @staticmethod
@@ -43,6 +46,7 @@ class LLMTokenCostReport(BaseModel):
     llm_family: LLMFamily
     version: str
     platform_llm_id: str
+    is_cache_hit: bool = False
 
     nb_tokens_by_category: NbTokensByCategoryDict
     costs_by_token_category: TokenCostsByCategoryDict
@@ -57,6 +61,7 @@ class LLMTokenCostReport(BaseModel):
             LLMTokenCostReportField.LLM_FAMILY: self.llm_family,
             LLMTokenCostReportField.VERSION: self.version,
             LLMTokenCostReportField.PLATFORM_LLM_ID: self.platform_llm_id,
+            LLMTokenCostReportField.IS_CACHE_HIT: self.is_cache_hit,
         }
         the_dict.update(dict_for_llm)
         dict_for_nb_tokens = {
@@ -88,6 +93,16 @@ def model_cost_per_token(llm_engine: LLMEngine, token_type: TokenCategory) -> fl
             model = llm_engine.llm_model.name_and_version
             log.warning(f"cost is not set for model {model} neither for {TokenCategory.INPUT} nor {TokenCategory.INPUT_CACHED}")
             return 0.0
+    elif token_type == TokenCategory.INPUT_CACHE_WRITE:
+        if cost_per_million_tokens := llm_engine.llm_model.cost_per_million_tokens_usd.get(TokenCategory.INPUT_CACHE_WRITE):
+            return cost_per_million_tokens / 1000000
+        elif cost_per_million_tokens := llm_engine.llm_model.cost_per_million_tokens_usd.get(TokenCategory.INPUT):
+            # according to anthropic docs, writing to the prompt cache costs 25% more than base input tokens
+            return 1.25 * cost_per_million_tokens / 1000000
+        else:
+            model = llm_engine.llm_model.name_and_version
+            log.warning(f"cost is not set for model {model} neither for {TokenCategory.INPUT} nor {TokenCategory.INPUT_CACHE_WRITE}")
+            return 0.0
     elif token_type == TokenCategory.INPUT_NON_CACHED:
         return model_cost_per_token(llm_engine=llm_engine, token_type=TokenCategory.INPUT)
     elif cost_per_million_tokens := llm_engine.llm_model.cost_per_million_tokens_usd.get(token_type):
@@ -100,6 +115,8 @@ class LLMTokensUsage(BaseModel):
     job_metadata: JobMetadata
     llm_engine: LLMEngine
     nb_tokens_by_category: NbTokensByCategoryDict
+    # True when the response was served by the LLM response cache, without calling the LLM
+    is_cache_hit: bool = False
 
     def compute_cost_report(self) -> LLMTokenCostReport:
         costs_by_token_category: TokenCostsByCategoryDict = {
@@ -113,6 +130,7 @@ class LLMTokensUsage(BaseModel):
             llm_family=self.llm_engine.llm_model.llm_family,
             version=self.llm_engine.llm_model.version,
             platform_llm_id=self.llm_engine.llm_id,
+            is_cache_hit=self.is_cache_hit,
             nb_tokens_by_category=self.nb_tokens_by_category,
             costs_by_token_category=costs_by_token_category,
         )
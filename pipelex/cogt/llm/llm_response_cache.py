@@ -0,0 +1,196 @@
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Type
+
+from pydantic import BaseModel
+from typing_extensions import override
+
+from pipelex.cogt.image.prompt_image import PromptImage, PromptImageBytes, PromptImagePath, PromptImageUrl
+from pipelex.cogt.llm.llm_job import LLMJob
+from pipelex.cogt.llm.llm_schema_cache import get_llm_schema_cache
+from pipelex.types import StrEnum
+
+
+class LLMResponseCacheBackend(StrEnum):
+    LRU = "lru"
+    SQLITE = "sqlite"
+
+
+def make_prompt_image_digest(prompt_image: PromptImage) -> str:
+    if isinstance(prompt_image, PromptImageBytes):
+        return hashlib.sha256(prompt_image.base_64).hexdigest()
+    elif isinstance(prompt_image, PromptImageUrl):
+        return hashlib.sha256(prompt_image.url.encode()).hexdigest()
+    elif isinstance(prompt_image, PromptImagePath):
+        # keyed by path, modification time and size, like the prompt image preparer, so the file is not read on every call
+        file_stat = os.stat(prompt_image.file_path)
+        path_key = f"{os.path.abspath(prompt_image.file_path)}:{file_stat.st_mtime_ns}:{file_stat.st_size}"
+        return hashlib.sha256(path_key.encode()).hexdigest()
+    else:
+        raise ValueError(f"Cannot make a digest of prompt image of type '{type(prompt_image)}'")
+
+
+def make_llm_response_cache_key(
+    llm_id: str,
+    llm_job: LLMJob,
+    schema: Optional[Type[BaseModel]] = None,
+) -> str:
+    """
+    Stable hash of everything that determines an LLM response: the same key means the same call to the same model.
+    """
+    llm_prompt = llm_job.llm_prompt
+    key_elements: Dict[str, Any] = {
+        "llm_id": llm_id,
+        "job_params": llm_job.job_params.model_dump(),
+        "system_text": llm_prompt.system_text,
+        "user_text": llm_prompt.user_text,
+        "image_digests": [make_prompt_image_digest(prompt_image=prompt_image) for prompt_image in llm_prompt.user_images],
+        "schema": get_llm_schema_cache().get_json_schema(schema=schema) if schema else None,
+    }
+    key_json = json.dumps(key_elements, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(key_json.encode()).hexdigest()
+
+
+class LLMResponseCacheAbstract(ABC):
+    """
+    Stores serialized LLM responses, evicting the least recently used ones beyond max_entries
+    and ignoring those older than ttl_seconds (when set).
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: Optional[int] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+    def _is_expired(self, stored_at: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - stored_at > self.ttl_seconds
+
+    @abstractmethod
+    async def get(self, cache_key: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    async def set(self, cache_key: str, response: str):
+        pass
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+    def teardown(self):
+        pass
+
+
+class LLMResponseCacheLRU(LLMResponseCacheAbstract):
+    def __init__(self, max_entries: int, ttl_seconds: Optional[int] = None):
+        super().__init__(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        # values are (stored_at, response)
+        self._entries: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+
+    @override
+    async def get(self, cache_key: str) -> Optional[str]:
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if self._is_expired(stored_at=stored_at):
+            del self._entries[cache_key]
+            return None
+        self._entries.move_to_end(cache_key)
+        return response
+
+    @override
+    async def set(self, cache_key: str, response: str):
+        self._entries[cache_key] = (time.time(), response)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @override
+    def clear(self):
+        self._entries.clear()
+
+    @override
+    def teardown(self):
+        self.clear()
+
+
+class LLMResponseCacheSqlite(LLMResponseCacheAbstract):
+    """
+    SQLite queries and commits run in a worker thread, one at a time, so that they never block the event loop.
+    The number of rows is counted once when opening and then tracked, so that evicting only happens beyond max_entries.
+    """
+
+    def __init__(self, sqlite_path: str, max_entries: int, ttl_seconds: Optional[int] = None):
+        super().__init__(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        if sqlite_dir := os.path.dirname(sqlite_path):
+            os.makedirs(sqlite_dir, exist_ok=True)
+        self._connection = sqlite3.connect(sqlite_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses "
+            "(cache_key TEXT PRIMARY KEY, response TEXT NOT NULL, stored_at REAL NOT NULL, used_at REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS llm_responses_used_at ON llm_responses (used_at)")
+        self._connection.commit()
+        self._nb_entries: int = self._connection.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+
+    @override
+    async def get(self, cache_key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get, cache_key)
+
+    @override
+    async def set(self, cache_key: str, response: str):
+        await asyncio.to_thread(self._set, cache_key, response)
+
+    def _get(self, cache_key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute("SELECT response, stored_at FROM llm_responses WHERE cache_key = ?", (cache_key,)).fetchone()
+            if row is None:
+                return None
+            response, stored_at = row
+            if self._is_expired(stored_at=stored_at):
+                self._connection.execute("DELETE FROM llm_responses WHERE cache_key = ?", (cache_key,))
+                self._connection.commit()
+                self._nb_entries -= 1
+                return None
+            self._connection.execute("UPDATE llm_responses SET used_at = ? WHERE cache_key = ?", (time.time(), cache_key))
+            self._connection.commit()
+            return response
+
+    def _set(self, cache_key: str, response: str):
+        now = time.time()
+        with self._lock:
+            is_new = self._connection.execute("SELECT 1 FROM llm_responses WHERE cache_key = ?", (cache_key,)).fetchone() is None
+            self._connection.execute(
+                "INSERT OR REPLACE INTO llm_responses (cache_key, response, stored_at, used_at) VALUES (?, ?, ?, ?)",
+                (cache_key, response, now, now),
+            )
+            if is_new:
+                self._nb_entries += 1
+            if self._nb_entries > self.max_entries:
+                # the oldest rows are found through the index on used_at
+                self._connection.execute(
+                    "DELETE FROM llm_responses WHERE cache_key IN (SELECT cache_key FROM llm_responses ORDER BY used_at ASC LIMIT ?)",
+                    (self._nb_entries - self.max_entries,),
+                )
+                self._nb_entries = self.max_entries
+            self._connection.commit()
+
+    @override
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM llm_responses")
+            self._connection.commit()
+            self._nb_entries = 0
+
+    @override
+    def teardown(self):
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,88 @@
+import copy
+from typing import Any, Callable, Dict, List, Tuple, Type, cast
+
+from pydantic import BaseModel, create_model
+
+from pipelex.tools.typing.pydantic_utils import BaseModelTypeVar
+
+LIST_SCHEMA_CLASS_NAME = "ListSchema"
+
+
+class LLMSchemaCache:
+    """Structured output schemas and structure prompts, built once per output class and shared by all the pipes and LLM workers.
+
+    Instructor wraps the output class in a new model and generates its JSON schema and tool definition on every request,
+    and lists of objects were wrapped in a new class on every request: the result being identical every time,
+    these are built once per class. Classes are the keys, so a class registered again under the same name gets its own schemas.
+    """
+
+    def __init__(self):
+        self._list_schemas: Dict[Type[Any], Type[BaseModel]] = {}
+        self._json_schemas: Dict[Type[BaseModel], Dict[str, Any]] = {}
+        self._instructor_schemas: Dict[Type[BaseModel], Type[BaseModel]] = {}
+        self._structure_prompts: Dict[Tuple[str, Type[Any]], str] = {}
+
+    def get_structure_prompt(self, class_name: str, output_class: Type[Any], make_structure_prompt: Callable[[], str]) -> str:
+        """The prompt describing the structure of the output class, made by make_structure_prompt the first time it's asked for."""
+        prompt_key = (class_name, output_class)
+        if (structure_prompt := self._structure_prompts.get(prompt_key)) is not None:
+            return structure_prompt
+        structure_prompt = make_structure_prompt()
+        self._structure_prompts[prompt_key] = structure_prompt
+        return structure_prompt
+
+    def get_list_schema(self, item_class: Type[Any]) -> Type[BaseModel]:
+        """The model wrapping a list of items, to generate a list of objects in one structured output."""
+        if list_schema := self._list_schemas.get(item_class):
+            return list_schema
+        list_schema = create_model(LIST_SCHEMA_CLASS_NAME, items=(List[item_class], ...))  # type: ignore
+        self._list_schemas[item_class] = list_schema
+        return list_schema
+
+    def get_json_schema(self, schema: Type[BaseModel]) -> Dict[str, Any]:
+        """The JSON schema of the class, shared by all the callers: it must not be modified."""
+        if (json_schema := self._json_schemas.get(schema)) is not None:
+            return json_schema
+        json_schema = schema.model_json_schema()
+        self._json_schemas[schema] = json_schema
+        return json_schema
+
+    def get_instructor_schema(self, schema: Type[BaseModelTypeVar]) -> Type[BaseModelTypeVar]:
+        """The class prepared for instructor, which uses it as is instead of wrapping the class again on every request.
+
+        Its tool definitions and JSON schema are computed once, instead of on every access.
+        """
+        if instructor_schema := self._instructor_schemas.get(schema):
+            return cast(Type[BaseModelTypeVar], instructor_schema)
+        # instructor pulls in the SDKs of all the providers it supports, so it's only imported by the workers which use it
+        from instructor import openai_schema
+
+        instructor_schema = cast(Type[BaseModel], openai_schema(schema))
+        # the tool definitions are class properties, recomputed on every access, so we replace them by their value
+        setattr(instructor_schema, "openai_schema", instructor_schema.openai_schema)  # pyright: ignore[reportAttributeAccessIssue]
+        setattr(instructor_schema, "anthropic_schema", instructor_schema.anthropic_schema)  # pyright: ignore[reportAttributeAccessIssue]
+        # the strict and JSON modes ask for the JSON schema on every request, and the strict mode alters what it gets
+        json_schema = instructor_schema.model_json_schema()
+        original_model_json_schema = instructor_schema.model_json_schema
+
+        def model_json_schema(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            if args or kwargs:
+                return original_model_json_schema(*args, **kwargs)
+            return copy.deepcopy(json_schema)
+
+        setattr(instructor_schema, "model_json_schema", staticmethod(model_json_schema))
+        self._instructor_schemas[schema] = instructor_schema
+        return cast(Type[BaseModelTypeVar], instructor_schema)
+
+    def clear(self):
+        self._list_schemas.clear()
+        self._json_schemas.clear()
+        self._instructor_schemas.clear()
+        self._structure_prompts.clear()
+
+
+_llm_schema_cache = LLMSchemaCache()
+
+
+def get_llm_schema_cache() -> LLMSchemaCache:
+    return _llm_schema_cache
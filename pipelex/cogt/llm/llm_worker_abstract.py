@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Type
+from contextlib import aclosing
+from typing import AsyncGenerator, Optional, Type
 
 from typing_extensions import override
 
@@ -87,6 +88,39 @@ class LLMWorkerAbstract(InferenceWorkerAbstract, ABC):
     ) -> str:
         pass
 
+    async def gen_text_stream(
+        self,
+        llm_job: LLMJob,
+    ) -> AsyncGenerator[str, None]:
+        log.debug("LLM Worker gen_text_stream")
+        log.verbose(llm_job.params_desc)
+        log.verbose(llm_job.llm_prompt.desc, title="llm_prompt")
+
+        # metadata
+        llm_job.job_metadata.unit_job_id = UnitJobId.LLM_GEN_TEXT
+
+        await self._before_job(llm_job=llm_job)
+
+        is_stream_complete = False
+        try:
+            # the worker's stream is closed as soon as ours is, so that it releases its connection
+            async with aclosing(self._gen_text_stream(llm_job=llm_job)) as text_stream:
+                async for text_chunk in text_stream:
+                    yield text_chunk
+            is_stream_complete = True
+        finally:
+            # a stream which failed or which the consumer stopped reading is still reported, if it used tokens
+            llm_tokens_usage = llm_job.job_report.llm_tokens_usage
+            if is_stream_complete or (llm_tokens_usage and llm_tokens_usage.nb_tokens_by_category):
+                await self._after_job(llm_job=llm_job)
+
+    async def _gen_text_stream(
+        self,
+        llm_job: LLMJob,
+    ) -> AsyncGenerator[str, None]:
+        # This can be overridden by workers which support streaming, the others yield the whole text at once
+        yield await self._gen_text(llm_job=llm_job)
+
     async def gen_object(
         self,
         llm_job: LLMJob,
@@ -3,10 +3,11 @@ from typing import Optional
 from pipelex.cogt.exceptions import MissingDependencyError
 from pipelex.cogt.llm.llm_models.llm_engine import LLMEngine
 from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
+from pipelex.cogt.llm.llm_rate_limiter import LLMRateLimiter
 from pipelex.cogt.llm.llm_worker_internal_abstract import LLMWorkerInternalAbstract
 from pipelex.cogt.llm.structured_output import StructureMethod
 from pipelex.config import get_config
-from pipelex.hub import get_plugin_manager
+from pipelex.hub import get_llm_deck, get_plugin_manager
 from pipelex.plugins.plugin_sdk_registry import PluginSdkHandle
 from pipelex.reporting.reporting_protocol import ReportingProtocol
 
@@ -19,6 +20,13 @@ class LLMWorkerFactory:
     ) -> LLMWorkerInternalAbstract:
         llm_sdk_handle = PluginSdkHandle.get_for_llm_platform(llm_platform=llm_engine.llm_platform)
         plugin_sdk_registry = get_plugin_manager().plugin_sdk_registry
+        llm_rate_limiter: Optional[LLMRateLimiter] = None
+        if llm_rate_limit := get_llm_deck().get_llm_rate_limit(llm_platform=llm_engine.llm_platform, llm_id=llm_engine.llm_id):
+            llm_rate_limiter = plugin_sdk_registry.get_llm_rate_limiter(
+                llm_platform=llm_engine.llm_platform,
+                llm_id=llm_engine.llm_id,
+                llm_rate_limit=llm_rate_limit,
+            )
         llm_worker: LLMWorkerInternalAbstract
         match llm_engine.llm_platform:
             case LLMPlatform.OPENAI | LLMPlatform.AZURE_OPENAI | LLMPlatform.PERPLEXITY | LLMPlatform.XAI:
@@ -42,6 +50,7 @@ class LLMWorkerFactory:
                     llm_engine=llm_engine,
                     structure_method=structure_method,
                     reporting_delegate=reporting_delegate,
+                    rate_limiter=llm_rate_limiter,
                 )
             case LLMPlatform.VERTEXAI:
                 try:
@@ -64,6 +73,7 @@ class LLMWorkerFactory:
                     llm_engine=llm_engine,
                     structure_method=StructureMethod.INSTRUCTOR_VERTEX_JSON,
                     reporting_delegate=reporting_delegate,
+                    rate_limiter=llm_rate_limiter,
                 )
             case LLMPlatform.CUSTOM_LLM:
                 from pipelex.plugins.openai.openai_factory import OpenAIFactory
@@ -81,6 +91,7 @@ class LLMWorkerFactory:
                     llm_engine=llm_engine,
                     structure_method=StructureMethod.INSTRUCTOR_OPENAI_STRUCTURED,
                     reporting_delegate=reporting_delegate,
+                    rate_limiter=llm_rate_limiter,
                 )
             case LLMPlatform.ANTHROPIC | LLMPlatform.BEDROCK_ANTHROPIC:
                 try:
@@ -111,6 +122,7 @@ class LLMWorkerFactory:
                     llm_engine=llm_engine,
                     structure_method=StructureMethod.INSTRUCTOR_ANTHROPIC_TOOLS,
                     reporting_delegate=reporting_delegate,
+                    rate_limiter=llm_rate_limiter,
                 )
             case LLMPlatform.MISTRAL:
                 try:
@@ -141,15 +153,27 @@ class LLMWorkerFactory:
                     llm_engine=llm_engine,
                     structure_method=StructureMethod.INSTRUCTOR_MISTRAL_TOOLS,
                     reporting_delegate=reporting_delegate,
+                    rate_limiter=llm_rate_limiter,
                 )
             case LLMPlatform.BEDROCK:
-                try:
-                    import aioboto3  # noqa: F401
-                    import boto3  # noqa: F401
-                except ImportError as exc:
-                    raise MissingDependencyError(
-                        "boto3,aioboto3", "bedrock", "The boto3 and aioboto3 SDKs are required to use Bedrock models."
-                    ) from exc
+                from pipelex.plugins.bedrock.bedrock_config import BedrockClientMethod
+
+                # only the SDK of the configured client method is required, so that the boto3 client can be used without aioboto3
+                match get_plugin_manager().plugin_configs.bedrock_config.client_method:
+                    case BedrockClientMethod.AIBOTO3:
+                        try:
+                            import aioboto3  # noqa: F401
+                        except ImportError as exc:
+                            raise MissingDependencyError(
+                                "aioboto3", "bedrock", "The aioboto3 SDK is required to use Bedrock models with the 'aioboto3' client method."
+                            ) from exc
+                    case BedrockClientMethod.BOTO3:
+                        try:
+                            import boto3  # noqa: F401
+                        except ImportError as exc:
+                            raise MissingDependencyError(
+                                "boto3", "bedrock", "The boto3 SDK is required to use Bedrock models with the 'boto3' client method."
+                            ) from exc
 
                 from pipelex.plugins.bedrock.bedrock_factory import BedrockFactory
                 from pipelex.plugins.bedrock.bedrock_llm_worker import BedrockLLMWorker
@@ -165,5 +189,6 @@ class LLMWorkerFactory:
                     sdk_instance=llm_sdk_instance,
                     llm_engine=llm_engine,
                     reporting_delegate=reporting_delegate,
+                    rate_limiter=llm_rate_limiter,
                 )
         return llm_worker
@@ -5,8 +5,11 @@ from typing_extensions import override
 from pipelex.cogt.exceptions import LLMCapabilityError
 from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.llm.llm_models.llm_engine import LLMEngine
+from pipelex.cogt.llm.llm_rate_limiter import LLMRateLimiter, count_nb_tokens_used, estimate_nb_prompt_tokens
 from pipelex.cogt.llm.llm_worker_abstract import LLMWorkerAbstract
 from pipelex.cogt.llm.structured_output import StructureMethod
+from pipelex.cogt.llm.token_category import TokenCategory
+from pipelex.pipeline.job_metadata import UnitJobId
 from pipelex.reporting.reporting_protocol import ReportingProtocol
 
 
@@ -16,6 +19,7 @@ class LLMWorkerInternalAbstract(LLMWorkerAbstract):
         llm_engine: LLMEngine,
         structure_method: Optional[StructureMethod] = None,
         reporting_delegate: Optional[ReportingProtocol] = None,
+        rate_limiter: Optional[LLMRateLimiter] = None,
     ):
         """
         Initialize the LLMWorker.
@@ -24,10 +28,12 @@ class LLMWorkerInternalAbstract(LLMWorkerAbstract):
             llm_engine (LLMEngine): The LLM engine to be used by the worker.
             structure_method (Optional[StructureMethod]): The structure method to be used by the worker.
             reporting_delegate (Optional[ReportingProtocol]): An optional report delegate for reporting unit jobs.
+            rate_limiter (Optional[LLMRateLimiter]): An optional rate limiter, shared with the other workers for the same platform and llm_id.
         """
         LLMWorkerAbstract.__init__(self, reporting_delegate=reporting_delegate)
         self.llm_engine = llm_engine
         self.structure_method = structure_method
+        self.rate_limiter = rate_limiter
 
     #########################################################
     # Instance methods
@@ -49,8 +55,36 @@ class LLMWorkerInternalAbstract(LLMWorkerAbstract):
         llm_job: LLMJob,
     ):
         await super()._before_job(llm_job=llm_job)
+        if llm_job.job_params.image_budget is None and llm_job.llm_prompt.user_images:
+            llm_job.job_params.image_budget = self.llm_engine.llm_model.image_budget
+        if self.rate_limiter:
+            await self.rate_limiter.acquire(nb_tokens_estimate=estimate_nb_prompt_tokens(llm_prompt=llm_job.llm_prompt))
         llm_job.llm_job_before_start(llm_engine=self.llm_engine)
 
+    @override
+    async def _after_job(
+        self,
+        llm_job: LLMJob,
+    ):
+        await super()._after_job(llm_job=llm_job)
+        if self.rate_limiter and (llm_tokens_usage := llm_job.job_report.llm_tokens_usage):
+            # replace our estimate with the actual usage, including the output tokens
+            self.rate_limiter.reconcile(
+                nb_tokens_estimate=estimate_nb_prompt_tokens(llm_prompt=llm_job.llm_prompt),
+                nb_tokens_used=count_nb_tokens_used(nb_tokens_by_category=llm_tokens_usage.nb_tokens_by_category),
+            )
+
+    def report_cache_hit(self, llm_job: LLMJob, unit_job_id: UnitJobId):
+        """Report a job answered by the LLM response cache: no tokens were sent nor generated, so it costs nothing."""
+        llm_job.job_metadata.unit_job_id = unit_job_id
+        llm_job.llm_job_before_start(llm_engine=self.llm_engine)
+        if llm_tokens_usage := llm_job.job_report.llm_tokens_usage:
+            llm_tokens_usage.nb_tokens_by_category = {TokenCategory.INPUT: 0, TokenCategory.OUTPUT: 0}
+            llm_tokens_usage.is_cache_hit = True
+        llm_job.llm_job_after_complete()
+        if self.reporting_delegate:
+            self.reporting_delegate.report_inference_job(inference_job=llm_job)
+
     @override
     def _check_can_perform_job(self, llm_job: LLMJob):
         # This can be overridden by subclasses for specific checks
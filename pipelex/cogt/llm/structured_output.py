@@ -1,7 +1,10 @@
-from instructor.mode import Mode as InstructorMode
+from typing import TYPE_CHECKING
 
 from pipelex.types import StrEnum
 
+if TYPE_CHECKING:
+    from instructor.mode import Mode as InstructorMode
+
 
 class StructureMethod(StrEnum):
     INSTRUCTOR_OPENAI_STRUCTURED = "openai_structured"
@@ -9,7 +12,10 @@ class StructureMethod(StrEnum):
     INSTRUCTOR_MISTRAL_TOOLS = "mistral_tools"
     INSTRUCTOR_VERTEX_JSON = "vertex_json"
 
-    def as_instructor_mode(self) -> InstructorMode:
+    def as_instructor_mode(self) -> "InstructorMode":
+        # instructor pulls in the SDKs of all the providers it supports, so it's only imported by the workers which use it
+        from instructor.mode import Mode as InstructorMode
+
         match self:
             case StructureMethod.INSTRUCTOR_OPENAI_STRUCTURED:
                 return InstructorMode.TOOLS_STRICT
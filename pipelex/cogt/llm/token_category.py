@@ -7,7 +7,8 @@ class TokenCategory(StrEnum):
     INPUT = "input"
     INPUT_CACHED = "input_cached"
     INPUT_NON_CACHED = "input_non_cached"
-    INPUT_JOINED = "input_joined"  # joined = cached + non-cached
+    INPUT_CACHE_WRITE = "input_cache_write"
+    INPUT_JOINED = "input_joined"  # joined = cached + non-cached + cache write
     INPUT_AUDIO = "input_audio"
     OUTPUT = "output"
     OUTPUT_AUDIO = "output_audio"
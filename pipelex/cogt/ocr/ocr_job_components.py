@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from pipelex.tools.config.models import ConfigModel
 
@@ -10,6 +10,8 @@ class OcrJobParams(BaseModel):
     should_caption_images: bool
     should_include_page_views: bool
     page_views_dpi: Optional[int] = None
+    # split PDFs into chunks of this many pages, OCRed concurrently
+    nb_pages_per_chunk: Optional[int] = Field(default=None, ge=1)
 
     @classmethod
     def make_default_ocr_job_params(cls) -> "OcrJobParams":
@@ -22,7 +24,9 @@ class OcrJobParams(BaseModel):
 
 
 class OcrJobConfig(ConfigModel):
-    pass
+    max_concurrent_chunks: int = Field(default=4, ge=1)
+    max_chunk_retries: int = Field(default=2, ge=0)
+    chunk_retry_backoff_seconds: float = Field(default=1, ge=0)
 
 
 ########################################################################
@@ -1,8 +1,9 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from pydantic import Field
 
 from pipelex import log
+from pipelex.cogt.exceptions import CogtError
 from pipelex.tools.misc.base_64_utils import save_base64_to_binary_file
 from pipelex.tools.misc.file_utils import ensure_directory_exists, save_text_to_path
 from pipelex.tools.typing.pydantic_utils import CustomBaseModel
@@ -46,9 +47,24 @@ class Page(CustomBaseModel):
             page_view.save_to_directory(directory=directory)
 
 
+class OcrOutputError(CogtError):
+    pass
+
+
 class OcrOutput(CustomBaseModel):
     pages: Dict[int, Page]
 
+    @classmethod
+    def make_from_chunks(cls, chunk_outputs: Sequence["OcrOutput"]) -> "OcrOutput":
+        """Merge the outputs of the chunks of a document, whose pages are indexed in the whole document."""
+        pages: Dict[int, Page] = {}
+        for chunk_output in chunk_outputs:
+            for page_index, page in chunk_output.pages.items():
+                if page_index in pages:
+                    raise OcrOutputError(f"Page {page_index} was found in several chunks")
+                pages[page_index] = page
+        return cls(pages=dict(sorted(pages.items())))
+
     @property
     def concatenated_text(self) -> str:
         return "\n".join([page.text for page in self.pages.values() if page.text])
@@ -1,5 +1,6 @@
+import asyncio
 from abc import abstractmethod
-from typing import Optional
+from typing import Awaitable, Callable, List, Optional, Tuple, Type
 
 from typing_extensions import override
 
@@ -7,9 +8,16 @@ from pipelex import log
 from pipelex.cogt.inference.inference_worker_abstract import InferenceWorkerAbstract
 from pipelex.cogt.ocr.ocr_engine import OcrEngine
 from pipelex.cogt.ocr.ocr_job import OcrJob
+from pipelex.cogt.ocr.ocr_job_components import OcrJobConfig
 from pipelex.cogt.ocr.ocr_output import OcrOutput
 from pipelex.pipeline.job_metadata import UnitJobId
 from pipelex.reporting.reporting_protocol import ReportingProtocol
+from pipelex.tools.misc.concurrency_utils import gather_bounded
+
+
+def make_page_ranges(nb_pages: int, nb_pages_per_chunk: int) -> List[range]:
+    """Split the page indexes of a document, starting from 0, into consecutive ranges of at most nb_pages_per_chunk pages."""
+    return [range(start, min(start + nb_pages_per_chunk, nb_pages)) for start in range(0, nb_pages, nb_pages_per_chunk)]
 
 
 class OcrWorkerAbstract(InferenceWorkerAbstract):
@@ -63,6 +71,40 @@ class OcrWorkerAbstract(InferenceWorkerAbstract):
 
         return result
 
+    async def _ocr_extract_pages_by_chunks(
+        self,
+        nb_pages: int,
+        nb_pages_per_chunk: int,
+        job_config: OcrJobConfig,
+        extract_page_range: Callable[[range], Awaitable[OcrOutput]],
+        retriable_errors: Tuple[Type[Exception], ...],
+    ) -> OcrOutput:
+        """OCR a document by page ranges, with a bounded number of ranges in flight, and merge their pages.
+
+        A range which fails with one of the retriable errors is retried on its own, so one failure doesn't redo the whole document.
+        """
+        page_ranges = make_page_ranges(nb_pages=nb_pages, nb_pages_per_chunk=nb_pages_per_chunk)
+        log.debug(f"OCR of {nb_pages} pages in {len(page_ranges)} chunks of up to {nb_pages_per_chunk} pages")
+
+        async def extract_page_range_with_retries(page_range: range) -> OcrOutput:
+            attempt = 0
+            while True:
+                try:
+                    return await extract_page_range(page_range)
+                except retriable_errors as exc:
+                    if attempt >= job_config.max_chunk_retries:
+                        raise
+                    retry_delay = job_config.chunk_retry_backoff_seconds * (2**attempt)
+                    log.warning(f"OCR of pages {page_range.start}-{page_range.stop - 1} failed, retrying in {retry_delay:.2f}s: {exc}")
+                    await asyncio.sleep(retry_delay)
+                    attempt += 1
+
+        chunk_outputs = await gather_bounded(
+            awaitables=(extract_page_range_with_retries(page_range) for page_range in page_ranges),
+            max_concurrency=job_config.max_concurrent_chunks,
+        )
+        return OcrOutput.make_from_chunks(chunk_outputs=chunk_outputs)
+
     @abstractmethod
     async def _ocr_extract_pages(
         self,
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, cast
+from typing import Dict, List, Literal, Optional, Union, cast
 
 import shortuuid
 from pydantic import Field, field_validator
@@ -11,7 +11,9 @@ from pipelex.libraries.library_config import LibraryConfig
 from pipelex.pipeline.track.tracker_config import TrackerConfig
 from pipelex.tools.aws.aws_config import AwsConfig
 from pipelex.tools.config.models import ConfigModel, ConfigRoot
+from pipelex.tools.http.http_config import HttpConfig
 from pipelex.tools.log.log_config import LogConfig
+from pipelex.tools.pdf.pdf_render_config import PdfRenderConfig
 from pipelex.tools.templating.templating_models import PromptingStyle
 from pipelex.types import StrEnum
 
@@ -41,6 +43,21 @@ class StaticValidationConfig(ConfigModel):
 
 class PipeRunConfig(ConfigModel):
     pipe_stack_limit: int
+    batch_max_concurrency: Union[int, Literal["unlimited"]]
+    bulk_max_concurrency: int = Field(ge=1)
+
+    @field_validator("batch_max_concurrency")
+    def validate_batch_max_concurrency(cls, value: Union[int, Literal["unlimited"]]) -> Union[int, Literal["unlimited"]]:
+        if isinstance(value, int) and value < 1:
+            raise PipelexConfigError(f"pipe_run_config.batch_max_concurrency must be a positive integer or 'unlimited', got {value}")
+        return value
+
+    @property
+    def applied_batch_max_concurrency(self) -> Optional[int]:
+        if self.batch_max_concurrency == "unlimited":
+            return None
+        else:
+            return self.batch_max_concurrency
 
 
 class DryRunConfig(ConfigModel):
@@ -91,6 +108,33 @@ class ReportingConfig(ConfigModel):
     cost_report_base_name: str
     cost_report_extension: str
     cost_report_unit_scale: float
+    is_usage_spilled_to_disk: bool
+    usage_spill_dir_path: str
+
+
+class RunRetentionConfig(ConfigModel):
+    max_completed_runs: Union[int, Literal["unlimited"]]
+    max_completed_run_age_seconds: Union[int, Literal["unlimited"]]
+
+    @field_validator("max_completed_runs", "max_completed_run_age_seconds")
+    def validate_limits(cls, value: Union[int, Literal["unlimited"]]) -> Union[int, Literal["unlimited"]]:
+        if isinstance(value, int) and value < 0:
+            raise PipelexConfigError(f"run_retention_config limits must be positive integers or 'unlimited', got {value}")
+        return value
+
+    @property
+    def applied_max_completed_runs(self) -> Optional[int]:
+        if self.max_completed_runs == "unlimited":
+            return None
+        else:
+            return self.max_completed_runs
+
+    @property
+    def applied_max_completed_run_age_seconds(self) -> Optional[int]:
+        if self.max_completed_run_age_seconds == "unlimited":
+            return None
+        else:
+            return self.max_completed_run_age_seconds
 
 
 class Pipelex(ConfigModel):
@@ -98,6 +142,8 @@ class Pipelex(ConfigModel):
     feature_config: FeatureConfig
     log_config: LogConfig
     aws_config: AwsConfig
+    http_config: HttpConfig
+    pdf_render_config: PdfRenderConfig
 
     library_config: LibraryConfig
     static_validation_config: StaticValidationConfig
@@ -109,6 +155,7 @@ class Pipelex(ConfigModel):
     dry_run_config: DryRunConfig
     pipe_run_config: PipeRunConfig
     reporting_config: ReportingConfig
+    run_retention_config: RunRetentionConfig
 
 
 class PipelexConfig(ConfigRoot):
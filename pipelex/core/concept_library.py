@@ -1,6 +1,6 @@
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Type
 
-from pydantic import Field, RootModel
+from pydantic import Field, PrivateAttr, RootModel
 from typing_extensions import override
 
 from pipelex import log
@@ -18,6 +18,8 @@ ConceptLibraryRoot = Dict[str, Concept]
 
 class ConceptLibrary(RootModel[ConceptLibraryRoot], ConceptProviderAbstract):
     root: ConceptLibraryRoot = Field(default_factory=dict)
+    # memoized transitive closure of refines: the codes of each concept and of all the concepts it refines, directly or not
+    _ancestor_codes_by_concept_code: Dict[str, FrozenSet[str]] = PrivateAttr(default_factory=dict)
 
     def validate_with_libraries(self):
         for concept in self.root.values():
@@ -47,8 +49,13 @@ class ConceptLibrary(RootModel[ConceptLibraryRoot], ConceptProviderAbstract):
 
                 self.get_required_concept(concept_code=domain_concept_code)
 
+        # the libraries are final: precompute the refines closure, which also checks that there is no cycle
+        for concept_code in self.root:
+            self._get_ancestor_codes(concept_code=concept_code)
+
     def reset(self):
         self.root = {}
+        self._ancestor_codes_by_concept_code.clear()
 
     @classmethod
     def make_empty(cls):
@@ -88,42 +95,45 @@ class ConceptLibrary(RootModel[ConceptLibraryRoot], ConceptProviderAbstract):
         if name in self.root:
             raise ConceptLibraryError(f"Concept '{name}' already exists in the library")
         self.root[name] = concept
+        self._ancestor_codes_by_concept_code.clear()
 
     def add_concepts(self, concepts: List[Concept]):
         for concept in concepts:
             self.add_new_concept(concept=concept)
 
+    def _get_ancestor_codes(self, concept_code: str, visited_concept_codes: Optional[Set[str]] = None) -> FrozenSet[str]:
+        if (ancestor_codes := self._ancestor_codes_by_concept_code.get(concept_code)) is not None:
+            return ancestor_codes
+        if visited_concept_codes is None:
+            visited_concept_codes = set()
+        if concept_code in visited_concept_codes:
+            raise ConceptLibraryError(f"Concept '{concept_code}' refines itself through: {sorted(visited_concept_codes)}")
+        visited_concept_codes.add(concept_code)
+        concept = self.get_required_concept(concept_code=concept_code)
+        ancestor_codes = self._make_ancestor_codes(concept=concept, visited_concept_codes=visited_concept_codes)
+        visited_concept_codes.discard(concept_code)
+        self._ancestor_codes_by_concept_code[concept_code] = ancestor_codes
+        return ancestor_codes
+
+    def _make_ancestor_codes(self, concept: Concept, visited_concept_codes: Optional[Set[str]] = None) -> FrozenSet[str]:
+        ancestor_codes: Set[str] = {concept.code}
+        for refined_concept_code in concept.refines:
+            ancestor_codes.update(self._get_ancestor_codes(concept_code=refined_concept_code, visited_concept_codes=visited_concept_codes))
+        return frozenset(ancestor_codes)
+
     @override
     def is_compatible(self, tested_concept: Concept, wanted_concept: Concept) -> bool:
         if tested_concept.code == wanted_concept.code:
             return True
-        for inherited_concept_code in tested_concept.refines:
-            inherited_concept = self.get_required_concept(concept_code=inherited_concept_code)
-            if self.is_compatible(inherited_concept, wanted_concept):
-                return True
-        return False
+        # the tested concept is not necessarily the one in the library, so its own refines are used
+        return wanted_concept.code in self._make_ancestor_codes(concept=tested_concept)
 
     @override
     def is_compatible_by_concept_code(self, tested_concept_code: str, wanted_concept_code: str) -> bool:
         if wanted_concept_code == NativeConcept.ANYTHING.code:
-            log.debug(
-                f"Concept '{tested_concept_code}' is compatible with '{wanted_concept_code}' "
-                f"because '{wanted_concept_code}' is '{NativeConcept.ANYTHING.code}'"
-            )
             return True
-        tested_concept = self.get_required_concept(concept_code=tested_concept_code)
         wanted_concept = self.get_required_concept(concept_code=wanted_concept_code)
-        if tested_concept.code == wanted_concept.code:
-            log.debug(f"Concept '{tested_concept_code}' is compatible with '{wanted_concept_code}' because they have the same code")
-            return True
-        for inherited_concept_code in tested_concept.refines:
-            if self.is_compatible_by_concept_code(inherited_concept_code, wanted_concept_code):
-                log.debug(
-                    f"Concept '{tested_concept_code}' is compatible with '{wanted_concept_code}' "
-                    f"because '{tested_concept_code}' refines '{inherited_concept_code}' which is compatible with '{wanted_concept_code}'"
-                )
-                return True
-        return False
+        return wanted_concept.code in self._get_ancestor_codes(concept_code=tested_concept_code)
 
     @override
     def get_concept(self, concept_code: str) -> Optional[Concept]:
@@ -159,6 +169,7 @@ class ConceptLibrary(RootModel[ConceptLibraryRoot], ConceptProviderAbstract):
     @override
     def teardown(self) -> None:
         self.root = {}
+        self._ancestor_codes_by_concept_code.clear()
 
     @override
     def get_class(self, concept_code: str) -> Optional[Type[Any]]:
@@ -41,8 +41,8 @@ def output_multiplicity_to_apply(
     """
     Interpret / unwrap the output multiplicity override and return the appropriate values.
     """
-    log.debug(f"output_multiplicity_base = {output_multiplicity_base}")
-    log.debug(f"output_multiplicity_override = {output_multiplicity_override}")
+    log.debug(lambda: f"output_multiplicity_base = {output_multiplicity_base}")
+    log.debug(lambda: f"output_multiplicity_override = {output_multiplicity_override}")
     if output_multiplicity_override is None:
         log.debug("output_multiplicity_override is None")
         if isinstance(output_multiplicity_base, bool):
@@ -79,15 +79,24 @@ def output_multiplicity_to_apply(
 class BatchParams(BaseModel):
     input_list_stuff_name: str
     input_item_stuff_name: str
+    max_concurrency: Optional[int] = None
+
+    @field_validator("max_concurrency")
+    @classmethod
+    def validate_max_concurrency(cls, v: Optional[int]) -> Optional[int]:
+        if v is not None and v < 1:
+            raise ValueError(f"Batch max_concurrency must be a positive integer, got {v}")
+        return v
 
     @classmethod
     def make_optional_batch_params(
         cls,
         input_list_name: Union[bool, str],
         input_item_name: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
     ) -> Optional["BatchParams"]:
         the_batch_params: Optional[BatchParams] = None
-        if input_list_name or input_item_name:
+        if input_list_name or input_item_name or max_concurrency:
             input_list_stuff_name: str
             if isinstance(input_list_name, str):
                 input_list_stuff_name = input_list_name
@@ -97,6 +106,7 @@ class BatchParams(BaseModel):
             the_batch_params = BatchParams(
                 input_list_stuff_name=input_list_stuff_name,
                 input_item_stuff_name=input_item_stuff_name,
+                max_concurrency=max_concurrency,
             )
         return the_batch_params
 
@@ -111,6 +121,8 @@ class BatchParams(BaseModel):
 class PipeRunParams(BaseModel):
     run_mode: PipeRunMode = PipeRunMode.LIVE
     final_stuff_code: Optional[str] = None
+    # when set, the PipeLLM producing the final stuff dispatches its partial text to the activity manager
+    is_final_text_streamed: bool = False
     output_multiplicity: Optional[PipeOutputMultiplicity] = None
     dynamic_output_concept_code: Optional[str] = None
     batch_params: Optional[BatchParams] = None
@@ -14,6 +14,7 @@ class PipeRunParamsFactory:
         dynamic_output_concept_code: Optional[str] = None,
         batch_params: Optional[BatchParams] = None,
         params: Optional[Dict[str, Any]] = None,
+        is_final_text_streamed: bool = False,
     ) -> PipeRunParams:
         pipe_stack_limit = pipe_stack_limit or get_config().pipelex.pipe_run_config.pipe_stack_limit
         return PipeRunParams(
@@ -23,4 +24,5 @@ class PipeRunParamsFactory:
             dynamic_output_concept_code=dynamic_output_concept_code,
             batch_params=batch_params,
             params=params or {},
+            is_final_text_streamed=is_final_text_streamed,
         )
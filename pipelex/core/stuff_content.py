@@ -1,16 +1,13 @@
+import asyncio
 import base64
 import json
 from abc import ABC, abstractmethod
 from io import BytesIO
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 
-import markdown
-from json2html import json2html
 from kajson import kajson
-from PIL import Image
 from pydantic import BaseModel
 from typing_extensions import Self, override
-from yattag import Doc
 
 from pipelex.cogt.llm.llm_prompt import LLMPrompt
 from pipelex.cogt.ocr.ocr_output import ExtractedImage
@@ -19,9 +16,13 @@ from pipelex.tools.misc.file_utils import ensure_directory_exists, get_increment
 from pipelex.tools.misc.filetype_utils import detect_file_type_from_base64
 from pipelex.tools.misc.markdown_utils import convert_to_markdown
 from pipelex.tools.misc.path_utils import InterpretedPathOrUrl, interpret_path_or_url
+from pipelex.tools.storage.local_storage_provider import LocalStorageProvider
 from pipelex.tools.templating.templating_models import TextFormat
 from pipelex.tools.typing.pydantic_utils import CustomBaseModel, clean_model_to_dict
 
+if TYPE_CHECKING:
+    from PIL import Image
+
 ObjectContentType = TypeVar("ObjectContentType", bound=BaseModel)
 StuffContentType = TypeVar("StuffContentType", bound="StuffContent")
 
@@ -105,6 +106,9 @@ class TextContent(StuffContentInitableFromStr):
 
     @override
     def rendered_html(self) -> str:
+        # the HTML rendering libraries are imported when rendering, they're not needed to run pipelines
+        import markdown
+
         # Convert a markdown string to HTML and return HTML as a Unicode string.
         html = markdown.markdown(self.text)
         return html
@@ -198,24 +202,33 @@ class ImageContent(StuffContentInitableFromStr):
     def make_from_str(cls, str_value: str) -> "ImageContent":
         return ImageContent(url=str_value)
 
+    @property
+    def rendered_url(self) -> str:
+        if self.base_64 and interpret_path_or_url(path_or_uri=self.url) == InterpretedPathOrUrl.FILE_NAME:
+            # the url is only the name of the image, its data url is built when needed rather than stored
+            return f"data:{detect_file_type_from_base64(b64=self.base_64).mime};base64,{self.base_64}"
+        return self.url
+
     @override
     def rendered_plain(self) -> str:
-        return self.url
+        return self.rendered_url
 
     @override
     def rendered_html(self) -> str:
+        from yattag import Doc
+
         doc = Doc()
-        doc.stag("img", src=self.url, klass="msg-img")
+        doc.stag("img", src=self.rendered_url, klass="msg-img")
 
         return doc.getvalue()
 
     @override
     def rendered_markdown(self, level: int = 1, is_pretty: bool = False) -> str:
-        return f"![{self.url}]({self.url})"
+        return f"![{self.url}]({self.rendered_url})"
 
     @override
     def rendered_json(self) -> str:
-        return json.dumps({"image_url": self.url, "source_prompt": self.source_prompt})
+        return json.dumps({"image_url": self.rendered_url, "source_prompt": self.source_prompt})
 
     @classmethod
     def make_from_extracted_image(cls, extracted_image: ExtractedImage) -> Self:
@@ -225,16 +238,49 @@ class ImageContent(StuffContentInitableFromStr):
             caption=extracted_image.caption,
         )
 
-    @classmethod
-    def make_from_image(cls, image: Image.Image) -> Self:
+    @staticmethod
+    def _encode_image_to_png(image: "Image.Image") -> bytes:
         buffer = BytesIO()
         image.save(buffer, format="PNG")
-        base_64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
+        return buffer.getvalue()
+
+    @classmethod
+    def make_from_image(cls, image: "Image.Image", image_name: str = "image.png") -> Self:
+        # the image is held once, in base_64, and the url is just its name, as for extracted images
+        base_64 = base64.b64encode(cls._encode_image_to_png(image=image)).decode("utf-8")
         return cls(
-            url=f"data:image/png;base64,{base_64}",
+            url=image_name,
             base_64=base_64,
         )
 
+    @classmethod
+    async def make_from_image_async(
+        cls,
+        image: "Image.Image",
+        image_name: str = "image.png",
+        storage_provider: Optional[LocalStorageProvider] = None,
+    ) -> Self:
+        """Encode the image off the event loop. With a storage provider, the image is stored and only its file path is kept."""
+        if storage_provider is None:
+            return await asyncio.to_thread(cls.make_from_image, image, image_name)
+        png_bytes = await asyncio.to_thread(cls._encode_image_to_png, image)
+        uri = await asyncio.to_thread(storage_provider.store, png_bytes)
+        return cls(url=uri)
+
+    @classmethod
+    async def make_from_png_bytes_async(
+        cls,
+        png_bytes: bytes,
+        image_name: str = "image.png",
+        storage_provider: Optional[LocalStorageProvider] = None,
+    ) -> Self:
+        """Same as make_from_image_async, for an image already encoded as PNG."""
+        if storage_provider is None:
+            base_64 = await asyncio.to_thread(base64.b64encode, png_bytes)
+            return cls(url=image_name, base_64=base_64.decode("utf-8"))
+        uri = await asyncio.to_thread(storage_provider.store, png_bytes)
+        return cls(url=uri)
+
     def save_to_directory(self, directory: str, base_name: Optional[str] = None, extension: Optional[str] = None):
         ensure_directory_exists(directory)
         base_name = base_name or "img"
@@ -295,6 +341,8 @@ class PDFContent(StuffContentInitableFromStr):
 
     @override
     def rendered_html(self) -> str:
+        from yattag import Doc
+
         doc = Doc()
         doc.stag("a", href=self.url, klass="msg-pdf")
         doc.text(self.url)
@@ -325,6 +373,8 @@ class HtmlContent(StuffContent):
 
     @override
     def rendered_html(self) -> str:
+        from yattag import Doc
+
         doc, tag, text = Doc().tagtext()
         with tag("div", klass=self.css_class):
             text(self.inner_html)
@@ -358,6 +408,8 @@ class MermaidContent(StuffContent):
 
     @override
     def rendered_html(self) -> str:
+        from yattag import Doc
+
         doc, tag, text = Doc().tagtext()
         with tag("div", klass="mermaid"):
             text(self.mermaid_code)
@@ -384,6 +436,8 @@ class StructuredContent(StuffContent):
 
     @override
     def rendered_html(self) -> str:
+        from json2html import json2html
+
         dict_dump = clean_model_to_dict(obj=self)
 
         html: str = json2html.convert(  # pyright: ignore[reportAssignmentType]
@@ -454,6 +508,8 @@ class ListContent(StuffContent, Generic[StuffContentType]):
 
     @override
     def rendered_html(self) -> str:
+        from json2html import json2html
+
         list_dump = [item.smart_dump() for item in self.items]
 
         html: str = json2html.convert(  # pyright: ignore[reportAssignmentType]
@@ -65,6 +65,33 @@ class WorkingMemory(BaseModel):
     def make_deep_copy(self) -> Self:
         return self.model_copy(deep=True)
 
+    def make_branch_copy(self) -> Self:
+        """
+        Make a copy-on-write copy of the working memory, to be used by a branch of a PipeBatch or PipeParallel.
+        The branch shares the parent's stuffs, which must be treated as read-only: only the dicts are copied,
+        so that the stuffs, aliases and main stuff changes made by the branch are recorded in the branch alone.
+        """
+        return self.model_copy(update={"root": self.root.copy(), "aliases": self.aliases.copy()})
+
+    def apply_branch_changes(self, branch: Self, branch_base: Self) -> None:
+        """
+        Replay onto this working memory the changes made by a branch, i.e. the stuffs and aliases which the branch
+        set, replaced or removed compared to branch_base, the memory it was copied from.
+        A name is either a stuff or an alias: setting one removes the other, as the working memory methods do.
+        """
+        for removed_name in branch_base.root.keys() - branch.root.keys():
+            self.root.pop(removed_name, None)
+        for removed_alias in branch_base.aliases.keys() - branch.aliases.keys():
+            self.aliases.pop(removed_alias, None)
+        for name, stuff in branch.root.items():
+            if branch_base.root.get(name) is not stuff:
+                self.aliases.pop(name, None)
+                self.root[name] = stuff
+        for alias, target in branch.aliases.items():
+            if branch_base.aliases.get(alias) != target:
+                self.root.pop(alias, None)
+                self.aliases[alias] = target
+
     def generate_full_stuff_dict(self) -> StuffDict:
         full_stuff_dict: StuffDict = self.root.copy()
         full_stuff_dict.update({alias: self.root[target] for alias, target in self.aliases.items()})
@@ -183,8 +210,8 @@ class WorkingMemory(BaseModel):
                 return
             else:
                 log.warning(f"Key '{name}' already exists in WorkingMemory and will be replaced by something different")
-                log.verbose(f"Existing stuff: {existing_stuff}")
-                log.verbose(f"New stuff: {stuff}")
+                log.verbose(lambda: f"Existing stuff: {existing_stuff}")
+                log.verbose(lambda: f"New stuff: {stuff}")
 
         # it's a new stuff
         self.set_stuff(name=name, stuff=stuff)
@@ -196,12 +223,12 @@ class WorkingMemory(BaseModel):
         if name:
             self.remove_main_stuff()
             self.add_new_stuff(name=name, stuff=stuff, aliases=[MAIN_STUFF_NAME])
-            log.verbose(f"Setting new main stuff {name}: {stuff.concept_code} = '{stuff.short_desc}'")
-            log.verbose(stuff.content.rendered_plain())
+            log.verbose(lambda: f"Setting new main stuff {name}: {stuff.concept_code} = '{stuff.short_desc}'")
+            log.verbose(stuff.content.rendered_plain)
         else:
             self.remove_alias_to_main_stuff()
             self.set_stuff(name=MAIN_STUFF_NAME, stuff=stuff)
-            log.verbose(f"Setting new main stuff (unnamed): {stuff.concept_code} = '{stuff.short_desc}'")
+            log.verbose(lambda: f"Setting new main stuff (unnamed): {stuff.concept_code} = '{stuff.short_desc}'")
 
     def set_alias(self, alias: str, target: str) -> None:
         """Add an alias pointing to a target name."""
@@ -1,7 +1,6 @@
 from typing import Any, Dict, List, Optional, Tuple, Type
 
 import shortuuid
-from polyfactory.factories.pydantic_factory import ModelFactory
 from pydantic import BaseModel
 
 from pipelex import log
@@ -162,6 +161,9 @@ class WorkingMemoryFactory(BaseModel):
             WorkingMemory with mock objects for each needed input
         """
 
+        # polyfactory is only needed for dry runs
+        from polyfactory.factories.pydantic_factory import ModelFactory
+
         working_memory = cls.make_empty()
 
         for variable_name, concept_code, structure_class in needed_inputs:
@@ -145,6 +145,10 @@ class LibraryParsingError(LibraryError):
     pass
 
 
+class LibrarySnapshotError(LibraryError):
+    pass
+
+
 class PipeDefinitionError(PipelexError):
     pass
 
@@ -9,6 +9,10 @@ PIPELEX_LIBRARIES_PATH = "libraries"
 class LibraryConfig(ConfigModel):
     package_name: ClassVar[str] = "pipelex"
     config_folder_path: str = "pipelex_libraries"
+    is_parse_cache_enabled: bool = False
+    parse_cache_path: str = ".pipelex/library_parse_cache.json"
+    is_library_snapshot_enabled: bool = False
+    library_snapshot_path: str = ".pipelex/library_snapshot.pickle"
 
     @property
     def config_file(self) -> str:
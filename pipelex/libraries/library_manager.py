@@ -21,12 +21,15 @@ from pipelex.exceptions import (
     ConceptLibraryError,
     LibraryError,
     LibraryParsingError,
+    LibrarySnapshotError,
     PipeFactoryError,
     PipeLibraryError,
     StaticValidationError,
 )
 from pipelex.libraries.library_config import LibraryConfig
 from pipelex.libraries.library_manager_abstract import LibraryManagerAbstract
+from pipelex.libraries.library_parse_cache import ParsedLibrary, get_library_parse_cache
+from pipelex.libraries.library_snapshot import LibrarySnapshot, compute_source_hashes
 from pipelex.tools.class_registry_utils import ClassRegistryUtils
 from pipelex.tools.misc.file_utils import find_files_in_dir
 from pipelex.tools.misc.json_utils import deep_update
@@ -65,6 +68,7 @@ class LibraryManager(LibraryManagerAbstract):
     concept_library: ConceptLibrary
     pipe_library: PipeLibrary
     llm_deck: Optional[LLMDeck] = None
+    is_loaded_from_snapshot: bool = False
     library_config: ClassVar[LibraryConfig]
 
     @classmethod
@@ -96,6 +100,7 @@ class LibraryManager(LibraryManagerAbstract):
     @override
     def teardown(self) -> None:
         self.llm_deck = None
+        self.is_loaded_from_snapshot = False
         self.pipe_library.teardown()
         self.concept_library.teardown()
         self.domain_library.teardown()
@@ -111,14 +116,16 @@ class LibraryManager(LibraryManagerAbstract):
         failing_pipelines_path = get_config().pipelex.library_config.failing_pipelines_path
         self.load_combo_libraries(library_paths=[Path(failing_pipelines_path)])
 
+    def register_library_classes(self):
+        for library_path in self.libraries_paths():
+            ClassRegistryUtils.register_classes_in_folder(
+                folder_path=library_path,
+            )
+
     def load_libraries(self):
         log.debug("LibraryManager loading separate libraries")
         library_paths = self.libraries_paths()
         # self._validate_toml_files()
-        for library_path in library_paths:
-            ClassRegistryUtils.register_classes_in_folder(
-                folder_path=library_path,
-            )
 
         native_concepts = ConceptFactory.list_native_concepts()
         self.concept_library.add_concepts(concepts=native_concepts)
@@ -129,6 +136,68 @@ class LibraryManager(LibraryManagerAbstract):
         toml_file_paths = [path for path in toml_file_paths if path != Path(failing_pipelines_path)]
         self.load_combo_libraries(library_paths=toml_file_paths)
 
+    def snapshot_source_paths(self) -> List[str]:
+        # the whole config folder: the pipelines, and the llm deck, integrations and templates they were validated with
+        source_paths = [self.library_config.config_folder_path]
+        if runtime_manager.is_unit_testing:
+            source_paths.append(self.library_config.test_pipelines_path)
+        return source_paths
+
+    def compute_snapshot_source_hashes(self) -> Dict[str, str]:
+        return compute_source_hashes(
+            source_dir_paths=self.snapshot_source_paths(),
+            config_dump=get_config().model_dump_json(exclude={"session_id"}),
+        )
+
+    def make_snapshot(self) -> LibrarySnapshot:
+        if self.llm_deck is None:
+            raise LibraryError("LLM deck is not loaded")
+        return LibrarySnapshot(
+            source_hashes=self.compute_snapshot_source_hashes(),
+            domains=self.domain_library.root,
+            concepts=self.concept_library.root,
+            pipes=self.pipe_library.root,
+            llm_deck=self.llm_deck,
+        )
+
+    def compile_snapshot(self) -> str:
+        """Save a snapshot of the libraries, which must have been validated, and return its path."""
+        snapshot_path = get_config().pipelex.library_config.library_snapshot_path
+        self.make_snapshot().save_to_path(snapshot_path=snapshot_path)
+        log.debug(f"LibraryManager saved a snapshot of the libraries to '{snapshot_path}'")
+        return snapshot_path
+
+    def load_snapshot_if_up_to_date(self) -> Optional[LLMDeck]:
+        """Load the libraries and the LLM deck from the compiled snapshot, if it was compiled from the current sources.
+
+        Returns the LLM deck if the snapshot was loaded, None if the libraries must be loaded from their sources.
+        The library classes must be registered beforehand.
+        """
+        library_config = get_config().pipelex.library_config
+        snapshot_path = library_config.library_snapshot_path
+        if not library_config.is_library_snapshot_enabled or not os.path.isfile(snapshot_path):
+            return None
+        try:
+            snapshot = LibrarySnapshot.load_from_path(snapshot_path=snapshot_path)
+        except LibrarySnapshotError as exc:
+            log.warning(f"Loading the libraries from their sources: {exc}")
+            return None
+        if not snapshot.is_up_to_date(source_hashes=self.compute_snapshot_source_hashes()):
+            log.info(f"The library snapshot '{snapshot_path}' is outdated, loading the libraries from their sources")
+            return None
+
+        for domain in snapshot.domains.values():
+            self.domain_library.add_domain_details(domain=domain)
+        self.concept_library.add_concepts(concepts=list(snapshot.concepts.values()))
+        for pipe in snapshot.pipes.values():
+            self.pipe_library.add_new_pipe(pipe=pipe)
+        self.llm_deck = snapshot.llm_deck
+        # the llm models must be resolved from the current llm model provider
+        self.llm_deck.clear_memoized_llm_models()
+        self.is_loaded_from_snapshot = True
+        log.debug(f"LibraryManager loaded the libraries from the snapshot '{snapshot_path}'")
+        return self.llm_deck
+
     def load_deck(self) -> LLMDeck:
         llm_deck_paths = self.library_config.get_llm_deck_paths()
         full_llm_deck_dict: Dict[str, Any] = {}
@@ -167,16 +236,17 @@ class LibraryManager(LibraryManagerAbstract):
     @override
     def load_combo_libraries(self, library_paths: List[Path]):
         log.debug("LibraryManager loading combo libraries")
-        # Find all .toml files in the directories and their subdirectories
+        # Parse each file once, the three passes below share the parsed libraries
+        parsed_libraries = self._parse_library_files(library_paths=library_paths)
 
         # First pass: load all domains
-        for toml_path in library_paths:
-            library_dict = load_toml_from_path(path=str(toml_path))
-            library_name = toml_path.stem
+        for parsed_library in parsed_libraries:
+            library_dict = parsed_library.library_dict
+            library_name = parsed_library.library_name
             domain_code = library_dict.get("domain")
             if domain_code is None:
                 raise LibraryParsingError(
-                    f"Error loading library '{library_name}' which has no domain set at '{toml_path}'. "
+                    f"Error loading library '{library_name}' which has no domain set at '{parsed_library.toml_path}'. "
                     "Just write 'domain = \"my_domain\"' at the top of the file."
                 )
             domain_definition = library_dict.get("definition")
@@ -193,28 +263,24 @@ class LibraryManager(LibraryManagerAbstract):
             self.domain_library.add_domain_details(domain=domain)
 
         # Second pass: load all concepts
-        for toml_path in library_paths:
+        for parsed_library in parsed_libraries:
+            toml_path = parsed_library.toml_path
             nb_concepts_before = len(self.concept_library.root)
-            library_dict = load_toml_from_path(path=str(toml_path))
-            library_name = toml_path.stem
+            library_name = parsed_library.library_name
             try:
-                self._load_library_dict(library_name=library_name, library_dict=library_dict, component_type=LibraryComponent.CONCEPT)
+                self._load_library_dict(library_name=library_name, library_dict=parsed_library.library_dict, component_type=LibraryComponent.CONCEPT)
             except ConceptLibraryError as exc:
                 raise LibraryError(f"Error loading concepts from library '{library_name}' at '{toml_path}': {exc}") from exc
             nb_concepts_loaded = len(self.concept_library.root) - nb_concepts_before
             log.verbose(f"Loaded {nb_concepts_loaded} concepts from '{toml_path.name}'")
 
         # Third pass: load all pipes
-        for toml_path in library_paths:
+        for parsed_library in parsed_libraries:
+            toml_path = parsed_library.toml_path
             nb_pipes_before = len(self.pipe_library.root)
+            library_name = parsed_library.library_name
             try:
-                library_dict = load_toml_from_path(path=str(toml_path))
-            except Exception as exc:
-                log.error(f"Failed to load TOML file '{toml_path}': {exc}")
-                continue
-            library_name = toml_path.stem
-            try:
-                self._load_library_dict(library_name=library_name, library_dict=library_dict, component_type=LibraryComponent.PIPE)
+                self._load_library_dict(library_name=library_name, library_dict=parsed_library.library_dict, component_type=LibraryComponent.PIPE)
             except StaticValidationError as static_validation_error:
                 static_validation_error.file_path = str(toml_path)
                 log.error(static_validation_error.desc())
@@ -226,8 +292,14 @@ class LibraryManager(LibraryManagerAbstract):
             nb_pipes_loaded = len(self.pipe_library.root) - nb_pipes_before
             log.verbose(f"Loaded {nb_pipes_loaded} pipes from '{toml_path.name}'")
 
+    def _parse_library_files(self, library_paths: List[Path]) -> List[ParsedLibrary]:
+        library_config = get_config().pipelex.library_config
+        cache_path = library_config.parse_cache_path if library_config.is_parse_cache_enabled else None
+        return get_library_parse_cache().parse_library_files(toml_paths=library_paths, cache_path=cache_path)
+
     def _load_library_dict(self, library_name: str, library_dict: Dict[str, Any], component_type: LibraryComponent):
-        if domain_code := library_dict.pop("domain", None):
+        # the library dict is shared by the loading passes, so it must not be altered
+        if domain_code := library_dict.get("domain"):
             # domain is set at the root of the library
             self._load_library_components_from_recursive_dict(
                 domain_code=domain_code,
@@ -281,7 +353,7 @@ class LibraryManager(LibraryManagerAbstract):
                 self.concept_library.add_new_concept(concept=concept_from_def)
             elif isinstance(concept_obj, dict):
                 # blueprint dict definition
-                concept_obj_dict: Dict[str, Any] = concept_obj
+                concept_obj_dict: Dict[str, Any] = concept_obj.copy()
                 try:
                     concept_from_dict = ConceptFactory.make_from_details_dict(
                         domain_code=domain_code, code=concept_str, details_dict=concept_obj_dict
@@ -315,6 +387,9 @@ class LibraryManager(LibraryManagerAbstract):
         log.debug("LibraryManager validating libraries")
         if self.llm_deck is None:
             raise LibraryError("LLM deck is not loaded")
+        if self.is_loaded_from_snapshot:
+            log.debug("LibraryManager skipping the validation of libraries loaded from a snapshot, which were validated when compiled")
+            return
 
         self.llm_deck.validate_llm_presets()
         LLMDeck.final_validate(deck=self.llm_deck)
@@ -0,0 +1,155 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from pipelex import log
+from pipelex.tools.misc.file_utils import ensure_directory_exists
+from pipelex.tools.misc.toml_utils import load_toml_from_path
+
+# bump it whenever the format of the cached entries changes, so that older cache files get ignored
+LIBRARY_PARSE_CACHE_VERSION = 2
+
+
+class ParsedLibrary(BaseModel):
+    """The content of a TOML library file, parsed once and shared by the domain, concept and pipe loading phases."""
+
+    model_config = ConfigDict(frozen=True)
+
+    toml_path: Path
+    library_dict: Dict[str, Any]
+
+    @property
+    def library_name(self) -> str:
+        return self.toml_path.stem
+
+
+class LibraryParseCacheEntry(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    mtime_ns: int
+    size: int
+    content_hash: str
+    # serialized rather than kept as a dict, so that each use gets its own copy that the factories can mutate
+    library_json: str
+
+
+class LibraryParseCacheFile(BaseModel):
+    version: int
+    entries: Dict[str, LibraryParseCacheEntry]
+
+
+class LibraryParseCache:
+    """Parsed TOML library files, keyed by path and checked against the file's mtime and content hash.
+
+    The entries are kept in memory, so that setting up Pipelex again in the same process doesn't parse anything,
+    and they can be persisted in a JSON cache file, so that a new process only parses the files that changed.
+    A file whose mtime and size are unchanged is trusted without being read; otherwise it's read and hashed,
+    and only parsed if its content actually changed.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, LibraryParseCacheEntry] = {}
+        self._loaded_cache_path: Optional[str] = None
+        self._is_dirty = False
+
+    def parse_library_files(self, toml_paths: List[Path], cache_path: Optional[str] = None) -> List[ParsedLibrary]:
+        if cache_path and cache_path != self._loaded_cache_path:
+            self._load_cache_file(cache_path=cache_path)
+        parsed_libraries = [
+            ParsedLibrary(toml_path=toml_path, library_dict=self.load_library_dict(toml_path=str(toml_path))) for toml_path in toml_paths
+        ]
+        if cache_path and self._is_dirty:
+            self._save_cache_file(cache_path=cache_path)
+        return parsed_libraries
+
+    def load_library_dict(self, toml_path: str) -> Dict[str, Any]:
+        path_key = os.path.abspath(toml_path)
+        stat_result = os.stat(path_key)
+        entry = self._entries.get(path_key)
+        if entry and entry.mtime_ns == stat_result.st_mtime_ns and entry.size == stat_result.st_size:
+            library_dict: Dict[str, Any] = json.loads(entry.library_json)
+            return library_dict
+
+        content_hash = self._hash_file(path=path_key)
+        if entry and entry.content_hash == content_hash:
+            # touched but unchanged: no need to parse it again
+            log.verbose(f"Library file '{toml_path}' was touched but its content is unchanged")
+            self._entries[path_key] = entry.model_copy(update={"mtime_ns": stat_result.st_mtime_ns, "size": stat_result.st_size})
+            self._is_dirty = True
+            library_dict = json.loads(entry.library_json)
+            return library_dict
+
+        library_dict = load_toml_from_path(path=path_key)
+        try:
+            library_json = json.dumps(library_dict)
+        except TypeError:
+            # TOML dates and times have no JSON equivalent, such a file is parsed every time
+            self._entries.pop(path_key, None)
+            return library_dict
+        # loading can rewrite the file to clean its trailing whitespace, so we describe it as it is now
+        stat_result = os.stat(path_key)
+        self._entries[path_key] = LibraryParseCacheEntry(
+            mtime_ns=stat_result.st_mtime_ns,
+            size=stat_result.st_size,
+            content_hash=self._hash_file(path=path_key),
+            library_json=library_json,
+        )
+        self._is_dirty = True
+        return library_dict
+
+    def clear(self):
+        self._entries.clear()
+        self._loaded_cache_path = None
+        self._is_dirty = False
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        with open(path, "rb") as file:
+            return hashlib.sha256(file.read()).hexdigest()
+
+    def _load_cache_file(self, cache_path: str):
+        self._loaded_cache_path = cache_path
+        if not os.path.isfile(cache_path):
+            return
+        try:
+            with open(cache_path, "r", encoding="utf-8") as cache_file:
+                cache_file_content = LibraryParseCacheFile.model_validate_json(cache_file.read())
+        except (OSError, UnicodeDecodeError, ValidationError) as exc:
+            # a corrupted or incompatible cache file only costs a full parse
+            log.warning(f"Ignoring the library parse cache file '{cache_path}' which could not be read: {exc}")
+            return
+        if cache_file_content.version != LIBRARY_PARSE_CACHE_VERSION:
+            log.debug(f"Ignoring the library parse cache file '{cache_path}' which has another version")
+            return
+        # the entries already in memory are at least as recent
+        self._entries = {**cache_file_content.entries, **self._entries}
+
+    def _save_cache_file(self, cache_path: str):
+        # forget the files that were removed, so that the cache doesn't grow forever
+        self._entries = {path_key: entry for path_key, entry in self._entries.items() if os.path.isfile(path_key)}
+        if cache_dir := os.path.dirname(cache_path):
+            ensure_directory_exists(cache_dir)
+        # write then rename, so that concurrent processes never read a partial file
+        tmp_cache_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            cache_file_content = LibraryParseCacheFile(version=LIBRARY_PARSE_CACHE_VERSION, entries=self._entries)
+            with open(tmp_cache_path, "w", encoding="utf-8") as cache_file:
+                cache_file.write(cache_file_content.model_dump_json())
+            os.replace(tmp_cache_path, cache_path)
+        except OSError as exc:
+            log.warning(f"Could not write the library parse cache file '{cache_path}': {exc}")
+            if os.path.isfile(tmp_cache_path):
+                os.remove(tmp_cache_path)
+            return
+        self._is_dirty = False
+
+
+_library_parse_cache = LibraryParseCache()
+
+
+def get_library_parse_cache() -> LibraryParseCache:
+    return _library_parse_cache
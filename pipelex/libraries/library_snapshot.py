@@ -0,0 +1,82 @@
+import hashlib
+import os
+import pickle
+from importlib.metadata import version
+from typing import Dict, List
+
+from pydantic import BaseModel, ConfigDict
+
+from pipelex.cogt.llm.llm_models.llm_deck import LLMDeck
+from pipelex.core.concept import Concept
+from pipelex.core.domain import Domain
+from pipelex.core.pipe_abstract import PipeAbstract
+from pipelex.exceptions import LibrarySnapshotError
+from pipelex.tools.misc.file_utils import ensure_directory_exists, find_files_in_dir
+
+# bump it whenever the content of the snapshot changes, so that older snapshots get ignored
+LIBRARY_SNAPSHOT_VERSION = 1
+LIBRARY_SOURCE_FILE_PATTERNS = ["*.toml", "*.py"]
+PIPELEX_VERSION = version("pipelex")
+
+
+def compute_source_hashes(source_dir_paths: List[str], config_dump: str) -> Dict[str, str]:
+    """Hash the files from which the libraries are built, and the config under which they are built.
+
+    The files are keyed by their path relative to the working directory,
+    so a snapshot compiled in a project can be used wherever the project is deployed.
+    """
+    source_hashes: Dict[str, str] = {"pipelex_config": hashlib.sha256(config_dump.encode()).hexdigest()}
+    for source_dir_path in source_dir_paths:
+        for pattern in LIBRARY_SOURCE_FILE_PATTERNS:
+            for source_file_path in find_files_in_dir(dir_path=source_dir_path, pattern=pattern, is_recursive=True):
+                if "__pycache__" in source_file_path.parts:
+                    continue
+                with open(source_file_path, "rb") as source_file:
+                    source_hashes[os.path.relpath(source_file_path)] = hashlib.sha256(source_file.read()).hexdigest()
+    return dict(sorted(source_hashes.items()))
+
+
+class LibrarySnapshot(BaseModel):
+    """The validated domains, concepts, pipes and LLM deck, as they stand once the libraries are set up.
+
+    Concepts refer to their structure classes by name, so the classes must still be registered when loading a snapshot.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    snapshot_version: int = LIBRARY_SNAPSHOT_VERSION
+    pipelex_version: str = PIPELEX_VERSION
+    source_hashes: Dict[str, str]
+    domains: Dict[str, Domain]
+    concepts: Dict[str, Concept]
+    pipes: Dict[str, PipeAbstract]
+    llm_deck: LLMDeck
+
+    def is_up_to_date(self, source_hashes: Dict[str, str]) -> bool:
+        return self.snapshot_version == LIBRARY_SNAPSHOT_VERSION and self.pipelex_version == PIPELEX_VERSION and self.source_hashes == source_hashes
+
+    def save_to_path(self, snapshot_path: str):
+        if snapshot_dir := os.path.dirname(snapshot_path):
+            ensure_directory_exists(snapshot_dir)
+        # write then rename, so that a process starting meanwhile never reads a partial snapshot
+        tmp_snapshot_path = f"{snapshot_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_snapshot_path, "wb") as snapshot_file:
+                pickle.dump(self, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_snapshot_path, snapshot_path)
+        except Exception as exc:
+            if os.path.isfile(tmp_snapshot_path):
+                os.remove(tmp_snapshot_path)
+            raise LibrarySnapshotError(f"Could not save the library snapshot to '{snapshot_path}': {exc}") from exc
+
+    @classmethod
+    def load_from_path(cls, snapshot_path: str) -> "LibrarySnapshot":
+        try:
+            with open(snapshot_path, "rb") as snapshot_file:
+                snapshot = pickle.load(snapshot_file)
+        except Exception as exc:
+            # e.g. a snapshot made by another version, referring to classes which no longer exist
+            raise LibrarySnapshotError(f"Could not load the library snapshot from '{snapshot_path}': {exc}") from exc
+        if not isinstance(snapshot, LibrarySnapshot):
+            raise LibrarySnapshotError(f"File '{snapshot_path}' is not a library snapshot")
+        return snapshot
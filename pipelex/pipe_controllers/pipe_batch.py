@@ -1,5 +1,4 @@
-import asyncio
-from typing import Any, Coroutine, List, Optional, Set, cast
+from typing import Any, Coroutine, Iterator, List, Optional, Set, cast
 
 import shortuuid
 from pydantic import model_validator
@@ -18,6 +17,7 @@ from pipelex.exceptions import PipeInputError, PipeInputNotFoundError, WorkingMe
 from pipelex.hub import get_pipeline_tracker, get_required_pipe
 from pipelex.pipe_controllers.pipe_controller import PipeController
 from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.tools.misc.concurrency_utils import iterate_as_completed_bounded
 
 
 class PipeBatch(PipeController):
@@ -87,6 +87,8 @@ class PipeBatch(PipeController):
             method_name = "dry_run_pipe" if pipe_run_params.run_mode == PipeRunMode.DRY else "_run_controller_pipe"
             log.debug(f"PipeBatch.{method_name}() final_stuff_code: {pipe_run_params.final_stuff_code}")
             pipe_run_params.final_stuff_code = None
+        # the branches each produce a part of the final stuff, none of them streams it
+        pipe_run_params.is_final_text_streamed = False
 
         pipe_run_params.push_pipe_layer(pipe_code=self.branch_pipe_code)
         try:
@@ -106,61 +108,56 @@ class PipeBatch(PipeController):
 
         # TODO: Make commented code work when inputing images named "a.b.c"
         sub_pipe = get_required_pipe(pipe_code=self.branch_pipe_code)
+        required_variables = sub_pipe.required_variables()
         nb_history_items_limit = get_config().pipelex.tracker_config.applied_nb_items_limit
+        max_concurrency = batch_params.max_concurrency or get_config().pipelex.pipe_run_config.applied_batch_max_concurrency
         batch_output_stuff_code = shortuuid.uuid()
-        tasks: List[Coroutine[Any, Any, PipeOutput]] = []
+        branch_items = input_content.items
+        if nb_history_items_limit:
+            branch_items = branch_items[:nb_history_items_limit]
+        nb_branches = len(branch_items)
         item_stuffs: List[Stuff] = []
         required_stuff_lists: List[List[Stuff]] = []
-        branch_output_item_codes: List[str] = []
-
-        for branch_index, item in enumerate(input_content.items):
-            branch_output_item_code = f"{batch_output_stuff_code}-branch-{branch_index}"
-            branch_output_item_codes.append(branch_output_item_code)
-            if nb_history_items_limit and branch_index >= nb_history_items_limit:
-                break
-            branch_input_item_code = f"{input_stuff_code}-branch-{branch_index}"
-            item_input_stuff = StuffFactory.make_stuff(
-                code=branch_input_item_code,
-                concept_str=input_item_concept_code,
-                content=item,
-                name=input_item_stuff_name,
-            )
-            item_stuffs.append(item_input_stuff)
-            branch_memory = working_memory.make_deep_copy()
-            branch_memory.set_new_main_stuff(stuff=item_input_stuff, name=input_item_stuff_name)
-
-            required_variables = sub_pipe.required_variables()
-            required_stuffs = branch_memory.get_existing_stuffs(names=required_variables)
-            required_stuffs = [required_stuff for required_stuff in required_stuffs if required_stuff.stuff_code != input_stuff_code]
-            required_stuff_lists.append(required_stuffs)
-            branch_pipe_run_params = pipe_run_params.deep_copy_with_final_stuff_code(final_stuff_code=branch_output_item_code)
-
-            if pipe_run_params.run_mode == PipeRunMode.DRY:
-                branch_pipe_run_params.run_mode = PipeRunMode.DRY
-                task = sub_pipe.run_pipe(
-                    job_metadata=job_metadata,
-                    working_memory=branch_memory,
-                    output_name=f"Batch result {branch_index + 1} of {output_name}",
-                    pipe_run_params=branch_pipe_run_params,
+
+        def make_branch_tasks() -> Iterator[Coroutine[Any, Any, PipeOutput]]:
+            # Branches are prepared lazily, only when the scheduler admits them,
+            # so that we never hold more branch memories than max_concurrency
+            for branch_index, item in enumerate(branch_items):
+                branch_output_item_code = f"{batch_output_stuff_code}-branch-{branch_index}"
+                branch_input_item_code = f"{input_stuff_code}-branch-{branch_index}"
+                item_input_stuff = StuffFactory.make_stuff(
+                    code=branch_input_item_code,
+                    concept_str=input_item_concept_code,
+                    content=item,
+                    name=input_item_stuff_name,
                 )
-            else:
-                task = sub_pipe.run_pipe(
+                item_stuffs.append(item_input_stuff)
+                branch_memory = working_memory.make_branch_copy()
+                branch_memory.set_new_main_stuff(stuff=item_input_stuff, name=input_item_stuff_name)
+
+                required_stuffs = branch_memory.get_existing_stuffs(names=required_variables)
+                required_stuffs = [required_stuff for required_stuff in required_stuffs if required_stuff.stuff_code != input_stuff_code]
+                required_stuff_lists.append(required_stuffs)
+                branch_pipe_run_params = pipe_run_params.deep_copy_with_final_stuff_code(final_stuff_code=branch_output_item_code)
+
+                if pipe_run_params.run_mode == PipeRunMode.DRY:
+                    branch_pipe_run_params.run_mode = PipeRunMode.DRY
+                yield sub_pipe.run_pipe(
                     job_metadata=job_metadata,
                     working_memory=branch_memory,
                     output_name=f"Batch result {branch_index + 1} of {output_name}",
                     pipe_run_params=branch_pipe_run_params,
                 )
-            tasks.append(task)
 
-        pipe_outputs = await asyncio.gather(*tasks)
+        log.debug(f"PipeBatch '{self.code}' running {nb_branches} branches with max_concurrency = {max_concurrency or 'unlimited'}")
+        # Only the main stuff of each branch is kept, the branch memory is released as soon as the branch completes
+        branch_output_stuffs: List[Optional[Stuff]] = [None] * nb_branches
+        async for branch_index, pipe_output in iterate_as_completed_bounded(awaitables=make_branch_tasks(), max_concurrency=max_concurrency):
+            branch_output_stuffs[branch_index] = pipe_output.main_stuff
+        output_stuffs = cast(List[Stuff], branch_output_stuffs)
 
-        output_items: List[StuffContent] = []
-        output_stuffs: List[Stuff] = []
+        output_items: List[StuffContent] = [output_stuff.content for output_stuff in output_stuffs]
         output_stuff_code = shortuuid.uuid()[:5]
-        for branch_index, pipe_output in enumerate(pipe_outputs):
-            branch_output_stuff = pipe_output.main_stuff
-            output_stuffs.append(branch_output_stuff)
-            output_items.append(branch_output_stuff.content)
 
         list_content: ListContent[StuffContent] = ListContent(items=output_items)
         output_stuff = StuffFactory.make_stuff(
@@ -194,8 +191,7 @@ class PipeBatch(PipeController):
                     is_with_edge=(required_stuff.stuff_name != MAIN_STUFF_NAME),
                 )
 
-        for branch_index, branch_output_stuff in enumerate(output_stuffs):
-            branch_output_item_code = branch_output_item_codes[branch_index]
+        for branch_output_stuff in output_stuffs:
             get_pipeline_tracker().add_aggregate_step(
                 from_stuff=branch_output_stuff,
                 to_stuff=output_stuff,
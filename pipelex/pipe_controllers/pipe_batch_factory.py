@@ -13,6 +13,7 @@ class PipeBatchBlueprint(PipeBlueprint):
 
     input_list_name: Optional[str] = None
     input_item_name: Optional[str] = None
+    max_concurrency: Optional[int] = None
 
 
 class PipeBatchFactory(PipeSpecificFactoryProtocol[PipeBatchBlueprint, PipeBatch]):
@@ -27,6 +28,7 @@ class PipeBatchFactory(PipeSpecificFactoryProtocol[PipeBatchBlueprint, PipeBatch
         batch_params = BatchParams.make_optional_batch_params(
             input_list_name=pipe_blueprint.input_list_name or False,
             input_item_name=pipe_blueprint.input_item_name,
+            max_concurrency=pipe_blueprint.max_concurrency,
         )
         return PipeBatch(
             domain=domain_code,
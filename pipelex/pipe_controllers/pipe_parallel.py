@@ -142,6 +142,7 @@ class PipeParallel(PipeController):
         if pipe_run_params.final_stuff_code:
             log.debug(f"PipeBatch.run_pipe() final_stuff_code: {pipe_run_params.final_stuff_code}")
             pipe_run_params.final_stuff_code = None
+        pipe_run_params.is_final_text_streamed = False
 
         tasks: List[Coroutine[Any, Any, PipeOutput]] = []
 
@@ -150,7 +151,7 @@ class PipeParallel(PipeController):
                 sub_pipe.run_pipe(
                     calling_pipe_code=self.code,
                     job_metadata=job_metadata,
-                    working_memory=working_memory.make_deep_copy(),
+                    working_memory=working_memory.make_branch_copy(),
                     sub_pipe_run_params=pipe_run_params.make_deep_copy(),
                 )
             )
@@ -251,7 +252,7 @@ class PipeParallel(PipeController):
                 sub_pipe.run_pipe(
                     calling_pipe_code=self.code,
                     job_metadata=job_metadata,
-                    working_memory=working_memory.make_deep_copy(),
+                    working_memory=working_memory.make_branch_copy(),
                     sub_pipe_run_params=pipe_run_params.make_deep_copy(),
                 )
             )
@@ -1,4 +1,5 @@
-from typing import List, Optional, Set
+import asyncio
+from typing import Dict, List, Optional, Set, Tuple
 
 from pydantic import model_validator
 from typing_extensions import Self, override
@@ -8,7 +9,7 @@ from pipelex.config import StaticValidationReaction, get_config
 from pipelex.core.pipe_input_spec import PipeInputSpec
 from pipelex.core.pipe_output import PipeOutput
 from pipelex.core.pipe_run_params import PipeRunMode, PipeRunParams
-from pipelex.core.working_memory import WorkingMemory
+from pipelex.core.working_memory import MAIN_STUFF_NAME, WorkingMemory
 from pipelex.exceptions import PipeRunParamsError, StaticValidationError, StaticValidationErrorType
 from pipelex.hub import get_required_pipe
 from pipelex.pipe_controllers.pipe_controller import PipeController
@@ -18,6 +19,8 @@ from pipelex.pipeline.job_metadata import JobMetadata
 
 class PipeSequence(PipeController):
     sequential_sub_pipes: List[SubPipe]
+    # in DAG mode, steps which don't depend on each other's results run concurrently
+    dag_mode: bool = False
 
     @override
     def needed_inputs(self) -> PipeInputSpec:
@@ -30,18 +33,7 @@ class PipeSequence(PipeController):
         generated_outputs: Set[str] = set()
 
         for sequential_sub_pipe in self.sequential_sub_pipes:
-            sub_pipe_needed_inputs = get_required_pipe(pipe_code=sequential_sub_pipe.pipe_code).needed_inputs()
-
-            # Handle batching: if this sub_pipe has batch_params, exclude the batch_as input
-            # since it's provided by the batching mechanism
-            if sequential_sub_pipe.batch_params:
-                batch_as_input = sequential_sub_pipe.batch_params.input_item_stuff_name
-                # Create a new PipeInputSpec without the batch_as input
-                filtered_needed_inputs = PipeInputSpec.make_empty()
-                for var_name, concept_code in sub_pipe_needed_inputs.items:
-                    if var_name != batch_as_input:
-                        filtered_needed_inputs.add_requirement(variable_name=var_name, concept_code=concept_code)
-                sub_pipe_needed_inputs = filtered_needed_inputs
+            sub_pipe_needed_inputs = self._get_sub_pipe_needed_inputs(sub_pipe=sequential_sub_pipe)
 
             # Add inputs that haven't been generated by previous steps
             for var_name, concept_code in sub_pipe_needed_inputs.items:
@@ -54,6 +46,65 @@ class PipeSequence(PipeController):
 
         return needed_inputs
 
+    @staticmethod
+    def _get_sub_pipe_needed_inputs(sub_pipe: SubPipe) -> PipeInputSpec:
+        sub_pipe_needed_inputs = get_required_pipe(pipe_code=sub_pipe.pipe_code).needed_inputs()
+
+        # Handle batching: if this sub_pipe has batch_params, exclude the batch_as input
+        # since it's provided by the batching mechanism
+        if sub_pipe.batch_params:
+            batch_as_input = sub_pipe.batch_params.input_item_stuff_name
+            # Create a new PipeInputSpec without the batch_as input
+            filtered_needed_inputs = PipeInputSpec.make_empty()
+            for var_name, concept_code in sub_pipe_needed_inputs.items:
+                if var_name != batch_as_input:
+                    filtered_needed_inputs.add_requirement(variable_name=var_name, concept_code=concept_code)
+            sub_pipe_needed_inputs = filtered_needed_inputs
+        return sub_pipe_needed_inputs
+
+    def make_step_dependencies(self) -> List[Set[int]]:
+        """
+        For each step, the indexes of the previous steps it must wait for when running in DAG mode.
+
+        A step depends on a previous step if it reads the result the previous one writes, if both write the same result,
+        or if it writes a result the previous one reads (which must not see the newer value).
+        A controller step may write other stuffs than its result, so it depends on all the previous steps,
+        and all the following steps depend on it.
+        Every step also moves the main stuff: a step reading it depends on all the previous steps, and the steps writing it
+        after a step reading it depend on that step. Writing it twice is not a conflict, as the changes are applied
+        in the order of the sequence.
+        """
+        steps_reads: List[Set[str]] = []
+        # None means the written stuffs are unknown
+        steps_writes: List[Optional[Set[str]]] = []
+        for sub_pipe in self.sequential_sub_pipes:
+            step_reads = set(self._get_sub_pipe_needed_inputs(sub_pipe=sub_pipe).required_names)
+            if sub_pipe.batch_params:
+                step_reads.add(sub_pipe.batch_params.input_list_stuff_name)
+            steps_reads.append(step_reads)
+            if isinstance(get_required_pipe(pipe_code=sub_pipe.pipe_code), PipeController):
+                steps_writes.append(None)
+            else:
+                step_writes = {sub_pipe.output_name} if sub_pipe.output_name else set()
+                step_writes.add(MAIN_STUFF_NAME)
+                steps_writes.append(step_writes)
+
+        step_dependencies: List[Set[int]] = []
+        for step_index, (step_reads, step_writes) in enumerate(zip(steps_reads, steps_writes)):
+            dependencies: Set[int] = set()
+            for previous_index in range(step_index):
+                previous_writes = steps_writes[previous_index]
+                if (
+                    step_writes is None
+                    or previous_writes is None
+                    or previous_writes & step_reads
+                    or (previous_writes & step_writes) - {MAIN_STUFF_NAME}
+                    or step_writes & steps_reads[previous_index]
+                ):
+                    dependencies.add(previous_index)
+            step_dependencies.append(dependencies)
+        return step_dependencies
+
     @override
     def required_variables(self) -> Set[str]:
         return set()
@@ -138,15 +189,22 @@ class PipeSequence(PipeController):
         pipe_run_params.push_pipe_layer(pipe_code=self.code)
         self._validate_output_multiplicity_support(pipe_run_params)
 
+        if self.dag_mode:
+            return await self._run_steps_as_dag(
+                job_metadata=job_metadata,
+                working_memory=working_memory,
+                pipe_run_params=pipe_run_params,
+            )
+
         evolving_memory = working_memory
 
         for sub_pipe_index, sub_pipe in enumerate(self.sequential_sub_pipes):
             sub_pipe_run_params: PipeRunParams
-            # only the last step should apply the final_stuff_code
+            # only the last step should apply the final_stuff_code and stream the final text
             if sub_pipe_index == len(self.sequential_sub_pipes) - 1:
                 sub_pipe_run_params = pipe_run_params.model_copy()
             else:
-                sub_pipe_run_params = pipe_run_params.model_copy(update=({"final_stuff_code": None}))
+                sub_pipe_run_params = pipe_run_params.model_copy(update=({"final_stuff_code": None, "is_final_text_streamed": False}))
             pipe_output = await sub_pipe.run_pipe(
                 calling_pipe_code=self.code,
                 working_memory=evolving_memory,
@@ -159,6 +217,83 @@ class PipeSequence(PipeController):
             pipeline_run_id=job_metadata.pipeline_run_id,
         )
 
+    async def _run_steps_as_dag(
+        self,
+        job_metadata: JobMetadata,
+        working_memory: WorkingMemory,
+        pipe_run_params: PipeRunParams,
+    ) -> PipeOutput:
+        """
+        Run each step as soon as the steps it depends on are done, on a branch copy of the memory they produced.
+        The changes made by the steps are applied in the order of the sequence, both to make the memory a step starts from
+        and to make the final working memory, which is the same as when running the steps one after the other.
+        If a step fails, the running steps are cancelled and awaited before raising its error.
+        """
+        step_dependencies = self.make_step_dependencies()
+        last_step_index = len(self.sequential_sub_pipes) - 1
+        # for each step, the memory it started from and the memory it produced
+        step_memories: Dict[int, Tuple[WorkingMemory, WorkingMemory]] = {}
+        running_steps: Dict[asyncio.Task[PipeOutput], Tuple[int, WorkingMemory]] = {}
+        pending_step_indexes = list(range(len(self.sequential_sub_pipes)))
+
+        try:
+            while pending_step_indexes or running_steps:
+                for step_index in list(pending_step_indexes):
+                    if not step_dependencies[step_index] <= step_memories.keys():
+                        continue
+                    pending_step_indexes.remove(step_index)
+                    sub_pipe_run_params = pipe_run_params.make_deep_copy()
+                    # only the last step should apply the final_stuff_code and stream the final text
+                    if step_index != last_step_index:
+                        sub_pipe_run_params.final_stuff_code = None
+                        sub_pipe_run_params.is_final_text_streamed = False
+                    step_base_memory = self._make_memory_with_step_changes(working_memory=working_memory, step_memories=step_memories)
+                    step_task = asyncio.create_task(
+                        self.sequential_sub_pipes[step_index].run_pipe(
+                            calling_pipe_code=self.code,
+                            working_memory=step_base_memory.make_branch_copy(),
+                            job_metadata=job_metadata,
+                            sub_pipe_run_params=sub_pipe_run_params,
+                        )
+                    )
+                    running_steps[step_task] = (step_index, step_base_memory)
+
+                done_tasks, _ = await asyncio.wait(running_steps.keys(), return_when=asyncio.FIRST_COMPLETED)
+                step_error: Optional[BaseException] = None
+                # retrieve the result of every done step, so that no error is left unretrieved
+                for done_task in done_tasks:
+                    step_index, step_base_memory = running_steps.pop(done_task)
+                    if done_step_error := done_task.exception():
+                        step_error = step_error or done_step_error
+                        continue
+                    step_memories[step_index] = (step_base_memory, done_task.result().working_memory)
+                if step_error:
+                    raise step_error
+        finally:
+            for running_task in running_steps:
+                running_task.cancel()
+            await asyncio.gather(*running_steps, return_exceptions=True)
+
+        for step_index in range(len(self.sequential_sub_pipes)):
+            step_base_memory, step_memory = step_memories[step_index]
+            working_memory.apply_branch_changes(branch=step_memory, branch_base=step_base_memory)
+        return PipeOutput(
+            working_memory=working_memory,
+            pipeline_run_id=job_metadata.pipeline_run_id,
+        )
+
+    @staticmethod
+    def _make_memory_with_step_changes(
+        working_memory: WorkingMemory,
+        step_memories: Dict[int, Tuple[WorkingMemory, WorkingMemory]],
+    ) -> WorkingMemory:
+        """A branch copy of the working memory with the changes of the steps done so far, applied in the order of the sequence."""
+        memory = working_memory.make_branch_copy()
+        for step_index in sorted(step_memories):
+            step_base_memory, step_memory = step_memories[step_index]
+            memory.apply_branch_changes(branch=step_memory, branch_base=step_base_memory)
+        return memory
+
     @override
     async def _dry_run_controller_pipe(
         self,
@@ -10,6 +10,7 @@ from pipelex.pipe_controllers.sub_pipe_factory import SubPipeBlueprint
 
 class PipeSequenceBlueprint(PipeBlueprint):
     steps: List[SubPipeBlueprint]
+    dag_mode: bool = False
 
 
 class PipeSequenceFactory(PipeSpecificFactoryProtocol[PipeSequenceBlueprint, PipeSequence]):
@@ -29,6 +30,7 @@ class PipeSequenceFactory(PipeSpecificFactoryProtocol[PipeSequenceBlueprint, Pip
             inputs=PipeInputSpec(root=pipe_blueprint.inputs or {}),
             output_concept_code=pipe_blueprint.output,
             sequential_sub_pipes=pipe_steps,
+            dag_mode=pipe_blueprint.dag_mode,
         )
 
     @classmethod
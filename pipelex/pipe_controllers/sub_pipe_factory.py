@@ -18,6 +18,7 @@ class SubPipeBlueprint(BaseModel):
     multiple_output: Optional[bool] = None
     batch_over: Union[bool, str] = False
     batch_as: Optional[str] = None
+    batch_max_concurrency: Optional[int] = None
 
     @model_validator(mode="after")
     def validate_multiple_output(self) -> Self:
@@ -36,6 +37,9 @@ class SubPipeBlueprint(BaseModel):
         if batch_as_is_specified and not batch_over_is_specified:
             raise PipeDefinitionError(f"In pipe '{self.pipe}': When 'batch_as' is specified, 'batch_over' must also be provided")
 
+        if self.batch_max_concurrency is not None and not batch_over_is_specified:
+            raise PipeDefinitionError(f"In pipe '{self.pipe}': 'batch_max_concurrency' can only be used together with 'batch_over'")
+
         return self
 
     def make_sub_pipe(self) -> SubPipe:
@@ -46,6 +50,7 @@ class SubPipeBlueprint(BaseModel):
         batch_params = BatchParams.make_optional_batch_params(
             input_list_name=self.batch_over,
             input_item_name=self.batch_as,
+            max_concurrency=self.batch_max_concurrency,
         )
         return SubPipe(
             pipe_code=self.pipe,
@@ -1,3 +1,4 @@
+from contextlib import aclosing
 from typing import List, Optional, Set, Type, cast
 
 from pydantic import model_validator
@@ -10,6 +11,7 @@ from pipelex.cogt.llm.llm_models.llm_deck_check import check_llm_setting_with_de
 from pipelex.cogt.llm.llm_models.llm_setting import LLMSetting, LLMSettingChoices, LLMSettingOrPresetId
 from pipelex.cogt.llm.llm_prompt import LLMPrompt
 from pipelex.cogt.llm.llm_prompt_factory_abstract import LLMPromptFactoryAbstract
+from pipelex.cogt.llm.llm_schema_cache import get_llm_schema_cache
 from pipelex.config import StaticValidationReaction, get_config
 from pipelex.core.concept_code_factory import ConceptCodeFactory
 from pipelex.core.concept_native import NativeConcept, NativeConceptClass
@@ -33,6 +35,7 @@ from pipelex.exceptions import (
     StaticValidationErrorType,
 )
 from pipelex.hub import (
+    get_activity_manager,
     get_class_registry,
     get_concept_provider,
     get_content_generator,
@@ -47,6 +50,7 @@ from pipelex.pipe_operators.pipe_jinja2_factory import PipeJinja2Factory
 from pipelex.pipe_operators.pipe_llm_prompt import PipeLLMPrompt, PipeLLMPromptOutput
 from pipelex.pipe_operators.pipe_operator import PipeOperator
 from pipelex.pipe_operators.piped_llm_prompt_factory import PipedLLMPromptFactory
+from pipelex.pipeline.activity.activity_models import ActivityReport, ActivityTextChunk
 from pipelex.pipeline.job_metadata import JobCategory, JobMetadata
 from pipelex.types import StrEnum
 
@@ -93,6 +97,25 @@ class PipeLLM(PipeOperator):
         if self.llm_choices:
             for llm_setting in self.llm_choices.list_used_presets():
                 check_llm_setting_with_deck(llm_setting_or_preset_id=llm_setting)
+        self._prepare_output_structure()
+
+    def _prepare_output_structure(self):
+        """Build the structure prompt and the structured output schemas of the output class once, at load time, rather than on every run."""
+        if self.output_concept_code == ConceptCodeFactory.make_concept_code(SpecialDomain.NATIVE, NativeConcept.DYNAMIC.code):
+            return
+        output_concept = get_required_concept(concept_code=self.output_concept_code)
+        _, is_multiple_output, _ = output_multiplicity_to_apply(
+            output_multiplicity_base=self.output_multiplicity,
+            output_multiplicity_override=None,
+        )
+        if output_concept.structure_class_name == NativeConceptClass.TEXT and not is_multiple_output:
+            return
+        PipeLLMPrompt.get_output_structure_prompt(output_concept=self.output_concept_code)
+        output_class = get_class_registry().get_required_subclass(name=output_concept.structure_class_name, base_class=StuffContent)
+        llm_schema_cache = get_llm_schema_cache()
+        schema = llm_schema_cache.get_list_schema(item_class=output_class) if is_multiple_output else output_class
+        llm_schema_cache.get_json_schema(schema=schema)
+        llm_schema_cache.get_instructor_schema(schema=schema)
 
     @override
     def needed_inputs(self) -> PipeInputSpec:
@@ -269,30 +292,29 @@ class PipeLLM(PipeOperator):
             llm_for_text_choice = self.llm_choices.for_text
             llm_for_object_choice = self.llm_choices.for_object
 
+        llm_deck = get_llm_deck()
+
         # Choice of main LLM for text first from this PipeLLM setting (self.llm_choices)
         # or from the llm_choice_overrides or fallback on the llm_choice_defaults
         llm_setting_or_preset_id_for_text: LLMSettingOrPresetId = (
-            llm_for_text_choice or get_llm_deck().llm_choice_overrides.for_text or get_llm_deck().llm_choice_defaults.for_text
+            llm_for_text_choice or llm_deck.llm_choice_overrides.for_text or llm_deck.llm_choice_defaults.for_text
         )
-        llm_setting_main: LLMSetting = get_llm_deck().get_llm_setting(llm_setting_or_preset_id=llm_setting_or_preset_id_for_text)
+        llm_setting_main: LLMSetting = llm_deck.get_llm_setting(llm_setting_or_preset_id=llm_setting_or_preset_id_for_text)
 
         # Choice of main LLM for object from this PipeLLM setting (self.llm_choices)
         # OR FROM THE llm_for_text_choice (if any)
         # then fallback on the llm_choice_overrides or llm_choice_defaults
         llm_setting_or_preset_id_for_object: LLMSettingOrPresetId = (
-            llm_for_object_choice
-            or llm_for_text_choice
-            or get_llm_deck().llm_choice_overrides.for_object
-            or get_llm_deck().llm_choice_defaults.for_object
+            llm_for_object_choice or llm_for_text_choice or llm_deck.llm_choice_overrides.for_object or llm_deck.llm_choice_defaults.for_object
         )
-        llm_setting_for_object: LLMSetting = get_llm_deck().get_llm_setting(llm_setting_or_preset_id=llm_setting_or_preset_id_for_object)
+        llm_setting_for_object: LLMSetting = llm_deck.get_llm_setting(llm_setting_or_preset_id=llm_setting_or_preset_id_for_object)
 
-        if not self.pipe_llm_prompt.prompting_style and (llm_model := get_llm_deck().find_optional_llm_model(llm_handle=llm_setting_main.llm_handle)):
+        if not self.pipe_llm_prompt.prompting_style and (llm_model := llm_deck.find_optional_llm_model(llm_handle=llm_setting_main.llm_handle)):
             llm_family = llm_model.llm_family
             if llm_setting_main.prompting_target:
-                log.dev(f"prompting_target for '{llm_setting_main.llm_handle}' from setting: {llm_setting_main}")
+                log.dev(lambda: f"prompting_target for '{llm_setting_main.llm_handle}' from setting: {llm_setting_main}")
             else:
-                log.dev(f"prompting_target for '{llm_setting_main.llm_handle}' from llm_family: {llm_family}")
+                log.dev(lambda: f"prompting_target for '{llm_setting_main.llm_handle}' from llm_family: {llm_family}")
             prompting_target = llm_setting_main.prompting_target or llm_family.prompting_target
             self.pipe_llm_prompt.prompting_style = get_config().pipelex.prompting_config.get_prompting_style(
                 prompting_target=prompting_target,
@@ -327,11 +349,32 @@ class PipeLLM(PipeOperator):
         the_content: StuffContent
         if output_concept.structure_class_name == NativeConceptClass.TEXT and not is_multiple_output:
             log.debug(f"PipeLLM generating a single text output: {self.class_name}_gen_text")
-            generated_text: str = await content_generator.make_llm_text(
-                job_metadata=job_metadata,
-                llm_prompt_for_text=llm_prompt_1,
-                llm_setting_main=llm_setting_main,
-            )
+            generated_text: str
+            if pipe_run_params.is_final_text_streamed:
+                text_chunks: List[str] = []
+                # the stream is closed even if dispatching a chunk fails, so that the LLM call is not left open
+                async with aclosing(
+                    content_generator.make_llm_text_stream(
+                        job_metadata=job_metadata,
+                        llm_prompt_for_text=llm_prompt_1,
+                        llm_setting_main=llm_setting_main,
+                    )
+                ) as text_stream:
+                    async for text_chunk in text_stream:
+                        text_chunks.append(text_chunk)
+                        get_activity_manager().dispatch_activity(
+                            activity_report=ActivityReport(
+                                job_metadata=job_metadata,
+                                content=ActivityTextChunk(pipe_code=self.code, text_chunk=text_chunk),
+                            )
+                        )
+                generated_text = "".join(text_chunks)
+            else:
+                generated_text = await content_generator.make_llm_text(
+                    job_metadata=job_metadata,
+                    llm_prompt_for_text=llm_prompt_1,
+                    llm_setting_main=llm_setting_main,
+                )
 
             the_content = TextContent(
                 text=generated_text,
@@ -1,4 +1,4 @@
-from typing import ClassVar, List, Optional, Set, cast
+from typing import Any, ClassVar, Dict, List, Optional, Set, Type, cast
 
 from pydantic import model_validator
 from typing_extensions import Self, override
@@ -7,6 +7,7 @@ from pipelex import log
 from pipelex.cogt.image.prompt_image import PromptImage
 from pipelex.cogt.image.prompt_image_factory import PromptImageFactory
 from pipelex.cogt.llm.llm_prompt import LLMPrompt
+from pipelex.cogt.llm.llm_schema_cache import get_llm_schema_cache
 from pipelex.core.concept import Concept
 from pipelex.core.concept_native import NativeConcept
 from pipelex.core.pipe_input_spec import PipeInputSpec
@@ -236,13 +237,21 @@ class PipeLLMPrompt(PipeOperator):
         output_class = get_class_registry().get_class(class_name)
         if not output_class:
             return ""
+        # the structure prompt only depends on the output class, so it's made once per class
+        return get_llm_schema_cache().get_structure_prompt(
+            class_name=class_name,
+            output_class=output_class,
+            make_structure_prompt=lambda: PipeLLMPrompt._make_output_structure_prompt(class_name=class_name, output_class=output_class),
+        )
 
+    @staticmethod
+    def _make_output_structure_prompt(class_name: str, output_class: Type[Any]) -> str:
         class_structure = get_type_structure(output_class, base_class=StuffContent)
 
         if not class_structure:
             return ""
 
-        output_structure_prompt = (
+        return (
             f"\n\n---\nRequested output format: The output should be the following class: {class_name}\n"
             f"{chr(10).join(class_structure)}\n"
             "You do NOT need to output a formatted JSON object, another LLM will take care of that. "
@@ -250,7 +259,6 @@ class PipeLLMPrompt(PipeOperator):
             "However, you MUST clearly output the values for each of these fields in your response.\n---\n"
             "DO NOT create information. If the information is not present, output None."
         )
-        return output_structure_prompt
 
     async def _unravel_text(
         self,
@@ -9,7 +9,7 @@ from pipelex.cogt.content_generation.content_generator_protocol import ContentGe
 from pipelex.cogt.ocr.ocr_engine import OcrEngine
 from pipelex.cogt.ocr.ocr_handle import OcrHandle
 from pipelex.cogt.ocr.ocr_input import OcrInput
-from pipelex.cogt.ocr.ocr_job_components import OcrJobConfig, OcrJobParams
+from pipelex.cogt.ocr.ocr_job_components import OcrJobParams
 from pipelex.config import StaticValidationReaction, get_config
 from pipelex.core.concept_native import NativeConcept
 from pipelex.core.pipe_input_spec import PipeInputSpec
@@ -30,6 +30,7 @@ from pipelex.hub import (
 from pipelex.pipe_operators.pipe_operator import PipeOperator
 from pipelex.pipeline.job_metadata import JobMetadata
 from pipelex.tools.pdf.pypdfium2_renderer import pypdfium2_renderer
+from pipelex.tools.storage.local_storage_provider import LocalStorageProvider
 
 
 class PipeOcrOutput(PipeOutput):
@@ -45,6 +46,7 @@ class PipeOcr(PipeOperator):
     should_include_images: bool
     should_include_page_views: bool
     page_views_dpi: int
+    nb_pages_per_chunk: Optional[int] = None
 
     image_stuff_name: Optional[str] = None
     pdf_stuff_name: Optional[str] = None
@@ -130,6 +132,14 @@ class PipeOcr(PipeOperator):
     def needed_inputs(self) -> PipeInputSpec:
         return PipeInputSpec.make_from_dict({PIPE_OCR_INPUT_NAME: self.inputs.root[PIPE_OCR_INPUT_NAME]})
 
+    @staticmethod
+    def _get_page_views_storage_provider() -> Optional[LocalStorageProvider]:
+        ocr_config = get_config().cogt.ocr_config
+        if not ocr_config.is_page_views_storage_enabled:
+            return None
+        # the page views are used as prompt images, which are read from file paths, so they're stored as local files
+        return LocalStorageProvider(directory=ocr_config.page_views_storage_dir)
+
     @override
     async def _run_operator_pipe(
         self,
@@ -158,6 +168,7 @@ class PipeOcr(PipeOperator):
             should_caption_images=self.should_caption_images,
             should_include_page_views=self.should_include_page_views,
             page_views_dpi=self.page_views_dpi,
+            nb_pages_per_chunk=self.nb_pages_per_chunk,
         )
         ocr_input = OcrInput(
             image_uri=image_uri,
@@ -168,7 +179,7 @@ class PipeOcr(PipeOperator):
             ocr_handle=ocr_handle,
             job_metadata=job_metadata,
             ocr_job_params=ocr_job_params,
-            ocr_job_config=OcrJobConfig(),
+            ocr_job_config=get_config().cogt.ocr_config.ocr_job_config,
         )
 
         # Build the output stuff, which is a list of page contents
@@ -192,8 +203,19 @@ class PipeOcr(PipeOperator):
                     needs_to_generate_page_views = False
 
                 if needs_to_generate_page_views:
-                    page_views = await pypdfium2_renderer.render_pdf_pages_from_uri(pdf_uri=pdf_uri, dpi=self.page_views_dpi)
-                    page_view_contents = [ImageContent.make_from_image(image=img) for img in page_views]
+                    # pages are encoded as they're rendered, so only a few rendered pages are held in memory at once
+                    page_views_storage_provider = self._get_page_views_storage_provider()
+                    page_view_contents = []
+                    page_number = 0
+                    async for png_page in pypdfium2_renderer.iterate_pdf_pages_as_png_from_uri(pdf_uri=pdf_uri, dpi=self.page_views_dpi):
+                        page_number += 1
+                        page_view_contents.append(
+                            await ImageContent.make_from_png_bytes_async(
+                                png_bytes=png_page,
+                                image_name=f"page_view_{page_number}.png",
+                                storage_provider=page_views_storage_provider,
+                            )
+                        )
             elif image_uri:
                 page_view_contents = [ImageContent.make_from_str(str_value=image_uri)]
 
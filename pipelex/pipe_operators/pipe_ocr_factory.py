@@ -1,5 +1,6 @@
 from typing import Any, Dict, Optional
 
+from pydantic import Field
 from typing_extensions import override
 
 from pipelex.cogt.ocr.ocr_engine_factory import OcrEngineFactory
@@ -18,6 +19,7 @@ class PipeOcrBlueprint(PipeBlueprint):
     page_image_captions: bool = False
     page_views: bool = False
     page_views_dpi: Optional[int] = None
+    pages_per_chunk: Optional[int] = Field(default=None, ge=1)
 
 
 class PipeOcrFactory(PipeSpecificFactoryProtocol[PipeOcrBlueprint, PipeOcr]):
@@ -45,6 +47,7 @@ class PipeOcrFactory(PipeSpecificFactoryProtocol[PipeOcrBlueprint, PipeOcr]):
             should_caption_images=pipe_blueprint.page_image_captions,
             should_include_page_views=pipe_blueprint.page_views,
             page_views_dpi=pipe_blueprint.page_views_dpi or get_config().cogt.ocr_config.default_page_views_dpi,
+            nb_pages_per_chunk=pipe_blueprint.pages_per_chunk or get_config().cogt.ocr_config.default_nb_pages_per_chunk,
         )
 
     @classmethod
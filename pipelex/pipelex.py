@@ -20,6 +20,7 @@ from pipelex.cogt.content_generation.content_generator_protocol import (
 from pipelex.cogt.inference.inference_manager import InferenceManager
 from pipelex.cogt.llm.llm_models.llm_model import LATEST_VERSION_NAME
 from pipelex.cogt.llm.llm_models.llm_model_library import LLMModelLibrary
+from pipelex.cogt.llm.llm_schema_cache import get_llm_schema_cache
 from pipelex.config import PipelexConfig, get_config
 from pipelex.core.concept_library import ConceptLibrary
 from pipelex.core.domain_library import DomainLibrary
@@ -36,7 +37,6 @@ from pipelex.pipeline.activity.activity_manager_protocol import (
     ActivityManagerProtocol,
 )
 from pipelex.pipeline.pipeline_manager import PipelineManager
-from pipelex.pipeline.track.pipeline_tracker import PipelineTracker
 from pipelex.pipeline.track.pipeline_tracker_protocol import (
     PipelineTrackerNoOp,
     PipelineTrackerProtocol,
@@ -47,10 +47,13 @@ from pipelex.reporting.reporting_protocol import ReportingNoOp, ReportingProtoco
 from pipelex.test_extras.registry_test_models import PipelexTestModels
 from pipelex.tools.config.models import ConfigRoot
 from pipelex.tools.func_registry import func_registry
+from pipelex.tools.http.http_client_manager import get_http_client_manager
+from pipelex.tools.pdf.pypdfium2_renderer import pypdfium2_renderer
 from pipelex.tools.runtime_manager import runtime_manager
 from pipelex.tools.secrets.env_secrets_provider import EnvSecretsProvider
 from pipelex.tools.secrets.secrets_provider_abstract import SecretsProviderAbstract
 from pipelex.tools.storage.storage_provider_abstract import StorageProviderAbstract
+from pipelex.tools.templating.jinja2_template_cache import get_jinja2_template_cache
 from pipelex.tools.templating.template_library import TemplateLibrary
 from pipelex.tools.typing.pydantic_utils import format_pydantic_validation_error
 
@@ -70,7 +73,7 @@ class Pipelex(metaclass=MetaSingleton):
         llm_model_provider: Optional[LLMModelLibrary] = None,
         inference_manager: Optional[InferenceManager] = None,
         pipeline_manager: Optional[PipelineManager] = None,
-        pipeline_tracker: Optional[PipelineTracker] = None,
+        pipeline_tracker: Optional[PipelineTrackerProtocol] = None,
         activity_manager: Optional[ActivityManagerProtocol] = None,
         reporting_delegate: Optional[ReportingProtocol] = None,
     ) -> None:
@@ -112,7 +115,10 @@ class Pipelex(metaclass=MetaSingleton):
 
         self.reporting_delegate: ReportingProtocol
         if get_config().pipelex.feature_config.is_reporting_enabled:
-            self.reporting_delegate = reporting_delegate or ReportingManager(reporting_config=get_config().pipelex.reporting_config)
+            self.reporting_delegate = reporting_delegate or ReportingManager(
+                reporting_config=get_config().pipelex.reporting_config,
+                run_retention_config=get_config().pipelex.run_retention_config,
+            )
         else:
             self.reporting_delegate = ReportingNoOp()
         self.pipelex_hub.set_report_delegate(self.reporting_delegate)
@@ -138,6 +144,9 @@ class Pipelex(metaclass=MetaSingleton):
         if pipeline_tracker:
             self.pipeline_tracker = pipeline_tracker
         elif get_config().pipelex.feature_config.is_pipeline_tracking_enabled:
+            # networkx is only imported when the pipelines are tracked
+            from pipelex.pipeline.track.pipeline_tracker import PipelineTracker
+
             self.pipeline_tracker = PipelineTracker(tracker_config=get_config().pipelex.tracker_config)
         else:
             self.pipeline_tracker = PipelineTrackerNoOp()
@@ -167,6 +176,8 @@ class Pipelex(metaclass=MetaSingleton):
         # tools
         self.pipelex_hub.set_secrets_provider(secrets_provider or EnvSecretsProvider())
         self.pipelex_hub.set_storage_provider(storage_provider)
+        get_http_client_manager().configure(http_config=get_config().pipelex.http_config)
+        pypdfium2_renderer.configure(pdf_render_config=get_config().pipelex.pdf_render_config)
         # cogt
         self.plugin_manager.setup(library_config=self.library_manager.library_config)
         self.pipelex_hub.set_content_generator(content_generator or ContentGenerator())
@@ -192,13 +203,16 @@ class Pipelex(metaclass=MetaSingleton):
         try:
             self.template_provider.setup()
             self.llm_model_provider.setup()
-            llm_deck = self.library_manager.load_deck()
-            for llm_model in self.llm_model_provider.get_all_llm_models():
-                if llm_model.version == LATEST_VERSION_NAME:
-                    llm_deck.add_llm_name_as_handle_with_defaults(
-                        llm_name=llm_model.llm_name,
-                    )
-            self.library_manager.load_libraries()
+            self.library_manager.register_library_classes()
+            llm_deck = self.library_manager.load_snapshot_if_up_to_date()
+            if llm_deck is None:
+                llm_deck = self.library_manager.load_deck()
+                for llm_model in self.llm_model_provider.get_all_llm_models():
+                    if llm_model.version == LATEST_VERSION_NAME:
+                        llm_deck.add_llm_name_as_handle_with_defaults(
+                            llm_name=llm_model.llm_name,
+                        )
+                self.library_manager.load_libraries()
             self.pipelex_hub.set_llm_deck_provider(llm_deck_provider=llm_deck)
         except ValidationError as exc:
             error_msg = format_pydantic_validation_error(exc)
@@ -219,6 +233,8 @@ class Pipelex(metaclass=MetaSingleton):
         self.pipeline_tracker.teardown()
         self.library_manager.teardown()
         self.template_provider.teardown()
+        get_jinja2_template_cache().clear()
+        get_llm_schema_cache().clear()
         self.activity_manager.teardown()
 
         # cogt
@@ -228,6 +244,8 @@ class Pipelex(metaclass=MetaSingleton):
         self.plugin_manager.teardown()
 
         # tools
+        get_http_client_manager().teardown()
+        pypdfium2_renderer.teardown()
         self.kajson_manager.teardown()
         self.class_registry.teardown()
         func_registry.teardown()
@@ -14,7 +14,7 @@ from pipelex.core.stuff_content import (
     StuffContent,
     TextContent,
 )
-from pipelex.pipeline.activity.activity_models import ActivityReport
+from pipelex.pipeline.activity.activity_models import ActivityReport, ActivityTextChunk
 from pipelex.tools.misc.file_fetch_utils import fetch_file_from_url_httpx
 from pipelex.tools.misc.file_utils import ensure_path, save_text_to_path
 from pipelex.tools.misc.json_utils import save_as_json_to_path
@@ -44,6 +44,9 @@ class ActivityHandlerForResultFiles:
             self.handle_stuff(stuff=the_stuff)
             if code := the_stuff.stuff_code:
                 self.already_handled_stuff.add(code)
+        elif isinstance(activity_report.content, ActivityTextChunk):
+            # partial texts are for live display, the complete stuff is handled when the pipe is done
+            return
         else:
             log.error(f"Unhandled activity_report: {activity_report}")
 
@@ -10,4 +10,11 @@ class ActivityReport(BaseModel):
     content: Any
 
 
+class ActivityTextChunk(BaseModel):
+    """Partial text streamed by a PipeLLM, dispatched as the content of an ActivityReport."""
+
+    pipe_code: str
+    text_chunk: str
+
+
 ActivityCallback = Callable[[ActivityReport], None]
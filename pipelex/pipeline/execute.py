@@ -1,6 +1,7 @@
 from typing import Optional
 
 from pipelex.client.protocol import CompactMemory
+from pipelex.config import get_config
 from pipelex.core.pipe_output import PipeOutput
 from pipelex.core.pipe_run_params import FORCE_DRY_RUN_MODE_ENV_KEY, PipeOutputMultiplicity, PipeRunMode
 from pipelex.core.pipe_run_params_factory import PipeRunParamsFactory
@@ -21,6 +22,7 @@ async def execute_pipeline(
     output_multiplicity: Optional[PipeOutputMultiplicity] = None,
     dynamic_output_concept_code: Optional[str] = None,
     pipe_run_mode: Optional[PipeRunMode] = None,
+    is_final_text_streamed: Optional[bool] = None,
 ) -> PipeOutput:
     """Execute a pipeline and wait for its completion.
 
@@ -47,6 +49,10 @@ async def execute_pipeline(
         If not specified, the pipe run mode is inferred from the environment variable
         ``PIPELEX_FORCE_DRY_RUN_MODE``. If the environment variable is not set,
         the pipe run mode is ``PipeRunMode.LIVE``.
+    is_final_text_streamed:
+        Whether the PipeLLM producing the final text dispatches its partial text, chunk by chunk,
+        to the activity manager as ``ActivityTextChunk`` contents.
+        If not specified, it defaults to the ``is_streaming_enabled`` setting of the LLM job config.
 
     Returns
     -------
@@ -75,10 +81,14 @@ async def execute_pipeline(
         pipeline_run_id=pipeline_run_id,
     )
 
+    if is_final_text_streamed is None:
+        is_final_text_streamed = get_config().cogt.llm_config.llm_job_config.is_streaming_enabled
+
     pipe_run_params = PipeRunParamsFactory.make_run_params(
         output_multiplicity=output_multiplicity,
         dynamic_output_concept_code=dynamic_output_concept_code,
         pipe_run_mode=pipe_run_mode,
+        is_final_text_streamed=is_final_text_streamed,
     )
 
     if working_memory:
@@ -92,4 +102,8 @@ async def execute_pipeline(
         output_name=output_name,
     )
 
-    return await get_pipe_router().run_pipe_job(pipe_job)
+    try:
+        return await get_pipe_router().run_pipe_job(pipe_job)
+    finally:
+        get_pipeline_manager().complete_pipeline(pipeline_run_id=pipeline_run_id)
+        get_report_delegate().complete_registry(pipeline_run_id=pipeline_run_id)
@@ -0,0 +1,259 @@
+import asyncio
+import statistics
+import time
+from typing import AsyncIterable, AsyncIterator, Iterable, List, Optional, Tuple, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from pipelex import log
+from pipelex.client.protocol import CompactMemory
+from pipelex.config import get_config
+from pipelex.core.pipe_abstract import PipeAbstract
+from pipelex.core.pipe_output import PipeOutput
+from pipelex.core.pipe_run_params import FORCE_DRY_RUN_MODE_ENV_KEY, PipeOutputMultiplicity, PipeRunMode
+from pipelex.core.pipe_run_params_factory import PipeRunParamsFactory
+from pipelex.core.working_memory import WorkingMemory
+from pipelex.core.working_memory_factory import WorkingMemoryFactory
+from pipelex.hub import get_pipe_router, get_pipeline_manager, get_report_delegate, get_required_pipe
+from pipelex.pipe_works.pipe_job_factory import PipeJobFactory
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.tools.environment import get_optional_env
+
+PipelineBulkInput = Union[WorkingMemory, CompactMemory]
+
+
+class PipelineBulkResult(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    input_index: int
+    pipeline_run_id: str
+    duration: float
+    pipe_output: Optional[PipeOutput] = None
+    error: Optional[Exception] = None
+
+    @property
+    def is_success(self) -> bool:
+        return self.error is None
+
+
+class PipelineBulkReport(BaseModel):
+    pipeline_run_id: Optional[str] = None
+    nb_succeeded: int = 0
+    nb_failed: int = 0
+    durations: List[float] = Field(default_factory=list)
+    wall_clock_duration: Optional[float] = None
+
+    def add_result(self, bulk_result: PipelineBulkResult):
+        if bulk_result.is_success:
+            self.nb_succeeded += 1
+        else:
+            self.nb_failed += 1
+        self.durations.append(bulk_result.duration)
+
+    def _get_duration_quantile(self, quantile: int) -> Optional[float]:
+        if len(self.durations) < 2:
+            return self.durations[0] if self.durations else None
+        return statistics.quantiles(self.durations, n=100, method="inclusive")[quantile - 1]
+
+    @property
+    def mean_duration(self) -> Optional[float]:
+        return statistics.fmean(self.durations) if self.durations else None
+
+    @property
+    def p50_duration(self) -> Optional[float]:
+        return self._get_duration_quantile(quantile=50)
+
+    @property
+    def p95_duration(self) -> Optional[float]:
+        return self._get_duration_quantile(quantile=95)
+
+    @property
+    def desc(self) -> str:
+        desc = f"Bulk pipeline {self.pipeline_run_id}: {self.nb_succeeded} succeeded, {self.nb_failed} failed"
+        if self.durations:
+            desc += f" • run duration mean {self.mean_duration:.2f}s, p50 {self.p50_duration:.2f}s, p95 {self.p95_duration:.2f}s"
+        if self.wall_clock_duration is not None:
+            desc += f" • wall clock {self.wall_clock_duration:.2f}s"
+        return desc
+
+
+async def _iterate_inputs(
+    inputs: Union[Iterable[PipelineBulkInput], AsyncIterable[PipelineBulkInput]],
+) -> AsyncIterator[PipelineBulkInput]:
+    if isinstance(inputs, AsyncIterable):
+        async for bulk_input in inputs:
+            yield bulk_input
+    else:
+        for bulk_input in inputs:
+            yield bulk_input
+
+
+async def _execute_bulk_input(
+    pipe: PipeAbstract,
+    bulk_input: PipelineBulkInput,
+    input_index: int,
+    pipeline_run_id: str,
+    output_name: Optional[str],
+    output_multiplicity: Optional[PipeOutputMultiplicity],
+    dynamic_output_concept_code: Optional[str],
+    pipe_run_mode: PipeRunMode,
+) -> PipelineBulkResult:
+    start_time = time.monotonic()
+    try:
+        working_memory: WorkingMemory
+        if isinstance(bulk_input, WorkingMemory):
+            working_memory = bulk_input
+        else:
+            working_memory = WorkingMemoryFactory.make_from_compact_memory(bulk_input)
+        pipe_job = PipeJobFactory.make_pipe_job(
+            pipe=pipe,
+            pipe_run_params=PipeRunParamsFactory.make_run_params(
+                output_multiplicity=output_multiplicity,
+                dynamic_output_concept_code=dynamic_output_concept_code,
+                pipe_run_mode=pipe_run_mode,
+            ),
+            job_metadata=JobMetadata(
+                job_name=f"{pipe.code} #{input_index}",
+                pipeline_run_id=pipeline_run_id,
+            ),
+            working_memory=working_memory,
+            output_name=output_name,
+        )
+        pipe_output = await get_pipe_router().run_pipe_job(pipe_job)
+    except Exception as exc:
+        log.error(f"Bulk run #{input_index} of pipe '{pipe.code}' failed: {exc}")
+        return PipelineBulkResult(
+            input_index=input_index,
+            pipeline_run_id=pipeline_run_id,
+            duration=time.monotonic() - start_time,
+            error=exc,
+        )
+    return PipelineBulkResult(
+        input_index=input_index,
+        pipeline_run_id=pipeline_run_id,
+        duration=time.monotonic() - start_time,
+        pipe_output=pipe_output,
+    )
+
+
+async def execute_pipelines_bulk(
+    pipe_code: str,
+    inputs: Union[Iterable[PipelineBulkInput], AsyncIterable[PipelineBulkInput]],
+    max_concurrency: Optional[int] = None,
+    output_name: Optional[str] = None,
+    output_multiplicity: Optional[PipeOutputMultiplicity] = None,
+    dynamic_output_concept_code: Optional[str] = None,
+    pipe_run_mode: Optional[PipeRunMode] = None,
+    bulk_report: Optional[PipelineBulkReport] = None,
+    is_report_generated: bool = True,
+) -> AsyncIterator[PipelineBulkResult]:
+    """Execute a pipe on many inputs, yielding the results as they complete.
+
+    All the runs share a single pipeline registration and report registry, the pipe is looked up once,
+    and no per-run console output is produced. A run which fails doesn't stop the others: its result holds the error.
+
+    Parameters
+    ----------
+    pipe_code:
+        The code of the pipe to execute.
+    inputs:
+        Iterable or async iterable of the inputs, each one either a ``WorkingMemory`` or a compact memory.
+        It is consumed lazily, as runs complete.
+    max_concurrency:
+        Max number of runs in flight. If not specified, ``bulk_max_concurrency`` of the pipe run config is used.
+    output_name:
+        Name of the output slot to write to.
+    output_multiplicity:
+        Output multiplicity.
+    dynamic_output_concept_code:
+        Override the dynamic output concept code.
+    pipe_run_mode:
+        Pipe run mode, inferred like for *execute_pipeline* if not specified.
+    bulk_report:
+        Optional ``PipelineBulkReport`` filled in as runs complete, to get the aggregate counts and durations.
+    is_report_generated:
+        Whether to generate the cost report of all the runs and log the latency summary once they are all done.
+
+    Yields
+    ------
+    PipelineBulkResult
+        The result of each run, in order of completion, with the index of its input.
+    """
+    if pipe_run_mode is None:
+        if run_mode_from_env := get_optional_env(key=FORCE_DRY_RUN_MODE_ENV_KEY):
+            pipe_run_mode = PipeRunMode(run_mode_from_env)
+        else:
+            pipe_run_mode = PipeRunMode.LIVE
+    max_concurrency = max_concurrency or get_config().pipelex.pipe_run_config.bulk_max_concurrency
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be a positive integer, got {max_concurrency}")
+
+    pipe = get_required_pipe(pipe_code=pipe_code)
+    pipeline = get_pipeline_manager().add_new_pipeline()
+    pipeline_run_id = pipeline.pipeline_run_id
+    get_report_delegate().open_registry(pipeline_run_id=pipeline_run_id)
+    bulk_report = bulk_report or PipelineBulkReport()
+    bulk_report.pipeline_run_id = pipeline_run_id
+    start_time = time.monotonic()
+
+    input_iterator = _iterate_inputs(inputs=inputs)
+    # async generators can't be advanced by several consumers at once
+    input_lock = asyncio.Lock()
+    next_input_index = 0
+    # bounded so that the workers don't get ahead of a slow consumer
+    results_queue: asyncio.Queue[PipelineBulkResult] = asyncio.Queue(maxsize=max_concurrency)
+
+    async def get_next_input() -> Optional[Tuple[int, PipelineBulkInput]]:
+        nonlocal next_input_index
+        async with input_lock:
+            try:
+                bulk_input = await input_iterator.__anext__()
+            except StopAsyncIteration:
+                return None
+            input_index = next_input_index
+            next_input_index += 1
+            return input_index, bulk_input
+
+    async def run_worker():
+        while next_input := await get_next_input():
+            input_index, bulk_input = next_input
+            bulk_result = await _execute_bulk_input(
+                pipe=pipe,
+                bulk_input=bulk_input,
+                input_index=input_index,
+                pipeline_run_id=pipeline_run_id,
+                output_name=output_name,
+                output_multiplicity=output_multiplicity,
+                dynamic_output_concept_code=dynamic_output_concept_code,
+                pipe_run_mode=pipe_run_mode,
+            )
+            await results_queue.put(bulk_result)
+
+    worker_tasks = [asyncio.create_task(run_worker()) for _ in range(max_concurrency)]
+    all_workers_task = asyncio.gather(*worker_tasks)
+    try:
+        while True:
+            get_result_task = asyncio.ensure_future(results_queue.get())
+            await asyncio.wait([get_result_task, all_workers_task], return_when=asyncio.FIRST_COMPLETED)
+            if not get_result_task.done():
+                get_result_task.cancel()
+                # the workers are done (or one of them raised): drain what they left in the queue
+                all_workers_task.result()
+                while not results_queue.empty():
+                    bulk_result = results_queue.get_nowait()
+                    bulk_report.add_result(bulk_result=bulk_result)
+                    yield bulk_result
+                break
+            bulk_result = get_result_task.result()
+            bulk_report.add_result(bulk_result=bulk_result)
+            yield bulk_result
+    finally:
+        for worker_task in worker_tasks:
+            worker_task.cancel()
+        await asyncio.gather(*worker_tasks, return_exceptions=True)
+        bulk_report.wall_clock_duration = time.monotonic() - start_time
+        if is_report_generated:
+            log.info(bulk_report.desc)
+            get_report_delegate().generate_report(pipeline_run_id=pipeline_run_id)
+        get_pipeline_manager().complete_pipeline(pipeline_run_id=pipeline_run_id)
+        get_report_delegate().complete_registry(pipeline_run_id=pipeline_run_id)
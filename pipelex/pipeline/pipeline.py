@@ -1,5 +1,14 @@
-from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
 
 
 class Pipeline(BaseModel):
     pipeline_run_id: str
+    created_at: datetime = Field(default_factory=datetime.now)
+    completed_at: Optional[datetime] = None
+
+    @property
+    def is_completed(self) -> bool:
+        return self.completed_at is not None
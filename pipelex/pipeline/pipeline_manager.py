@@ -1,8 +1,10 @@
+from datetime import datetime, timedelta
 from typing import Dict, Optional
 
 from pydantic import Field, RootModel
 from typing_extensions import override
 
+from pipelex.config import get_config
 from pipelex.exceptions import PipelineManagerNotFoundError
 from pipelex.pipeline.pipeline import Pipeline
 from pipelex.pipeline.pipeline_factory import PipelineFactory
@@ -42,3 +44,26 @@ class PipelineManager(PipelineManagerAbstract, RootModel[PipelineManagerRoot]):
         pipeline = PipelineFactory.make_pipeline()
         self._set_pipeline(pipeline_run_id=pipeline.pipeline_run_id, pipeline=pipeline)
         return pipeline
+
+    @override
+    def complete_pipeline(self, pipeline_run_id: str) -> None:
+        pipeline = self.get_optional_pipeline(pipeline_run_id=pipeline_run_id)
+        if pipeline is None:
+            # it was already dropped by the retention policy
+            return
+        pipeline.completed_at = datetime.now()
+        self._apply_run_retention()
+
+    def _apply_run_retention(self):
+        run_retention_config = get_config().pipelex.run_retention_config
+        completed_pipelines = sorted(
+            (pipeline for pipeline in self.root.values() if pipeline.completed_at is not None),
+            key=lambda pipeline: pipeline.completed_at or datetime.min,
+        )
+        if (max_age_seconds := run_retention_config.applied_max_completed_run_age_seconds) is not None:
+            oldest_allowed_time = datetime.now() - timedelta(seconds=max_age_seconds)
+            while completed_pipelines and (completed_pipelines[0].completed_at or datetime.min) < oldest_allowed_time:
+                del self.root[completed_pipelines.pop(0).pipeline_run_id]
+        if (max_completed_runs := run_retention_config.applied_max_completed_runs) is not None:
+            while len(completed_pipelines) > max_completed_runs:
+                del self.root[completed_pipelines.pop(0).pipeline_run_id]
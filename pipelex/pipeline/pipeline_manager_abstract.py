@@ -24,3 +24,7 @@ class PipelineManagerAbstract(ABC):
     @abstractmethod
     def add_new_pipeline(self) -> Pipeline:
         pass
+
+    @abstractmethod
+    def complete_pipeline(self, pipeline_run_id: str) -> None:
+        pass
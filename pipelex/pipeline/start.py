@@ -2,6 +2,7 @@ import asyncio
 from typing import Optional
 
 from pipelex.client.protocol import CompactMemory
+from pipelex.config import get_config
 from pipelex.core.pipe_output import PipeOutput
 from pipelex.core.pipe_run_params import PipeOutputMultiplicity, PipeRunMode
 from pipelex.core.pipe_run_params_factory import PipeRunParamsFactory
@@ -21,6 +22,7 @@ async def start_pipeline(
     output_multiplicity: Optional[PipeOutputMultiplicity] = None,
     dynamic_output_concept_code: Optional[str] = None,
     pipe_run_mode: PipeRunMode = PipeRunMode.LIVE,
+    is_final_text_streamed: Optional[bool] = None,
 ) -> asyncio.Task[PipeOutput]:
     """Start a pipeline in the background.
 
@@ -45,6 +47,10 @@ async def start_pipeline(
         Override the dynamic output concept code.
     pipe_run_mode:
         Pipe run mode: ``PipeRunMode.LIVE`` or ``PipeRunMode.DRY``.
+    is_final_text_streamed:
+        Whether the PipeLLM producing the final text dispatches its partial text, chunk by chunk,
+        to the activity manager as ``ActivityTextChunk`` contents.
+        If not specified, it defaults to the ``is_streaming_enabled`` setting of the LLM job config.
     Returns
     -------
     Tuple[str, asyncio.Task[PipeOutput]]
@@ -67,10 +73,14 @@ async def start_pipeline(
         pipeline_run_id=pipeline_run_id,
     )
 
+    if is_final_text_streamed is None:
+        is_final_text_streamed = get_config().cogt.llm_config.llm_job_config.is_streaming_enabled
+
     pipe_run_params = PipeRunParamsFactory.make_run_params(
         output_multiplicity=output_multiplicity,
         dynamic_output_concept_code=dynamic_output_concept_code,
         pipe_run_mode=pipe_run_mode,
+        is_final_text_streamed=is_final_text_streamed,
     )
 
     if working_memory:
@@ -87,4 +97,10 @@ async def start_pipeline(
     # Launch execution without awaiting the result.
     task: asyncio.Task[PipeOutput] = asyncio.create_task(get_pipe_router().run_pipe_job(pipe_job))
 
+    def complete_pipeline_run(_: asyncio.Task[PipeOutput]):
+        get_pipeline_manager().complete_pipeline(pipeline_run_id=pipeline_run_id)
+        get_report_delegate().complete_registry(pipeline_run_id=pipeline_run_id)
+
+    task.add_done_callback(complete_pipeline_run)
+
     return task
@@ -26,6 +26,12 @@ ANTHROPIC_API_KEY_VAR_NAME = "ANTHROPIC_API_KEY"
 class AnthropicConfig(ConfigModel):
     claude_4_reduced_tokens_limit: Union[int, Literal["unlimited"]] = Field(default="unlimited")
     api_key_method: AnthropicKeyMethod = Field(strict=False)
+    # prompt caching: system prompts and user prompts at least this long get a cache breakpoint
+    is_prompt_caching_enabled: bool = False
+    prompt_caching_min_chars: int = Field(default=4096, ge=0)
+
+    def is_prompt_text_cached(self, prompt_text: Optional[str]) -> bool:
+        return self.is_prompt_caching_enabled and prompt_text is not None and len(prompt_text) >= self.prompt_caching_min_chars
 
     @property
     def claude_4_tokens_limit(self) -> Optional[int]:
@@ -1,4 +1,3 @@
-import asyncio
 from typing import List, Optional, Union
 
 from anthropic import AsyncAnthropic, AsyncAnthropicBedrock
@@ -13,22 +12,12 @@ from openai.types.chat import (
 
 from pipelex import log
 from pipelex.cogt.exceptions import CogtError
-from pipelex.cogt.image.prompt_image import (
-    PromptImage,
-    PromptImageBytes,
-    PromptImagePath,
-    PromptImageTypedBytes,
-    PromptImageTypedBytesOrUrl,
-    PromptImageUrl,
-)
+from pipelex.cogt.image.prompt_image import PromptImageTypedBytes, PromptImageTypedBytesOrUrl
 from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
 from pipelex.cogt.llm.token_category import NbTokensByCategoryDict, TokenCategory
 from pipelex.config import get_config
-from pipelex.hub import get_plugin_manager, get_secrets_provider
-from pipelex.tools.misc.base_64_utils import (
-    load_binary_as_base64_async,
-)
+from pipelex.hub import get_inference_manager, get_plugin_manager, get_secrets_provider
 
 
 class AnthropicFactoryError(CogtError):
@@ -57,6 +46,19 @@ class AnthropicFactory:
             case _:
                 raise AnthropicFactoryError(f"Unsupported LLM platform for Anthropic sdk: '{llm_platform}'")
 
+    @staticmethod
+    def make_system_text_blocks(llm_job: LLMJob) -> Optional[List[TextBlockParam]]:
+        """
+        Makes the system prompt blocks (if a system prompt is provided), with a cache breakpoint if prompt caching applies to it.
+        """
+        system_text = llm_job.llm_prompt.system_text
+        if not system_text:
+            return None
+        text_block_param: TextBlockParam = {"type": "text", "text": system_text}
+        if get_plugin_manager().plugin_configs.anthropic_config.is_prompt_text_cached(prompt_text=system_text):
+            text_block_param["cache_control"] = {"type": "ephemeral"}
+        return [text_block_param]
+
     @classmethod
     async def make_user_message(
         cls,
@@ -72,8 +74,11 @@ class AnthropicFactory:
             }
             content.append(text_block_param)
         if llm_job.llm_prompt.user_images:
-            tasks_to_prep_images = [cls._prep_image_for_anthropic(prompt_image) for prompt_image in llm_job.llm_prompt.user_images]
-            prepped_user_images = await asyncio.gather(*tasks_to_prep_images)
+            prompt_image_preparer = get_inference_manager().get_prompt_image_preparer()
+            prepped_user_images = await prompt_image_preparer.prepare_all_typed_bytes_or_urls(
+                prompt_images=llm_job.llm_prompt.user_images,
+                image_budget=llm_job.job_params.image_budget,
+            )
             # images_block_params: List[ImageBlockParam] = []
             for prepped_image in prepped_user_images:
                 image_block_param: ImageBlockParam
@@ -100,6 +105,10 @@ class AnthropicFactory:
                     raise AnthropicFactoryError(f"Unsupported PromptImageTypedBytesOrUrl type: '{type(prepped_image).__name__}'")
                 content.append(image_block_param)
 
+        if content and get_plugin_manager().plugin_configs.anthropic_config.is_prompt_text_cached(prompt_text=llm_job.llm_prompt.user_text):
+            # the breakpoint on the last block caches the whole prompt, for the calls repeating it
+            content[-1]["cache_control"] = {"type": "ephemeral"}
+
         message = {
             "role": "user",
             "content": content,
@@ -112,8 +121,12 @@ class AnthropicFactory:
     def openai_typed_user_message(
         user_content_txt: str,
         prepped_user_images: Optional[List[PromptImageTypedBytesOrUrl]] = None,
+        is_cached: bool = False,
     ) -> ChatCompletionMessageParam:
         text_block_param: TextBlockParam = {"type": "text", "text": user_content_txt}
+        if is_cached:
+            # the text comes last, so the breakpoint caches the whole prompt
+            text_block_param["cache_control"] = {"type": "ephemeral"}
         message: MessageParam
         if prepped_user_images is not None:
             log.debug(prepped_user_images)
@@ -157,23 +170,6 @@ class AnthropicFactory:
 
         return message  # type: ignore
 
-    @classmethod
-    async def _prep_image_for_anthropic(
-        cls,
-        prompt_image: PromptImage,
-    ) -> PromptImageTypedBytesOrUrl:
-        typed_bytes_or_url: PromptImageTypedBytesOrUrl
-        if isinstance(prompt_image, PromptImageBytes):
-            typed_bytes_or_url = prompt_image.make_prompt_image_typed_bytes()
-        elif isinstance(prompt_image, PromptImageUrl):
-            typed_bytes_or_url = prompt_image.url
-        elif isinstance(prompt_image, PromptImagePath):
-            b64 = await load_binary_as_base64_async(prompt_image.file_path)
-            typed_bytes_or_url = PromptImageTypedBytes(base_64=b64, file_type=prompt_image.get_file_type())
-        else:
-            raise AnthropicFactoryError(f"Unsupported PromptImage type: '{type(prompt_image).__name__}'")
-        return typed_bytes_or_url
-
     @classmethod
     async def make_simple_messages(
         cls,
@@ -185,13 +181,17 @@ class AnthropicFactory:
         llm_prompt = llm_job.llm_prompt
         messages: List[ChatCompletionMessageParam] = []
         #### System message ####
-        if system_content := llm_prompt.system_text:
-            messages.append(ChatCompletionSystemMessageParam(role="system", content=system_content))
+        if system_text_blocks := cls.make_system_text_blocks(llm_job=llm_job):
+            # instructor passes the blocks on to the anthropic system prompt, including their cache_control
+            messages.append(ChatCompletionSystemMessageParam(role="system", content=system_text_blocks))  # type: ignore
 
         prepped_user_images: Optional[List[PromptImageTypedBytesOrUrl]]
         if llm_prompt.user_images:
-            tasks_to_prep_images = [cls._prep_image_for_anthropic(prompt_image) for prompt_image in llm_prompt.user_images]
-            prepped_user_images = await asyncio.gather(*tasks_to_prep_images)
+            prompt_image_preparer = get_inference_manager().get_prompt_image_preparer()
+            prepped_user_images = await prompt_image_preparer.prepare_all_typed_bytes_or_urls(
+                prompt_images=llm_prompt.user_images,
+                image_budget=llm_job.job_params.image_budget,
+            )
         else:
             prepped_user_images = None
 
@@ -200,16 +200,24 @@ class AnthropicFactory:
             AnthropicFactory.openai_typed_user_message(
                 user_content_txt=llm_prompt.user_text if llm_prompt.user_text else "",
                 prepped_user_images=prepped_user_images,
+                is_cached=get_plugin_manager().plugin_configs.anthropic_config.is_prompt_text_cached(prompt_text=llm_prompt.user_text),
             )
         )
         return messages
 
     @staticmethod
     def make_nb_tokens_by_category(usage: Usage) -> NbTokensByCategoryDict:
+        nb_tokens_cache_read = usage.cache_read_input_tokens or 0
+        nb_tokens_cache_write = usage.cache_creation_input_tokens or 0
         nb_tokens_by_category: NbTokensByCategoryDict = {
-            TokenCategory.INPUT: usage.input_tokens,
+            # anthropic's input tokens exclude those read from or written to the prompt cache, ours include them
+            TokenCategory.INPUT: usage.input_tokens + nb_tokens_cache_read + nb_tokens_cache_write,
             TokenCategory.OUTPUT: usage.output_tokens,
         }
+        if nb_tokens_cache_read:
+            nb_tokens_by_category[TokenCategory.INPUT_CACHED] = nb_tokens_cache_read
+        if nb_tokens_cache_write:
+            nb_tokens_by_category[TokenCategory.INPUT_CACHE_WRITE] = nb_tokens_cache_write
         return nb_tokens_by_category
 
     @staticmethod
@@ -1,14 +1,16 @@
-from typing import Any, Optional, Type
+from typing import Any, AsyncGenerator, Optional, Type
 
 import instructor
-from anthropic import NOT_GIVEN, AsyncAnthropic, AsyncAnthropicBedrock
+from anthropic import NOT_GIVEN, APIConnectionError, APIStatusError, AsyncAnthropic, AsyncAnthropicBedrock, NotFoundError
 from typing_extensions import override
 
 from pipelex import log
-from pipelex.cogt.exceptions import LLMCompletionError, LLMEngineParameterError, SdkTypeError
+from pipelex.cogt.exceptions import LLMCompletionError, LLMEngineParameterError, LLMModelNotFoundError, SdkTypeError
 from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.llm.llm_models.llm_engine import LLMEngine
 from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
+from pipelex.cogt.llm.llm_rate_limiter import LLMRateLimiter
+from pipelex.cogt.llm.llm_schema_cache import get_llm_schema_cache
 from pipelex.cogt.llm.llm_worker_internal_abstract import LLMWorkerInternalAbstract
 from pipelex.cogt.llm.structured_output import StructureMethod
 from pipelex.hub import get_plugin_manager
@@ -24,12 +26,14 @@ class AnthropicLLMWorker(LLMWorkerInternalAbstract):
         llm_engine: LLMEngine,
         structure_method: Optional[StructureMethod] = None,
         reporting_delegate: Optional[ReportingProtocol] = None,
+        rate_limiter: Optional[LLMRateLimiter] = None,
     ):
         LLMWorkerInternalAbstract.__init__(
             self,
             llm_engine=llm_engine,
             structure_method=structure_method,
             reporting_delegate=reporting_delegate,
+            rate_limiter=rate_limiter,
         )
         self.default_max_tokens: int
         if default_max_tokens := llm_engine.llm_model.max_tokens:
@@ -78,7 +82,7 @@ class AnthropicLLMWorker(LLMWorkerInternalAbstract):
         max_tokens = self._adapt_max_tokens(max_tokens=llm_job.job_params.max_tokens)
         response = await self.anthropic_async_client.messages.create(
             messages=[message],
-            system=llm_job.llm_prompt.system_text or NOT_GIVEN,
+            system=AnthropicFactory.make_system_text_blocks(llm_job=llm_job) or NOT_GIVEN,
             model=self.llm_engine.llm_id,
             temperature=llm_job.job_params.temperature,
             max_tokens=max_tokens,
@@ -99,6 +103,37 @@ class AnthropicLLMWorker(LLMWorkerInternalAbstract):
 
         return full_reply_content
 
+    @override
+    async def _gen_text_stream(
+        self,
+        llm_job: LLMJob,
+    ) -> AsyncGenerator[str, None]:
+        message = await AnthropicFactory.make_user_message(llm_job=llm_job)
+        max_tokens = self._adapt_max_tokens(max_tokens=llm_job.job_params.max_tokens)
+        try:
+            async with self.anthropic_async_client.messages.stream(
+                messages=[message],
+                system=AnthropicFactory.make_system_text_blocks(llm_job=llm_job) or NOT_GIVEN,
+                model=self.llm_engine.llm_id,
+                temperature=llm_job.job_params.temperature,
+                max_tokens=max_tokens,
+            ) as stream:
+                async for text_chunk in stream.text_stream:
+                    yield text_chunk
+                final_message = await stream.get_final_message()
+        except NotFoundError as not_found_error:
+            raise LLMModelNotFoundError(
+                f"Anthropic model not found:\n{self.llm_engine.desc}\nmodel: {self.llm_engine.llm_model.desc}\n{not_found_error}"
+            ) from not_found_error
+        except APIConnectionError as api_connection_error:
+            raise LLMCompletionError(f"Anthropic API connection error: {api_connection_error}") from api_connection_error
+        except APIStatusError as api_status_error:
+            # errors sent in the middle of the stream, e.g. when the API is overloaded, are raised as status errors
+            raise LLMCompletionError(f"Anthropic API error with model: {self.llm_engine.llm_model.desc}:\n{api_status_error}") from api_status_error
+
+        if (llm_tokens_usage := llm_job.job_report.llm_tokens_usage) and (usage := final_message.usage):
+            llm_tokens_usage.nb_tokens_by_category = AnthropicFactory.make_nb_tokens_by_category(usage=usage)
+
     @override
     async def _gen_object(
         self,
@@ -109,7 +144,7 @@ class AnthropicLLMWorker(LLMWorkerInternalAbstract):
         max_tokens = self._adapt_max_tokens(max_tokens=llm_job.job_params.max_tokens)
         result_object, completion = await self.instructor_for_objects.chat.completions.create_with_completion(
             messages=messages,
-            response_model=schema,
+            response_model=get_llm_schema_cache().get_instructor_schema(schema=schema),
             max_retries=llm_job.job_config.max_retries,
             model=self.llm_engine.llm_id,
             temperature=llm_job.job_params.temperature,
@@ -1,20 +1,81 @@
-from typing import Any, Dict, Optional, Tuple, cast
+import asyncio
+from contextlib import AsyncExitStack
+from typing import Any, Dict, List, Optional, Tuple
 
 import aioboto3
-from types_aiobotocore_bedrock_runtime.type_defs import ConverseResponseTypeDef
+from aiobotocore.config import AioConfig
 from typing_extensions import override
 
 from pipelex import log
 from pipelex.cogt.llm.token_category import NbTokensByCategoryDict, TokenCategory
 from pipelex.plugins.bedrock.bedrock_client_protocol import BedrockClientProtocol
 from pipelex.plugins.bedrock.bedrock_message import BedrockMessageDictList
+from pipelex.tools.misc.concurrency_utils import close_on_event_loop
 
 
 class BedrockClientAioboto3(BedrockClientProtocol):
-    def __init__(self, aws_region: str):
+    """Bedrock runtime client shared by all the Bedrock workers.
+
+    The underlying aiobotocore client, with its credentials, endpoint and connection pool, is opened lazily
+    on the first call and reused until teardown. As its connections are bound to the event loop which opened them,
+    the client is reopened if it's used from another event loop.
+    """
+
+    def __init__(
+        self,
+        aws_region: str,
+        max_pool_connections: int,
+        connect_timeout: float,
+        read_timeout: float,
+        is_converse_stream_enabled: bool = False,
+    ):
         log.verbose(f"Init BedrockClientAioboto3 with region '{aws_region}'")
         self.aws_region = aws_region
+        self.is_converse_stream_enabled = is_converse_stream_enabled
         self.session = aioboto3.Session()
+        self.aio_config = AioConfig(
+            max_pool_connections=max_pool_connections,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+        )
+        self._client: Optional[Any] = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client_lock: Optional[asyncio.Lock] = None
+
+    async def _get_client(self) -> Any:
+        current_loop = asyncio.get_running_loop()
+        if self._client_loop is not current_loop:
+            if self._client_loop is not None:
+                log.verbose("BedrockClientAioboto3 used from another event loop, reopening its client")
+                self._release_client()
+            self._client_loop = current_loop
+            self._client_lock = asyncio.Lock()
+        if self._client is not None:
+            return self._client
+
+        assert self._client_lock is not None
+        async with self._client_lock:
+            if self._client is None:
+                exit_stack = AsyncExitStack()
+                self._client = await exit_stack.enter_async_context(
+                    self.session.client("bedrock-runtime", region_name=self.aws_region, config=self.aio_config)  # pyright: ignore
+                )
+                self._exit_stack = exit_stack
+            return self._client
+
+    def _release_client(self):
+        exit_stack = self._exit_stack
+        client_loop = self._client_loop
+        self._client = None
+        self._exit_stack = None
+        self._client_loop = None
+        self._client_lock = None
+        if exit_stack is not None:
+            close_on_event_loop(make_close_coroutine=exit_stack.aclose, event_loop=client_loop, resource_desc="Bedrock client")
+
+    def teardown(self):
+        self._release_client()
 
     @override
     async def chat(
@@ -36,13 +97,36 @@ class BedrockClientAioboto3(BedrockClientProtocol):
         if system_text:
             params["system"] = [{"text": system_text}]
 
-        async with self.session.client("bedrock-runtime", region_name=self.aws_region) as aioboto3_session:  # type: ignore
-            conversation_response: ConverseResponseTypeDef = await aioboto3_session.converse(**params)
-            resp_dict: Dict[str, Any] = cast(Dict[str, Any], conversation_response)
-            usage_dict: Dict[str, Any] = resp_dict["usage"]
-            nb_tokens_by_category: NbTokensByCategoryDict = {
-                TokenCategory.INPUT: usage_dict["inputTokens"],
-                TokenCategory.OUTPUT: usage_dict["outputTokens"],
-            }
-            response_text: str = resp_dict["output"]["message"]["content"][0]["text"]
-            return response_text, nb_tokens_by_category
+        bedrock_client = await self._get_client()
+        if self.is_converse_stream_enabled:
+            return await self._chat_with_converse_stream(bedrock_client=bedrock_client, params=params)
+
+        resp_dict: Dict[str, Any] = await bedrock_client.converse(**params)
+        usage_dict: Dict[str, Any] = resp_dict["usage"]
+        nb_tokens_by_category: NbTokensByCategoryDict = {
+            TokenCategory.INPUT: usage_dict["inputTokens"],
+            TokenCategory.OUTPUT: usage_dict["outputTokens"],
+        }
+        response_text: str = resp_dict["output"]["message"]["content"][0]["text"]
+        return response_text, nb_tokens_by_category
+
+    async def _chat_with_converse_stream(
+        self,
+        bedrock_client: Any,
+        params: Dict[str, Any],
+    ) -> Tuple[str, NbTokensByCategoryDict]:
+        # long generations come in as they're produced, so they don't hit the read timeout
+        stream_response: Dict[str, Any] = await bedrock_client.converse_stream(**params)
+        text_chunks: List[str] = []
+        nb_tokens_by_category: NbTokensByCategoryDict = {}
+        async for event_dict in stream_response["stream"]:
+            if content_block_delta := event_dict.get("contentBlockDelta"):
+                if text_chunk := content_block_delta["delta"].get("text"):
+                    text_chunks.append(text_chunk)
+            elif metadata := event_dict.get("metadata"):
+                usage_dict: Dict[str, Any] = metadata["usage"]
+                nb_tokens_by_category = {
+                    TokenCategory.INPUT: usage_dict["inputTokens"],
+                    TokenCategory.OUTPUT: usage_dict["outputTokens"],
+                }
+        return "".join(text_chunks), nb_tokens_by_category
@@ -1,7 +1,9 @@
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Optional, Tuple
 
 import boto3
+from botocore.config import Config as BotocoreConfig
 from typing_extensions import override
 
 from pipelex import log
@@ -11,9 +13,41 @@ from pipelex.plugins.bedrock.bedrock_message import BedrockMessageDictList
 
 
 class BedrockClientBoto3(BedrockClientProtocol):
-    def __init__(self, aws_region: str):
+    """Bedrock runtime client using the synchronous boto3 SDK.
+
+    The blocking calls run in a dedicated thread pool, so they don't stall the event loop, and the pool is bounded
+    so that concurrent calls beyond max_workers queue up rather than open ever more connections.
+    The number of queued calls is tracked to help size the pool.
+    """
+
+    def __init__(
+        self,
+        aws_region: str,
+        max_workers: int,
+        connect_timeout: float,
+        read_timeout: float,
+    ):
         log.debug(f"Initializing BedrockClientBoto3 with region '{aws_region}'")
-        self.boto3_client = boto3.client(service_name="bedrock-runtime", region_name=aws_region)  # pyright: ignore
+        # one connection per worker thread
+        botocore_config = BotocoreConfig(
+            max_pool_connections=max_workers,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+        )
+        self.boto3_client = boto3.client(service_name="bedrock-runtime", region_name=aws_region, config=botocore_config)  # pyright: ignore
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bedrock_boto3")
+        # counters are only updated from the event loop
+        self.nb_calls_pending = 0
+        self.max_queue_depth = 0
+
+    def teardown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls waiting for a worker thread."""
+        return max(0, self.nb_calls_pending - self.max_workers)
 
     @override
     async def chat(
@@ -35,8 +69,15 @@ class BedrockClientBoto3(BedrockClientProtocol):
         if system_text:
             params["system"] = [{"text": system_text}]
 
-        loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
-        resp_dict: Dict[str, Any] = await loop.run_in_executor(None, lambda: self.boto3_client.converse(**params))  # pyright: ignore
+        self.nb_calls_pending += 1
+        if queue_depth := self.queue_depth:
+            self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+            log.debug(f"BedrockClientBoto3: {queue_depth} call(s) queued for {self.max_workers} worker threads")
+        loop = asyncio.get_running_loop()
+        try:
+            resp_dict: Dict[str, Any] = await loop.run_in_executor(self.executor, lambda: self.boto3_client.converse(**params))  # pyright: ignore
+        finally:
+            self.nb_calls_pending -= 1
 
         usage_dict: Dict[str, Any] = resp_dict["usage"]
         nb_tokens_by_category: NbTokensByCategoryDict = {
@@ -23,6 +23,11 @@ AWS_REGION_VAR_NAME = "AWS_REGION"
 
 class BedrockConfig(ConfigModel):
     client_method: BedrockClientMethod = Field(strict=False)
+    max_pool_connections: int = Field(default=10, ge=1)
+    connect_timeout: float = Field(default=10, gt=0)
+    read_timeout: float = Field(default=300, gt=0)
+    is_converse_stream_enabled: bool = False
+    boto3_max_workers: int = Field(default=10, ge=1)
 
     def configure(self, secrets_provider: SecretsProviderAbstract) -> str:
         """Configure and return AWS region."""
@@ -24,11 +24,22 @@ class BedrockFactory:
             case BedrockClientMethod.AIBOTO3:
                 from pipelex.plugins.bedrock.bedrock_client_aioboto3 import BedrockClientAioboto3
 
-                bedrock_async_client = BedrockClientAioboto3(aws_region=aws_region)
+                bedrock_async_client = BedrockClientAioboto3(
+                    aws_region=aws_region,
+                    max_pool_connections=bedrock_config.max_pool_connections,
+                    connect_timeout=bedrock_config.connect_timeout,
+                    read_timeout=bedrock_config.read_timeout,
+                    is_converse_stream_enabled=bedrock_config.is_converse_stream_enabled,
+                )
             case BedrockClientMethod.BOTO3:
                 from pipelex.plugins.bedrock.bedrock_client_boto3 import BedrockClientBoto3
 
-                bedrock_async_client = BedrockClientBoto3(aws_region=aws_region)
+                bedrock_async_client = BedrockClientBoto3(
+                    aws_region=aws_region,
+                    max_workers=bedrock_config.boto3_max_workers,
+                    connect_timeout=bedrock_config.connect_timeout,
+                    read_timeout=bedrock_config.read_timeout,
+                )
 
         return bedrock_async_client
 
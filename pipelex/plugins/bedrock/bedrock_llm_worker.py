@@ -6,6 +6,7 @@ from pipelex import log
 from pipelex.cogt.exceptions import LLMCapabilityError, LLMEngineParameterError, SdkTypeError
 from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.llm.llm_models.llm_engine import LLMEngine
+from pipelex.cogt.llm.llm_rate_limiter import LLMRateLimiter
 from pipelex.cogt.llm.llm_worker_internal_abstract import LLMWorkerInternalAbstract
 from pipelex.cogt.llm.structured_output import StructureMethod
 from pipelex.plugins.bedrock.bedrock_client_protocol import BedrockClientProtocol
@@ -21,12 +22,14 @@ class BedrockLLMWorker(LLMWorkerInternalAbstract):
         llm_engine: LLMEngine,
         structure_method: Optional[StructureMethod] = None,
         reporting_delegate: Optional[ReportingProtocol] = None,
+        rate_limiter: Optional[LLMRateLimiter] = None,
     ):
         LLMWorkerInternalAbstract.__init__(
             self,
             llm_engine=llm_engine,
             structure_method=structure_method,
             reporting_delegate=reporting_delegate,
+            rate_limiter=rate_limiter,
         )
 
         if not isinstance(sdk_instance, BedrockClientProtocol):
@@ -19,14 +19,12 @@ from openai.types.chat import (
     ChatCompletionUserMessageParam,
 )
 
-from pipelex.cogt.exceptions import PromptImageFormatError
-from pipelex.cogt.image.prompt_image import PromptImage, PromptImageBytes, PromptImagePath, PromptImageUrl
+from pipelex.cogt.image.prompt_image import PromptImageTypedBytes, PromptImageTypedBytesOrUrl
 from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.llm.token_category import NbTokensByCategoryDict, TokenCategory
 from pipelex.cogt.ocr.ocr_output import ExtractedImageFromPage, OcrOutput, Page
-from pipelex.hub import get_plugin_manager, get_secrets_provider
+from pipelex.hub import get_inference_manager, get_plugin_manager, get_secrets_provider
 from pipelex.plugins.openai.openai_factory import OpenAIFactory
-from pipelex.tools.misc.base_64_utils import encode_to_base64, load_binary_as_base64
 
 
 class MistralFactory:
@@ -45,7 +43,7 @@ class MistralFactory:
     #########################################################
 
     @classmethod
-    def make_simple_messages(cls, llm_job: LLMJob) -> List[Messages]:
+    async def make_simple_messages(cls, llm_job: LLMJob) -> List[Messages]:
         """
         Makes a list of messages with a system message (if provided) and followed by a user message.
         """
@@ -54,8 +52,13 @@ class MistralFactory:
         if user_text := llm_job.llm_prompt.user_text:
             user_content.append(TextChunk(text=user_text))
         if user_images := llm_job.llm_prompt.user_images:
-            for user_image in user_images:
-                user_content.append(cls.make_mistral_image_url(user_image))
+            prompt_image_preparer = get_inference_manager().get_prompt_image_preparer()
+            prepped_user_images = await prompt_image_preparer.prepare_all_typed_bytes_or_urls(
+                prompt_images=user_images,
+                image_budget=llm_job.job_params.image_budget,
+            )
+            for prepped_image in prepped_user_images:
+                user_content.append(cls.make_mistral_image_url(prepped_image=prepped_image))
         if user_content:
             messages.append(UserMessage(content=user_content))
 
@@ -65,22 +68,13 @@ class MistralFactory:
         return messages
 
     @classmethod
-    def make_mistral_image_url(cls, prompt_image: PromptImage) -> ImageURLChunk:
-        if isinstance(prompt_image, PromptImageUrl):
-            return ImageURLChunk(image_url=prompt_image.url)
-        elif isinstance(prompt_image, PromptImagePath):
-            image_bytes = load_binary_as_base64(prompt_image.file_path).decode("utf-8")
-            # TODO: use actual image type
-            return ImageURLChunk(image_url=f"data:image/png;base64,{image_bytes}")
-        elif isinstance(prompt_image, PromptImageBytes):
-            image_bytes = encode_to_base64(prompt_image.base_64).decode("utf-8")
-            # TODO: use actual image type
-            return ImageURLChunk(image_url=f"data:image/png;base64,{image_bytes}")
-        else:
-            raise PromptImageFormatError(f"prompt_image of type {type(prompt_image)} is not supported")
+    def make_mistral_image_url(cls, prepped_image: PromptImageTypedBytesOrUrl) -> ImageURLChunk:
+        if isinstance(prepped_image, PromptImageTypedBytes):
+            return ImageURLChunk(image_url=prepped_image.make_data_url())
+        return ImageURLChunk(image_url=prepped_image)
 
     @classmethod
-    def make_simple_messages_openai_typed(
+    async def make_simple_messages_openai_typed(
         cls,
         llm_job: LLMJob,
     ) -> List[ChatCompletionMessageParam]:
@@ -99,8 +93,13 @@ class MistralFactory:
             user_contents.append(user_part_text)
 
         if user_images := llm_prompt.user_images:
-            for prompt_image in user_images:
-                openai_image_url = OpenAIFactory.make_openai_image_url(prompt_image=prompt_image)
+            prompt_image_preparer = get_inference_manager().get_prompt_image_preparer()
+            prepped_user_images = await prompt_image_preparer.prepare_all_typed_bytes_or_urls(
+                prompt_images=user_images,
+                image_budget=llm_job.job_params.image_budget,
+            )
+            for prepped_image in prepped_user_images:
+                openai_image_url = OpenAIFactory.make_openai_image_url(prepped_image=prepped_image)
                 image_param = ChatCompletionContentPartImageParam(image_url=openai_image_url, type="image_url")
                 user_contents.append(image_param)
 
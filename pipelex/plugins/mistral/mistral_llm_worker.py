@@ -9,6 +9,8 @@ from pipelex import log
 from pipelex.cogt.exceptions import LLMCompletionError, LLMEngineParameterError, SdkTypeError
 from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.llm.llm_models.llm_engine import LLMEngine
+from pipelex.cogt.llm.llm_rate_limiter import LLMRateLimiter
+from pipelex.cogt.llm.llm_schema_cache import get_llm_schema_cache
 from pipelex.cogt.llm.llm_worker_internal_abstract import LLMWorkerInternalAbstract
 from pipelex.cogt.llm.structured_output import StructureMethod
 from pipelex.plugins.mistral.mistral_factory import MistralFactory
@@ -23,12 +25,14 @@ class MistralLLMWorker(LLMWorkerInternalAbstract):
         llm_engine: LLMEngine,
         structure_method: Optional[StructureMethod] = None,
         reporting_delegate: Optional[ReportingProtocol] = None,
+        rate_limiter: Optional[LLMRateLimiter] = None,
     ):
         LLMWorkerInternalAbstract.__init__(
             self,
             llm_engine=llm_engine,
             structure_method=structure_method,
             reporting_delegate=reporting_delegate,
+            rate_limiter=rate_limiter,
         )
 
         if not isinstance(sdk_instance, Mistral):
@@ -52,7 +56,7 @@ class MistralLLMWorker(LLMWorkerInternalAbstract):
         self,
         llm_job: LLMJob,
     ) -> str:
-        messages = MistralFactory.make_simple_messages(llm_job=llm_job)
+        messages = await MistralFactory.make_simple_messages(llm_job=llm_job)
         response: Optional[ChatCompletionResponse] = await self.mistral_client_for_text.chat.complete_async(
             messages=messages,
             model=self.llm_engine.llm_id,
@@ -79,8 +83,8 @@ class MistralLLMWorker(LLMWorkerInternalAbstract):
         schema: Type[BaseModelTypeVar],
     ) -> BaseModelTypeVar:
         result_object, completion = await self.instructor_for_objects.chat.completions.create_with_completion(
-            response_model=schema,
-            messages=MistralFactory.make_simple_messages_openai_typed(llm_job=llm_job),
+            response_model=get_llm_schema_cache().get_instructor_schema(schema=schema),
+            messages=await MistralFactory.make_simple_messages_openai_typed(llm_job=llm_job),
             model=self.llm_engine.llm_id,
             temperature=llm_job.job_params.temperature,
             max_tokens=llm_job.job_params.max_tokens or self.default_max_tokens,
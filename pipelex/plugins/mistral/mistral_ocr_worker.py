@@ -1,6 +1,11 @@
+import os
 from typing import Any, Optional
+from urllib.parse import urlsplit
 
+import httpx
 from mistralai import Mistral
+from mistralai.models import SDKError
+from mistralai.types import UNSET
 from typing_extensions import override
 
 from pipelex import log
@@ -8,14 +13,17 @@ from pipelex.cogt.exceptions import OcrCapabilityError, SdkTypeError
 from pipelex.cogt.ocr.ocr_engine import OcrEngine
 from pipelex.cogt.ocr.ocr_input import OcrInputError
 from pipelex.cogt.ocr.ocr_job import OcrJob
+from pipelex.cogt.ocr.ocr_job_components import OcrJobConfig
 from pipelex.cogt.ocr.ocr_output import OcrOutput
 from pipelex.cogt.ocr.ocr_worker_abstract import OcrWorkerAbstract
 from pipelex.plugins.mistral.mistral_factory import MistralFactory
-from pipelex.plugins.mistral.mistral_utils import upload_file_for_ocr
+from pipelex.plugins.mistral.mistral_utils import upload_bytes_for_ocr, upload_file_for_ocr
 from pipelex.reporting.reporting_protocol import ReportingProtocol
 from pipelex.tools.misc.base_64_utils import load_binary_as_base64_async
+from pipelex.tools.misc.file_fetch_utils import fetch_file_from_url_httpx_async
 from pipelex.tools.misc.filetype_utils import detect_file_type_from_base64
 from pipelex.tools.misc.path_utils import clarify_path_or_url
+from pipelex.tools.pdf.pypdfium2_renderer import get_pdf_nb_pages
 
 
 class MistralOcrWorker(OcrWorkerAbstract):
@@ -50,6 +58,8 @@ class MistralOcrWorker(OcrWorkerAbstract):
                 should_include_images=ocr_job.job_params.should_include_images,
                 should_caption_images=ocr_job.job_params.should_caption_images,
                 should_include_page_views=ocr_job.job_params.should_include_page_views,
+                nb_pages_per_chunk=ocr_job.job_params.nb_pages_per_chunk,
+                job_config=ocr_job.job_config,
             )
         else:
             raise OcrInputError("No image nor PDF URI provided in OcrJob")
@@ -79,6 +89,8 @@ class MistralOcrWorker(OcrWorkerAbstract):
         should_include_images: bool,
         should_caption_images: bool,
         should_include_page_views: bool,
+        nb_pages_per_chunk: Optional[int] = None,
+        job_config: Optional[OcrJobConfig] = None,
     ) -> OcrOutput:
         if should_caption_images:
             raise OcrCapabilityError("Captioning is not implemented for Mistral OCR.")
@@ -89,19 +101,49 @@ class MistralOcrWorker(OcrWorkerAbstract):
             # the caller will be responsible to get the page views using other solution if needed
             # raise OcrCapabilityError("Page views are not implemented for Mistral OCR.")
         pdf_path, pdf_url = clarify_path_or_url(path_or_uri=pdf_uri)  # pyright: ignore
-        ocr_output: OcrOutput
+        if nb_pages_per_chunk:
+            nb_pages: int
+            pdf_bytes: Optional[bytes] = None
+            if pdf_url:
+                # a remote document has to be downloaded to count its pages
+                pdf_bytes = await fetch_file_from_url_httpx_async(url=pdf_url)
+                nb_pages = await get_pdf_nb_pages(pdf_input=pdf_bytes)
+            else:
+                assert pdf_path is not None  # Type narrowing for mypy
+                nb_pages = await get_pdf_nb_pages(pdf_input=pdf_path)
+            if nb_pages > nb_pages_per_chunk:
+                # the document is uploaded once and each chunk is a request for some of its pages,
+                # so Mistral doesn't download a remote document again for every chunk
+                chunked_document_url: str
+                if pdf_bytes is not None:
+                    assert pdf_url is not None  # Type narrowing for mypy
+                    file_name = os.path.basename(urlsplit(pdf_url).path) or "document.pdf"
+                    chunked_document_url = await self._upload_pdf_bytes(pdf_bytes=pdf_bytes, file_name=file_name)
+                else:
+                    assert pdf_path is not None  # Type narrowing for mypy
+                    chunked_document_url = await self._upload_pdf_file(pdf_path=pdf_path)
+                return await self._ocr_extract_pages_by_chunks(
+                    nb_pages=nb_pages,
+                    nb_pages_per_chunk=nb_pages_per_chunk,
+                    job_config=job_config or OcrJobConfig(),
+                    extract_page_range=lambda page_range: self.extract_from_pdf_url(
+                        pdf_url=chunked_document_url,
+                        should_include_images=should_include_images,
+                        page_range=page_range,
+                    ),
+                    retriable_errors=(SDKError, httpx.HTTPError),
+                )
+
         if pdf_url:
-            ocr_output = await self.extract_from_pdf_url(
-                pdf_url=pdf_url,
-                should_include_images=should_include_images,
-            )
+            document_url = pdf_url
         else:  # pdf_path must be provided based on validation
             assert pdf_path is not None  # Type narrowing for mypy
-            ocr_output = await self.extract_from_pdf_file(
-                pdf_path=pdf_path,
-                should_include_images=should_include_images,
-            )
-        return ocr_output
+            document_url = await self._upload_pdf_file(pdf_path=pdf_path)
+
+        return await self.extract_from_pdf_url(
+            pdf_url=document_url,
+            should_include_images=should_include_images,
+        )
 
     async def extract_from_image_url(
         self,
@@ -141,6 +183,7 @@ class MistralOcrWorker(OcrWorkerAbstract):
         self,
         pdf_url: str,
         should_include_images: bool = False,
+        page_range: Optional[range] = None,
     ) -> OcrOutput:
         ocr_response = await self.mistral_client.ocr.process_async(
             model=self.ocr_engine.ocr_model_name,
@@ -148,6 +191,7 @@ class MistralOcrWorker(OcrWorkerAbstract):
                 "type": "document_url",
                 "document_url": pdf_url,
             },
+            pages=list(page_range) if page_range is not None else UNSET,
             include_image_base64=should_include_images,
         )
 
@@ -155,13 +199,12 @@ class MistralOcrWorker(OcrWorkerAbstract):
             mistral_ocr_response=ocr_response,
             should_include_images=should_include_images,
         )
+        if page_range is not None and not set(ocr_output.pages).issubset(page_range):
+            # the pages are indexed within the chunk, we want them indexed within the document
+            ocr_output.pages = {page_range[rank]: page for rank, (_, page) in enumerate(sorted(ocr_output.pages.items()))}
         return ocr_output
 
-    async def extract_from_pdf_file(
-        self,
-        pdf_path: str,
-        should_include_images: bool = False,
-    ) -> OcrOutput:
+    async def _upload_pdf_file(self, pdf_path: str) -> str:
         # Upload the file
         uploaded_file_id = await upload_file_for_ocr(
             mistral_client=self.mistral_client,
@@ -172,7 +215,25 @@ class MistralOcrWorker(OcrWorkerAbstract):
         signed_url = await self.mistral_client.files.get_signed_url_async(
             file_id=uploaded_file_id,
         )
+        return signed_url.url
+
+    async def _upload_pdf_bytes(self, pdf_bytes: bytes, file_name: str) -> str:
+        uploaded_file_id = await upload_bytes_for_ocr(
+            mistral_client=self.mistral_client,
+            file_name=file_name,
+            file_content=pdf_bytes,
+        )
+        signed_url = await self.mistral_client.files.get_signed_url_async(
+            file_id=uploaded_file_id,
+        )
+        return signed_url.url
+
+    async def extract_from_pdf_file(
+        self,
+        pdf_path: str,
+        should_include_images: bool = False,
+    ) -> OcrOutput:
         return await self.extract_from_pdf_url(
-            pdf_url=signed_url.url,
+            pdf_url=await self._upload_pdf_file(pdf_path=pdf_path),
             should_include_images=should_include_images,
         )
@@ -20,8 +20,30 @@ async def upload_file_for_ocr(
     async with aiofiles.open(file_path, "rb") as file:  # type: ignore[reportUnknownMemberType]
         file_content = await file.read()
 
+    return await upload_bytes_for_ocr(
+        mistral_client=mistral_client,
+        file_name=os.path.basename(file_path),
+        file_content=file_content,
+    )
+
+
+async def upload_bytes_for_ocr(
+    mistral_client: Mistral,
+    file_name: str,
+    file_content: bytes,
+) -> str:
+    """
+    Upload the content of a file to Mistral.
+
+    Args:
+        file_name: Name of the uploaded file
+        file_content: Content of the file
+
+    Returns:
+        ID of the uploaded file
+    """
     uploaded_file = await mistral_client.files.upload_async(
-        file={"file_name": os.path.basename(file_path), "content": file_content},
+        file={"file_name": file_name, "content": file_content},
         purpose="ocr",
     )
     return uploaded_file.id
@@ -13,14 +13,13 @@ from openai.types.chat.chat_completion_content_part_image_param import ImageURL
 from openai.types.completion_usage import CompletionUsage
 
 from pipelex import log
-from pipelex.cogt.exceptions import LLMEngineParameterError, LLMPromptParameterError
-from pipelex.cogt.image.prompt_image import PromptImage, PromptImageBytes, PromptImagePath, PromptImageUrl
+from pipelex.cogt.exceptions import LLMEngineParameterError
+from pipelex.cogt.image.prompt_image import PromptImageTypedBytes, PromptImageTypedBytesOrUrl
 from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.llm.llm_models.llm_engine import LLMEngine
 from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
 from pipelex.cogt.llm.token_category import NbTokensByCategoryDict, TokenCategory
-from pipelex.hub import get_plugin_manager, get_secrets_provider
-from pipelex.tools.misc.base_64_utils import load_binary_as_base64
+from pipelex.hub import get_inference_manager, get_plugin_manager, get_secrets_provider
 
 
 class OpenAIFactory:
@@ -85,7 +84,7 @@ class OpenAIFactory:
         return the_client
 
     @classmethod
-    def make_simple_messages(
+    async def make_simple_messages(
         cls,
         llm_job: LLMJob,
         llm_engine: LLMEngine,
@@ -104,8 +103,13 @@ class OpenAIFactory:
             user_part_text = ChatCompletionContentPartTextParam(text=user_prompt_text, type="text")
             user_contents.append(user_part_text)
         if llm_prompt.user_images:
-            for prompt_image in llm_prompt.user_images:
-                openai_image_url = cls.make_openai_image_url(prompt_image=prompt_image)
+            prompt_image_preparer = get_inference_manager().get_prompt_image_preparer()
+            prepped_user_images = await prompt_image_preparer.prepare_all_typed_bytes_or_urls(
+                prompt_images=llm_prompt.user_images,
+                image_budget=llm_job.job_params.image_budget,
+            )
+            for prepped_image in prepped_user_images:
+                openai_image_url = cls.make_openai_image_url(prepped_image=prepped_image)
                 image_param = ChatCompletionContentPartImageParam(image_url=openai_image_url, type="image_url")
                 user_contents.append(image_param)
 
@@ -113,20 +117,10 @@ class OpenAIFactory:
         return messages
 
     @classmethod
-    def make_openai_image_url(cls, prompt_image: PromptImage) -> ImageURL:
-        if isinstance(prompt_image, PromptImageUrl):
-            url = prompt_image.url
-            openai_image_url = ImageURL(url=url, detail="high")
-        elif isinstance(prompt_image, PromptImageBytes):
-            # TODO: manage image type
-            url_with_bytes: str = f"data:image/jpeg;base64,{prompt_image.base_64.decode('utf-8')}"
-            openai_image_url = ImageURL(url=url_with_bytes, detail="high")
-        elif isinstance(prompt_image, PromptImagePath):
-            image_bytes = load_binary_as_base64(path=prompt_image.file_path)
-            return cls.make_openai_image_url(PromptImageBytes(base_64=image_bytes))
-        else:
-            raise LLMPromptParameterError(f"prompt_image of type {type(prompt_image)} is not supported")
-        return openai_image_url
+    def make_openai_image_url(cls, prepped_image: PromptImageTypedBytesOrUrl) -> ImageURL:
+        if isinstance(prepped_image, PromptImageTypedBytes):
+            return ImageURL(url=prepped_image.make_data_url(), detail="high")
+        return ImageURL(url=prepped_image, detail="high")
 
     @staticmethod
     def make_openai_error_info(exception: Exception) -> str:
@@ -1,4 +1,4 @@
-from typing import Any, Optional, Type
+from typing import Any, AsyncGenerator, Dict, Optional, Type
 
 import instructor
 import openai
@@ -11,6 +11,9 @@ from pipelex.cogt.exceptions import LLMCompletionError, LLMEngineParameterError,
 from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.llm.llm_models.llm_engine import LLMEngine
 from pipelex.cogt.llm.llm_models.llm_family import LLMFamily
+from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
+from pipelex.cogt.llm.llm_rate_limiter import LLMRateLimiter
+from pipelex.cogt.llm.llm_schema_cache import get_llm_schema_cache
 from pipelex.cogt.llm.llm_worker_internal_abstract import LLMWorkerInternalAbstract
 from pipelex.cogt.llm.structured_output import StructureMethod
 from pipelex.plugins.openai.openai_factory import OpenAIFactory
@@ -25,12 +28,14 @@ class OpenAILLMWorker(LLMWorkerInternalAbstract):
         llm_engine: LLMEngine,
         structure_method: Optional[StructureMethod],
         reporting_delegate: Optional[ReportingProtocol] = None,
+        rate_limiter: Optional[LLMRateLimiter] = None,
     ):
         LLMWorkerInternalAbstract.__init__(
             self,
             llm_engine=llm_engine,
             structure_method=structure_method,
             reporting_delegate=reporting_delegate,
+            rate_limiter=rate_limiter,
         )
 
         if not isinstance(sdk_instance, openai.AsyncOpenAI):
@@ -48,80 +53,80 @@ class OpenAILLMWorker(LLMWorkerInternalAbstract):
 
     #########################################################
 
+    def _make_text_completion_params(self, llm_job: LLMJob) -> Dict[str, Any]:
+        match self.llm_engine.llm_model.llm_family:
+            case LLMFamily.O_SERIES:
+                # for o1 models, we must use temperature=1, and tokens limit is named max_completion_tokens
+                return {
+                    "temperature": 1,
+                    "max_completion_tokens": llm_job.job_params.max_tokens or NOT_GIVEN,
+                }
+            case LLMFamily.GEMINI:
+                # for gemini models, we multiply the temperature by 2 because the range is 0-2
+                return {
+                    "temperature": llm_job.job_params.temperature * 2,
+                    "max_tokens": llm_job.job_params.max_tokens or NOT_GIVEN,
+                }
+            case (
+                LLMFamily.GPT_4
+                | LLMFamily.GPT_3_5
+                | LLMFamily.GPT_3
+                | LLMFamily.GPT_4_5
+                | LLMFamily.GPT_4_1
+                | LLMFamily.GPT_4O
+                | LLMFamily.CUSTOM_LLAMA_4
+                | LLMFamily.CUSTOM_GEMMA_3
+                | LLMFamily.CUSTOM_MISTRAL_SMALL_3_1
+                | LLMFamily.CUSTOM_QWEN_3
+                | LLMFamily.PERPLEXITY_SEARCH
+                | LLMFamily.PERPLEXITY_RESEARCH
+                | LLMFamily.PERPLEXITY_REASONING
+                | LLMFamily.PERPLEXITY_DEEPSEEK
+                | LLMFamily.GROK_3
+            ):
+                return {
+                    "temperature": llm_job.job_params.temperature,
+                    "max_tokens": llm_job.job_params.max_tokens or NOT_GIVEN,
+                }
+            case (
+                LLMFamily.CLAUDE_3
+                | LLMFamily.CLAUDE_3_5
+                | LLMFamily.CLAUDE_3_7
+                | LLMFamily.CLAUDE_4
+                | LLMFamily.MISTRAL_7B
+                | LLMFamily.MISTRAL_8X7B
+                | LLMFamily.MISTRAL_LARGE
+                | LLMFamily.MISTRAL_SMALL
+                | LLMFamily.MISTRAL_CODESTRAL
+                | LLMFamily.MINISTRAL
+                | LLMFamily.PIXTRAL
+                | LLMFamily.LLAMA_3
+                | LLMFamily.LLAMA_3_1
+                | LLMFamily.BEDROCK_MISTRAL_LARGE
+                | LLMFamily.BEDROCK_ANTHROPIC_CLAUDE
+                | LLMFamily.BEDROCK_META_LLAMA_3
+                | LLMFamily.BEDROCK_AMAZON_NOVA
+            ):
+                raise LLMEngineParameterError(f"LLM family {self.llm_engine.llm_model.llm_family} is not supported by OpenAILLMWorker")
+
     @override
     async def _gen_text(
         self,
         llm_job: LLMJob,
     ) -> str:
-        messages = OpenAIFactory.make_simple_messages(
+        messages = await OpenAIFactory.make_simple_messages(
             llm_job=llm_job,
             llm_engine=self.llm_engine,
         )
+        completion_params = self._make_text_completion_params(llm_job=llm_job)
 
         try:
-            match self.llm_engine.llm_model.llm_family:
-                case LLMFamily.O_SERIES:
-                    # for o1 models, we must use temperature=1, and tokens limit is named max_completion_tokens
-                    response = await self.openai_client_for_text.chat.completions.create(
-                        model=self.llm_engine.llm_id,
-                        temperature=1,
-                        max_completion_tokens=llm_job.job_params.max_tokens or NOT_GIVEN,
-                        seed=llm_job.job_params.seed,
-                        messages=messages,
-                    )
-                case LLMFamily.GEMINI:
-                    # for gemini models, we multiply the temperature by 2 because the range is 0-2
-                    response = await self.openai_client_for_text.chat.completions.create(
-                        model=self.llm_engine.llm_id,
-                        temperature=llm_job.job_params.temperature * 2,
-                        max_tokens=llm_job.job_params.max_tokens or NOT_GIVEN,
-                        seed=llm_job.job_params.seed,
-                        messages=messages,
-                    )
-                case (
-                    LLMFamily.GPT_4
-                    | LLMFamily.GPT_3_5
-                    | LLMFamily.GPT_3
-                    | LLMFamily.GPT_4_5
-                    | LLMFamily.GPT_4_1
-                    | LLMFamily.GPT_4O
-                    | LLMFamily.CUSTOM_LLAMA_4
-                    | LLMFamily.CUSTOM_GEMMA_3
-                    | LLMFamily.CUSTOM_MISTRAL_SMALL_3_1
-                    | LLMFamily.CUSTOM_QWEN_3
-                    | LLMFamily.PERPLEXITY_SEARCH
-                    | LLMFamily.PERPLEXITY_RESEARCH
-                    | LLMFamily.PERPLEXITY_REASONING
-                    | LLMFamily.PERPLEXITY_DEEPSEEK
-                    | LLMFamily.GROK_3
-                ):
-                    response = await self.openai_client_for_text.chat.completions.create(
-                        model=self.llm_engine.llm_id,
-                        temperature=llm_job.job_params.temperature,
-                        max_tokens=llm_job.job_params.max_tokens or NOT_GIVEN,
-                        seed=llm_job.job_params.seed,
-                        messages=messages,
-                    )
-                case (
-                    LLMFamily.CLAUDE_3
-                    | LLMFamily.CLAUDE_3_5
-                    | LLMFamily.CLAUDE_3_7
-                    | LLMFamily.CLAUDE_4
-                    | LLMFamily.MISTRAL_7B
-                    | LLMFamily.MISTRAL_8X7B
-                    | LLMFamily.MISTRAL_LARGE
-                    | LLMFamily.MISTRAL_SMALL
-                    | LLMFamily.MISTRAL_CODESTRAL
-                    | LLMFamily.MINISTRAL
-                    | LLMFamily.PIXTRAL
-                    | LLMFamily.LLAMA_3
-                    | LLMFamily.LLAMA_3_1
-                    | LLMFamily.BEDROCK_MISTRAL_LARGE
-                    | LLMFamily.BEDROCK_ANTHROPIC_CLAUDE
-                    | LLMFamily.BEDROCK_META_LLAMA_3
-                    | LLMFamily.BEDROCK_AMAZON_NOVA
-                ):
-                    raise LLMEngineParameterError(f"LLM family {self.llm_engine.llm_model.llm_family} is not supported by OpenAILLMWorker")
+            response = await self.openai_client_for_text.chat.completions.create(
+                model=self.llm_engine.llm_id,
+                seed=llm_job.job_params.seed,
+                messages=messages,
+                **completion_params,
+            )
         except NotFoundError as not_found_error:
             # TODO: record llm config so it can be displayed here
             raise LLMModelNotFoundError(
@@ -143,16 +148,59 @@ class OpenAILLMWorker(LLMWorkerInternalAbstract):
             llm_tokens_usage.nb_tokens_by_category = OpenAIFactory.make_nb_tokens_by_category(usage=usage)
         return response_text
 
+    @override
+    async def _gen_text_stream(
+        self,
+        llm_job: LLMJob,
+    ) -> AsyncGenerator[str, None]:
+        messages = await OpenAIFactory.make_simple_messages(
+            llm_job=llm_job,
+            llm_engine=self.llm_engine,
+        )
+        completion_params = self._make_text_completion_params(llm_job=llm_job)
+        if self.llm_engine.llm_platform == LLMPlatform.AZURE_OPENAI:
+            log.warning("Azure OpenAI does not support stream_options, token usage won't be reported", problem_id="azure_openai_no_stream_options")
+        else:
+            completion_params["stream_options"] = {"include_usage": True}
+
+        try:
+            stream = await self.openai_client_for_text.chat.completions.create(
+                model=self.llm_engine.llm_id,
+                seed=llm_job.job_params.seed,
+                messages=messages,
+                stream=True,
+                **completion_params,
+            )
+            # closing the stream releases its connection, even if the consumer stops reading before the end
+            async with stream:
+                async for chunk in stream:
+                    if chunk.choices and (text_chunk := chunk.choices[0].delta.content):
+                        yield text_chunk
+                    # with include_usage, the last chunk has no choices but carries the usage of the whole completion
+                    if (llm_tokens_usage := llm_job.job_report.llm_tokens_usage) and (usage := chunk.usage):
+                        llm_tokens_usage.nb_tokens_by_category = OpenAIFactory.make_nb_tokens_by_category(usage=usage)
+        except NotFoundError as not_found_error:
+            raise LLMModelNotFoundError(
+                f"OpenAI model or deployment not found:\n{self.llm_engine.desc}\nmodel: {self.llm_engine.llm_model.desc}\n{not_found_error}"
+            ) from not_found_error
+        except APIConnectionError as api_connection_error:
+            raise LLMCompletionError(f"OpenAI API connection error: {api_connection_error}") from api_connection_error
+        except BadRequestError as bad_request_error:
+            raise LLMCompletionError(
+                f"OpenAI bad request error with model: {self.llm_engine.llm_model.desc}:\n{bad_request_error}"
+            ) from bad_request_error
+
     @override
     async def _gen_object(
         self,
         llm_job: LLMJob,
         schema: Type[BaseModelTypeVar],
     ) -> BaseModelTypeVar:
-        messages = OpenAIFactory.make_simple_messages(
+        messages = await OpenAIFactory.make_simple_messages(
             llm_job=llm_job,
             llm_engine=self.llm_engine,
         )
+        response_model = get_llm_schema_cache().get_instructor_schema(schema=schema)
         try:
             match self.llm_engine.llm_model.llm_family:
                 case LLMFamily.O_SERIES:
@@ -163,7 +211,7 @@ class OpenAILLMWorker(LLMWorkerInternalAbstract):
                         max_completion_tokens=llm_job.job_params.max_tokens or NOT_GIVEN,
                         seed=llm_job.job_params.seed,
                         messages=messages,
-                        response_model=schema,
+                        response_model=response_model,
                         max_retries=llm_job.job_config.max_retries,
                     )
                 case LLMFamily.GEMINI:
@@ -174,7 +222,7 @@ class OpenAILLMWorker(LLMWorkerInternalAbstract):
                         max_tokens=llm_job.job_params.max_tokens or NOT_GIVEN,
                         seed=llm_job.job_params.seed,
                         messages=messages,
-                        response_model=schema,
+                        response_model=response_model,
                         max_retries=llm_job.job_config.max_retries,
                     )
                 case (
@@ -200,7 +248,7 @@ class OpenAILLMWorker(LLMWorkerInternalAbstract):
                         max_tokens=llm_job.job_params.max_tokens or NOT_GIVEN,
                         seed=llm_job.job_params.seed,
                         messages=messages,
-                        response_model=schema,
+                        response_model=response_model,
                         max_retries=llm_job.job_config.max_retries,
                     )
                 case (
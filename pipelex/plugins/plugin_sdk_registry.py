@@ -1,9 +1,11 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from pydantic import Field, RootModel
+from pydantic import Field, PrivateAttr, RootModel
 
 from pipelex.cogt.imgg.imgg_platform import ImggPlatform
 from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
+from pipelex.cogt.llm.llm_models.llm_rate_limit import LLMRateLimit
+from pipelex.cogt.llm.llm_rate_limiter import LLMRateLimiter
 from pipelex.cogt.ocr.ocr_platform import OcrPlatform
 from pipelex.types import StrEnum
 
@@ -65,12 +67,15 @@ PluginSdkRegistryRoot = Dict[str, Any]
 
 class PluginSdkRegistry(RootModel[PluginSdkRegistryRoot]):
     root: PluginSdkRegistryRoot = Field(default_factory=dict)
+    # rate limiters live next to the sdk instances so that every worker sharing an sdk instance also shares its budgets
+    _llm_rate_limiters: Dict[Tuple[LLMPlatform, str], LLMRateLimiter] = PrivateAttr(default_factory=dict)
 
     def teardown(self):
         for llm_sdk_instance in self.root.values():
             if hasattr(llm_sdk_instance, "teardown"):
                 llm_sdk_instance.teardown()
         self.root = {}
+        self._llm_rate_limiters = {}
 
     def get_llm_sdk_instance(self, llm_sdk_handle: PluginSdkHandle) -> Optional[Any]:
         return self.root.get(llm_sdk_handle)
@@ -79,6 +84,14 @@ class PluginSdkRegistry(RootModel[PluginSdkRegistryRoot]):
         self.root[llm_sdk_handle] = llm_sdk_instance
         return llm_sdk_instance
 
+    def get_llm_rate_limiter(self, llm_platform: LLMPlatform, llm_id: str, llm_rate_limit: LLMRateLimit) -> LLMRateLimiter:
+        key = (llm_platform, llm_id)
+        if llm_rate_limiter := self._llm_rate_limiters.get(key):
+            return llm_rate_limiter
+        llm_rate_limiter = LLMRateLimiter(llm_rate_limit=llm_rate_limit, desc=f"{llm_platform}/{llm_id}")
+        self._llm_rate_limiters[key] = llm_rate_limiter
+        return llm_rate_limiter
+
     def get_ocr_sdk_instance(self, ocr_sdk_handle: PluginSdkHandle) -> Optional[Any]:
         return self.root.get(ocr_sdk_handle)
 
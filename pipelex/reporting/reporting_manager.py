@@ -1,3 +1,5 @@
+import os
+import time
 from typing import Dict, List, Optional
 
 from pydantic import Field, RootModel
@@ -9,7 +11,7 @@ from pipelex.cogt.inference.cost_registry import CostRegistry
 from pipelex.cogt.inference.inference_job_abstract import InferenceJobAbstract
 from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.llm.llm_report import LLMTokenCostReport, LLMTokensUsage
-from pipelex.config import ReportingConfig
+from pipelex.config import ReportingConfig, RunRetentionConfig
 from pipelex.pipeline.pipeline_models import SpecialPipelineId
 from pipelex.reporting.reporting_protocol import ReportingProtocol
 from pipelex.tools.misc.file_utils import ensure_path, get_incremental_file_path
@@ -28,9 +30,14 @@ class UsageRegistry(RootModel[LLMUsageRegistryRoot]):
 
 
 class ReportingManager(ReportingProtocol):
-    def __init__(self, reporting_config: ReportingConfig):
+    def __init__(self, reporting_config: ReportingConfig, run_retention_config: Optional[RunRetentionConfig] = None):
         self._usage_registries: Dict[str, UsageRegistry] = {}
         self._reporting_config = reporting_config
+        self._run_retention_config = run_retention_config
+        # completion time of the completed registries, in order of completion
+        self._completed_at_by_run_id: Dict[str, float] = {}
+        # files holding the cost reports of the usages spilled to disk
+        self._spill_file_paths: Dict[str, str] = {}
 
     ############################################################
     # Manager lifecycle
@@ -44,6 +51,8 @@ class ReportingManager(ReportingProtocol):
     @override
     def teardown(self):
         self._usage_registries.clear()
+        self._completed_at_by_run_id.clear()
+        self._spill_file_paths.clear()
 
     ############################################################
     # Private methods
@@ -72,6 +81,43 @@ class ReportingManager(ReportingProtocol):
         if self._reporting_config.is_log_costs_to_console:
             log.verbose(llm_token_cost_report, title="Token Cost report")
 
+    def _spill_registry(self, pipeline_run_id: str):
+        """Append the cost reports of the registry's usages to its spill file and drop the usages from memory."""
+        registry = self._get_registry(pipeline_run_id)
+        llm_tokens_usages = registry.get_current_tokens_usage()
+        if not llm_tokens_usages:
+            return
+        spill_file_path = os.path.join(self._reporting_config.usage_spill_dir_path, f"{pipeline_run_id}.jsonl")
+        ensure_path(self._reporting_config.usage_spill_dir_path)
+        with open(spill_file_path, "a", encoding="utf-8") as spill_file:
+            for llm_tokens_usage in llm_tokens_usages:
+                cost_report = CostRegistry.complete_cost_report(llm_tokens_usage=llm_tokens_usage)
+                spill_file.write(cost_report.model_dump_json() + "\n")
+        self._spill_file_paths[pipeline_run_id] = spill_file_path
+        llm_tokens_usages.clear()
+
+    def _load_spilled_cost_reports(self, pipeline_run_id: str) -> List[LLMTokenCostReport]:
+        spill_file_path = self._spill_file_paths.get(pipeline_run_id)
+        if not spill_file_path:
+            return []
+        with open(spill_file_path, "r", encoding="utf-8") as spill_file:
+            return [LLMTokenCostReport.model_validate_json(line) for line in spill_file if line.strip()]
+
+    def _apply_run_retention(self):
+        if not self._run_retention_config:
+            return
+        if (max_age_seconds := self._run_retention_config.applied_max_completed_run_age_seconds) is not None:
+            oldest_allowed_time = time.time() - max_age_seconds
+            for run_id, completed_at in list(self._completed_at_by_run_id.items()):
+                if completed_at >= oldest_allowed_time:
+                    # the following ones completed later
+                    break
+                self.close_registry(pipeline_run_id=run_id)
+        if (max_completed_runs := self._run_retention_config.applied_max_completed_runs) is not None:
+            nb_runs_to_close = len(self._completed_at_by_run_id) - max_completed_runs
+            for run_id in list(self._completed_at_by_run_id.keys())[: max(nb_runs_to_close, 0)]:
+                self.close_registry(pipeline_run_id=run_id)
+
     ############################################################
     # ReportingProtocol
     ############################################################
@@ -115,8 +161,22 @@ class ReportingManager(ReportingProtocol):
                 llm_tokens_usages=registry.get_current_tokens_usage(),
                 unit_scale=self._reporting_config.cost_report_unit_scale,
                 cost_report_file_path=cost_report_file_path,
+                completed_cost_reports=self._load_spilled_cost_reports(pipeline_run_id=run_id),
             )
 
+    @override
+    def complete_registry(self, pipeline_run_id: str):
+        if pipeline_run_id not in self._usage_registries:
+            log.warning(f"Cannot complete registry for pipeline '{pipeline_run_id}': it does not exist or was already closed")
+            return
+        if self._reporting_config.is_usage_spilled_to_disk:
+            self._spill_registry(pipeline_run_id=pipeline_run_id)
+        self._completed_at_by_run_id[pipeline_run_id] = time.time()
+        self._apply_run_retention()
+
     @override
     def close_registry(self, pipeline_run_id: str):
         self._usage_registries.pop(pipeline_run_id)
+        self._completed_at_by_run_id.pop(pipeline_run_id, None)
+        # the spill file is kept, it's the persisted record of the run's usages
+        self._spill_file_paths.pop(pipeline_run_id, None)
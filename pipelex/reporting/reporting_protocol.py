@@ -12,6 +12,8 @@ class ReportingProtocol(Protocol):
 
     def generate_report(self, pipeline_run_id: Optional[str] = None): ...
 
+    def complete_registry(self, pipeline_run_id: str): ...
+
     def close_registry(self, pipeline_run_id: str): ...
 
     def setup(self): ...
@@ -32,6 +34,10 @@ class ReportingNoOp(ReportingProtocol):
     def generate_report(self, pipeline_run_id: Optional[str] = None):
         pass
 
+    @override
+    def complete_registry(self, pipeline_run_id: str):
+        pass
+
     @override
     def close_registry(self, pipeline_run_id: str):
         pass
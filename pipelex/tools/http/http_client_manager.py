@@ -0,0 +1,313 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from pipelex import log
+from pipelex.tools.http.http_config import HttpConfig
+from pipelex.tools.misc.concurrency_utils import close_on_event_loop
+
+RETRIED_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+DOWNLOAD_CACHE_CONTENT_SUFFIX = ".bin"
+
+
+class DownloadCache:
+    """Downloaded files kept on disk, keyed by url, and revalidated with their ETag or Last-Modified header.
+
+    Files are written to a temporary file then renamed, so that a reader never sees a partial file, and the metadata
+    records the size and hash of the content, so that a copy which doesn't match its validators is never used.
+    The least recently used files are evicted when their total size exceeds max_bytes.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def _get_paths(self, url: str) -> Tuple[str, str]:
+        url_digest = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{url_digest}{DOWNLOAD_CACHE_CONTENT_SUFFIX}"), os.path.join(self.cache_dir, f"{url_digest}.json")
+
+    def _load_metadata(self, url: str) -> Optional[Dict[str, Any]]:
+        content_path, metadata_path = self._get_paths(url=url)
+        try:
+            with open(metadata_path, encoding="utf-8") as metadata_file:
+                metadata: Dict[str, Any] = json.load(metadata_file)
+            content_size = os.path.getsize(content_path)
+        except (OSError, ValueError):
+            return None
+        if metadata.get("url") != url or metadata.get("size") != content_size:
+            return None
+        return metadata
+
+    def get_validators(self, url: str) -> Dict[str, str]:
+        """Headers to make the request conditional, if we have a complete cached copy of the url."""
+        metadata = self._load_metadata(url=url)
+        if metadata is None:
+            return {}
+        validators: Dict[str, str] = {}
+        if etag := metadata.get("etag"):
+            validators["If-None-Match"] = etag
+        if last_modified := metadata.get("last_modified"):
+            validators["If-Modified-Since"] = last_modified
+        return validators
+
+    def load(self, url: str) -> Optional[bytes]:
+        """The cached copy of the url, or None if it was evicted or replaced by a concurrent download since its validators were sent."""
+        metadata = self._load_metadata(url=url)
+        if metadata is None:
+            return None
+        content_path, _ = self._get_paths(url=url)
+        try:
+            with open(content_path, "rb") as content_file:
+                content = content_file.read()
+            # mark it as recently used, the eviction goes by modification time
+            os.utime(content_path)
+        except OSError:
+            return None
+        if hashlib.sha256(content).hexdigest() != metadata.get("content_hash"):
+            return None
+        return content
+
+    def store(self, url: str, response: httpx.Response):
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            # without validators, we couldn't tell whether a cached copy is still valid
+            return
+        content = response.content
+        if len(content) > self.max_bytes:
+            return
+        metadata = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "size": len(content),
+            "content_hash": hashlib.sha256(content).hexdigest(),
+        }
+        content_path, metadata_path = self._get_paths(url=url)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._write_file(path=content_path, data=content)
+            self._write_file(path=metadata_path, data=json.dumps(metadata).encode())
+        except OSError as exc:
+            log.warning(f"Could not store the download of '{url}' in the download cache: {exc}")
+            return
+        self._evict()
+
+    @staticmethod
+    def _write_file(path: str, data: bytes):
+        # write then rename, so that concurrent downloads, from other processes or threads, never read a partial file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _evict(self):
+        content_files: List[Tuple[float, int, str]] = []
+        with os.scandir(self.cache_dir) as dir_entries:
+            for dir_entry in dir_entries:
+                if not dir_entry.name.endswith(DOWNLOAD_CACHE_CONTENT_SUFFIX):
+                    continue
+                try:
+                    stat_result = dir_entry.stat()
+                except OSError:
+                    continue
+                content_files.append((stat_result.st_mtime, stat_result.st_size, dir_entry.path))
+        total_size = sum(size for _, size, _ in content_files)
+        for _, size, content_path in sorted(content_files):
+            if total_size <= self.max_bytes:
+                break
+            metadata_path = f"{content_path.removesuffix(DOWNLOAD_CACHE_CONTENT_SUFFIX)}.json"
+            for evicted_path in (metadata_path, content_path):
+                try:
+                    os.remove(evicted_path)
+                except FileNotFoundError:
+                    pass
+            total_size -= size
+
+
+class HttpClientManager:
+    """Process-wide HTTP clients used to fetch files, with pooled keep-alive connections.
+
+    The async client is bound to the event loop which created it, so a new one is made for another event loop.
+    Concurrent requests to the same host are limited, failed requests are retried with an exponential backoff,
+    and downloads can be cached on disk.
+    """
+
+    def __init__(self, http_config: Optional[HttpConfig] = None):
+        self.http_config = http_config or HttpConfig()
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._sync_client: Optional[httpx.Client] = None
+        self._download_cache: Optional[DownloadCache] = None
+
+    def configure(self, http_config: HttpConfig):
+        self.teardown()
+        self.http_config = http_config
+
+    @property
+    def download_cache(self) -> Optional[DownloadCache]:
+        if not self.http_config.is_download_cache_enabled:
+            return None
+        if self._download_cache is None:
+            self._download_cache = DownloadCache(
+                cache_dir=self.http_config.download_cache_dir,
+                max_bytes=self.http_config.download_cache_max_bytes,
+            )
+        return self._download_cache
+
+    def _make_limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.http_config.max_connections,
+            max_keepalive_connections=self.http_config.max_keepalive_connections,
+        )
+
+    def _make_timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(self.http_config.read_timeout, connect=self.http_config.connect_timeout)
+
+    def _make_async_transport(self) -> httpx.AsyncBaseTransport:
+        # the transport retries the connection errors, the retries on error statuses are ours
+        return httpx.AsyncHTTPTransport(
+            limits=self._make_limits(),
+            http2=self.http_config.is_http2_enabled,
+            retries=self.http_config.max_retries,
+        )
+
+    def _make_sync_transport(self) -> httpx.BaseTransport:
+        return httpx.HTTPTransport(
+            limits=self._make_limits(),
+            http2=self.http_config.is_http2_enabled,
+            retries=self.http_config.max_retries,
+        )
+
+    def get_async_client(self) -> httpx.AsyncClient:
+        current_loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not current_loop:
+            self._release_async_client()
+            self._async_client = httpx.AsyncClient(transport=self._make_async_transport(), timeout=self._make_timeout(), follow_redirects=True)
+            self._async_client_loop = current_loop
+            self._host_semaphores = {}
+        return self._async_client
+
+    def get_sync_client(self) -> httpx.Client:
+        if self._sync_client is None:
+            self._sync_client = httpx.Client(transport=self._make_sync_transport(), timeout=self._make_timeout(), follow_redirects=True)
+        return self._sync_client
+
+    def _get_host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        if host_semaphore := self._host_semaphores.get(host):
+            return host_semaphore
+        host_semaphore = asyncio.Semaphore(self.http_config.max_connections_per_host)
+        self._host_semaphores[host] = host_semaphore
+        return host_semaphore
+
+    def _get_retry_delay(self, attempt: int) -> float:
+        return self.http_config.retry_backoff_seconds * (2**attempt)
+
+    async def _get_async(self, url: str, headers: Dict[str, str], timeout: Optional[float]) -> httpx.Response:
+        async_client = self.get_async_client()
+        request_timeout = timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT
+        attempt = 0
+        while True:
+            async with self._get_host_semaphore(url=url):
+                response = await async_client.get(url, headers=headers, timeout=request_timeout)
+            if response.status_code in RETRIED_STATUS_CODES and attempt < self.http_config.max_retries:
+                retry_delay = self._get_retry_delay(attempt=attempt)
+                log.debug(f"Fetching '{url}' failed with status {response.status_code}, retrying in {retry_delay:.2f}s")
+                await asyncio.sleep(retry_delay)
+                attempt += 1
+                continue
+            return response
+
+    def _get(self, url: str, headers: Dict[str, str], timeout: Optional[float]) -> httpx.Response:
+        sync_client = self.get_sync_client()
+        request_timeout = timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT
+        attempt = 0
+        while True:
+            response = sync_client.get(url, headers=headers, timeout=request_timeout)
+            if response.status_code in RETRIED_STATUS_CODES and attempt < self.http_config.max_retries:
+                retry_delay = self._get_retry_delay(attempt=attempt)
+                log.debug(f"Fetching '{url}' failed with status {response.status_code}, retrying in {retry_delay:.2f}s")
+                time.sleep(retry_delay)
+                attempt += 1
+                continue
+            return response
+
+    async def fetch_bytes_async(self, url: str, timeout: Optional[float] = None) -> bytes:
+        download_cache = self.download_cache
+        if not download_cache:
+            response = await self._get_async(url=url, headers={}, timeout=timeout)
+            return self._handle_response(url=url, response=response, download_cache=None)
+        # the download cache reads and writes files, which must not block the event loop
+        headers = await asyncio.to_thread(download_cache.get_validators, url=url)
+        response = await self._get_async(url=url, headers=headers, timeout=timeout)
+        content = await asyncio.to_thread(self._handle_response, url=url, response=response, download_cache=download_cache)
+        if content is None:
+            response = await self._get_async(url=url, headers={}, timeout=timeout)
+            content = await asyncio.to_thread(self._handle_response, url=url, response=response, download_cache=download_cache)
+        return content or b""
+
+    def fetch_bytes(self, url: str, timeout: Optional[float] = None) -> bytes:
+        download_cache = self.download_cache
+        headers = download_cache.get_validators(url=url) if download_cache else {}
+        response = self._get(url=url, headers=headers, timeout=timeout)
+        content = self._handle_response(url=url, response=response, download_cache=download_cache)
+        if content is None:
+            response = self._get(url=url, headers={}, timeout=timeout)
+            content = self._handle_response(url=url, response=response, download_cache=download_cache)
+        return content or b""
+
+    def _handle_response(self, url: str, response: httpx.Response, download_cache: Optional[DownloadCache]) -> Optional[bytes]:
+        """The downloaded content, or None if the server confirmed a cached copy which is no longer there, so the url must be fetched again."""
+        if response.status_code == httpx.codes.NOT_MODIFIED and download_cache and self._is_conditional(response=response):
+            cached_content = download_cache.load(url=url)
+            if cached_content is None:
+                log.debug(f"The cached download of '{url}' was evicted or replaced meanwhile, fetching it again")
+            else:
+                log.verbose(f"Using the cached download of '{url}'")
+            return cached_content
+        response.raise_for_status()  # Raise exception for 4XX/5XX status codes
+        if download_cache:
+            download_cache.store(url=url, response=response)
+        return response.content
+
+    @staticmethod
+    def _is_conditional(response: httpx.Response) -> bool:
+        request_headers = response.request.headers
+        return "If-None-Match" in request_headers or "If-Modified-Since" in request_headers
+
+    def _release_async_client(self):
+        async_client = self._async_client
+        client_loop = self._async_client_loop
+        self._async_client = None
+        self._async_client_loop = None
+        self._host_semaphores = {}
+        if async_client is not None:
+            close_on_event_loop(make_close_coroutine=async_client.aclose, event_loop=client_loop, resource_desc="HTTP client")
+
+    def teardown(self):
+        self._release_async_client()
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+        self._download_cache = None
+
+
+_http_client_manager = HttpClientManager()
+
+
+def get_http_client_manager() -> HttpClientManager:
+    return _http_client_manager
@@ -0,0 +1,17 @@
+from pydantic import Field
+
+from pipelex.tools.config.models import ConfigModel
+
+
+class HttpConfig(ConfigModel):
+    max_connections: int = Field(default=100, ge=1)
+    max_keepalive_connections: int = Field(default=20, ge=0)
+    max_connections_per_host: int = Field(default=10, ge=1)
+    connect_timeout: float = Field(default=10, gt=0)
+    read_timeout: float = Field(default=60, gt=0)
+    max_retries: int = Field(default=2, ge=0)
+    retry_backoff_seconds: float = Field(default=0.5, ge=0)
+    is_http2_enabled: bool = False
+    is_download_cache_enabled: bool = False
+    download_cache_dir: str = ".pipelex/download_cache"
+    download_cache_max_bytes: int = Field(default=1024 * 1024 * 1024, ge=0)
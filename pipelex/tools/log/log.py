@@ -211,7 +211,7 @@ class Log:
         Log a verbose message.
 
         Args:
-            content (Union[str, Any]): The content to log.
+            content (Union[str, Any]): The content to log, or a function returning it, only called if the message is emitted.
             title (Optional[str], optional): The title of the log message. Defaults to None.
             inline (Optional[str], optional): Inline title for the log message. Defaults to None.
                 Used to display the title inline, only if the title arg is None.
@@ -229,7 +229,7 @@ class Log:
         Log a debug message.
 
         Args:
-            content (Union[str, Any]): The content to log.
+            content (Union[str, Any]): The content to log, or a function returning it, only called if the message is emitted.
             title (Optional[str], optional): The title of the log message. Defaults to None.
             inline (Optional[str], optional): Inline title for the log message. Defaults to None.
                 Used to display the title inline, only if the title arg is None.
@@ -247,7 +247,7 @@ class Log:
         Log a development message.
 
         Args:
-            content (Union[str, Any]): The content to log.
+            content (Union[str, Any]): The content to log, or a function returning it, only called if the message is emitted.
             title (Optional[str], optional): The title of the log message. Defaults to None.
             inline (Optional[str], optional): Inline title for the log message. Defaults to None.
                 Used to display the title inline, only if the title arg is None.
@@ -265,7 +265,7 @@ class Log:
         Log an info message.
 
         Args:
-            content (Union[str, Any]): The content to log.
+            content (Union[str, Any]): The content to log, or a function returning it, only called if the message is emitted.
             title (Optional[str], optional): The title of the log message. Defaults to None.
             inline (Optional[str], optional): Inline title for the log message. Defaults to None.
                 Used to display the title inline, only if the title arg is None.
@@ -284,7 +284,7 @@ class Log:
         Log a warning message.
 
         Args:
-            content (Union[str, Any]): The content to log.
+            content (Union[str, Any]): The content to log, or a function returning it, only called if the message is emitted.
             title (Optional[str], optional): The title of the log message. Defaults to None.
             inline (Optional[str], optional): Inline title for the log message. Defaults to None.
                 Used to display the title inline, only if the title arg is None.
@@ -307,7 +307,7 @@ class Log:
         Log an error message.
 
         Args:
-            content (Union[str, Any]): The content to log.
+            content (Union[str, Any]): The content to log, or a function returning it, only called if the message is emitted.
             title (Optional[str], optional): The title of the log message. Defaults to None.
             inline (Optional[str], optional): Inline title for the log message. Defaults to None.
                 Used to display the title inline, only if the title arg is None.
@@ -337,7 +337,7 @@ class Log:
         Log a critical message.
 
         Args:
-            content (Union[str, Any]): The content to log.
+            content (Union[str, Any]): The content to log, or a function returning it, only called if the message is emitted.
             title (Optional[str], optional): The title of the log message. Defaults to None.
             inline (Optional[str], optional): Inline title for the log message. Defaults to None.
                 Used to display the title inline, only if the title arg is None.
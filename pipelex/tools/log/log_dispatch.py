@@ -2,11 +2,14 @@ import inspect
 import logging
 import os
 import traceback
-from typing import Any, List, Optional, Union
+from types import FrameType
+from typing import Any, Callable, List, Optional, Union
 
 from pipelex.tools.log.log_config import CallerInfoTemplate, LogConfig, LogMode
 from pipelex.tools.misc.json_utils import purify_json, purify_json_dict, purify_json_list
 
+_LOG_DISPATCH_FILE_PATH = __file__
+
 
 class LogDispatch:
     """
@@ -72,9 +75,54 @@ class LogDispatch:
     # Private methods
     ########################################################
 
+    def _get_log_origin_name(self) -> str:
+        """
+        Finds the name of the top-level package which the log call originates from, skipping the logging modules.
+        It only walks up the frames, so it's cheap enough to be done before knowing if the message will be emitted.
+
+        Returns:
+            str: The name of the logger to use, "unknown" if it could not be determined.
+        """
+        frame: Optional[FrameType] = inspect.currentframe()
+        try:
+            while frame is not None:
+                frame_file = frame.f_code.co_filename
+                if frame_file == _LOG_DISPATCH_FILE_PATH or frame_file.endswith("/log.py"):
+                    frame = frame.f_back
+                    continue
+                module_name: Optional[str] = frame.f_globals.get("__name__")
+                if module_name is None:
+                    frame = frame.f_back
+                    continue
+                if module_name == "__main__":
+                    if self.project_name is None:
+                        raise RuntimeError("Project name is not set. You must call initialize Pipelex first.")
+                    return self.project_name
+                return module_name.split(sep=".", maxsplit=1)[0]
+            return "unknown"
+        finally:
+            del frame
+
+    def is_enabled_for(self, severity: int, log_origin_name: str) -> bool:
+        """
+        Checks whether a log message of the given severity would be emitted, before paying for its formatting.
+
+        Args:
+            severity (int): The severity level of the log message.
+            log_origin_name (str): The name of the logger the message would be logged to.
+
+        Returns:
+            bool: True if the message would be emitted, False otherwise.
+        """
+        if not self._log_config.is_console_logging_enabled:
+            return False
+        if logging.getLogger(log_origin_name).isEnabledFor(severity):
+            return True
+        return self.log_mode == LogMode.POOR and logging.getLogger(self._log_config.generic_poor_logger).isEnabledFor(severity)
+
     def dispatch(
         self,
-        content: Union[str, Any],
+        content: Union[str, Any, Callable[[], Any]],
         severity: int,
         title: Optional[str] = None,
         inline: Optional[str] = None,
@@ -82,15 +130,24 @@ class LogDispatch:
     ):
         """
         Dispatches a log message to appropriate logging methods based on content type.
+        Nothing is evaluated nor formatted if the severity is disabled for the logger of the caller.
 
         Args:
-            content (Union[str, Any]): The content to be logged.
+            content (Union[str, Any, Callable[[], Any]]): The content to be logged.
+                A function or lambda is only called if the message is emitted, to get the actual content.
             severity (int): The severity level of the log message.
             title (Optional[str], optional): The title of the log message. Defaults to None.
             inline (Optional[str], optional): Inline title for the log message. Defaults to None.
                 Used to display the title inline, only if the title arg is None.
             include_exception (bool, optional): Whether to include exception traceback. Defaults to False.
         """
+        log_origin_name = self._get_log_origin_name()
+        if not self.is_enabled_for(severity=severity, log_origin_name=log_origin_name):
+            return
+
+        if inspect.isfunction(content) or inspect.ismethod(content):
+            content = content()
+
         caller_info_str: Optional[str] = None
         if (
             (self._log_config.is_caller_info_enabled)
@@ -117,6 +174,7 @@ class LogDispatch:
             self._log_message(
                 message=content,
                 severity=severity,
+                log_origin_name=log_origin_name,
                 caller_info_str=caller_info_str,
                 title=title,
                 inline=inline,
@@ -126,6 +184,7 @@ class LogDispatch:
             self._log_data(
                 data=content,
                 severity=severity,
+                log_origin_name=log_origin_name,
                 caller_info_str=caller_info_str,
                 title=title,
                 include_exception=include_exception,
@@ -135,6 +194,7 @@ class LogDispatch:
         self,
         message: str,
         severity: int,
+        log_origin_name: str,
         caller_info_str: Optional[str],
         title: Optional[str] = None,
         inline: Optional[str] = None,
@@ -146,6 +206,7 @@ class LogDispatch:
         Args:
             message (str): The message to be logged.
             severity (int): The severity level of the log message.
+            log_origin_name (str): The name of the logger to log to.
             caller_info_str (Optional[str]): Information about the caller.
             title (Optional[str], optional): The title of the log message. Defaults to None.
             inline (Optional[str], optional): Inline title for the log message. Defaults to None.
@@ -163,12 +224,13 @@ class LogDispatch:
 
         if include_exception:
             message += f"\n{traceback.format_exc()}"
-        self._log_to_console(message=message_for_console, severity=severity)
+        self._log_to_console(message=message_for_console, severity=severity, log_origin_name=log_origin_name)
 
     def _log_data(
         self,
         data: Any,
         severity: int,
+        log_origin_name: str,
         caller_info_str: Optional[str],
         title: Optional[str] = None,
         include_exception: bool = False,
@@ -179,6 +241,7 @@ class LogDispatch:
         Args:
             data (Any): The data to be logged.
             severity (int): The severity level of the log message.
+            log_origin_name (str): The name of the logger to log to.
             caller_info_str (Optional[str]): Information about the caller.
             title (Optional[str], optional): The title of the log message. Defaults to None.
             include_exception (bool, optional): Whether to include exception traceback. Defaults to False.
@@ -191,7 +254,7 @@ class LogDispatch:
                 message = f"{caller_info_str}: {message}"
             if include_exception:
                 message += f"\n{traceback.format_exc()}"
-            self._log_to_console(message=message, severity=severity)
+            self._log_to_console(message=message, severity=severity, log_origin_name=log_origin_name)
         elif isinstance(data, dict):
             dict_string: str
             _, dict_string = purify_json_dict(
@@ -206,7 +269,7 @@ class LogDispatch:
                 message = f"{caller_info_str}: {message}"
             if include_exception:
                 message += f"\n{traceback.format_exc()}"
-            self._log_to_console(message=message, severity=severity)
+            self._log_to_console(message=message, severity=severity, log_origin_name=log_origin_name)
         elif isinstance(data, list):
             list_data: List[Any] = data
             _, list_string = purify_json_list(
@@ -221,7 +284,7 @@ class LogDispatch:
                 message = f"{caller_info_str}: {message}"
             if include_exception:
                 message += f"\n{traceback.format_exc()}"
-            self._log_to_console(message=message, severity=severity)
+            self._log_to_console(message=message, severity=severity, log_origin_name=log_origin_name)
         else:
             _, dict_string = purify_json(
                 data=data,
@@ -236,15 +299,16 @@ class LogDispatch:
                 message = f"{caller_info_str}: {message}"
             if include_exception:
                 message += f"\n{traceback.format_exc()}"
-            self._log_to_console(message=message, severity=severity)
+            self._log_to_console(message=message, severity=severity, log_origin_name=log_origin_name)
 
-    def _log_to_console(self, message: str, severity: int):
+    def _log_to_console(self, message: str, severity: int, log_origin_name: str):
         """
         Logs a message to the console.
 
         Args:
             message (str): The message to be logged.
             severity (int): The severity level of the log message.
+            log_origin_name (str): The name of the logger to log to.
         """
         if not self._log_config.is_console_logging_enabled:
             return
@@ -256,38 +320,5 @@ class LogDispatch:
                 logger = logging.getLogger(self._log_config.generic_poor_logger)
                 logger.log(level=severity, msg=message, stacklevel=6)
 
-        stack = inspect.stack()
-        try:
-            logging_module_path = os.path.abspath(__file__)
-            log_origin_name = "unknown"
-
-            for frame_info in stack[1:]:
-                try:
-                    frame = frame_info.frame
-                    module = inspect.getmodule(frame)
-
-                    if module is None:
-                        continue
-
-                    if hasattr(module, "__file__") and module.__file__ is not None:
-                        module_file = os.path.abspath(module.__file__)
-                    else:
-                        continue
-
-                    if module_file == logging_module_path or module_file.endswith("/log.py"):
-                        continue
-                    else:
-                        if module.__name__ == "__main__":
-                            if self.project_name is None:
-                                raise RuntimeError("Project name is not set. You must call initialize Pipelex first.")
-                            log_origin_name = self.project_name
-                        else:
-                            log_origin_name = module.__name__.split(sep=".", maxsplit=1)[0]
-                        break
-                finally:
-                    del frame_info
-            logger = logging.getLogger(log_origin_name)
-            logger.log(level=severity, msg=message, stacklevel=5)
-        finally:
-            if stack:
-                del stack
+        logger = logging.getLogger(log_origin_name)
+        logger.log(level=severity, msg=message, stacklevel=5)
@@ -0,0 +1,99 @@
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Coroutine, Dict, Iterable, List, Optional, Set, Tuple, TypeVar, cast
+
+from pipelex import log
+
+T = TypeVar("T")
+
+# strong references to the closing tasks, so that they don't get garbage collected before they're done
+_closing_tasks: Set["asyncio.Task[Any]"] = set()
+
+
+async def iterate_as_completed_bounded(
+    awaitables: Iterable[Awaitable[T]],
+    max_concurrency: Optional[int] = None,
+) -> AsyncIterator[Tuple[int, T]]:
+    """
+    Run awaitables with at most max_concurrency of them in flight, yielding (index, result) as each one completes.
+
+    The awaitables iterable is consumed lazily: a new one is only pulled (and therefore created, when it's a generator)
+    once a slot frees up. This caps the number of simultaneous calls but also the memory held by pending work.
+    If any awaitable raises, the ones still in flight are cancelled and the exception is propagated.
+    If max_concurrency is None or 0, everything is admitted at once.
+    """
+    if max_concurrency is not None and max_concurrency < 0:
+        raise ValueError(f"max_concurrency must be positive or None, got {max_concurrency}")
+    iterator = iter(awaitables)
+    in_flight: Dict["asyncio.Future[T]", int] = {}
+    next_index = 0
+
+    def admit_next() -> bool:
+        nonlocal next_index
+        try:
+            awaitable = next(iterator)
+        except StopIteration:
+            return False
+        in_flight[asyncio.ensure_future(awaitable)] = next_index
+        next_index += 1
+        return True
+
+    try:
+        while not max_concurrency or len(in_flight) < max_concurrency:
+            if not admit_next():
+                break
+        while in_flight:
+            done, _ = await asyncio.wait(in_flight.keys(), return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                index = in_flight.pop(future)
+                result = future.result()
+                # admit the next one before yielding so that slow consumers don't starve the window
+                admit_next()
+                yield index, result
+    finally:
+        for future in in_flight:
+            future.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight.keys(), return_exceptions=True)
+
+
+async def gather_bounded(
+    awaitables: Iterable[Awaitable[T]],
+    max_concurrency: Optional[int] = None,
+) -> List[T]:
+    """
+    Bounded-concurrency equivalent of asyncio.gather: results are written into their ordered slots as they arrive.
+    """
+    results: List[Optional[T]] = []
+    async for index, result in iterate_as_completed_bounded(awaitables=awaitables, max_concurrency=max_concurrency):
+        if index >= len(results):
+            results.extend([None] * (index + 1 - len(results)))
+        results[index] = result
+    return cast(List[T], results)
+
+
+def close_on_event_loop(
+    make_close_coroutine: Callable[[], Coroutine[Any, Any, Any]],
+    event_loop: Optional[asyncio.AbstractEventLoop],
+    resource_desc: str,
+):
+    """
+    Close a resource bound to the event loop which opened it, such as a client and its connection pool,
+    whether we're called from that loop, from another thread, or from synchronous code once the loop is idle.
+    The close coroutine is only made when it can be run. If the loop is closed, the connections died with it.
+    """
+    if event_loop is None or event_loop.is_closed():
+        return
+    try:
+        running_loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if event_loop is running_loop:
+        closing_task = event_loop.create_task(make_close_coroutine())
+        _closing_tasks.add(closing_task)
+        closing_task.add_done_callback(_closing_tasks.discard)
+    elif event_loop.is_running():
+        asyncio.run_coroutine_threadsafe(make_close_coroutine(), event_loop)
+    elif running_loop is None:
+        event_loop.run_until_complete(make_close_coroutine())
+    else:
+        log.warning(f"Could not close the {resource_desc} of an idle event loop from another running loop")
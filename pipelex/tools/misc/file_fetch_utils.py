@@ -1,36 +1,18 @@
 from typing import Optional
 
-import httpx
-from httpx import Response
+from pipelex.tools.http.http_client_manager import get_http_client_manager
 
 
 async def fetch_file_from_url_httpx_async(
     url: str,
     timeout: Optional[int] = None,
 ) -> bytes:
-    async with httpx.AsyncClient() as client:
-        response: Response = await client.get(
-            url,
-            timeout=timeout,
-            follow_redirects=True,
-        )
-        response.raise_for_status()  # Raise exception for 4XX/5XX status codes
-
-        bytes_content: bytes = response.content
-        return bytes_content
+    # the shared client keeps its connections alive between downloads
+    return await get_http_client_manager().fetch_bytes_async(url=url, timeout=timeout)
 
 
 def fetch_file_from_url_httpx(
     url: str,
     timeout: Optional[int] = None,
 ) -> bytes:
-    with httpx.Client() as client:
-        response: Response = client.get(
-            url,
-            timeout=timeout,
-            follow_redirects=True,
-        )
-        response.raise_for_status()  # Raise exception for 4XX/5XX status codes
-
-        bytes_content: bytes = response.content
-        return bytes_content
+    return get_http_client_manager().fetch_bytes(url=url, timeout=timeout)
@@ -0,0 +1,12 @@
+from typing import Optional
+
+from pydantic import Field
+
+from pipelex.tools.config.models import ConfigModel
+
+
+class PdfRenderConfig(ConfigModel):
+    # rendering in worker processes requires the main module to be guarded by `if __name__ == "__main__":`
+    is_process_pool_enabled: bool = False
+    max_workers: Optional[int] = Field(default=None, ge=1)
+    nb_pages_per_batch: int = Field(default=4, ge=1)
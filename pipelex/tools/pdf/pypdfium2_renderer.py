@@ -1,18 +1,32 @@
 from __future__ import annotations
 
 import asyncio
+import io
+import multiprocessing
+import os
 import pathlib
-from typing import List
-
-import pypdfium2 as pdfium
-from PIL import Image
-from pypdfium2.raw import FPDFBitmap_BGRA
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any, AsyncIterator, Deque, List, Optional, cast
 
 from pipelex.tools.exceptions import ToolException
 from pipelex.tools.misc.file_fetch_utils import fetch_file_from_url_httpx_async
 from pipelex.tools.misc.path_utils import clarify_path_or_url
+from pipelex.tools.pdf.pdf_render_config import PdfRenderConfig
+
+if TYPE_CHECKING:
+    from PIL import Image
 
 PDFIUM2_REFERENCE_DPI = 72
+PDF_RENDER_DEFAULT_MAX_WORKERS = 4
+# in threads, PDFium calls are serialized, so only the next batch is rendered while the current one is consumed
+PDF_RENDER_NB_BATCHES_IN_FLIGHT_IN_THREADS = 2
+
+# PDFium is not thread-safe, so within a process, all the calls to PDFium hold this lock
+_pdfium_lock = threading.Lock()
 
 
 class PyPdfium2RendererError(ToolException):
@@ -22,56 +36,255 @@ class PyPdfium2RendererError(ToolException):
 PdfInput = str | pathlib.Path | bytes
 
 
+# ---- blocking helpers, run in worker threads or worker processes --------
+# pypdfium2 is imported on first use, it's not needed to import pipelex
+def _count_pdf_pages(pdf_input: PdfInput) -> int:
+    import pypdfium2 as pdfium
+
+    with _pdfium_lock:
+        pdf_doc = pdfium.PdfDocument(pdf_input)
+        try:
+            return len(pdf_doc)
+        finally:
+            pdf_doc.close()
+
+
+async def get_pdf_nb_pages(pdf_input: PdfInput) -> int:
+    """Count the pages of a document in a worker thread, without rendering anything."""
+    return await asyncio.to_thread(_count_pdf_pages, pdf_input)
+
+
+def _encode_image_to_png(image: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _decode_png_images(png_pages: List[bytes]) -> List[Image.Image]:
+    from PIL import Image
+
+    images: List[Image.Image] = []
+    for png_page in png_pages:
+        image = Image.open(io.BytesIO(png_page))
+        image.load()
+        images.append(image)
+    return images
+
+
+def _render_pdf_page_batch(pdf_input: PdfInput, scale: float, page_indexes: List[int], is_png: bool) -> List[Any]:
+    """Render pages of the document, as PIL images or encoded as PNG."""
+    import pypdfium2 as pdfium
+    from pypdfium2.raw import FPDFBitmap_BGRA
+
+    images: List[Image.Image] = []
+    with _pdfium_lock:
+        pdf_doc = pdfium.PdfDocument(pdf_input)
+        try:
+            for page_index in page_indexes:
+                page = pdf_doc[page_index]
+                pil_img: Image.Image = page.render(  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+                    scale=scale,  # pyright: ignore[reportArgumentType]
+                    force_bitmap_format=FPDFBitmap_BGRA,  # always 4-channel
+                    rev_byteorder=True,  # so we get RGBA
+                ).to_pil()
+                images.append(pil_img)  # pyright: ignore[reportUnknownArgumentType]
+                page.close()
+        finally:
+            pdf_doc.close()
+    if is_png:
+        return [_encode_image_to_png(image=image) for image in images]
+    return images
+
+
+def _write_tmp_pdf_file(pdf_bytes: bytes) -> str:
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_pdf_file:
+        tmp_pdf_file.write(pdf_bytes)
+        return tmp_pdf_file.name
+
+
 class PyPdfium2Renderer:
     """
-    Thread-safe PDF page renderer built on pypdfium2.
+    PDF page renderer built on pypdfium2.
+
+    • PDFium is not thread-safe, so by default pages are rendered in worker
+      threads behind a process-wide lock, keeping the event loop responsive.
 
-    • All entry into the native PDFium library is protected by a single
-      asyncio.Lock, so the enclosing *process* is safe even if other
-      libraries spin up worker threads.
+    • With `is_process_pool_enabled`, batches of pages are rendered
+      concurrently in a pool of worker processes, each with its own PDFium,
+      and encoded as PNG there. The workers are spawned, so the main module
+      of the program must be guarded by `if __name__ == "__main__":`.
+      Documents given as bytes, such as downloaded ones, are written once
+      to a temporary file that the workers open.
 
-    • Heavy work runs inside `asyncio.to_thread`, keeping the event-loop
-      responsive for the rest of your application.
+    • Pages are yielded in order as their batch completes. The number of
+      batches in flight is bounded, so memory doesn't grow with the size
+      of the document.
     """
 
-    _pdfium_lock: asyncio.Lock = asyncio.Lock()  # shared per process
+    def __init__(self, pdf_render_config: Optional[PdfRenderConfig] = None):
+        self.pdf_render_config = pdf_render_config or PdfRenderConfig()
+        self._executor: Optional[ProcessPoolExecutor] = None
 
-    # ---- internal blocking helper ------------------------------------
-    @staticmethod
-    def _render_pdf_pages_sync(pdf_input: PdfInput, scale: float) -> List[Image.Image]:
-        pdf_doc = pdfium.PdfDocument(pdf_input)
-        images: List[Image.Image] = []
-        for index in range(len(pdf_doc)):
-            # page = doc.get_page(index)
-            page = pdf_doc[index]
-
-            pil_img: Image.Image = page.render(  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
-                scale=scale,  # pyright: ignore[reportArgumentType]
-                force_bitmap_format=FPDFBitmap_BGRA,  # always 4-channel
-                rev_byteorder=True,  # so we get RGBA
-            ).to_pil()
-
-            images.append(pil_img)  # pyright: ignore[reportUnknownArgumentType]
-            page.close()
-        pdf_doc.close()
-        return images
+    def configure(self, pdf_render_config: PdfRenderConfig):
+        self.teardown()
+        self.pdf_render_config = pdf_render_config
+
+    @property
+    def max_workers(self) -> int:
+        return self.pdf_render_config.max_workers or min(PDF_RENDER_DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawned rather than forked, so the workers don't inherit the locks held by the threads of this process
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    def _release_executor(self, executor: ProcessPoolExecutor):
+        # a broken pool can't be used anymore, the next render gets a new one
+        if self._executor is executor:
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def teardown(self):
+        if self._executor is not None:
+            self._release_executor(executor=self._executor)
 
     # ---- public async façade -----------------------------------------
-    async def render_pdf_pages(self, pdf_input: PdfInput, dpi: int) -> List[Image.Image]:
+    async def get_nb_pages(self, pdf_input: PdfInput) -> int:
+        return await get_pdf_nb_pages(pdf_input=pdf_input)
+
+    async def _iterate_page_batches(
+        self,
+        pdf_input: PdfInput,
+        dpi: int,
+        first_page: int,
+        last_page: Optional[int],
+        is_png: bool,
+    ) -> AsyncIterator[List[Any]]:
+        if first_page < 1:
+            raise PyPdfium2RendererError(f"Invalid first page {first_page}, pages are numbered from 1")
+        nb_pages = await self.get_nb_pages(pdf_input=pdf_input)
+        if last_page is None or last_page > nb_pages:
+            last_page = nb_pages
+        page_indexes = list(range(first_page - 1, last_page))
+        nb_pages_per_batch = self.pdf_render_config.nb_pages_per_batch
+        batches = [page_indexes[start : start + nb_pages_per_batch] for start in range(0, len(page_indexes), nb_pages_per_batch)]
+
         scale = dpi / PDFIUM2_REFERENCE_DPI
-        """Render *one* page and return PNG bytes."""
-        async with self._pdfium_lock:
-            return await asyncio.to_thread(self._render_pdf_pages_sync, pdf_input, scale)
+        loop = asyncio.get_running_loop()
+        executor: Optional[ProcessPoolExecutor] = None
+        max_nb_batches_in_flight = PDF_RENDER_NB_BATCHES_IN_FLIGHT_IN_THREADS
+        tmp_pdf_path: Optional[str] = None
+        if self.pdf_render_config.is_process_pool_enabled:
+            executor = self._get_executor()
+            max_nb_batches_in_flight = self.max_workers * 2
+            if isinstance(pdf_input, bytes):
+                # the workers open the document from a file, rather than getting its bytes with each batch
+                tmp_pdf_path = await asyncio.to_thread(_write_tmp_pdf_file, pdf_input)
+                pdf_input = tmp_pdf_path
+        # the worker processes send PNG rather than raw bitmaps, which are much bigger
+        is_rendered_as_png = is_png or executor is not None
+
+        pending_batches: Deque[asyncio.Future[List[Any]]] = deque()
+        next_batch_index = 0
+        try:
+            while next_batch_index < len(batches) or pending_batches:
+                # a broken pool raises as soon as a batch is submitted, or when a batch was running in a worker which died
+                try:
+                    while next_batch_index < len(batches) and len(pending_batches) < max_nb_batches_in_flight:
+                        batch = batches[next_batch_index]
+                        pending_batches.append(loop.run_in_executor(executor, _render_pdf_page_batch, pdf_input, scale, batch, is_rendered_as_png))
+                        next_batch_index += 1
+                    rendered_pages = await pending_batches.popleft()
+                except BrokenProcessPool as exc:
+                    if executor is not None:
+                        self._release_executor(executor=executor)
+                    raise PyPdfium2RendererError(
+                        "The PDF rendering worker processes stopped unexpectedly. With the process pool enabled, "
+                        'the main module of your program must be guarded by `if __name__ == "__main__":`'
+                    ) from exc
+                if is_rendered_as_png and not is_png:
+                    rendered_pages = await asyncio.to_thread(_decode_png_images, rendered_pages)
+                yield rendered_pages
+        finally:
+            for pending_batch in pending_batches:
+                pending_batch.cancel()
+            if tmp_pdf_path:
+                await asyncio.to_thread(os.remove, tmp_pdf_path)
+
+    async def iterate_pdf_pages(
+        self,
+        pdf_input: PdfInput,
+        dpi: int,
+        first_page: int = 1,
+        last_page: Optional[int] = None,
+    ) -> AsyncIterator[Image.Image]:
+        """Render the pages from first_page to last_page, numbered from 1 and included, and yield them in order."""
+        async for images in self._iterate_page_batches(pdf_input=pdf_input, dpi=dpi, first_page=first_page, last_page=last_page, is_png=False):
+            for image in cast(List["Image.Image"], images):
+                yield image
+
+    async def iterate_pdf_pages_as_png(
+        self,
+        pdf_input: PdfInput,
+        dpi: int,
+        first_page: int = 1,
+        last_page: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """Same as iterate_pdf_pages, with the pages encoded as PNG by the workers which render them."""
+        async for png_pages in self._iterate_page_batches(pdf_input=pdf_input, dpi=dpi, first_page=first_page, last_page=last_page, is_png=True):
+            for png_page in cast(List[bytes], png_pages):
+                yield png_page
 
-    async def render_pdf_pages_from_uri(self, pdf_uri: str, dpi: int) -> List[Image.Image]:
+    async def render_pdf_pages(
+        self,
+        pdf_input: PdfInput,
+        dpi: int,
+        first_page: int = 1,
+        last_page: Optional[int] = None,
+    ) -> List[Image.Image]:
+        return [image async for image in self.iterate_pdf_pages(pdf_input=pdf_input, dpi=dpi, first_page=first_page, last_page=last_page)]
+
+    async def _get_pdf_input_from_uri(self, pdf_uri: str) -> PdfInput:
         pdf_path, pdf_url = clarify_path_or_url(path_or_uri=pdf_uri)  # pyright: ignore
         if pdf_url:
-            pdf_bytes = await fetch_file_from_url_httpx_async(url=pdf_url)
-            return await self.render_pdf_pages(pdf_input=pdf_bytes, dpi=dpi)
+            return await fetch_file_from_url_httpx_async(url=pdf_url)
         elif pdf_path:
-            return await self.render_pdf_pages(pdf_input=pdf_path, dpi=dpi)
+            return pdf_path
         else:
             raise PyPdfium2RendererError(f"Invalid PDF URI: {pdf_uri}")
 
+    async def iterate_pdf_pages_from_uri(
+        self,
+        pdf_uri: str,
+        dpi: int,
+        first_page: int = 1,
+        last_page: Optional[int] = None,
+    ) -> AsyncIterator[Image.Image]:
+        pdf_input = await self._get_pdf_input_from_uri(pdf_uri=pdf_uri)
+        async for image in self.iterate_pdf_pages(pdf_input=pdf_input, dpi=dpi, first_page=first_page, last_page=last_page):
+            yield image
+
+    async def iterate_pdf_pages_as_png_from_uri(
+        self,
+        pdf_uri: str,
+        dpi: int,
+        first_page: int = 1,
+        last_page: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        pdf_input = await self._get_pdf_input_from_uri(pdf_uri=pdf_uri)
+        async for png_page in self.iterate_pdf_pages_as_png(pdf_input=pdf_input, dpi=dpi, first_page=first_page, last_page=last_page):
+            yield png_page
+
+    async def render_pdf_pages_from_uri(
+        self,
+        pdf_uri: str,
+        dpi: int,
+        first_page: int = 1,
+        last_page: Optional[int] = None,
+    ) -> List[Image.Image]:
+        pdf_input = await self._get_pdf_input_from_uri(pdf_uri=pdf_uri)
+        return await self.render_pdf_pages(pdf_input=pdf_input, dpi=dpi, first_page=first_page, last_page=last_page)
+
 
 pypdfium2_renderer = PyPdfium2Renderer()
@@ -0,0 +1,37 @@
+import hashlib
+import os
+
+from typing_extensions import override
+
+from pipelex.tools.misc.file_utils import ensure_directory_exists
+from pipelex.tools.misc.filetype_utils import FileTypeException, detect_file_type_from_bytes
+from pipelex.tools.storage.storage_provider_abstract import StorageProviderAbstract
+
+
+class LocalStorageProvider(StorageProviderAbstract):
+    """Stores data as files in a local directory, named after the hash of their content.
+
+    The uris are file paths, so the stored files can be used wherever a file path is expected, e.g. as prompt images.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    @override
+    def load(self, uri: str) -> bytes:
+        with open(uri, "rb") as file:
+            return file.read()
+
+    @override
+    def store(self, data: bytes) -> str:
+        ensure_directory_exists(self.directory)
+        file_name = hashlib.sha256(data).hexdigest()
+        try:
+            file_name += f".{detect_file_type_from_bytes(buf=data).extension}"
+        except FileTypeException:
+            pass
+        file_path = os.path.join(self.directory, file_name)
+        if not os.path.isfile(file_path):
+            with open(file_path, "wb") as file:
+                file.write(data)
+        return file_path
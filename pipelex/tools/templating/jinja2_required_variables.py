@@ -1,13 +1,9 @@
 from typing import Optional, Set
 
-from jinja2 import meta
-from jinja2.exceptions import (
-    TemplateSyntaxError,
-    UndefinedError,
-)
-
-from pipelex.tools.templating.jinja2_environment import make_jinja2_env_from_template_provider
-from pipelex.tools.templating.jinja2_errors import Jinja2DetectVariablesError, Jinja2StuffError, make_jinja2_error_explanation
+from jinja2.exceptions import TemplateSyntaxError
+
+from pipelex.tools.templating.jinja2_errors import Jinja2DetectVariablesError, make_jinja2_error_explanation
+from pipelex.tools.templating.jinja2_template_cache import get_jinja2_template_cache
 from pipelex.tools.templating.jinja2_template_category import Jinja2TemplateCategory
 from pipelex.tools.templating.template_provider_abstract import TemplateProviderAbstract
 
@@ -33,30 +29,16 @@ def detect_jinja2_required_variables(
     Raises:
         Jinja2StuffError: If neither jinja2 nor jinja2_name is provided
     """
-    jinja2_env, loader = make_jinja2_env_from_template_provider(
-        template_category=template_category,
-        template_provider=template_provider,
-    )
-
-    template_source: str
-    if jinja2:
-        template_source = jinja2
-    elif jinja2_name:
-        template_source = loader.get_source(jinja2_env, jinja2_name)[0]
-    else:
-        raise Jinja2StuffError("No jinja2 or jinja2_name provided")
-
     try:
-        parsed_ast = jinja2_env.parse(template_source)
-        undeclared_variables = meta.find_undeclared_variables(parsed_ast)
-    except Jinja2StuffError as stuff_error:
-        explanation = make_jinja2_error_explanation(jinja2_name=jinja2_name, template_text=template_source)
-        raise Jinja2DetectVariablesError(f"Jinja2 detect variables — stuff error: '{stuff_error}' {explanation}") from stuff_error
+        compiled_template = get_jinja2_template_cache().get_compiled_template(
+            template_category=template_category,
+            template_provider=template_provider,
+            jinja2_name=jinja2_name,
+            jinja2=jinja2,
+        )
     except TemplateSyntaxError as syntax_error:
+        template_source = jinja2 or (template_provider.get_template(template_name=jinja2_name) if jinja2_name else None)
         explanation = make_jinja2_error_explanation(jinja2_name=jinja2_name, template_text=template_source)
         raise Jinja2DetectVariablesError(f"Jinja2 detect variables — syntax error: '{syntax_error}' {explanation}") from syntax_error
-    except UndefinedError as undef_error:
-        explanation = make_jinja2_error_explanation(jinja2_name=jinja2_name, template_text=template_source)
-        raise Jinja2DetectVariablesError(f"Jinja2 detect variables — undefined error: '{undef_error}' {explanation}") from undef_error
 
-    return undeclared_variables
+    return set(compiled_template.undeclared_variables)
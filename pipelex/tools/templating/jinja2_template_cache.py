@@ -0,0 +1,100 @@
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Optional, Tuple
+
+from jinja2 import Environment, Template, meta
+from pydantic import BaseModel, ConfigDict
+
+from pipelex.tools.templating.jinja2_environment import make_jinja2_env_from_template_provider
+from pipelex.tools.templating.jinja2_errors import Jinja2StuffError
+from pipelex.tools.templating.jinja2_template_category import Jinja2TemplateCategory
+from pipelex.tools.templating.template_provider_abstract import TemplateProviderAbstract
+
+JINJA2_TEMPLATE_CACHE_MAX_TEMPLATES = 1024
+
+
+class Jinja2CompiledTemplate(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+    template: Template
+    template_source: str
+    undeclared_variables: FrozenSet[str]
+
+
+class Jinja2TemplateCache:
+    """Long-lived jinja2 environments and compiled templates.
+
+    There is one environment per template category and template provider. Compiled templates are keyed
+    by their source rather than by their name, so that a template which changes in the provider gets recompiled.
+    """
+
+    def __init__(self, max_templates: int = JINJA2_TEMPLATE_CACHE_MAX_TEMPLATES):
+        self.max_templates = max_templates
+        # the provider is kept alongside its environment so that its id can't be reused while it's cached
+        self._environments: Dict[Tuple[Jinja2TemplateCategory, int], Tuple[TemplateProviderAbstract, Environment]] = {}
+        self._templates: OrderedDict[Tuple[Jinja2TemplateCategory, int, str], Jinja2CompiledTemplate] = OrderedDict()
+
+    def get_environment(
+        self,
+        template_category: Jinja2TemplateCategory,
+        template_provider: TemplateProviderAbstract,
+    ) -> Environment:
+        environment_key = (template_category, id(template_provider))
+        if cached := self._environments.get(environment_key):
+            return cached[1]
+        jinja2_env, _ = make_jinja2_env_from_template_provider(
+            template_category=template_category,
+            template_provider=template_provider,
+        )
+        self._environments[environment_key] = (template_provider, jinja2_env)
+        return jinja2_env
+
+    def get_compiled_template(
+        self,
+        template_category: Jinja2TemplateCategory,
+        template_provider: TemplateProviderAbstract,
+        jinja2_name: Optional[str] = None,
+        jinja2: Optional[str] = None,
+    ) -> Jinja2CompiledTemplate:
+        template_source: str
+        if jinja2:
+            template_source = jinja2
+        elif jinja2_name:
+            template_source = template_provider.get_template(template_name=jinja2_name)
+        else:
+            raise Jinja2StuffError("No jinja2 or jinja2_name provided")
+
+        # str hashes are cached by python, so the source itself is a cheap key for a given template
+        template_key = (template_category, id(template_provider), template_source)
+        if compiled_template := self._templates.get(template_key):
+            self._templates.move_to_end(template_key)
+            return compiled_template
+
+        jinja2_env = self.get_environment(template_category=template_category, template_provider=template_provider)
+        parsed_ast = jinja2_env.parse(template_source, name=jinja2_name)
+        undeclared_variables = frozenset(meta.find_undeclared_variables(parsed_ast))
+        template = jinja2_env.template_class.from_code(
+            jinja2_env,
+            jinja2_env.compile(parsed_ast, name=jinja2_name),
+            jinja2_env.make_globals(None),
+            None,
+        )
+        compiled_template = Jinja2CompiledTemplate(
+            template=template,
+            template_source=template_source,
+            undeclared_variables=undeclared_variables,
+        )
+        self._templates[template_key] = compiled_template
+        while len(self._templates) > self.max_templates:
+            self._templates.popitem(last=False)
+        return compiled_template
+
+    def clear(self):
+        self._environments.clear()
+        self._templates.clear()
+
+
+_jinja2_template_cache = Jinja2TemplateCache()
+
+
+def get_jinja2_template_cache() -> Jinja2TemplateCache:
+    return _jinja2_template_cache
@@ -16,4 +16,9 @@ class Jinja2TemplateLoader(BaseLoader):
     def get_source(self, environment: Environment, template: str) -> Tuple[str, Optional[str], Optional[Callable[[], bool]]]:
         the_template = self.template_provider.get_template(template_name=template)
         log.debug(f"TemplateLoader.get_source: template='{template}'")
-        return the_template, None, None
+
+        def is_up_to_date() -> bool:
+            # environments are long-lived: templates included by name get reloaded if they changed in the provider
+            return self.template_provider.get_template(template_name=template) == the_template
+
+        return the_template, None, is_up_to_date
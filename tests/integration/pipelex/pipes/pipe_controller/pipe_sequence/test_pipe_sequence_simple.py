@@ -1,13 +1,16 @@
 """Simple integration test for PipeSequence controller."""
 
-from typing import cast
+import asyncio
+from typing import Any, List, cast
 
 import pytest
 from pytest import FixtureRequest
+from pytest_mock import MockerFixture
 
 from pipelex import pretty_print
 from pipelex.core.pipe_input_spec import PipeInputSpec
-from pipelex.core.pipe_run_params import PipeRunMode
+from pipelex.core.pipe_output import PipeOutput
+from pipelex.core.pipe_run_params import BatchParams, PipeRunMode
 from pipelex.core.pipe_run_params_factory import PipeRunParamsFactory
 from pipelex.core.stuff_content import TextContent
 from pipelex.core.stuff_factory import StuffFactory
@@ -125,3 +128,105 @@ class TestPipeSequenceSimple:
         assert "capitalized_text" in final_working_memory.root
         assert "final_text" in final_working_memory.root
         assert final_working_memory.aliases["main_stuff"] == "final_text"
+
+    async def test_dag_sequence_processing(self, request: FixtureRequest, pipe_run_mode: PipeRunMode):
+        """Test PipeSequence in DAG mode, with an independent step running alongside the others."""
+        pipe_sequence = PipeSequence(
+            domain="test_integration",
+            code="dag_sequence",
+            inputs=PipeInputSpec(root={"input_text": "Text"}),
+            output_concept_code="Text",
+            sequential_sub_pipes=[
+                SubPipe(pipe_code="capitalize_text", output_name="capitalized_text"),
+                SubPipe(pipe_code="capitalize_text", output_name="shouted_text"),
+                SubPipe(pipe_code="add_prefix", output_name="final_text"),
+            ],
+            dag_mode=True,
+        )
+        # the 2nd step only needs the input, the 3rd one needs the result of the 1st one
+        assert pipe_sequence.make_step_dependencies() == [set(), set(), {0}]
+
+        input_text_stuff = StuffFactory.make_stuff(
+            concept_str="Text",
+            content=TextContent(text="hello world"),
+            name="input_text",
+        )
+        working_memory = WorkingMemoryFactory.make_from_single_stuff(input_text_stuff)
+
+        pipe_output = await pipe_sequence.run_pipe(
+            job_metadata=JobMetadata(job_name=cast(str, request.node.originalname)),  # type: ignore
+            working_memory=working_memory,
+            output_name="sequence_result",
+            pipe_run_params=PipeRunParamsFactory.make_run_params(pipe_run_mode=pipe_run_mode),
+        )
+
+        # same final working memory as when running the steps one after the other
+        final_working_memory = pipe_output.working_memory
+        assert list(final_working_memory.root.keys()) == ["input_text", "capitalized_text", "shouted_text", "final_text"]
+        assert final_working_memory.aliases["main_stuff"] == "final_text"
+        final_result = pipe_output.main_stuff
+        assert isinstance(final_result.content, TextContent)
+        if pipe_run_mode != PipeRunMode.DRY:
+            assert final_result.content.text == "PROCESSED: HELLO WORLD"
+        else:
+            assert "DRY RUN" in final_result.content.text
+
+    async def test_dag_dependencies_on_main_stuff(self):
+        """A step reading the main stuff waits for all the previous steps, which all move it."""
+        pipe_sequence = PipeSequence(
+            domain="test_integration",
+            code="dag_sequence_over_main_stuff",
+            inputs=PipeInputSpec(root={"input_text": "Text"}),
+            output_concept_code="Text",
+            sequential_sub_pipes=[
+                SubPipe(pipe_code="capitalize_text", output_name="capitalized_text"),
+                SubPipe(pipe_code="capitalize_text", output_name="shouted_text"),
+                # batch_over = true batches over the main stuff
+                SubPipe(
+                    pipe_code="capitalize_text",
+                    output_name="capitalized_texts",
+                    batch_params=BatchParams.make_optional_batch_params(input_list_name=True, input_item_name="input_text"),
+                ),
+                SubPipe(pipe_code="capitalize_text", output_name="final_text"),
+            ],
+            dag_mode=True,
+        )
+        # the last step moves the main stuff, so it must wait for the step reading it
+        assert pipe_sequence.make_step_dependencies() == [set(), set(), {0, 1}, {2}]
+
+    async def test_dag_failure_cancels_and_awaits_running_steps(self, mocker: MockerFixture):
+        """When steps fail, the running steps are cancelled and awaited before the first error is raised."""
+        pipe_sequence = PipeSequence(
+            domain="test_integration",
+            code="dag_sequence_failing",
+            inputs=PipeInputSpec(root={"input_text": "Text"}),
+            output_concept_code="Text",
+            sequential_sub_pipes=[
+                SubPipe(pipe_code="capitalize_text", output_name="failing_text"),
+                SubPipe(pipe_code="capitalize_text", output_name="other_failing_text"),
+                SubPipe(pipe_code="capitalize_text", output_name="slow_text"),
+            ],
+            dag_mode=True,
+        )
+        cancelled_steps: List[str] = []
+
+        async def run_pipe(self: SubPipe, **kwargs: Any) -> PipeOutput:
+            if self.output_name == "slow_text":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled_steps.append("slow_text")
+                    raise
+            raise RuntimeError(f"Step {self.output_name} failed")
+
+        mocker.patch.object(SubPipe, "run_pipe", autospec=True, side_effect=run_pipe)
+        input_text_stuff = StuffFactory.make_stuff(concept_str="Text", content=TextContent(text="hello world"), name="input_text")
+
+        with pytest.raises(RuntimeError, match="failed"):
+            await pipe_sequence.run_pipe(
+                job_metadata=JobMetadata(job_name="dag_failure"),
+                working_memory=WorkingMemoryFactory.make_from_single_stuff(input_text_stuff),
+                pipe_run_params=PipeRunParamsFactory.make_run_params(),
+            )
+        # the slow step is done by the time the error is raised, it doesn't outlive the pipe
+        assert cancelled_steps == ["slow_text"]
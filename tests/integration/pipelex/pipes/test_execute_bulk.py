@@ -0,0 +1,73 @@
+from typing import AsyncIterator, List
+
+import pytest
+
+from pipelex.core.pipe_run_params import PipeRunMode
+from pipelex.core.stuff_content import TextContent
+from pipelex.core.stuff_factory import StuffFactory
+from pipelex.core.working_memory import WorkingMemory
+from pipelex.core.working_memory_factory import WorkingMemoryFactory
+from pipelex.pipeline.execute_bulk import PipelineBulkReport, PipelineBulkResult, execute_pipelines_bulk
+
+INPUT_TEXTS = ["hello world", "good morning", "bonjour", "hola", "guten tag"]
+
+
+def make_input_memory(text: str) -> WorkingMemory:
+    input_text_stuff = StuffFactory.make_stuff(
+        concept_str="Text",
+        content=TextContent(text=text),
+        name="input_text",
+    )
+    return WorkingMemoryFactory.make_from_single_stuff(input_text_stuff)
+
+
+@pytest.mark.dry_runnable
+@pytest.mark.inference
+@pytest.mark.asyncio(loop_scope="class")
+class TestExecuteBulk:
+    async def test_execute_pipelines_bulk(self, pipe_run_mode: PipeRunMode):
+        async def iterate_input_memories() -> AsyncIterator[WorkingMemory]:
+            for text in INPUT_TEXTS:
+                yield make_input_memory(text=text)
+
+        bulk_report = PipelineBulkReport()
+        bulk_results: List[PipelineBulkResult] = []
+        async for bulk_result in execute_pipelines_bulk(
+            pipe_code="capitalize_text",
+            inputs=iterate_input_memories(),
+            max_concurrency=2,
+            pipe_run_mode=pipe_run_mode,
+            bulk_report=bulk_report,
+            is_report_generated=False,
+        ):
+            bulk_results.append(bulk_result)
+
+        assert sorted(bulk_result.input_index for bulk_result in bulk_results) == list(range(len(INPUT_TEXTS)))
+        # all the runs share a single pipeline
+        assert {bulk_result.pipeline_run_id for bulk_result in bulk_results} == {bulk_report.pipeline_run_id}
+        for bulk_result in bulk_results:
+            assert bulk_result.is_success
+            assert bulk_result.pipe_output is not None
+            assert isinstance(bulk_result.pipe_output.main_stuff.content, TextContent)
+        assert bulk_report.nb_succeeded == len(INPUT_TEXTS)
+        assert bulk_report.nb_failed == 0
+        assert bulk_report.p95_duration is not None
+
+    async def test_execute_pipelines_bulk_reports_failures(self, pipe_run_mode: PipeRunMode):
+        # the 2nd input lacks the stuff the pipe needs: its run fails without stopping the others
+        input_memories = [make_input_memory(text="hello world"), WorkingMemoryFactory.make_empty(), make_input_memory(text="bonjour")]
+        bulk_report = PipelineBulkReport()
+        bulk_results = [
+            bulk_result
+            async for bulk_result in execute_pipelines_bulk(
+                pipe_code="capitalize_text",
+                inputs=input_memories,
+                pipe_run_mode=pipe_run_mode,
+                bulk_report=bulk_report,
+                is_report_generated=False,
+            )
+        ]
+        failed_indexes = [bulk_result.input_index for bulk_result in bulk_results if not bulk_result.is_success]
+        assert failed_indexes == [1]
+        assert bulk_report.nb_succeeded == 2
+        assert bulk_report.nb_failed == 1
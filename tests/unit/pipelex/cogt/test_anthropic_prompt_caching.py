@@ -0,0 +1,86 @@
+import pytest
+from anthropic.types import Usage
+from pytest_mock import MockerFixture
+
+from pipelex.cogt.inference.cost_registry import CostRegistry
+from pipelex.cogt.llm.llm_job_components import LLMJobParams
+from pipelex.cogt.llm.llm_job_factory import LLMJobFactory
+from pipelex.cogt.llm.llm_models.llm_engine import LLMEngine
+from pipelex.cogt.llm.llm_models.llm_family import LLMFamily
+from pipelex.cogt.llm.llm_models.llm_model import LLMModel
+from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
+from pipelex.cogt.llm.llm_report import LLMTokensUsage
+from pipelex.cogt.llm.token_category import TokenCategory
+from pipelex.hub import get_plugin_manager
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.plugins.anthropic.anthropic_factory import AnthropicFactory
+
+LONG_SYSTEM_TEXT = "You are an expert in contracts. " * 200
+
+
+def make_claude_engine() -> LLMEngine:
+    llm_model = LLMModel(
+        default_platform=LLMPlatform.ANTHROPIC,
+        llm_family=LLMFamily.CLAUDE_3_7,
+        llm_name="claude-3-7-sonnet",
+        version="latest",
+        is_gen_object_supported=True,
+        cost_per_million_tokens_usd={
+            TokenCategory.INPUT: 3.0,
+            TokenCategory.INPUT_CACHED: 0.3,
+            TokenCategory.INPUT_CACHE_WRITE: 3.75,
+            TokenCategory.OUTPUT: 15.0,
+        },
+        platform_llm_id={LLMPlatform.ANTHROPIC: "claude-3-7-sonnet-20250219"},
+    )
+    return LLMEngine(llm_platform=LLMPlatform.ANTHROPIC, llm_model=llm_model)
+
+
+class TestAnthropicPromptCaching:
+    def test_nb_tokens_by_category_with_cache(self) -> None:
+        usage = Usage(input_tokens=100, output_tokens=20, cache_read_input_tokens=3000, cache_creation_input_tokens=500)
+        nb_tokens_by_category = AnthropicFactory.make_nb_tokens_by_category(usage=usage)
+        assert nb_tokens_by_category == {
+            TokenCategory.INPUT: 3600,
+            TokenCategory.OUTPUT: 20,
+            TokenCategory.INPUT_CACHED: 3000,
+            TokenCategory.INPUT_CACHE_WRITE: 500,
+        }
+
+    def test_cost_report_prices_cache_reads_and_writes(self) -> None:
+        llm_tokens_usage = LLMTokensUsage(
+            job_metadata=JobMetadata(),
+            llm_engine=make_claude_engine(),
+            nb_tokens_by_category={
+                TokenCategory.INPUT: 3600,
+                TokenCategory.OUTPUT: 20,
+                TokenCategory.INPUT_CACHED: 3000,
+                TokenCategory.INPUT_CACHE_WRITE: 500,
+            },
+        )
+        cost_report = CostRegistry.complete_cost_report(llm_tokens_usage=llm_tokens_usage)
+        assert cost_report.nb_tokens_by_category[TokenCategory.INPUT_NON_CACHED] == 100
+        costs = cost_report.costs_by_token_category
+        assert costs[TokenCategory.INPUT_NON_CACHED] == pytest.approx(100 * 3.0 / 1e6)
+        assert costs[TokenCategory.INPUT_CACHED] == pytest.approx(3000 * 0.3 / 1e6)
+        assert costs[TokenCategory.INPUT_CACHE_WRITE] == pytest.approx(500 * 3.75 / 1e6)
+        assert costs[TokenCategory.INPUT_JOINED] == pytest.approx((100 * 3.0 + 3000 * 0.3 + 500 * 3.75) / 1e6)
+
+    @pytest.mark.asyncio
+    async def test_cache_breakpoints_are_opt_in(self, mocker: MockerFixture) -> None:
+        llm_job = LLMJobFactory.make_llm_job_from_prompt_contents(
+            llm_job_params=LLMJobParams(temperature=0.5, max_tokens=None, seed=None),
+            system_text=LONG_SYSTEM_TEXT,
+            user_text="Summarize the termination clause.",
+        )
+        system_text_blocks = AnthropicFactory.make_system_text_blocks(llm_job=llm_job)
+        assert system_text_blocks is not None
+        assert "cache_control" not in system_text_blocks[0]
+
+        mocker.patch.object(get_plugin_manager().plugin_configs.anthropic_config, "is_prompt_caching_enabled", True)
+        system_text_blocks = AnthropicFactory.make_system_text_blocks(llm_job=llm_job)
+        assert system_text_blocks is not None
+        assert system_text_blocks[0].get("cache_control") == {"type": "ephemeral"}
+        # the user prompt is too short to be worth a breakpoint
+        user_message = await AnthropicFactory.make_user_message(llm_job=llm_job)
+        assert all("cache_control" not in block for block in user_message["content"])  # type: ignore
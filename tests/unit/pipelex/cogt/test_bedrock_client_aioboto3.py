@@ -0,0 +1,87 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.cogt.llm.token_category import TokenCategory
+from pipelex.plugins.bedrock.bedrock_client_aioboto3 import BedrockClientAioboto3
+
+USER_MESSAGES: List[Dict[str, Any]] = [{"role": "user", "content": [{"text": "Hello"}]}]
+
+
+class FakeBedrockRuntimeClient:
+    def __init__(self) -> None:
+        self.nb_enters = 0
+        self.nb_exits = 0
+
+    async def __aenter__(self) -> "FakeBedrockRuntimeClient":
+        self.nb_enters += 1
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.nb_exits += 1
+
+    async def converse(self, **params: Any) -> Dict[str, Any]:
+        return {
+            "output": {"message": {"content": [{"text": "Hi there"}]}},
+            "usage": {"inputTokens": 12, "outputTokens": 3},
+        }
+
+    async def converse_stream(self, **params: Any) -> Dict[str, Any]:
+        async def stream() -> AsyncIterator[Dict[str, Any]]:
+            yield {"messageStart": {"role": "assistant"}}
+            yield {"contentBlockDelta": {"delta": {"text": "Hi "}, "contentBlockIndex": 0}}
+            yield {"contentBlockDelta": {"delta": {"text": "there"}, "contentBlockIndex": 0}}
+            yield {"messageStop": {"stopReason": "end_turn"}}
+            yield {"metadata": {"usage": {"inputTokens": 12, "outputTokens": 3}}}
+
+        return {"stream": stream()}
+
+
+def make_bedrock_client(mocker: MockerFixture, is_converse_stream_enabled: bool = False) -> Tuple[BedrockClientAioboto3, FakeBedrockRuntimeClient]:
+    bedrock_client = BedrockClientAioboto3(
+        aws_region="us-east-1",
+        max_pool_connections=4,
+        connect_timeout=5,
+        read_timeout=30,
+        is_converse_stream_enabled=is_converse_stream_enabled,
+    )
+    fake_runtime_client = FakeBedrockRuntimeClient()
+    mocker.patch.object(bedrock_client.session, "client", return_value=fake_runtime_client)
+    return bedrock_client, fake_runtime_client
+
+
+class TestBedrockClientAioboto3:
+    @pytest.mark.asyncio
+    async def test_client_is_opened_once_and_closed_on_teardown(self, mocker: MockerFixture) -> None:
+        bedrock_client, fake_runtime_client = make_bedrock_client(mocker=mocker)
+        for _ in range(3):
+            response_text, nb_tokens_by_category = await bedrock_client.chat(
+                messages=USER_MESSAGES,  # type: ignore
+                system_text="Be brief",
+                model="some-model",
+                temperature=0.5,
+                max_tokens=100,
+            )
+            assert response_text == "Hi there"
+            assert nb_tokens_by_category == {TokenCategory.INPUT: 12, TokenCategory.OUTPUT: 3}
+        assert fake_runtime_client.nb_enters == 1
+        assert bedrock_client.aio_config.max_pool_connections == 4
+
+        bedrock_client.teardown()
+        # the event loop is still running, so the client is closed by a task
+        await asyncio.sleep(0)
+        assert fake_runtime_client.nb_exits == 1
+
+    @pytest.mark.asyncio
+    async def test_converse_stream(self, mocker: MockerFixture) -> None:
+        bedrock_client, _ = make_bedrock_client(mocker=mocker, is_converse_stream_enabled=True)
+        response_text, nb_tokens_by_category = await bedrock_client.chat(
+            messages=USER_MESSAGES,  # type: ignore
+            system_text=None,
+            model="some-model",
+            temperature=0.5,
+        )
+        assert response_text == "Hi there"
+        assert nb_tokens_by_category == {TokenCategory.INPUT: 12, TokenCategory.OUTPUT: 3}
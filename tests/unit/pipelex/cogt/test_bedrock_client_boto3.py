@@ -0,0 +1,60 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.plugins.bedrock.bedrock_client_boto3 import BedrockClientBoto3
+
+CONVERSE_DURATION = 0.2
+
+
+class TestBedrockClientBoto3:
+    @pytest.mark.asyncio
+    async def test_calls_run_in_bounded_thread_pool(self, mocker: MockerFixture) -> None:
+        bedrock_client = BedrockClientBoto3(aws_region="us-east-1", max_workers=2, connect_timeout=5, read_timeout=30)
+        converse_thread_names: List[str] = []
+
+        def converse(**params: Any) -> Dict[str, Any]:
+            converse_thread_names.append(threading.current_thread().name)
+            time.sleep(CONVERSE_DURATION)
+            return {
+                "output": {"message": {"content": [{"text": "Hi there"}]}},
+                "usage": {"inputTokens": 12, "outputTokens": 3},
+            }
+
+        mocker.patch.object(bedrock_client, "boto3_client", **{"converse.side_effect": converse})
+
+        nb_ticks = 0
+
+        async def tick() -> None:
+            nonlocal nb_ticks
+            while True:
+                await asyncio.sleep(0.01)
+                nb_ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        try:
+            results = await asyncio.gather(
+                *(
+                    bedrock_client.chat(
+                        messages=[{"role": "user", "content": [{"text": "Hello"}]}],  # type: ignore
+                        system_text=None,
+                        model="some-model",
+                        temperature=0.5,
+                    )
+                    for _ in range(4)
+                )
+            )
+        finally:
+            ticker.cancel()
+            bedrock_client.teardown()
+
+        assert [response_text for response_text, _ in results] == ["Hi there"] * 4
+        assert all(thread_name.startswith("bedrock_boto3") for thread_name in converse_thread_names)
+        # 4 calls for 2 threads: 2 calls were queued and the event loop kept running meanwhile
+        assert bedrock_client.max_queue_depth == 2
+        assert bedrock_client.nb_calls_pending == 0
+        assert nb_ticks >= 10
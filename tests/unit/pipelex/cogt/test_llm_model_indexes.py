@@ -0,0 +1,55 @@
+from pipelex.cogt.llm.llm_models.llm_deck import LLMDeck
+from pipelex.cogt.llm.llm_models.llm_engine_blueprint import LLMEngineBlueprint
+from pipelex.cogt.llm.llm_models.llm_model import LATEST_VERSION_NAME
+from pipelex.cogt.llm.llm_models.llm_platform import DEFAULT_PLATFORM_INDICATOR
+from pipelex.hub import get_llm_deck, get_llm_models_provider
+
+
+class TestLLMModelIndexes:
+    def test_library_lookups_match_scan(self) -> None:
+        llm_models_provider = get_llm_models_provider()
+        all_llm_models = llm_models_provider.get_all_llm_models()
+        assert all_llm_models
+        for llm_model in all_llm_models:
+            found_llm_model = llm_models_provider.get_optional_llm_model(
+                llm_name=llm_model.llm_name,
+                llm_version=llm_model.version,
+                llm_platform_choice=DEFAULT_PLATFORM_INDICATOR,
+            )
+            assert found_llm_model is llm_model
+
+            same_name_llm_models = [other_llm_model for other_llm_model in all_llm_models if other_llm_model.llm_name == llm_model.llm_name]
+            expected_latest = next(
+                (other_llm_model for other_llm_model in same_name_llm_models if other_llm_model.version == LATEST_VERSION_NAME),
+                max(same_name_llm_models, key=lambda m: m.version),
+            )
+            latest_llm_model = llm_models_provider.get_optional_llm_model(
+                llm_name=llm_model.llm_name,
+                llm_version=LATEST_VERSION_NAME,
+                llm_platform_choice=DEFAULT_PLATFORM_INDICATOR,
+            )
+            assert latest_llm_model is expected_latest
+
+        assert (
+            llm_models_provider.get_optional_llm_model(
+                llm_name="no-such-llm",
+                llm_version=LATEST_VERSION_NAME,
+                llm_platform_choice=DEFAULT_PLATFORM_INDICATOR,
+            )
+            is None
+        )
+
+    def test_deck_memoizes_llm_models_by_handle(self) -> None:
+        llm_deck = get_llm_deck()
+        assert isinstance(llm_deck, LLMDeck)
+        llm_handle = next(iter(llm_deck.llm_handles))
+        llm_model = llm_deck.find_llm_model(llm_handle=llm_handle)
+        assert llm_deck.find_optional_llm_model(llm_handle=llm_handle) is llm_model
+        assert llm_deck.find_optional_llm_model(llm_handle="no-such-handle") is None
+
+        # adding a handle resets the memo, so a handle which was missing gets resolved
+        deck_copy = LLMDeck.model_validate(llm_deck.model_dump())
+        assert deck_copy.find_optional_llm_model(llm_handle="no-such-handle") is None
+        deck_copy.llm_handles["no-such-handle"] = LLMEngineBlueprint(llm_name=llm_model.llm_name)
+        deck_copy.add_llm_name_as_handle_with_defaults(llm_name="another-handle")
+        assert deck_copy.find_optional_llm_model(llm_handle="no-such-handle") is not None
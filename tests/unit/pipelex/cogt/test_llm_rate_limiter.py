@@ -0,0 +1,67 @@
+from typing import List
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.cogt.llm.llm_models.llm_rate_limit import LLMRateLimit
+from pipelex.cogt.llm.llm_prompt import LLMPrompt
+from pipelex.cogt.llm.llm_rate_limiter import LLMRateLimiter, TokenBucket, count_nb_tokens_used, estimate_nb_prompt_tokens
+from pipelex.cogt.llm.token_category import TokenCategory
+from pipelex.tools.exceptions import ConfigValidationError
+
+
+class TestLLMRateLimiter:
+    def test_token_bucket_reserve(self) -> None:
+        bucket = TokenBucket(capacity=60)
+        assert bucket.reserve(amount=60) == 0.0
+        # the bucket is empty and refills at 1 per second: the next reservations queue up one after the other
+        assert bucket.reserve(amount=1) == pytest.approx(1.0, abs=0.01)
+        assert bucket.reserve(amount=1) == pytest.approx(2.0, abs=0.01)
+
+    def test_token_bucket_caps_oversized_reservation(self) -> None:
+        bucket = TokenBucket(capacity=10)
+        assert bucket.reserve(amount=1000) == 0.0
+        assert bucket.level == pytest.approx(0.0, abs=0.01)
+
+    def test_token_bucket_adjust(self) -> None:
+        bucket = TokenBucket(capacity=100)
+        bucket.reserve(amount=50)
+        bucket.adjust(amount=-30)
+        assert bucket.level == pytest.approx(80.0, abs=0.01)
+        bucket.adjust(amount=-1000)
+        assert bucket.level == pytest.approx(100.0)
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_waits_for_budget(self, mocker: MockerFixture) -> None:
+        sleeps: List[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        mocker.patch("pipelex.cogt.llm.llm_rate_limiter.asyncio.sleep", side_effect=fake_sleep)
+        rate_limiter = LLMRateLimiter(llm_rate_limit=LLMRateLimit(requests_per_minute=2, tokens_per_minute=6000), desc="test")
+
+        await rate_limiter.acquire(nb_tokens_estimate=1000)
+        await rate_limiter.acquire(nb_tokens_estimate=1000)
+        assert not sleeps
+
+        # out of requests: the 3rd call waits for one request to be refilled (30s at 2 rpm)
+        await rate_limiter.acquire(nb_tokens_estimate=1000)
+        assert sleeps == [pytest.approx(30.0, abs=0.1)]
+
+        # the actual usage was much larger than the estimates: the token budget now is the bottleneck
+        rate_limiter.reconcile(nb_tokens_estimate=1000, nb_tokens_used=12000)
+        await rate_limiter.acquire(nb_tokens_estimate=1000)
+        assert sleeps[-1] == pytest.approx(90.0, abs=0.1)
+
+    def test_token_estimates(self) -> None:
+        llm_prompt = LLMPrompt(system_text="a" * 40, user_text="b" * 400)
+        assert estimate_nb_prompt_tokens(llm_prompt=llm_prompt) == 110
+        nb_tokens_used = count_nb_tokens_used(
+            nb_tokens_by_category={TokenCategory.INPUT: 100, TokenCategory.INPUT_CACHED: 80, TokenCategory.OUTPUT: 20},
+        )
+        assert nb_tokens_used == 120
+
+    def test_rate_limit_validation(self) -> None:
+        with pytest.raises(ConfigValidationError):
+            LLMRateLimit(requests_per_minute=0)
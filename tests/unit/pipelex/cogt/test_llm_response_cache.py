@@ -0,0 +1,103 @@
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+from pytest_mock import MockerFixture
+
+from pipelex.cogt.image.prompt_image import PromptImageBytes, PromptImagePath
+from pipelex.cogt.llm.llm_job_components import LLMJobParams
+from pipelex.cogt.llm.llm_job_factory import LLMJobFactory
+from pipelex.cogt.llm.llm_response_cache import LLMResponseCacheLRU, LLMResponseCacheSqlite, make_llm_response_cache_key
+
+
+class CachedAnswer(BaseModel):
+    answer: str
+
+
+class TestLLMResponseCache:
+    def test_cache_key_is_stable_and_content_addressed(self) -> None:
+        def make_key(user_text: str, temperature: float = 0.5, image_bytes: bytes = b"aGVsbG8=") -> str:
+            llm_job = LLMJobFactory.make_llm_job_from_prompt_contents(
+                llm_job_params=LLMJobParams(temperature=temperature, max_tokens=None, seed=None),
+                user_text=user_text,
+                user_images=[PromptImageBytes(base_64=image_bytes)],
+            )
+            return make_llm_response_cache_key(llm_id="gpt-4o-mini", llm_job=llm_job)
+
+        assert make_key("What is 2+2?") == make_key("What is 2+2?")
+        assert make_key("What is 2+2?") != make_key("What is 2+3?")
+        assert make_key("What is 2+2?") != make_key("What is 2+2?", temperature=0.6)
+        assert make_key("What is 2+2?") != make_key("What is 2+2?", image_bytes=b"d29ybGQ=")
+
+        llm_job = LLMJobFactory.make_llm_job_from_prompt_contents(
+            llm_job_params=LLMJobParams(temperature=0.5, max_tokens=None, seed=None),
+            user_text="What is 2+2?",
+        )
+        text_key = make_llm_response_cache_key(llm_id="gpt-4o-mini", llm_job=llm_job)
+        object_key = make_llm_response_cache_key(llm_id="gpt-4o-mini", llm_job=llm_job, schema=CachedAnswer)
+        assert text_key != object_key
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self) -> None:
+        cache = LLMResponseCacheLRU(max_entries=2)
+        await cache.set(cache_key="a", response="A")
+        await cache.set(cache_key="b", response="B")
+        # using "a" makes "b" the least recently used
+        assert await cache.get(cache_key="a") == "A"
+        await cache.set(cache_key="c", response="C")
+        assert await cache.get(cache_key="b") is None
+        assert await cache.get(cache_key="a") == "A"
+        assert await cache.get(cache_key="c") == "C"
+
+    @pytest.mark.asyncio
+    async def test_lru_ttl(self, mocker: MockerFixture) -> None:
+        mock_time = mocker.patch("pipelex.cogt.llm.llm_response_cache.time.time", return_value=1000.0)
+        cache = LLMResponseCacheLRU(max_entries=10, ttl_seconds=60)
+        await cache.set(cache_key="a", response="A")
+        mock_time.return_value = 1059.0
+        assert await cache.get(cache_key="a") == "A"
+        mock_time.return_value = 1061.0
+        assert await cache.get(cache_key="a") is None
+
+    @pytest.mark.asyncio
+    async def test_sqlite_persistence_and_eviction(self, tmp_path: Path) -> None:
+        sqlite_path = str(tmp_path / "cache" / "llm_responses.sqlite")
+        cache = LLMResponseCacheSqlite(sqlite_path=sqlite_path, max_entries=2)
+        await cache.set(cache_key="a", response=CachedAnswer(answer="4").model_dump_json())
+        cache.teardown()
+
+        reopened_cache = LLMResponseCacheSqlite(sqlite_path=sqlite_path, max_entries=2)
+        cached_json = await reopened_cache.get(cache_key="a")
+        assert cached_json is not None
+        assert CachedAnswer.model_validate_json(cached_json) == CachedAnswer(answer="4")
+
+        await reopened_cache.set(cache_key="b", response="B")
+        await reopened_cache.set(cache_key="c", response="C")
+        assert await reopened_cache.get(cache_key="a") is None
+        assert await reopened_cache.get(cache_key="c") == "C"
+        reopened_cache.teardown()
+
+        # the number of rows is counted again when opening, so eviction resumes where it stopped
+        reopened_cache = LLMResponseCacheSqlite(sqlite_path=sqlite_path, max_entries=2)
+        await reopened_cache.set(cache_key="d", response="D")
+        assert await reopened_cache.get(cache_key="b") is None
+        assert await reopened_cache.get(cache_key="c") == "C"
+        assert await reopened_cache.get(cache_key="d") == "D"
+        reopened_cache.teardown()
+
+    def test_image_path_is_keyed_by_file_stat(self, tmp_path: Path) -> None:
+        image_path = tmp_path / "image.png"
+        image_path.write_bytes(b"first")
+
+        def make_key() -> str:
+            llm_job = LLMJobFactory.make_llm_job_from_prompt_contents(
+                llm_job_params=LLMJobParams(temperature=0.5, max_tokens=None, seed=None),
+                user_text="Describe this image",
+                user_images=[PromptImagePath(file_path=str(image_path))],
+            )
+            return make_llm_response_cache_key(llm_id="gpt-4o-mini", llm_job=llm_job)
+
+        first_key = make_key()
+        assert make_key() == first_key
+        image_path.write_bytes(b"second version")
+        assert make_key() != first_key
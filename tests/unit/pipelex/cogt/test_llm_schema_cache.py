@@ -0,0 +1,68 @@
+from typing import List
+
+from instructor.mode import Mode
+from instructor.process_response import handle_response_model
+from pydantic import BaseModel
+
+from pipelex.cogt.llm.llm_schema_cache import LLMSchemaCache
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+class Order(BaseModel):
+    customer: str
+    items: List[Item]
+
+
+class TestLLMSchemaCache:
+    def test_structure_prompt_is_made_once(self):
+        llm_schema_cache = LLMSchemaCache()
+        made_prompts: List[str] = []
+
+        def make_structure_prompt() -> str:
+            made_prompts.append("Order structure")
+            return "Order structure"
+
+        assert (
+            llm_schema_cache.get_structure_prompt(class_name="Order", output_class=Order, make_structure_prompt=make_structure_prompt)
+            == "Order structure"
+        )
+        assert (
+            llm_schema_cache.get_structure_prompt(class_name="Order", output_class=Order, make_structure_prompt=make_structure_prompt)
+            == "Order structure"
+        )
+        assert len(made_prompts) == 1
+        llm_schema_cache.clear()
+        llm_schema_cache.get_structure_prompt(class_name="Order", output_class=Order, make_structure_prompt=make_structure_prompt)
+        assert len(made_prompts) == 2
+
+    def test_list_schema_is_built_once(self):
+        llm_schema_cache = LLMSchemaCache()
+        list_schema = llm_schema_cache.get_list_schema(item_class=Item)
+        assert llm_schema_cache.get_list_schema(item_class=Item) is list_schema
+        wrapped_list = list_schema.model_validate({"items": [{"name": "apple", "price": 1}]})
+        assert getattr(wrapped_list, "items") == [Item(name="apple", price=1)]
+
+    def test_json_schema_is_built_once(self):
+        llm_schema_cache = LLMSchemaCache()
+        json_schema = llm_schema_cache.get_json_schema(schema=Order)
+        assert json_schema == Order.model_json_schema()
+        assert llm_schema_cache.get_json_schema(schema=Order) is json_schema
+
+    def test_instructor_schema_is_used_as_is(self):
+        llm_schema_cache = LLMSchemaCache()
+        instructor_schema = llm_schema_cache.get_instructor_schema(schema=Order)
+        assert llm_schema_cache.get_instructor_schema(schema=Order) is instructor_schema
+        assert issubclass(instructor_schema, Order)
+        assert instructor_schema.__name__ == "Order"
+        for mode in (Mode.TOOLS, Mode.TOOLS_STRICT, Mode.ANTHROPIC_TOOLS, Mode.MISTRAL_TOOLS, Mode.JSON):
+            response_model, _ = handle_response_model(instructor_schema, mode=mode, messages=[{"role": "user", "content": "Order"}])
+            # instructor doesn't wrap the class again
+            assert response_model is instructor_schema
+        # the strict mode alters the schema it gets, which must not alter the cached one
+        assert instructor_schema.model_json_schema() == instructor_schema.model_json_schema(mode="validation")
+        order = instructor_schema.model_validate({"customer": "Alice", "items": [{"name": "apple", "price": 1}]})
+        assert isinstance(order, Order)
@@ -0,0 +1,178 @@
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, AsyncIterator, List, Type
+
+import httpx
+import pytest
+from anthropic import APIStatusError, AsyncAnthropic
+from openai import AsyncOpenAI
+from openai.types.chat import ChatCompletionChunk
+from pytest_mock import MockerFixture
+from typing_extensions import override
+
+from pipelex.cogt.exceptions import LLMCompletionError
+from pipelex.cogt.llm.llm_job import LLMJob
+from pipelex.cogt.llm.llm_job_components import LLMJobParams
+from pipelex.cogt.llm.llm_job_factory import LLMJobFactory
+from pipelex.cogt.llm.llm_models.llm_engine import LLMEngine
+from pipelex.cogt.llm.llm_models.llm_family import LLMFamily
+from pipelex.cogt.llm.llm_models.llm_model import LLMModel
+from pipelex.cogt.llm.llm_models.llm_platform import LLMPlatform
+from pipelex.cogt.llm.llm_worker_abstract import LLMWorkerAbstract
+from pipelex.cogt.llm.token_category import TokenCategory
+from pipelex.pipeline.job_metadata import UnitJobId
+from pipelex.plugins.anthropic.anthropic_llm_worker import AnthropicLLMWorker
+from pipelex.plugins.openai.openai_llm_worker import OpenAILLMWorker
+from pipelex.tools.typing.pydantic_utils import BaseModelTypeVar
+
+
+class FakeLLMWorker(LLMWorkerAbstract):
+    @property
+    @override
+    def is_gen_object_supported(self) -> bool:
+        return False
+
+    @override
+    async def _gen_text(self, llm_job: LLMJob) -> str:
+        return "Hello world"
+
+    @override
+    async def _gen_object(self, llm_job: LLMJob, schema: Type[BaseModelTypeVar]) -> BaseModelTypeVar:
+        return schema.model_validate_json(await self._gen_text(llm_job=llm_job))
+
+
+class FakeStreamingLLMWorker(FakeLLMWorker):
+    @override
+    async def _gen_text_stream(self, llm_job: LLMJob) -> AsyncGenerator[str, None]:
+        for text_chunk in ("Hello", " ", "world"):
+            yield text_chunk
+
+
+class FakeUsageStreamingLLMWorker(FakeStreamingLLMWorker):
+    """Records the usage of the prompt when the stream starts, as the APIs which report it first do."""
+
+    @override
+    async def _gen_text_stream(self, llm_job: LLMJob) -> AsyncGenerator[str, None]:
+        llm_job.llm_job_before_start(llm_engine=make_llm_engine())
+        if llm_tokens_usage := llm_job.job_report.llm_tokens_usage:
+            llm_tokens_usage.nb_tokens_by_category = {TokenCategory.INPUT: 10}
+        async for text_chunk in super()._gen_text_stream(llm_job=llm_job):
+            yield text_chunk
+
+
+class FakeOpenAIStream:
+    def __init__(self) -> None:
+        self.is_closed = False
+
+    async def __aenter__(self) -> "FakeOpenAIStream":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.is_closed = True
+
+    async def __aiter__(self) -> AsyncIterator[ChatCompletionChunk]:
+        for text_chunk in ("Hello", " ", "world"):
+            yield ChatCompletionChunk.model_validate(
+                {
+                    "id": "chunk",
+                    "object": "chat.completion.chunk",
+                    "created": 0,
+                    "model": "gpt-4o-mini",
+                    "choices": [{"index": 0, "delta": {"content": text_chunk}}],
+                }
+            )
+
+
+class FakeAnthropicStream:
+    """Streams a first chunk, then fails like the API does when it gets overloaded in the middle of a response."""
+
+    async def __aenter__(self) -> "FakeAnthropicStream":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    @property
+    async def text_stream(self) -> AsyncIterator[str]:
+        yield "Hello"
+        raise APIStatusError(
+            "Overloaded",
+            response=httpx.Response(status_code=529, request=httpx.Request("POST", "https://api.anthropic.com/v1/messages")),
+            body=None,
+        )
+
+
+def make_llm_engine(llm_platform: LLMPlatform = LLMPlatform.ANTHROPIC) -> LLMEngine:
+    llm_model = LLMModel(
+        default_platform=llm_platform,
+        llm_family=LLMFamily.CLAUDE_3_5 if llm_platform == LLMPlatform.ANTHROPIC else LLMFamily.GPT_4O,
+        llm_name="claude-3-5-haiku" if llm_platform == LLMPlatform.ANTHROPIC else "gpt-4o-mini",
+        version="latest",
+        is_gen_object_supported=True,
+        cost_per_million_tokens_usd={},
+        platform_llm_id={llm_platform: "claude-3-5-haiku-latest" if llm_platform == LLMPlatform.ANTHROPIC else "gpt-4o-mini"},
+        max_tokens=8192,
+    )
+    return LLMEngine(llm_platform=llm_platform, llm_model=llm_model)
+
+
+def make_llm_job() -> LLMJob:
+    return LLMJobFactory.make_llm_job_from_prompt_contents(
+        llm_job_params=LLMJobParams(temperature=0.5, max_tokens=None, seed=None),
+        user_text="Say hello",
+    )
+
+
+class TestLLMTextStream:
+    @pytest.mark.asyncio
+    async def test_gen_text_stream_falls_back_to_whole_text(self, mocker: MockerFixture) -> None:
+        reporting_delegate = mocker.MagicMock()
+        llm_worker = FakeLLMWorker(reporting_delegate=reporting_delegate)
+        llm_job = make_llm_job()
+        text_chunks: List[str] = [text_chunk async for text_chunk in llm_worker.gen_text_stream(llm_job=llm_job)]
+        assert text_chunks == ["Hello world"]
+        assert llm_job.job_metadata.unit_job_id == UnitJobId.LLM_GEN_TEXT
+        reporting_delegate.report_inference_job.assert_called_once_with(inference_job=llm_job)
+
+    @pytest.mark.asyncio
+    async def test_gen_text_stream_reports_after_last_chunk(self, mocker: MockerFixture) -> None:
+        reporting_delegate = mocker.MagicMock()
+        llm_worker = FakeStreamingLLMWorker(reporting_delegate=reporting_delegate)
+        text_chunks: List[str] = []
+        async for text_chunk in llm_worker.gen_text_stream(llm_job=make_llm_job()):
+            # the job is only reported once the whole text has been streamed
+            reporting_delegate.report_inference_job.assert_not_called()
+            text_chunks.append(text_chunk)
+        assert "".join(text_chunks) == "Hello world"
+        reporting_delegate.report_inference_job.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_anthropic_stream_errors_are_mapped(self, mocker: MockerFixture) -> None:
+        llm_worker = AnthropicLLMWorker(sdk_instance=AsyncAnthropic(api_key="test"), llm_engine=make_llm_engine())
+        mocker.patch.object(llm_worker.anthropic_async_client.messages, "stream", return_value=FakeAnthropicStream())
+        text_chunks: List[str] = []
+        with pytest.raises(LLMCompletionError):
+            async for text_chunk in llm_worker.gen_text_stream(llm_job=make_llm_job()):
+                text_chunks.append(text_chunk)
+        assert text_chunks == ["Hello"]
+
+    @pytest.mark.asyncio
+    async def test_gen_text_stream_stopped_early_is_reported_if_it_used_tokens(self, mocker: MockerFixture) -> None:
+        for llm_worker_class, is_reported in ((FakeUsageStreamingLLMWorker, True), (FakeStreamingLLMWorker, False)):
+            reporting_delegate = mocker.MagicMock()
+            llm_worker = llm_worker_class(reporting_delegate=reporting_delegate)
+            async with aclosing(llm_worker.gen_text_stream(llm_job=make_llm_job())) as text_stream:
+                async for text_chunk in text_stream:
+                    assert text_chunk == "Hello"
+                    break
+            assert reporting_delegate.report_inference_job.called == is_reported
+
+    @pytest.mark.asyncio
+    async def test_openai_stream_is_closed_when_stopped_early(self, mocker: MockerFixture) -> None:
+        llm_worker = OpenAILLMWorker(sdk_instance=AsyncOpenAI(api_key="test"), llm_engine=make_llm_engine(LLMPlatform.OPENAI), structure_method=None)
+        fake_stream = FakeOpenAIStream()
+        mocker.patch.object(llm_worker.openai_client_for_text.chat.completions, "create", mocker.AsyncMock(return_value=fake_stream))
+        async with aclosing(llm_worker.gen_text_stream(llm_job=make_llm_job())) as text_stream:
+            async for text_chunk in text_stream:
+                assert text_chunk == "Hello"
+                break
+        assert fake_stream.is_closed
@@ -0,0 +1,115 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+from mistralai import Mistral
+from mistralai.models import OCRPageObject, OCRResponse, SDKError
+from pytest_mock import MockerFixture
+
+from pipelex.cogt.ocr.ocr_engine import OcrEngine
+from pipelex.cogt.ocr.ocr_job_components import OcrJobConfig
+from pipelex.cogt.ocr.ocr_output import OcrOutput, OcrOutputError, Page
+from pipelex.cogt.ocr.ocr_platform import OcrPlatform
+from pipelex.cogt.ocr.ocr_worker_abstract import make_page_ranges
+from pipelex.plugins.mistral.mistral_ocr_worker import MistralOcrWorker
+
+NB_PAGES = 7
+
+
+def make_ocr_response(page_indexes: List[int]) -> OCRResponse:
+    pages = [OCRPageObject.model_construct(index=page_index, markdown=f"text of page {page_index}", images=[]) for page_index in page_indexes]
+    return OCRResponse.model_construct(pages=pages)
+
+
+class TestOcrChunking:
+    def test_make_page_ranges(self):
+        assert make_page_ranges(nb_pages=7, nb_pages_per_chunk=3) == [range(0, 3), range(3, 6), range(6, 7)]
+        assert make_page_ranges(nb_pages=2, nb_pages_per_chunk=3) == [range(0, 2)]
+
+    def test_merge_chunks(self):
+        merged = OcrOutput.make_from_chunks(
+            chunk_outputs=[OcrOutput(pages={2: Page(text="c")}), OcrOutput(pages={0: Page(text="a"), 1: Page(text="b")})]
+        )
+        assert list(merged.pages) == [0, 1, 2]
+        assert merged.concatenated_text == "a\nb\nc"
+        with pytest.raises(OcrOutputError):
+            OcrOutput.make_from_chunks(chunk_outputs=[OcrOutput(pages={0: Page(text="a")}), OcrOutput(pages={0: Page(text="a")})])
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("is_indexed_within_chunk", [False, True])
+    async def test_mistral_ocr_by_chunks(self, mocker: MockerFixture, is_indexed_within_chunk: bool):
+        worker = MistralOcrWorker(
+            sdk_instance=Mistral(api_key="test"),
+            ocr_engine=OcrEngine(ocr_platform=OcrPlatform.MISTRAL, ocr_model_name="mistral-ocr-latest"),
+        )
+        mocker.patch.object(worker, "_upload_pdf_file", return_value="https://example.com/signed.pdf")
+        mocker.patch("pipelex.plugins.mistral.mistral_ocr_worker.get_pdf_nb_pages", return_value=NB_PAGES)
+
+        requested_pages: List[List[int]] = []
+        nb_in_flight = 0
+        max_nb_in_flight = 0
+        has_failed = False
+
+        async def process_async(**kwargs: Any) -> OCRResponse:
+            nonlocal nb_in_flight, max_nb_in_flight, has_failed
+            pages: List[int] = kwargs["pages"]
+            requested_pages.append(pages)
+            nb_in_flight += 1
+            max_nb_in_flight = max(max_nb_in_flight, nb_in_flight)
+            await asyncio.sleep(0.01)
+            nb_in_flight -= 1
+            if pages[0] == 2 and not has_failed:
+                has_failed = True
+                raise SDKError("Service unavailable", status_code=503)
+            return make_ocr_response(page_indexes=list(range(len(pages))) if is_indexed_within_chunk else pages)
+
+        mocker.patch.object(worker.mistral_client.ocr, "process_async", side_effect=process_async)
+
+        ocr_output = await worker.make_ocr_output_from_pdf(
+            pdf_uri="/tmp/document.pdf",
+            should_include_images=False,
+            should_caption_images=False,
+            should_include_page_views=False,
+            nb_pages_per_chunk=2,
+            job_config=OcrJobConfig(max_concurrent_chunks=2, max_chunk_retries=1, chunk_retry_backoff_seconds=0),
+        )
+
+        page_texts: Dict[int, str] = {page_index: page.text or "" for page_index, page in ocr_output.pages.items()}
+        assert page_texts == {
+            page_index: f"text of page {page_index if not is_indexed_within_chunk else page_index % 2}" for page_index in range(NB_PAGES)
+        }
+        # only the failed chunk was retried
+        assert sorted(requested_pages) == [[0, 1], [2, 3], [2, 3], [4, 5], [6]]
+        assert max_nb_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_remote_pdf_is_downloaded_once(self, mocker: MockerFixture):
+        worker = MistralOcrWorker(
+            sdk_instance=Mistral(api_key="test"),
+            ocr_engine=OcrEngine(ocr_platform=OcrPlatform.MISTRAL, ocr_model_name="mistral-ocr-latest"),
+        )
+        fetch_file = mocker.patch("pipelex.plugins.mistral.mistral_ocr_worker.fetch_file_from_url_httpx_async", return_value=b"%PDF")
+        mocker.patch("pipelex.plugins.mistral.mistral_ocr_worker.get_pdf_nb_pages", return_value=NB_PAGES)
+        upload_pdf_bytes = mocker.patch.object(worker, "_upload_pdf_bytes", return_value="https://example.com/signed.pdf")
+        requested_urls: List[str] = []
+
+        async def process_async(**kwargs: Any) -> OCRResponse:
+            requested_urls.append(kwargs["document"]["document_url"])
+            return make_ocr_response(page_indexes=kwargs["pages"])
+
+        mocker.patch.object(worker.mistral_client.ocr, "process_async", side_effect=process_async)
+
+        ocr_output = await worker.make_ocr_output_from_pdf(
+            pdf_uri="https://example.com/files/report.pdf",
+            should_include_images=False,
+            should_caption_images=False,
+            should_include_page_views=False,
+            nb_pages_per_chunk=3,
+            job_config=OcrJobConfig(max_concurrent_chunks=2, max_chunk_retries=0, chunk_retry_backoff_seconds=0),
+        )
+
+        assert len(ocr_output.pages) == NB_PAGES
+        # the document downloaded to count its pages is uploaded once, and all the chunks use the uploaded copy
+        fetch_file.assert_called_once()
+        upload_pdf_bytes.assert_called_once_with(pdf_bytes=b"%PDF", file_name="report.pdf")
+        assert requested_urls == ["https://example.com/signed.pdf"] * 3
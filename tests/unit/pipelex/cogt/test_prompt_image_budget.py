@@ -0,0 +1,66 @@
+import base64
+import io
+import os
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from pipelex.cogt.image.prompt_image import PromptImageBytes, PromptImagePath
+from pipelex.cogt.image.prompt_image_budget import PromptImageBudget, PromptImageFormat
+from pipelex.cogt.image.prompt_image_preparer import PromptImagePreparer
+from pipelex.tools.misc.filetype_utils import FileType
+
+PNG_FILE_TYPE = FileType(extension="png", mime="image/png")
+
+
+def make_page_render_bytes(width: int, height: int) -> bytes:
+    # noise compresses badly, like a scanned page
+    image = Image.frombytes("RGB", (width, height), os.urandom(width * height * 3))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class TestPromptImageBudget:
+    def test_image_within_budget_is_untouched(self) -> None:
+        image_bytes = make_page_render_bytes(width=200, height=100)
+        image_budget = PromptImageBudget(max_edge_pixels=1000)
+        assert image_budget.apply(image_bytes=image_bytes, file_type=PNG_FILE_TYPE) == (image_bytes, PNG_FILE_TYPE)
+
+    def test_downscale_and_recompress(self) -> None:
+        image_bytes = make_page_render_bytes(width=1200, height=800)
+        image_budget = PromptImageBudget(max_edge_pixels=600)
+        budgeted_bytes, file_type = image_budget.apply(image_bytes=image_bytes, file_type=PNG_FILE_TYPE)
+        assert file_type == PromptImageFormat.JPEG.file_type
+        assert Image.open(io.BytesIO(budgeted_bytes)).size == (600, 400)
+        assert len(budgeted_bytes) < len(image_bytes) / 4
+
+    def test_max_bytes(self) -> None:
+        image_bytes = make_page_render_bytes(width=800, height=800)
+        image_budget = PromptImageBudget(max_bytes=50_000, target_format=PromptImageFormat.WEBP)
+        budgeted_bytes, file_type = image_budget.apply(image_bytes=image_bytes, file_type=PNG_FILE_TYPE)
+        assert file_type.mime == "image/webp"
+        assert len(budgeted_bytes) <= 50_000
+
+    @pytest.mark.asyncio
+    async def test_preparer_applies_budget_and_keeps_original(self, tmp_path: Path) -> None:
+        image_bytes = make_page_render_bytes(width=1200, height=800)
+        file_path = tmp_path / "page.png"
+        file_path.write_bytes(image_bytes)
+        preparer = PromptImagePreparer(max_bytes=10 * 1024 * 1024)
+        image_budget = PromptImageBudget(max_edge_pixels=600)
+
+        budgeted = await preparer.prepare_typed_bytes(prompt_image=PromptImagePath(file_path=str(file_path)), image_budget=image_budget)
+        assert budgeted.file_type.mime == "image/jpeg"
+        assert await preparer.prepare_typed_bytes(prompt_image=PromptImagePath(file_path=str(file_path)), image_budget=image_budget) is budgeted
+        # without a budget, or with another one, the image is prepared separately
+        original = await preparer.prepare_typed_bytes(prompt_image=PromptImagePath(file_path=str(file_path)))
+        assert base64.b64decode(original.base_64) == image_bytes
+        assert file_path.read_bytes() == image_bytes
+
+        # images held in memory are reduced too, and their payload is left as is
+        prompt_image_bytes = PromptImageBytes(base_64=base64.b64encode(image_bytes))
+        budgeted_from_bytes = await preparer.prepare_typed_bytes(prompt_image=prompt_image_bytes, image_budget=image_budget)
+        assert budgeted_from_bytes.file_type.mime == "image/jpeg"
+        assert prompt_image_bytes.base_64 == base64.b64encode(image_bytes)
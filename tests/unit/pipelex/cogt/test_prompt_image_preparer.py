@@ -0,0 +1,61 @@
+import base64
+import os
+from pathlib import Path
+
+import pytest
+
+from pipelex.cogt.image.prompt_image import PromptImageBytes, PromptImagePath, PromptImageTypedBytes, PromptImageUrl
+from pipelex.cogt.image.prompt_image_preparer import PromptImagePreparer
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
+
+
+def write_png(path: Path, payload: bytes) -> str:
+    path.write_bytes(PNG_SIGNATURE + payload)
+    return str(path)
+
+
+class TestPromptImagePreparer:
+    @pytest.mark.asyncio
+    async def test_file_payload_is_cached_until_the_file_changes(self, tmp_path: Path) -> None:
+        preparer = PromptImagePreparer(max_bytes=1024 * 1024)
+        file_path = write_png(tmp_path / "page.png", payload=b"first version")
+        prompt_image = PromptImagePath(file_path=file_path)
+
+        typed_bytes = await preparer.prepare_typed_bytes(prompt_image=prompt_image)
+        assert typed_bytes.file_type.mime == "image/png"
+        assert base64.b64decode(typed_bytes.base_64).endswith(b"first version")
+        # the same image sent to another step, and the same path seen through another PromptImage
+        assert await preparer.prepare_typed_bytes(prompt_image=PromptImagePath(file_path=file_path)) is typed_bytes
+        assert preparer.nb_bytes == len(typed_bytes.base_64)
+
+        write_png(tmp_path / "page.png", payload=b"second, longer version")
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        changed_typed_bytes = await preparer.prepare_typed_bytes(prompt_image=prompt_image)
+        assert base64.b64decode(changed_typed_bytes.base_64).endswith(b"second, longer version")
+
+    @pytest.mark.asyncio
+    async def test_max_bytes(self, tmp_path: Path) -> None:
+        file_paths = [write_png(tmp_path / f"page_{index}.png", payload=bytes(100)) for index in range(3)]
+        payload_size = len(base64.b64encode(PNG_SIGNATURE + bytes(100)))
+        preparer = PromptImagePreparer(max_bytes=2 * payload_size)
+        all_typed_bytes = [await preparer.prepare_typed_bytes(prompt_image=PromptImagePath(file_path=file_path)) for file_path in file_paths]
+        assert len(all_typed_bytes) == 3
+        # the first one was evicted to stay within the budget
+        assert preparer.nb_bytes == 2 * payload_size
+        assert await preparer.prepare_typed_bytes(prompt_image=PromptImagePath(file_path=file_paths[2])) is all_typed_bytes[2]
+        assert await preparer.prepare_typed_bytes(prompt_image=PromptImagePath(file_path=file_paths[0])) is not all_typed_bytes[0]
+
+    @pytest.mark.asyncio
+    async def test_bytes_and_urls(self) -> None:
+        preparer = PromptImagePreparer(max_bytes=1024)
+        base_64 = base64.b64encode(PNG_SIGNATURE + bytes(1000))
+        prepped_images = await preparer.prepare_all_typed_bytes_or_urls(
+            prompt_images=[PromptImageBytes(base_64=base_64), PromptImageUrl(url="https://example.com/page.png")]
+        )
+        typed_bytes = prepped_images[0]
+        assert isinstance(typed_bytes, PromptImageTypedBytes)
+        assert typed_bytes.base_64 is base_64
+        assert typed_bytes.make_data_url().startswith("data:image/png;base64,")
+        assert prepped_images[1] == "https://example.com/page.png"
@@ -0,0 +1,60 @@
+from typing import List
+
+import pytest
+
+from pipelex.core.concept import Concept
+from pipelex.core.concept_factory import ConceptFactory
+from pipelex.core.concept_library import ConceptLibrary
+from pipelex.core.concept_native import NativeConcept
+from pipelex.exceptions import ConceptLibraryError
+
+
+def make_concept(code: str, refines: List[str]) -> Concept:
+    return Concept(code=f"test_domain.{code}", domain="test_domain", structure_class_name="TextContent", definition=code, refines=refines)
+
+
+def make_concept_library() -> ConceptLibrary:
+    concept_library = ConceptLibrary.make_empty()
+    concept_library.add_concepts(concepts=ConceptFactory.list_native_concepts())
+    concept_library.add_concepts(
+        concepts=[
+            make_concept(code="Document", refines=[NativeConcept.TEXT.code]),
+            make_concept(code="Contract", refines=["test_domain.Document"]),
+            make_concept(code="Lease", refines=["test_domain.Contract"]),
+            make_concept(code="Photo", refines=[NativeConcept.IMAGE.code]),
+        ]
+    )
+    return concept_library
+
+
+class TestConceptCompatibility:
+    def test_is_compatible_through_refines_chain(self):
+        concept_library = make_concept_library()
+        concept_library.validate_with_libraries()
+        assert concept_library.is_compatible_by_concept_code("test_domain.Lease", "test_domain.Document")
+        assert concept_library.is_compatible_by_concept_code("test_domain.Lease", NativeConcept.TEXT.code)
+        assert concept_library.is_compatible_by_concept_code("test_domain.Lease", NativeConcept.ANYTHING.code)
+        assert not concept_library.is_compatible_by_concept_code("test_domain.Document", "test_domain.Lease")
+        assert not concept_library.is_compatible_by_concept_code("test_domain.Lease", NativeConcept.IMAGE.code)
+        assert concept_library.is_compatible(
+            tested_concept=concept_library.get_required_concept("test_domain.Contract"),
+            wanted_concept=concept_library.get_required_concept("test_domain.Document"),
+        )
+        assert concept_library.is_image_concept("test_domain.Photo")
+
+    def test_closure_is_reset_when_concepts_are_added(self):
+        concept_library = make_concept_library()
+        assert not concept_library.is_compatible_by_concept_code("test_domain.Invoice", "test_domain.Document")
+        concept_library.add_new_concept(concept=make_concept(code="Invoice", refines=["test_domain.Document"]))
+        assert concept_library.is_compatible_by_concept_code("test_domain.Invoice", "test_domain.Document")
+
+    def test_refines_cycle_is_detected(self):
+        concept_library = make_concept_library()
+        concept_library.add_concepts(
+            concepts=[
+                make_concept(code="Chicken", refines=["test_domain.Egg"]),
+                make_concept(code="Egg", refines=["test_domain.Chicken"]),
+            ]
+        )
+        with pytest.raises(ConceptLibraryError):
+            concept_library.validate_with_libraries()
@@ -0,0 +1,42 @@
+import base64
+import os
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from pipelex.core.stuff_content import ImageContent
+from pipelex.tools.storage.local_storage_provider import LocalStorageProvider
+
+
+class TestImageContent:
+    def test_make_from_image_keeps_a_single_copy(self):
+        image_content = ImageContent.make_from_image(image=Image.new("RGB", (8, 8)), image_name="page_view_1.png")
+        assert image_content.url == "page_view_1.png"
+        assert image_content.base_64 is not None
+        assert base64.b64decode(image_content.base_64).startswith(b"\x89PNG")
+        # the data url is only built for rendering
+        assert f'src="data:image/png;base64,{image_content.base_64}"' in image_content.rendered_html()
+
+    @pytest.mark.asyncio
+    async def test_make_from_image_async_with_storage(self, tmp_path: Path):
+        storage_provider = LocalStorageProvider(directory=str(tmp_path))
+        image = Image.new("RGB", (8, 8), color="red")
+        image_content = await ImageContent.make_from_image_async(image=image, storage_provider=storage_provider)
+        assert image_content.base_64 is None
+        assert os.path.dirname(image_content.url) == str(tmp_path)
+        assert image_content.url.endswith(".png")
+        assert storage_provider.load(uri=image_content.url).startswith(b"\x89PNG")
+        # the same page view rendered again is stored once
+        same_image_content = await ImageContent.make_from_image_async(image=image, storage_provider=storage_provider)
+        assert same_image_content.url == image_content.url
+        assert len(os.listdir(tmp_path)) == 1
+
+    def test_renderings_use_the_data_url(self):
+        image_content = ImageContent.make_from_image(image=Image.new("RGB", (8, 8)), image_name="page_view_1.png")
+        data_url = f"data:image/png;base64,{image_content.base_64}"
+        assert image_content.rendered_plain() == data_url
+        assert image_content.rendered_markdown() == f"![page_view_1.png]({data_url})"
+        assert data_url in image_content.rendered_json()
+        # an image which is not held in base_64 is rendered from its url
+        assert ImageContent(url="https://example.com/image.png").rendered_plain() == "https://example.com/image.png"
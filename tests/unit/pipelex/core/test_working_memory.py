@@ -179,3 +179,41 @@ class TestWorkingMemory:
         empty_memory = WorkingMemoryFactory.make_empty()
         assert len(empty_memory.root) == 0
         assert len(empty_memory.aliases) == 0
+
+    def test_working_memory_branch_copy(self, multiple_stuff_memory: WorkingMemory):
+        """Test that a branch copy shares the parent's stuffs but records its own changes apart."""
+        branch_memory = multiple_stuff_memory.make_branch_copy()
+
+        # Stuffs are shared, not duplicated
+        for name, stuff in multiple_stuff_memory.root.items():
+            assert branch_memory.root[name] is stuff
+        assert branch_memory.get_main_stuff() is multiple_stuff_memory.get_main_stuff()
+
+        # Changes in the branch don't leak into the parent
+        item_stuff = StuffFactory.make_stuff(concept_str="native.Text", name="item", content=TextContent(text="Branch item"))
+        branch_memory.set_new_main_stuff(stuff=item_stuff, name="item")
+        branch_memory.remove_stuff(name="question")
+
+        assert "item" not in multiple_stuff_memory.root
+        assert "question" in multiple_stuff_memory.root
+        assert multiple_stuff_memory.get_main_stuff().stuff_name == "document"
+        assert branch_memory.get_main_stuff() is item_stuff
+
+    def test_working_memory_apply_branch_changes(self, multiple_stuff_memory: WorkingMemory):
+        """Test that the changes of a branch can be replayed onto another memory."""
+        branch_base = multiple_stuff_memory.make_branch_copy()
+        branch_memory = branch_base.make_branch_copy()
+        item_stuff = StuffFactory.make_stuff(concept_str="native.Text", name="item", content=TextContent(text="Branch item"))
+        branch_memory.set_new_main_stuff(stuff=item_stuff, name="item")
+        branch_memory.remove_stuff(name="question")
+
+        # the target memory got an unnamed main stuff meanwhile, which the named main stuff of the branch replaces
+        target_memory = multiple_stuff_memory.make_branch_copy()
+        unnamed_stuff = StuffFactory.make_stuff(concept_str="native.Text", content=TextContent(text="Unnamed"))
+        target_memory.set_new_main_stuff(stuff=unnamed_stuff)
+        target_memory.apply_branch_changes(branch=branch_memory, branch_base=branch_base)
+
+        assert target_memory.root["item"] is item_stuff
+        assert "question" not in target_memory.root
+        assert target_memory.get_main_stuff() is item_stuff
+        assert target_memory.root["document"] is multiple_stuff_memory.root["document"]
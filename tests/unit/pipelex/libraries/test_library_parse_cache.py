@@ -0,0 +1,70 @@
+import os
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from pipelex.libraries import library_parse_cache as library_parse_cache_module
+from pipelex.libraries.library_parse_cache import LibraryParseCache
+
+LIBRARY_TOML = """domain = "test_domain"
+
+[concept]
+Question = "A question"
+"""
+
+
+class TestLibraryParseCache:
+    def test_each_file_is_parsed_once(self, tmp_path: Path, mocker: MockerFixture):
+        toml_path = tmp_path / "library.toml"
+        toml_path.write_text(LIBRARY_TOML)
+        load_spy = mocker.spy(library_parse_cache_module, "load_toml_from_path")
+        cache = LibraryParseCache()
+
+        parsed_library = cache.parse_library_files(toml_paths=[toml_path])[0]
+        assert parsed_library.library_name == "library"
+        assert parsed_library.library_dict == {"domain": "test_domain", "concept": {"Question": "A question"}}
+        # each use gets its own copy
+        parsed_library.library_dict["concept"].clear()
+        assert cache.load_library_dict(toml_path=str(toml_path))["concept"] == {"Question": "A question"}
+        assert load_spy.call_count == 1
+
+        # touched but unchanged: not parsed again
+        os.utime(toml_path, ns=(0, 0))
+        assert cache.load_library_dict(toml_path=str(toml_path))["domain"] == "test_domain"
+        assert load_spy.call_count == 1
+
+        # changed: parsed again
+        toml_path.write_text(LIBRARY_TOML.replace("test_domain", "other_domain"))
+        assert cache.load_library_dict(toml_path=str(toml_path))["domain"] == "other_domain"
+        assert load_spy.call_count == 2
+
+    def test_cache_file_is_shared_between_processes(self, tmp_path: Path, mocker: MockerFixture):
+        toml_path = tmp_path / "library.toml"
+        toml_path.write_text(LIBRARY_TOML)
+        cache_path = str(tmp_path / "cache" / "library_parse_cache.json")
+        LibraryParseCache().parse_library_files(toml_paths=[toml_path], cache_path=cache_path)
+        assert os.path.isfile(cache_path)
+
+        # a new cache, as in a new process, reads the cache file instead of parsing
+        load_spy = mocker.spy(library_parse_cache_module, "load_toml_from_path")
+        parsed_library = LibraryParseCache().parse_library_files(toml_paths=[toml_path], cache_path=cache_path)[0]
+        assert parsed_library.library_dict["domain"] == "test_domain"
+        assert load_spy.call_count == 0
+
+    def test_corrupted_cache_file_is_ignored(self, tmp_path: Path):
+        toml_path = tmp_path / "library.toml"
+        toml_path.write_text(LIBRARY_TOML)
+        cache_path = tmp_path / "library_parse_cache.json"
+        cache_path.write_bytes(b"not json")
+        parsed_library = LibraryParseCache().parse_library_files(toml_paths=[toml_path], cache_path=str(cache_path))[0]
+        assert parsed_library.library_dict["domain"] == "test_domain"
+
+    def test_library_with_dates_is_not_cached(self, tmp_path: Path, mocker: MockerFixture):
+        toml_path = tmp_path / "library.toml"
+        toml_path.write_text(f"{LIBRARY_TOML}\n[dates]\nreleased = 2025-01-01\n")
+        load_spy = mocker.spy(library_parse_cache_module, "load_toml_from_path")
+        cache = LibraryParseCache()
+        cache_path = str(tmp_path / "library_parse_cache.json")
+        assert cache.parse_library_files(toml_paths=[toml_path], cache_path=cache_path)[0].library_dict["domain"] == "test_domain"
+        assert cache.load_library_dict(toml_path=str(toml_path))["domain"] == "test_domain"
+        assert load_spy.call_count == 2
@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import pytest
+
+from pipelex.config import get_config
+from pipelex.exceptions import LibrarySnapshotError
+from pipelex.hub import get_library_manager
+from pipelex.libraries.library_manager import LibraryManager
+from pipelex.libraries.library_snapshot import LibrarySnapshot, compute_source_hashes
+
+
+class TestLibrarySnapshot:
+    def test_compute_source_hashes(self, tmp_path: Path):
+        library_path = tmp_path / "library.toml"
+        library_path.write_text('domain = "test_domain"\n')
+        (tmp_path / "structures.py").write_text("")
+        (tmp_path / "__pycache__").mkdir()
+        (tmp_path / "__pycache__" / "cached.py").write_text("")
+        source_hashes = compute_source_hashes(source_dir_paths=[str(tmp_path)], config_dump="{}")
+        assert len(source_hashes) == 3
+        assert compute_source_hashes(source_dir_paths=[str(tmp_path)], config_dump="{}") == source_hashes
+        assert compute_source_hashes(source_dir_paths=[str(tmp_path)], config_dump='{"other": 1}') != source_hashes
+        library_path.write_text('domain = "other_domain"\n')
+        assert compute_source_hashes(source_dir_paths=[str(tmp_path)], config_dump="{}") != source_hashes
+
+    def test_save_and_load_snapshot(self, tmp_path: Path):
+        library_manager = get_library_manager()
+        assert isinstance(library_manager, LibraryManager)
+        snapshot = library_manager.make_snapshot()
+        snapshot_path = str(tmp_path / "snapshots" / "library_snapshot.pickle")
+        snapshot.save_to_path(snapshot_path=snapshot_path)
+
+        loaded_snapshot = LibrarySnapshot.load_from_path(snapshot_path=snapshot_path)
+        assert loaded_snapshot.pipes.keys() == library_manager.pipe_library.root.keys()
+        assert loaded_snapshot.concepts == library_manager.concept_library.root
+        assert loaded_snapshot.domains == library_manager.domain_library.root
+        assert loaded_snapshot.is_up_to_date(source_hashes=library_manager.compute_snapshot_source_hashes())
+        assert not loaded_snapshot.is_up_to_date(source_hashes={})
+
+    def test_load_invalid_snapshot(self, tmp_path: Path):
+        snapshot_path = tmp_path / "library_snapshot.pickle"
+        snapshot_path.write_bytes(b"not a snapshot")
+        with pytest.raises(LibrarySnapshotError):
+            LibrarySnapshot.load_from_path(snapshot_path=str(snapshot_path))
+
+    def test_snapshot_is_not_loaded_unless_enabled(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        library_config = get_config().pipelex.library_config
+        assert not library_config.is_library_snapshot_enabled
+        library_manager = get_library_manager()
+        assert isinstance(library_manager, LibraryManager)
+        monkeypatch.chdir(tmp_path)
+        library_manager.make_snapshot().save_to_path(snapshot_path=library_config.library_snapshot_path)
+        assert library_manager.load_snapshot_if_up_to_date() is None
@@ -0,0 +1,98 @@
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.cogt.exceptions import ReportingManagerError
+from pipelex.cogt.llm.llm_job import LLMJob
+from pipelex.cogt.llm.llm_job_components import LLMJobParams
+from pipelex.cogt.llm.llm_job_factory import LLMJobFactory
+from pipelex.cogt.llm.llm_models.llm_engine import LLMEngine
+from pipelex.cogt.llm.token_category import TokenCategory
+from pipelex.config import ReportingConfig, RunRetentionConfig
+from pipelex.hub import get_llm_models_provider
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.reporting.reporting_manager import ReportingManager
+
+
+def make_reporting_config(tmp_path: Path, is_usage_spilled_to_disk: bool = False) -> ReportingConfig:
+    return ReportingConfig(
+        is_log_costs_to_console=False,
+        is_generate_cost_report_file_enabled=False,
+        cost_report_dir_path=str(tmp_path / "reports"),
+        cost_report_base_name="cost_report",
+        cost_report_extension="xlsx",
+        cost_report_unit_scale=1.0,
+        is_usage_spilled_to_disk=is_usage_spilled_to_disk,
+        usage_spill_dir_path=str(tmp_path / "usage"),
+    )
+
+
+def make_completed_llm_job(pipeline_run_id: str) -> LLMJob:
+    job_metadata = JobMetadata(pipeline_run_id=pipeline_run_id)
+    llm_job = LLMJobFactory.make_llm_job_from_prompt_contents(
+        llm_job_params=LLMJobParams(temperature=0.5, max_tokens=None, seed=None),
+        user_text="Say hello",
+        job_metadata=job_metadata,
+    )
+    llm_model = get_llm_models_provider().get_llm_model(llm_name="gpt-4o-mini", llm_version="latest", llm_platform_choice="default")
+    llm_job.llm_job_before_start(llm_engine=LLMEngine(llm_platform=llm_model.default_platform, llm_model=llm_model))
+    assert llm_job.job_report.llm_tokens_usage is not None
+    llm_job.job_report.llm_tokens_usage.nb_tokens_by_category = {TokenCategory.INPUT: 100, TokenCategory.OUTPUT: 20}
+    llm_job.llm_job_after_complete()
+    return llm_job
+
+
+class TestReportingManager:
+    def test_retention_by_count(self, tmp_path: Path) -> None:
+        reporting_manager = ReportingManager(
+            reporting_config=make_reporting_config(tmp_path=tmp_path),
+            run_retention_config=RunRetentionConfig(max_completed_runs=1, max_completed_run_age_seconds="unlimited"),
+        )
+        reporting_manager.setup()
+        for pipeline_run_id in ("run_1", "run_2", "run_3"):
+            reporting_manager.open_registry(pipeline_run_id=pipeline_run_id)
+        reporting_manager.complete_registry(pipeline_run_id="run_1")
+        reporting_manager.complete_registry(pipeline_run_id="run_2")
+
+        # only the most recently completed run is kept, the one still running is untouched
+        with pytest.raises(ReportingManagerError):
+            reporting_manager.generate_report(pipeline_run_id="run_1")
+        reporting_manager.generate_report(pipeline_run_id="run_2")
+        reporting_manager.generate_report(pipeline_run_id="run_3")
+
+    def test_retention_by_age(self, tmp_path: Path, mocker: MockerFixture) -> None:
+        mock_time = mocker.patch("pipelex.reporting.reporting_manager.time.time", return_value=1000.0)
+        reporting_manager = ReportingManager(
+            reporting_config=make_reporting_config(tmp_path=tmp_path),
+            run_retention_config=RunRetentionConfig(max_completed_runs="unlimited", max_completed_run_age_seconds=60),
+        )
+        reporting_manager.setup()
+        reporting_manager.open_registry(pipeline_run_id="old_run")
+        reporting_manager.open_registry(pipeline_run_id="new_run")
+        reporting_manager.complete_registry(pipeline_run_id="old_run")
+        mock_time.return_value = 1100.0
+        reporting_manager.complete_registry(pipeline_run_id="new_run")
+
+        with pytest.raises(ReportingManagerError):
+            reporting_manager.generate_report(pipeline_run_id="old_run")
+        reporting_manager.generate_report(pipeline_run_id="new_run")
+
+    def test_usage_spilled_to_disk(self, tmp_path: Path, mocker: MockerFixture) -> None:
+        reporting_manager = ReportingManager(reporting_config=make_reporting_config(tmp_path=tmp_path, is_usage_spilled_to_disk=True))
+        reporting_manager.setup()
+        reporting_manager.open_registry(pipeline_run_id="run_1")
+        for _ in range(3):
+            reporting_manager.report_inference_job(inference_job=make_completed_llm_job(pipeline_run_id="run_1"))
+        reporting_manager.complete_registry(pipeline_run_id="run_1")
+
+        spill_file_path = tmp_path / "usage" / "run_1.jsonl"
+        assert len(spill_file_path.read_text().splitlines()) == 3
+
+        # the report is still generated from the spilled usages
+        generate_report = mocker.patch("pipelex.reporting.reporting_manager.CostRegistry.generate_report")
+        reporting_manager.generate_report(pipeline_run_id="run_1")
+        call_kwargs = generate_report.call_args.kwargs
+        assert call_kwargs["llm_tokens_usages"] == []
+        assert len(call_kwargs["completed_cost_reports"]) == 3
+        assert call_kwargs["completed_cost_reports"][0].nb_tokens_by_category[TokenCategory.OUTPUT] == 20
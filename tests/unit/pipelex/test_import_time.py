@@ -0,0 +1,57 @@
+import json
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+# the modules whose import would cost startup time to every CLI command and every worker, used or not
+LAZY_IMPORTED_MODULES = [
+    "aioboto3",
+    "anthropic",
+    "boto3",
+    "fal_client",
+    "instructor",
+    "json2html",
+    "markdown",
+    "mistralai",
+    "networkx",
+    "openai",
+    "pandas",
+    "PIL",
+    "polyfactory",
+    "pypdfium2",
+    "yattag",
+]
+# generous, so that it only fails when a heavy import creeps back in, the import takes well under a second without them
+IMPORT_TIME_BUDGET_SECONDS = 2.0
+NB_IMPORT_RUNS = 3
+
+IMPORT_SCRIPT = f"""
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import pipelex.cli._cli
+import pipelex.pipelex
+
+elapsed = time.perf_counter() - start
+loaded = [module_name for module_name in {LAZY_IMPORTED_MODULES!r} if module_name in sys.modules]
+print(json.dumps({{"elapsed": elapsed, "loaded": loaded}}))
+"""
+
+
+def import_pipelex_in_subprocess() -> Dict[str, Any]:
+    completed = subprocess.run([sys.executable, "-c", IMPORT_SCRIPT], capture_output=True, text=True, check=True)
+    result: Dict[str, Any] = json.loads(completed.stdout.strip().splitlines()[-1])
+    return result
+
+
+class TestImportTime:
+    def test_heavy_dependencies_are_imported_lazily(self):
+        loaded: List[str] = import_pipelex_in_subprocess()["loaded"]
+        assert loaded == [], f"These modules should only be imported on first use: {loaded}"
+
+    def test_import_time_budget(self):
+        # the fastest of a few runs, to be less sensitive to the load of the machine
+        elapsed = min(import_pipelex_in_subprocess()["elapsed"] for _ in range(NB_IMPORT_RUNS))
+        assert elapsed < IMPORT_TIME_BUDGET_SECONDS, f"Importing pipelex took {elapsed:.2f}s, the budget is {IMPORT_TIME_BUDGET_SECONDS}s"
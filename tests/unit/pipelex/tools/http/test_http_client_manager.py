@@ -0,0 +1,135 @@
+import asyncio
+import os
+from pathlib import Path
+from typing import Callable, List
+
+import httpx
+import pytest
+from typing_extensions import override
+
+from pipelex.tools.http.http_client_manager import HttpClientManager
+from pipelex.tools.http.http_config import HttpConfig
+
+
+class MockedHttpClientManager(HttpClientManager):
+    def __init__(self, http_config: HttpConfig, handler: Callable[[httpx.Request], httpx.Response]):
+        super().__init__(http_config=http_config)
+        self.handler = handler
+        self.nb_async_transports = 0
+
+    @override
+    def _make_async_transport(self) -> httpx.AsyncBaseTransport:
+        self.nb_async_transports += 1
+        return httpx.MockTransport(self.handler)
+
+    @override
+    def _make_sync_transport(self) -> httpx.BaseTransport:
+        return httpx.MockTransport(self.handler)
+
+
+class TestHttpClientManager:
+    @pytest.mark.asyncio
+    async def test_client_is_reused(self) -> None:
+        manager = MockedHttpClientManager(http_config=HttpConfig(), handler=lambda request: httpx.Response(200, content=request.url.path.encode()))
+        assert await manager.fetch_bytes_async(url="https://example.com/a") == b"/a"
+        assert await manager.fetch_bytes_async(url="https://example.com/b") == b"/b"
+        assert manager.nb_async_transports == 1
+        manager.teardown()
+
+    @pytest.mark.asyncio
+    async def test_retry_on_error_status(self) -> None:
+        statuses: List[int] = [503, 429, 200]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(statuses.pop(0), content=b"payload")
+
+        manager = MockedHttpClientManager(http_config=HttpConfig(max_retries=2, retry_backoff_seconds=0), handler=handler)
+        assert await manager.fetch_bytes_async(url="https://example.com/file.pdf") == b"payload"
+        assert not statuses
+
+        statuses.extend([503, 503, 503])
+        with pytest.raises(httpx.HTTPStatusError):
+            manager.fetch_bytes(url="https://example.com/file.pdf")
+        manager.teardown()
+
+    @pytest.mark.asyncio
+    async def test_max_connections_per_host(self) -> None:
+        nb_in_flight = 0
+        max_nb_in_flight = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal nb_in_flight, max_nb_in_flight
+            nb_in_flight += 1
+            max_nb_in_flight = max(max_nb_in_flight, nb_in_flight)
+            await asyncio.sleep(0.001)
+            nb_in_flight -= 1
+            return httpx.Response(200)
+
+        manager = MockedHttpClientManager(http_config=HttpConfig(max_connections_per_host=2), handler=handler)  # pyright: ignore[reportArgumentType]
+        await asyncio.gather(*(manager.fetch_bytes_async(url=f"https://example.com/{index}") for index in range(8)))
+        assert max_nb_in_flight == 2
+        manager.teardown()
+
+    def test_download_cache_revalidation(self, tmp_path: Path) -> None:
+        received_headers: List[httpx.Headers] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            received_headers.append(request.headers)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=b"document", headers={"ETag": '"v1"'})
+
+        http_config = HttpConfig(is_download_cache_enabled=True, download_cache_dir=str(tmp_path))
+        manager = MockedHttpClientManager(http_config=http_config, handler=handler)
+        assert manager.fetch_bytes(url="https://example.com/doc.pdf") == b"document"
+        assert manager.fetch_bytes(url="https://example.com/doc.pdf") == b"document"
+        assert "If-None-Match" not in received_headers[0]
+        assert received_headers[1]["If-None-Match"] == '"v1"'
+        manager.teardown()
+
+    def test_download_cache_ignores_mismatched_copies(self, tmp_path: Path) -> None:
+        received_headers: List[httpx.Headers] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            received_headers.append(request.headers)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=b"document", headers={"ETag": '"v1"'})
+
+        http_config = HttpConfig(is_download_cache_enabled=True, download_cache_dir=str(tmp_path))
+        manager = MockedHttpClientManager(http_config=http_config, handler=handler)
+        url = "https://example.com/doc.pdf"
+        assert manager.fetch_bytes(url=url) == b"document"
+        content_path = next(tmp_path.glob("*.bin"))
+
+        # a partial copy is not revalidated
+        content_path.write_bytes(b"docu")
+        assert manager.fetch_bytes(url=url) == b"document"
+        assert "If-None-Match" not in received_headers[1]
+
+        # a copy replaced after its validators were sent is downloaded again
+        download_cache = manager.download_cache
+        assert download_cache is not None
+        assert download_cache.get_validators(url=url) == {"If-None-Match": '"v1"'}
+        content_path.write_bytes(b"DOCUMENT")
+        assert download_cache.load(url=url) is None
+        manager.teardown()
+
+    def test_download_cache_eviction(self, tmp_path: Path) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"x" * 10, headers={"ETag": f'"{request.url.path}"'})
+
+        http_config = HttpConfig(is_download_cache_enabled=True, download_cache_dir=str(tmp_path), download_cache_max_bytes=25)
+        manager = MockedHttpClientManager(http_config=http_config, handler=handler)
+        download_cache = manager.download_cache
+        assert download_cache is not None
+        for index, url in enumerate(("https://example.com/a", "https://example.com/b")):
+            manager.fetch_bytes(url=url)
+            content_path, _ = download_cache._get_paths(url=url)  # pyright: ignore[reportPrivateUsage]
+            os.utime(content_path, (index, index))
+        manager.fetch_bytes(url="https://example.com/c")
+        # the least recently used download is evicted
+        assert download_cache.get_validators(url="https://example.com/a") == {}
+        assert download_cache.get_validators(url="https://example.com/b") == {"If-None-Match": '"/b"'}
+        assert download_cache.get_validators(url="https://example.com/c") == {"If-None-Match": '"/c"'}
+        manager.teardown()
@@ -0,0 +1,38 @@
+import logging
+
+from pytest_mock import MockerFixture
+
+from pipelex import log
+from pipelex.tools.log.log_levels import LogLevel
+
+LOG_ORIGIN_NAME = __name__.split(sep=".", maxsplit=1)[0]
+
+
+class TestLogDispatch:
+    def test_disabled_level_is_not_evaluated(self, mocker: MockerFixture) -> None:
+        origin_logger = logging.getLogger(LOG_ORIGIN_NAME)
+        previous_level = origin_logger.level
+        log.set_level_for_package(package_name=LOG_ORIGIN_NAME, level=LogLevel.INFO)
+        try:
+            log_message = mocker.spy(log.log_dispatch, "_log_message")
+            make_content = mocker.MagicMock(return_value="expensive content")
+
+            def make_verbose_content() -> str:
+                return make_content()
+
+            log.verbose(make_verbose_content)
+            log.debug(make_verbose_content, title="Some title")
+            make_content.assert_not_called()
+            log_message.assert_not_called()
+
+            log.info(make_verbose_content)
+            make_content.assert_called_once()
+            assert log_message.call_args.kwargs["message"] == "expensive content"
+            assert log_message.call_args.kwargs["log_origin_name"] == LOG_ORIGIN_NAME
+        finally:
+            origin_logger.setLevel(previous_level)
+
+    def test_lazy_data_content(self, mocker: MockerFixture) -> None:
+        log_data = mocker.spy(log.log_dispatch, "_log_data")
+        log.warning(lambda: {"answer": 42}, title="Lazy data")
+        assert log_data.call_args.kwargs["data"] == {"answer": 42}
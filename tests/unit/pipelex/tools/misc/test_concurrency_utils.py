@@ -0,0 +1,111 @@
+import asyncio
+from typing import Iterator, List
+
+import pytest
+
+from pipelex.tools.misc.concurrency_utils import close_on_event_loop, gather_bounded, iterate_as_completed_bounded
+
+
+class ConcurrencyProbe:
+    def __init__(self) -> None:
+        self.nb_in_flight = 0
+        self.max_nb_in_flight = 0
+        self.nb_created = 0
+
+    async def work(self, value: int, delay: float) -> int:
+        self.nb_in_flight += 1
+        self.max_nb_in_flight = max(self.max_nb_in_flight, self.nb_in_flight)
+        await asyncio.sleep(delay)
+        self.nb_in_flight -= 1
+        return value * 10
+
+    def make_tasks(self, nb_tasks: int) -> Iterator["asyncio.Future[int]"]:
+        for index in range(nb_tasks):
+            self.nb_created += 1
+            # later items finish first to check that ordering is restored
+            yield asyncio.ensure_future(self.work(value=index, delay=0.001 * (nb_tasks - index)))
+
+
+class TestConcurrencyUtils:
+    @pytest.mark.asyncio
+    async def test_gather_bounded_keeps_order_and_limits_concurrency(self) -> None:
+        probe = ConcurrencyProbe()
+        results = await gather_bounded(awaitables=(probe.work(value=index, delay=0.001 * (20 - index)) for index in range(20)), max_concurrency=3)
+        assert results == [index * 10 for index in range(20)]
+        assert probe.max_nb_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_gather_bounded_unlimited(self) -> None:
+        probe = ConcurrencyProbe()
+        results = await gather_bounded(awaitables=[probe.work(value=index, delay=0.001) for index in range(10)], max_concurrency=None)
+        assert results == [index * 10 for index in range(10)]
+        assert probe.max_nb_in_flight == 10
+
+    @pytest.mark.asyncio
+    async def test_gather_bounded_empty(self) -> None:
+        results: List[int] = await gather_bounded(awaitables=[], max_concurrency=4)
+        assert results == []
+
+    @pytest.mark.asyncio
+    async def test_iterate_as_completed_bounded_admits_lazily(self) -> None:
+        probe = ConcurrencyProbe()
+        nb_created_when_first_completed = 0
+        indexes: List[int] = []
+        async for index, result in iterate_as_completed_bounded(awaitables=probe.make_tasks(nb_tasks=8), max_concurrency=2):
+            if not indexes:
+                nb_created_when_first_completed = probe.nb_created
+            indexes.append(index)
+            assert result == index * 10
+        assert sorted(indexes) == list(range(8))
+        # only the initial window plus the one admitted to replace the first completed task
+        assert nb_created_when_first_completed == 3
+        assert probe.max_nb_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_iterate_as_completed_bounded_cancels_on_error(self) -> None:
+        cancelled: List[int] = []
+
+        async def failing() -> int:
+            await asyncio.sleep(0.001)
+            raise RuntimeError("boom")
+
+        async def slow(index: int) -> int:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(index)
+                raise
+            return index
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await gather_bounded(awaitables=[slow(0), failing(), slow(2)], max_concurrency=3)
+        assert sorted(cancelled) == [0, 2]
+
+    @pytest.mark.asyncio
+    async def test_negative_max_concurrency_is_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            await gather_bounded(awaitables=[], max_concurrency=-1)
+
+    def test_close_on_event_loop(self) -> None:
+        closed_on_loops: List[asyncio.AbstractEventLoop] = []
+
+        async def close() -> None:
+            closed_on_loops.append(asyncio.get_running_loop())
+
+        # from synchronous code, once the loop which opened the resource is idle
+        event_loop = asyncio.new_event_loop()
+        close_on_event_loop(make_close_coroutine=close, event_loop=event_loop, resource_desc="test client")
+        assert closed_on_loops == [event_loop]
+
+        # from the loop itself, as a task
+        async def close_from_loop() -> None:
+            close_on_event_loop(make_close_coroutine=close, event_loop=event_loop, resource_desc="test client")
+            await asyncio.sleep(0)
+
+        event_loop.run_until_complete(close_from_loop())
+        assert closed_on_loops == [event_loop, event_loop]
+
+        # a closed loop took its connections with it, there is nothing left to close
+        event_loop.close()
+        close_on_event_loop(make_close_coroutine=close, event_loop=event_loop, resource_desc="test client")
+        assert len(closed_on_loops) == 2
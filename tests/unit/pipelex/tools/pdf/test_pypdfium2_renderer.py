@@ -0,0 +1,78 @@
+import io
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, ClassVar, List
+
+import pypdfium2 as pdfium
+import pytest
+from PIL import Image
+from pytest_mock import MockerFixture
+
+from pipelex.tools.pdf.pdf_render_config import PdfRenderConfig
+from pipelex.tools.pdf.pypdfium2_renderer import PyPdfium2Renderer, PyPdfium2RendererError
+
+
+def make_pdf_bytes(page_widths: List[int]) -> bytes:
+    pdf_doc = pdfium.PdfDocument.new()
+    for page_width in page_widths:
+        pdf_doc.new_page(page_width, 100)  # pyright: ignore[reportUnknownMemberType]
+    buffer = io.BytesIO()
+    pdf_doc.save(buffer)  # pyright: ignore[reportUnknownMemberType]
+    pdf_doc.close()
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio(loop_scope="class")
+class TestPyPdfium2Renderer:
+    # each page has its own width, so we can check which pages were rendered, and in which order
+    PAGE_WIDTHS: ClassVar[List[int]] = [100 + 10 * index for index in range(11)]
+
+    @pytest.mark.parametrize("is_process_pool_enabled", [False, True])
+    async def test_render_pages_in_order(self, is_process_pool_enabled: bool):
+        renderer = PyPdfium2Renderer(
+            pdf_render_config=PdfRenderConfig(is_process_pool_enabled=is_process_pool_enabled, max_workers=2, nb_pages_per_batch=3)
+        )
+        try:
+            pdf_bytes = make_pdf_bytes(page_widths=self.PAGE_WIDTHS)
+            assert await renderer.get_nb_pages(pdf_input=pdf_bytes) == len(self.PAGE_WIDTHS)
+            images = await renderer.render_pdf_pages(pdf_input=pdf_bytes, dpi=72)
+            assert [image.width for image in images] == self.PAGE_WIDTHS
+        finally:
+            renderer.teardown()
+
+    async def test_iterate_page_range(self):
+        renderer = PyPdfium2Renderer(pdf_render_config=PdfRenderConfig(nb_pages_per_batch=2))
+        try:
+            pdf_bytes = make_pdf_bytes(page_widths=self.PAGE_WIDTHS)
+            widths = [image.width async for image in renderer.iterate_pdf_pages(pdf_input=pdf_bytes, dpi=144, first_page=3, last_page=7)]
+            assert widths == [2 * page_width for page_width in self.PAGE_WIDTHS[2:7]]
+            with pytest.raises(PyPdfium2RendererError):
+                await renderer.render_pdf_pages(pdf_input=pdf_bytes, dpi=72, first_page=0)
+        finally:
+            renderer.teardown()
+
+    async def test_iterate_pages_as_png_in_processes(self):
+        renderer = PyPdfium2Renderer(pdf_render_config=PdfRenderConfig(is_process_pool_enabled=True, max_workers=2, nb_pages_per_batch=4))
+        try:
+            pdf_bytes = make_pdf_bytes(page_widths=self.PAGE_WIDTHS)
+            png_pages = [png_page async for png_page in renderer.iterate_pdf_pages_as_png(pdf_input=pdf_bytes, dpi=72)]
+            assert [Image.open(io.BytesIO(png_page)).width for png_page in png_pages] == self.PAGE_WIDTHS
+        finally:
+            renderer.teardown()
+
+    async def test_broken_process_pool_is_replaced(self, mocker: MockerFixture):
+        renderer = PyPdfium2Renderer(pdf_render_config=PdfRenderConfig(is_process_pool_enabled=True, max_workers=1))
+        broken_executor = renderer._get_executor()  # pyright: ignore[reportPrivateUsage]
+
+        def submit(*args: Any, **kwargs: Any) -> Any:
+            raise BrokenProcessPool("A child process terminated abruptly")
+
+        mocker.patch.object(broken_executor, "submit", side_effect=submit)
+        pdf_bytes = make_pdf_bytes(page_widths=self.PAGE_WIDTHS[:2])
+        try:
+            with pytest.raises(PyPdfium2RendererError, match="__main__"):
+                await renderer.render_pdf_pages(pdf_input=pdf_bytes, dpi=72)
+            # the next render gets a new pool
+            images = await renderer.render_pdf_pages(pdf_input=pdf_bytes, dpi=72)
+            assert [image.width for image in images] == self.PAGE_WIDTHS[:2]
+        finally:
+            renderer.teardown()
@@ -0,0 +1,94 @@
+from typing import Dict
+
+import pytest
+from typing_extensions import override
+
+from pipelex.tools.templating.jinja2_rendering import render_jinja2
+from pipelex.tools.templating.jinja2_template_cache import Jinja2TemplateCache
+from pipelex.tools.templating.jinja2_template_category import Jinja2TemplateCategory
+from pipelex.tools.templating.template_provider_abstract import TemplateProviderAbstract
+
+
+class DictTemplateProvider(TemplateProviderAbstract):
+    def __init__(self, templates: Dict[str, str]):
+        self.templates = templates
+
+    @override
+    def setup(self) -> None:
+        pass
+
+    @override
+    def teardown(self) -> None:
+        pass
+
+    @override
+    def get_template(self, template_name: str) -> str:
+        return self.templates[template_name]
+
+
+class TestJinja2TemplateCache:
+    def test_compiled_template_is_reused(self) -> None:
+        template_cache = Jinja2TemplateCache()
+        template_provider = DictTemplateProvider(templates={"greeting": "Hello {{ name }}"})
+        compiled_template = template_cache.get_compiled_template(
+            template_category=Jinja2TemplateCategory.LLM_PROMPT,
+            template_provider=template_provider,
+            jinja2_name="greeting",
+        )
+        assert compiled_template.undeclared_variables == {"name"}
+        assert (
+            template_cache.get_compiled_template(
+                template_category=Jinja2TemplateCategory.LLM_PROMPT,
+                template_provider=template_provider,
+                jinja2_name="greeting",
+            )
+            is compiled_template
+        )
+        # one environment per category
+        assert template_cache.get_environment(
+            template_category=Jinja2TemplateCategory.LLM_PROMPT, template_provider=template_provider
+        ) is template_cache.get_environment(template_category=Jinja2TemplateCategory.LLM_PROMPT, template_provider=template_provider)
+        assert template_cache.get_environment(
+            template_category=Jinja2TemplateCategory.LLM_PROMPT, template_provider=template_provider
+        ) is not template_cache.get_environment(template_category=Jinja2TemplateCategory.MARKDOWN, template_provider=template_provider)
+
+        # a template which changed in the provider is recompiled
+        template_provider.templates["greeting"] = "Hi {{ first_name }}"
+        changed_template = template_cache.get_compiled_template(
+            template_category=Jinja2TemplateCategory.LLM_PROMPT,
+            template_provider=template_provider,
+            jinja2_name="greeting",
+        )
+        assert changed_template.undeclared_variables == {"first_name"}
+
+    def test_max_templates(self) -> None:
+        template_cache = Jinja2TemplateCache(max_templates=2)
+        template_provider = DictTemplateProvider(templates={})
+
+        def get_compiled_template(jinja2: str):
+            return template_cache.get_compiled_template(
+                template_category=Jinja2TemplateCategory.LLM_PROMPT,
+                template_provider=template_provider,
+                jinja2=jinja2,
+            )
+
+        first_template = get_compiled_template(jinja2="{{ a }}")
+        get_compiled_template(jinja2="{{ b }}")
+        get_compiled_template(jinja2="{{ c }}")
+        assert get_compiled_template(jinja2="{{ a }}") is not first_template
+
+    @pytest.mark.asyncio
+    async def test_render_included_template_after_change(self) -> None:
+        template_provider = DictTemplateProvider(templates={"signature": "Bob"})
+
+        async def render() -> str:
+            return await render_jinja2(
+                template_category=Jinja2TemplateCategory.MARKDOWN,
+                template_provider=template_provider,
+                temlating_context={},
+                jinja2="Regards, {% include 'signature' %}",
+            )
+
+        assert await render() == "Regards, Bob"
+        template_provider.templates["signature"] = "Alice"
+        assert await render() == "Regards, Alice"